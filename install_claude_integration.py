@@ -80,6 +80,15 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+def forward_to_supervisor(event_type: str, hook_data: dict) -> bool:
+    """Hand the event to the running supervisor; False if it was not accepted."""
+    try:
+        from context_cleaner.ipc.hook_client import send_hook_event
+        return send_hook_event(event_type, hook_data)
+    except Exception:
+        # Older Context Cleaner or supervisor not running - handle in-process
+        return False
+
 def get_hook_manager():
     """Get Context Cleaner hook manager with error handling."""
     try:
@@ -148,11 +157,22 @@ def main():
         
         # Determine hook type from script name or arguments
         if 'session_start' in str(sys.argv) or hook_data.get('event_type') == 'session_start':
-            handle_session_start(hook_data)
+            event_type = 'session_start'
         elif 'session_end' in str(sys.argv) or hook_data.get('event_type') == 'session_end':
-            handle_session_end(hook_data)
+            event_type = 'session_end'
         else:
             # Default to context change tracking
+            event_type = 'context_change'
+        
+        # Fast path: the supervisor daemon applies and batches session writes
+        if forward_to_supervisor(event_type, hook_data):
+            sys.exit(0)
+        
+        if event_type == 'session_start':
+            handle_session_start(hook_data)
+        elif event_type == 'session_end':
+            handle_session_end(hook_data)
+        else:
             handle_context_change(hook_data)
         
         # Always exit successfully - never block Claude Code
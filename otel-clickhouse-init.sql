@@ -138,7 +138,8 @@ CREATE TABLE IF NOT EXISTS claude_message_content (
     PRIMARY KEY (message_uuid),
     INDEX idx_session (session_id) TYPE set(100) GRANULARITY 8192,
     INDEX idx_content_hash (message_hash) TYPE set(1000) GRANULARITY 8192,
-    INDEX idx_content_search (message_content) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1
+    INDEX idx_content_search (message_content) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1,
+    INDEX idx_content_tokens lower(message_content) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1 -- case-insensitive hasToken() search
     
 ) ENGINE = MergeTree()
 ORDER BY (session_id, timestamp)
@@ -183,7 +184,8 @@ CREATE TABLE IF NOT EXISTS claude_file_content (
     PRIMARY KEY (file_access_uuid),
     INDEX idx_file_path (file_path) TYPE set(1000) GRANULARITY 8192,
     INDEX idx_content_hash (file_content_hash) TYPE set(1000) GRANULARITY 8192,
-    INDEX idx_content_search (file_content) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1
+    INDEX idx_content_search (file_content) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1,
+    INDEX idx_content_tokens lower(file_content) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1 -- case-insensitive hasToken() search
     
 ) ENGINE = ReplacingMergeTree() -- Use ReplacingMergeTree for file deduplication
 ORDER BY (file_path, file_content_hash)
@@ -217,7 +219,8 @@ CREATE TABLE IF NOT EXISTS claude_tool_results (
     
     PRIMARY KEY (tool_result_uuid),
     INDEX idx_tool_name (tool_name) TYPE set(50) GRANULARITY 8192,
-    INDEX idx_output_search (tool_output) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1
+    INDEX idx_output_search (tool_output) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1,
+    INDEX idx_output_tokens lower(tool_output) TYPE tokenbf_v1(32768, 3, 0) GRANULARITY 1 -- case-insensitive hasToken() search
     
 ) ENGINE = MergeTree()
 ORDER BY (session_id, timestamp, tool_name)
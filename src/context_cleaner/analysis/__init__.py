@@ -11,6 +11,7 @@ Components:
 - UsageAnalyzer: File access patterns and workflow recognition
 - TokenAnalyzer: Token usage and efficiency analysis
 - TemporalAnalyzer: Session boundaries and topic drift detection
+- SequenceMining: Recurring tool-sequence counting over encoded symbols
 """
 
 from .models import (
@@ -54,6 +55,7 @@ from .correlation_analyzer import (
     LongTermTrend,
     CorrelationInsights,
 )
+from .sequence_mining import SequenceMiner, SequencePattern
 
 __all__ = [
     # Core models and data structures
@@ -92,4 +94,7 @@ __all__ = [
     "CrossSessionPattern",
     "LongTermTrend",
     "CorrelationInsights",
+    # Sequence mining
+    "SequenceMiner",
+    "SequencePattern",
 ]
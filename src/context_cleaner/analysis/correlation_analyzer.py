@@ -12,9 +12,12 @@ from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 from pathlib import Path
 
+import numpy as np
+
 from .models import SessionAnalysis, CacheConfig
 from .session_parser import SessionCacheParser
 from .discovery import CacheDiscoveryService, CacheLocation
+from .sequence_mining import find_common_subsequences
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +193,112 @@ class CorrelationInsights:
         return [t for t in self.long_term_trends if t.is_significant_trend][:3]
 
 
+class _SessionSimilarityIndex:
+    """
+    Per-session similarity features, extracted once for a batch of sessions.
+
+    Computes the same score as ``_calculate_session_similarity`` one row at a
+    time: file Jaccard from an inverted file -> sessions index, weighted tool
+    Jaccard from a dense tool-count matrix, and duration/token ratios from
+    scalar vectors. Memory stays O(sessions) instead of O(sessions^2).
+    """
+
+    def __init__(self, sessions: List[SessionAnalysis]):
+        self.size = len(sessions)
+        file_ids: Dict[Any, int] = {}
+        tool_ids: Dict[str, int] = {}
+        session_files: List[np.ndarray] = []
+        tool_counts: List[Counter] = []
+
+        for session in sessions:
+            files = {op.file_path for op in session.file_operations if op.file_path}
+            session_files.append(
+                np.fromiter(
+                    (file_ids.setdefault(f, len(file_ids)) for f in files),
+                    dtype=np.int64,
+                    count=len(files),
+                )
+            )
+            tools = Counter(op.tool_name for op in session.file_operations)
+            for tool in tools:
+                tool_ids.setdefault(tool, len(tool_ids))
+            tool_counts.append(tools)
+
+        self._session_files = session_files
+        self._file_counts = np.array([len(f) for f in session_files], dtype=np.int64)
+        postings: List[List[int]] = [[] for _ in range(len(file_ids))]
+        for index, files in enumerate(session_files):
+            for file_id in files:
+                postings[file_id].append(index)
+        self._postings = [np.array(p, dtype=np.int64) for p in postings]
+
+        self._tools = np.zeros((self.size, len(tool_ids)), dtype=np.float64)
+        for index, tools in enumerate(tool_counts):
+            for tool, count in tools.items():
+                self._tools[index, tool_ids[tool]] = count
+        self._tool_totals = self._tools.sum(axis=1)
+
+        self._durations = np.array(
+            [s.duration_hours for s in sessions], dtype=np.float64
+        )
+        self._tokens = np.array([s.total_tokens for s in sessions], dtype=np.float64)
+
+    def row(self, index: int) -> np.ndarray:
+        """Similarity of session ``index`` to every session in the batch."""
+        total = np.zeros(self.size, dtype=np.float64)
+        parts = np.zeros(self.size, dtype=np.float64)
+
+        # File similarity (Jaccard over file paths)
+        files = self._session_files[index]
+        if len(files):
+            shared = np.bincount(
+                np.concatenate([self._postings[f] for f in files]),
+                minlength=self.size,
+            )
+        else:
+            shared = np.zeros(self.size, dtype=np.int64)
+        union = self._file_counts[index] + self._file_counts - shared
+        has_files = union > 0
+        total += np.divide(shared, union, out=np.zeros(self.size), where=has_files)
+        parts += has_files
+
+        # Tool similarity (weighted Jaccard over tool counts)
+        overlap = np.minimum(self._tools[index], self._tools).sum(axis=1)
+        total_max = self._tool_totals[index] + self._tool_totals - overlap
+        has_tools = total_max > 0
+        total += np.divide(overlap, total_max, out=np.zeros(self.size), where=has_tools)
+        parts += has_tools
+
+        # Duration similarity (normalized)
+        longest = np.maximum(self._durations[index], self._durations)
+        shortest = np.minimum(self._durations[index], self._durations)
+        total += np.divide(
+            shortest, longest, out=np.zeros(self.size), where=longest > 0
+        )
+        parts += 1
+
+        # Token count similarity (normalized)
+        has_tokens = (self._tokens[index] > 0) & (self._tokens > 0)
+        total += np.divide(
+            np.minimum(self._tokens[index], self._tokens),
+            np.maximum(self._tokens[index], self._tokens),
+            out=np.zeros(self.size),
+            where=has_tokens,
+        )
+        parts += has_tokens
+
+        return total / parts
+
+    def mean_pairwise(self) -> float:
+        """Average similarity over all distinct pairs in the batch."""
+        if self.size < 2:
+            return 0.0
+        pair_total = sum(
+            float(self.row(i)[i + 1 :].sum()) for i in range(self.size - 1)
+        )
+        return pair_total / (self.size * (self.size - 1) // 2)
+
+
 class CrossSessionCorrelationAnalyzer:
     """Analyzes correlations and patterns across multiple Claude Code sessions."""
 
@@ -361,29 +470,33 @@ class CrossSessionCorrelationAnalyzer:
     ) -> List[SessionCluster]:
         """Cluster sessions based on similarity."""
         clusters = []
-        processed_sessions = set()
+        if not sessions:
+            return clusters
 
-        for i, session in enumerate(sessions):
-            if session.session_id in processed_sessions:
-                continue
+        index = _SessionSimilarityIndex(sessions)
+        # Sessions are marked processed by id, so duplicates of a clustered
+        # session id are skipped as well
+        _, id_codes = np.unique([s.session_id for s in sessions], return_inverse=True)
+        processed_ids = np.zeros(id_codes.max() + 1, dtype=bool)
 
-            # Find similar sessions
-            similar_sessions = [session]
-            for j, other_session in enumerate(sessions[i + 1 :], i + 1):
-                if other_session.session_id in processed_sessions:
-                    continue
+        for i in range(len(sessions)):
+            if processed_ids[id_codes[i]]:
+                continue
 
-                similarity = self._calculate_session_similarity(session, other_session)
-                if similarity >= self.similarity_threshold:
-                    similar_sessions.append(other_session)
+            # Find similar sessions among later, unprocessed sessions
+            candidates = np.zeros(len(sessions), dtype=bool)
+            candidates[i + 1 :] = True
+            candidates &= ~processed_ids[id_codes]
+            candidates &= index.row(i) >= self.similarity_threshold
+            similar = [i] + np.flatnonzero(candidates).tolist()
 
-            if len(similar_sessions) >= self.min_cluster_size:
+            if len(similar) >= self.min_cluster_size:
+                similar_sessions = [sessions[j] for j in similar]
                 cluster = self._create_session_cluster(similar_sessions)
                 clusters.append(cluster)
 
                 # Mark sessions as processed
-                for s in similar_sessions:
-                    processed_sessions.add(s.session_id)
+                processed_ids[id_codes[similar]] = True
 
         # Sort clusters by size and similarity
         clusters.sort(key=lambda x: (x.cluster_size, x.similarity_score), reverse=True)
@@ -448,13 +561,7 @@ class CrossSessionCorrelationAnalyzer:
         session_ids = [s.session_id for s in sessions]
 
         # Calculate average similarity within cluster
-        similarities = []
-        for i in range(len(sessions)):
-            for j in range(i + 1, len(sessions)):
-                sim = self._calculate_session_similarity(sessions[i], sessions[j])
-                similarities.append(sim)
-
-        avg_similarity = sum(similarities) / len(similarities) if similarities else 0.0
+        avg_similarity = _SessionSimilarityIndex(sessions).mean_pairwise()
 
         # Determine common theme
         common_theme = self._determine_common_theme(sessions)
@@ -665,15 +772,8 @@ class CrossSessionCorrelationAnalyzer:
         for weekday, day_sessions in weekday_patterns.items():
             if len(day_sessions) >= 3:  # At least 3 occurrences
                 # Check for similarity in these sessions
-                similarities = []
-                for i in range(len(day_sessions)):
-                    for j in range(i + 1, len(day_sessions)):
-                        sim = self._calculate_session_similarity(
-                            day_sessions[i], day_sessions[j]
-                        )
-                        similarities.append(sim)
-
-                if similarities and sum(similarities) / len(similarities) > 0.5:
+                mean_similarity = _SessionSimilarityIndex(day_sessions).mean_pairwise()
+                if mean_similarity > 0.5:
                     weekday_names = [
                         "Monday",
                         "Tuesday",
@@ -691,10 +791,10 @@ class CrossSessionCorrelationAnalyzer:
                         session_sequence=[s.session_id for s in day_sessions],
                         time_intervals=[7.0 * 24]
                         * (len(day_sessions) - 1),  # Weekly intervals
-                        consistency_score=sum(similarities) / len(similarities),
+                        consistency_score=mean_similarity,
                         evolution_trend="cyclical",
                         key_indicators=[weekday_names[weekday], "weekly"],
-                        correlation_strength=sum(similarities) / len(similarities),
+                        correlation_strength=mean_similarity,
                         first_occurrence=min(s.start_time for s in day_sessions),
                         last_occurrence=max(s.start_time for s in day_sessions),
                         frequency_days=7.0,
@@ -732,22 +832,10 @@ class CrossSessionCorrelationAnalyzer:
         self, sequences: List[List[str]]
     ) -> List[Tuple[List[str], int]]:
         """Find common subsequences in a list of sequences."""
-        subsequence_counter = Counter()
-
-        for sequence in sequences:
-            # Generate all subsequences of length 2-4
-            for length in range(2, min(5, len(sequence) + 1)):
-                for i in range(len(sequence) - length + 1):
-                    subseq = tuple(sequence[i : i + length])
-                    subsequence_counter[subseq] += 1
-
-        # Return subsequences that appear multiple times
-        common = [
-            (list(subseq), count)
-            for subseq, count in subsequence_counter.items()
-            if count > 1
-        ]
-        return sorted(common, key=lambda x: x[1], reverse=True)
+        # Subsequences of length 2-4 that appear multiple times
+        return find_common_subsequences(
+            sequences, min_length=2, max_length=4, min_support=2
+        )
 
     def _calculate_time_intervals(self, sessions: List[SessionAnalysis]) -> List[float]:
         """Calculate time intervals between sessions in hours."""
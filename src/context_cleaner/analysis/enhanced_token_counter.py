@@ -10,14 +10,16 @@ This service addresses the 90% undercount issue in the current token analysis by
 
 import logging
 import asyncio
+import hashlib
 import json
 import math
 import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 # Optional imports for enhanced functionality
 try:
@@ -33,15 +35,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def get_accurate_token_count(content: Any) -> int:
-    """Return a conservative token estimate for arbitrary content strings."""
-
-    if content is None:
-        return 0
-
-    if not isinstance(content, str):
-        content = str(content)
-
+def _count_tokens(content: str) -> int:
     normalized = content.strip()
     if not normalized:
         return 0
@@ -52,6 +46,120 @@ def get_accurate_token_count(content: Any) -> int:
     return max(word_tokens, char_tokens)
 
 
+class TokenCountCache:
+    """
+    Bounded LRU cache of token counts keyed by a content hash.
+
+    Validation, planning and dashboard code count the same context values
+    over and over; hashing a string is much cheaper than scanning it for
+    tokens, so repeated content is counted once. Strings shorter than
+    ``min_length`` are counted directly since that is cheaper than hashing.
+    """
+
+    def __init__(self, max_entries: int = 16384, min_length: int = 64):
+        self.max_entries = max_entries
+        self.min_length = min_length
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(content: str) -> bytes:
+        data = content.encode("utf-8", "surrogatepass")
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def count(self, content: Any) -> int:
+        """Token count for one piece of content."""
+        return self.count_many([content])[0]
+
+    def count_many(self, contents: Iterable[Any]) -> List[int]:
+        """Token counts for many pieces of content, in order.
+
+        Duplicates within the batch are counted once and the cache lock is
+        taken once per batch rather than once per string.
+        """
+        texts = [
+            "" if c is None else c if isinstance(c, str) else str(c) for c in contents
+        ]
+        results: List[Optional[int]] = [None] * len(texts)
+        pending: Dict[bytes, List[int]] = {}
+
+        for index, text in enumerate(texts):
+            if len(text) < self.min_length:
+                results[index] = _count_tokens(text)
+            else:
+                pending.setdefault(self._key(text), []).append(index)
+
+        if pending:
+            with self._lock:
+                for key in list(pending):
+                    cached = self._counts.get(key)
+                    if cached is None:
+                        continue
+                    self._counts.move_to_end(key)
+                    self.hits += len(pending[key])
+                    for index in pending.pop(key):
+                        results[index] = cached
+
+            computed = {
+                key: _count_tokens(texts[indexes[0]])
+                for key, indexes in pending.items()
+            }
+
+            with self._lock:
+                for key, count in computed.items():
+                    indexes = pending[key]
+                    self.misses += 1
+                    self.hits += len(indexes) - 1
+                    for index in indexes:
+                        results[index] = count
+                    self._counts[key] = count
+                    self._counts.move_to_end(key)
+                while len(self._counts) > self.max_entries:
+                    self._counts.popitem(last=False)
+
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._counts),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_token_count_cache = TokenCountCache()
+
+
+def get_token_count_cache() -> TokenCountCache:
+    """Get the process-wide token count cache."""
+    return _token_count_cache
+
+
+def get_accurate_token_count(content: Any) -> int:
+    """Return a conservative token estimate for arbitrary content strings."""
+
+    if content is None:
+        return 0
+
+    return _token_count_cache.count(content)
+
+
+def get_accurate_token_counts(contents: Iterable[Any]) -> List[int]:
+    """Token estimates for many pieces of content in one call."""
+    return _token_count_cache.count_many(contents)
+
+
 @dataclass
 class SessionTokenMetrics:
     """Token metrics for a specific session."""
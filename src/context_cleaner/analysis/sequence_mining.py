@@ -0,0 +1,238 @@
+"""
+Sequence Mining
+
+Counting engine for recurring tool-call sequences. Sequences are encoded once
+as integer symbol IDs in a single flat array; n-grams of any length are then
+keyed with numpy (exact base-V packing while it fits in 63 bits, a double
+polynomial rolling hash beyond that) and counted with ``np.unique`` instead of
+materialising a tuple per window in a Python ``Counter``.
+
+Ranking follows ``Counter`` semantics throughout: ties keep the order in which
+patterns (or symbols) were first seen, so results are drop-in replacements for
+the previous ``Counter``-based code.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Moduli/base for the rolling hash used once exact packing would overflow
+_HASH_MOD_1 = 2_147_483_647
+_HASH_MOD_2 = 2_147_483_629
+_HASH_BASE = 1_000_003
+_PACKED_KEY_LIMIT = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class SequencePattern:
+    """A contiguous symbol sequence and the number of times it occurs."""
+
+    symbols: Tuple[Hashable, ...]
+    support: int
+
+    @property
+    def length(self) -> int:
+        return len(self.symbols)
+
+
+class SequenceMiner:
+    """Counts recurring contiguous subsequences across many sequences."""
+
+    def __init__(self, sequences: Iterable[Sequence[Hashable]]):
+        symbol_ids: Dict[Hashable, int] = {}
+        encoded: List[int] = []
+        lengths: List[int] = []
+
+        for sequence in sequences:
+            lengths.append(len(sequence))
+            encoded.extend(symbol_ids.setdefault(s, len(symbol_ids)) for s in sequence)
+
+        self.symbols: List[Hashable] = list(symbol_ids)
+        self._flat = np.array(encoded, dtype=np.int64)
+        self._lengths = np.array(lengths, dtype=np.int64)
+        self._starts = np.concatenate(([0], np.cumsum(self._lengths)[:-1])).astype(
+            np.int64
+        )
+        # Sequence index of every flat position
+        self._owner = np.repeat(np.arange(len(lengths), dtype=np.int64), self._lengths)
+
+    @property
+    def sequence_count(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def max_sequence_length(self) -> int:
+        return int(self._lengths.max()) if len(self._lengths) else 0
+
+    def count_ngrams(
+        self, min_length: int = 2, max_length: Optional[int] = 4, min_support: int = 1
+    ) -> List[SequencePattern]:
+        """
+        Count every n-gram with ``min_length <= n <= max_length``.
+
+        Args:
+            min_length: Shortest n-gram to count
+            max_length: Longest n-gram to count (None for no limit)
+            min_support: Minimum occurrences for a pattern to be returned
+
+        Returns:
+            Patterns in first-occurrence order: by sequence, then length,
+            then position, matching a ``Counter`` filled in that order
+        """
+        upper = self.max_sequence_length
+        if max_length is not None:
+            upper = min(upper, max_length)
+
+        keys: List[Tuple[int, int, int, int]] = []  # (seq, length, pos, count)
+        for length in range(max(1, min_length), upper + 1):
+            positions, counts = self._count_length(length)
+            keep = counts >= min_support
+            positions, counts = positions[keep], counts[keep]
+            owners = self._owner[positions]
+            keys.extend(
+                zip(
+                    owners.tolist(),
+                    [length] * len(positions),
+                    positions.tolist(),
+                    counts.tolist(),
+                )
+            )
+
+        keys.sort()
+        return [
+            SequencePattern(self._decode(position, length), count)
+            for _, length, position, count in keys
+        ]
+
+    def top_k(
+        self,
+        k: Optional[int] = None,
+        min_length: int = 2,
+        max_length: Optional[int] = 4,
+        min_support: int = 1,
+    ) -> List[SequencePattern]:
+        """Most frequent n-grams, ties broken by first occurrence."""
+        patterns = self.count_ngrams(min_length, max_length, min_support)
+        patterns.sort(key=lambda p: p.support, reverse=True)
+        return patterns if k is None else patterns[:k]
+
+    def _count_length(self, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """First flat position and count of every distinct n-gram of ``length``."""
+        valid = self._window_starts(length)
+        if not len(valid):
+            empty = np.array([], dtype=np.int64)
+            return empty, empty
+        window_keys = self._window_keys(valid, length)
+        _, first, counts = np.unique(window_keys, return_index=True, return_counts=True)
+        return valid[first], counts
+
+    def _window_starts(self, length: int) -> np.ndarray:
+        """Flat positions where a window of ``length`` stays inside its sequence."""
+        if not len(self._flat) or length > len(self._flat):
+            return np.array([], dtype=np.int64)
+        positions = np.arange(len(self._flat) - length + 1, dtype=np.int64)
+        ends = (
+            self._starts[self._owner[positions]] + self._lengths[self._owner[positions]]
+        )
+        return positions[positions + length <= ends]
+
+    def _window_keys(self, positions: np.ndarray, length: int) -> np.ndarray:
+        radix = max(1, len(self.symbols))
+        if radix**length <= _PACKED_KEY_LIMIT:
+            keys = np.zeros(len(positions), dtype=np.int64)
+            for offset in range(length):
+                keys = keys * radix + self._flat[positions + offset]
+            return keys
+
+        hash_1 = np.zeros(len(positions), dtype=np.int64)
+        hash_2 = np.zeros(len(positions), dtype=np.int64)
+        for offset in range(length):
+            symbol = self._flat[positions + offset] + 1
+            hash_1 = (hash_1 * _HASH_BASE + symbol) % _HASH_MOD_1
+            hash_2 = (hash_2 * _HASH_BASE + symbol) % _HASH_MOD_2
+        return hash_1 * _HASH_MOD_2 + hash_2
+
+    def _decode(self, position: int, length: int) -> Tuple[Hashable, ...]:
+        return tuple(self.symbols[s] for s in self._flat[position : position + length])
+
+
+def find_common_subsequences(
+    sequences: Iterable[Sequence[Hashable]],
+    min_length: int = 2,
+    max_length: Optional[int] = 4,
+    min_support: int = 2,
+    top_k: Optional[int] = None,
+) -> List[Tuple[List[Hashable], int]]:
+    """Recurring contiguous subsequences as ``(symbols, support)``, most frequent first."""
+    miner = SequenceMiner(sequences)
+    return [
+        (list(p.symbols), p.support)
+        for p in miner.top_k(top_k, min_length, max_length, min_support)
+    ]
+
+
+def most_common_sequence(sequences: Sequence[Sequence[Hashable]]) -> List[Hashable]:
+    """
+    Position-wise consensus of the sequences sharing the most common length.
+
+    Ties (for the length and for each position) go to the value seen first.
+    """
+    if not sequences:
+        return []
+
+    lengths = np.array([len(seq) for seq in sequences], dtype=np.int64)
+    length_values, length_first, length_counts = np.unique(
+        lengths, return_index=True, return_counts=True
+    )
+    best = np.flatnonzero(length_counts == length_counts.max())
+    common_length = int(length_values[best[np.argmin(length_first[best])]])
+    if common_length == 0:
+        return []
+
+    rows = [seq for seq in sequences if len(seq) == common_length]
+    symbol_ids: Dict[Hashable, int] = {}
+    matrix = np.array(
+        [[symbol_ids.setdefault(s, len(symbol_ids)) for s in row] for row in rows],
+        dtype=np.int64,
+    )
+    symbols = list(symbol_ids)
+
+    result = []
+    for column in matrix.T:
+        values, first, counts = np.unique(column, return_index=True, return_counts=True)
+        best = np.flatnonzero(counts == counts.max())
+        result.append(symbols[int(values[best[np.argmin(first[best])]])])
+    return result
+
+
+def jaccard_to_reference(
+    sequences: Sequence[Sequence[Hashable]], reference: Sequence[Hashable]
+) -> np.ndarray:
+    """Set Jaccard similarity of every sequence to ``reference`` (0.0 if either is empty)."""
+    reference_set = set(reference)
+    result = np.zeros(len(sequences), dtype=np.float64)
+    if not reference_set:
+        return result
+
+    lengths = np.array([len(seq) for seq in sequences], dtype=np.int64)
+    owner = np.repeat(np.arange(len(sequences), dtype=np.int64), lengths)
+    symbol_ids: Dict[Hashable, int] = {s: i for i, s in enumerate(reference_set)}
+    flat = np.array(
+        [symbol_ids.setdefault(s, len(symbol_ids)) for seq in sequences for s in seq],
+        dtype=np.int64,
+    )
+    if not len(flat):
+        return result
+
+    # Distinct (sequence, symbol) pairs give each sequence's symbol set
+    pairs = np.unique(owner * len(symbol_ids) + flat)
+    pair_owner = pairs // len(symbol_ids)
+    in_reference = (pairs % len(symbol_ids)) < len(reference_set)
+    set_sizes = np.bincount(pair_owner, minlength=len(sequences))
+    shared = np.bincount(pair_owner[in_reference], minlength=len(sequences))
+
+    union = set_sizes + len(reference_set) - shared
+    non_empty = lengths > 0
+    np.divide(shared, union, out=result, where=non_empty)
+    return result
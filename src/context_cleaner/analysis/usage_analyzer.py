@@ -16,6 +16,11 @@ import re
 from .models import SessionAnalysis, ToolUsage, CacheConfig
 from .session_parser import SessionCacheParser
 from .discovery import CacheDiscoveryService, CacheLocation
+from .sequence_mining import (
+    find_common_subsequences,
+    jaccard_to_reference,
+    most_common_sequence,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -340,32 +345,9 @@ class UsagePatternAnalyzer:
 
     def _find_most_common_sequence(self, sequences: List[List[str]]) -> List[str]:
         """Find the most representative sequence from a list of sequences."""
-        if not sequences:
-            return []
-
-        # Find the most common length
-        lengths = [len(seq) for seq in sequences]
-        most_common_length = Counter(lengths).most_common(1)[0][0]
-
-        # Filter sequences by most common length
-        filtered_sequences = [
-            seq for seq in sequences if len(seq) == most_common_length
-        ]
-
-        if not filtered_sequences:
-            return sequences[0] if sequences else []
-
-        # Find most common element at each position
-        result = []
-        for i in range(most_common_length):
-            elements_at_position = [
-                seq[i] for seq in filtered_sequences if i < len(seq)
-            ]
-            if elements_at_position:
-                most_common = Counter(elements_at_position).most_common(1)[0][0]
-                result.append(most_common)
-
-        return result
+        # Position-wise most common element among sequences of the most
+        # common length
+        return most_common_sequence(sequences)
 
     def _calculate_pattern_confidence(
         self, file_sequences: List[List[str]], tool_sequences: List[List[str]]
@@ -379,11 +361,8 @@ class UsagePatternAnalyzer:
         tool_consistency = 0.0
         if tool_sequences:
             most_common_tools = self._find_most_common_sequence(tool_sequences)
-            matches = sum(
-                1
-                for seq in tool_sequences
-                if self._sequence_similarity(seq, most_common_tools) >= 0.7
-            )
+            similarities = jaccard_to_reference(tool_sequences, most_common_tools)
+            matches = int((similarities >= 0.7).sum())
             tool_consistency = matches / len(tool_sequences)
 
         # Calculate file type consistency
@@ -391,28 +370,13 @@ class UsagePatternAnalyzer:
         if file_sequences:
             file_extensions = [[Path(f).suffix for f in seq] for seq in file_sequences]
             most_common_exts = self._find_most_common_sequence(file_extensions)
-            matches = sum(
-                1
-                for seq in file_extensions
-                if self._sequence_similarity(seq, most_common_exts) >= 0.7
-            )
+            similarities = jaccard_to_reference(file_extensions, most_common_exts)
+            matches = int((similarities >= 0.7).sum())
             file_type_consistency = matches / len(file_extensions)
 
         # Combine confidences
         return (tool_consistency + file_type_consistency) / 2
 
-    def _sequence_similarity(self, seq1: List[str], seq2: List[str]) -> float:
-        """Calculate similarity between two sequences."""
-        if not seq1 or not seq2:
-            return 0.0
-
-        # Use Jaccard similarity for simplicity
-        set1, set2 = set(seq1), set(seq2)
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-
-        return intersection / union if union > 0 else 0.0
-
     def _generate_pattern_description(
         self, tools: List[str], files: List[str]
     ) -> Tuple[str, str]:
@@ -542,24 +506,14 @@ class UsagePatternAnalyzer:
         self, sessions: List[SessionAnalysis]
     ) -> List[Tuple[List[str], int]]:
         """Analyze common tool usage sequences."""
-        sequence_counter = Counter()
-
-        for session in sessions:
-            tools = [op.tool_name for op in session.file_operations]
-
-            # Generate subsequences of length 2-4
-            for length in range(2, min(5, len(tools) + 1)):
-                for i in range(len(tools) - length + 1):
-                    subsequence = tuple(tools[i : i + length])
-                    sequence_counter[subsequence] += 1
-
-        # Convert to list format
-        common_sequences = []
-        for sequence, count in sequence_counter.most_common(20):
-            if count >= 2:  # Only include sequences that appear multiple times
-                common_sequences.append((list(sequence), count))
+        tool_sequences = [
+            [op.tool_name for op in session.file_operations] for session in sessions
+        ]
 
-        return common_sequences
+        # Top 20 subsequences of length 2-4 that appear multiple times
+        return find_common_subsequences(
+            tool_sequences, min_length=2, max_length=4, min_support=2, top_k=20
+        )
 
     def _analyze_duration_patterns(
         self, sessions: List[SessionAnalysis]
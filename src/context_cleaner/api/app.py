@@ -16,13 +16,14 @@ from fastapi import (
     Request,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from typing import List, Optional, Dict, Any
 import logging
 import asyncio
 import uuid
+import time
 import traceback
 from datetime import datetime
 
@@ -44,12 +45,18 @@ from .cache import MultiLevelCache, InMemoryCache
 from .cache_manager import AdvancedCacheManager
 from .response_optimization import (
     CompressionMiddleware,
+    EncodedResponseCache,
     OptimizedJSONResponse,
     ResponseStreamFactory,
     create_optimized_response,
     performance_metrics,
 )
 from .websocket import ConnectionManager, EventBus, HeartbeatManager
+from context_cleaner.monitoring.metrics_registry import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    get_metrics_registry,
+)
+from context_cleaner.monitoring.sampling_profiler import get_sampling_profiler
 from context_cleaner.telemetry.clients.clickhouse_client import ClickHouseClient
 from context_cleaner.telemetry.context_rot.config import (
     ApplicationConfig,
@@ -82,6 +89,18 @@ from context_cleaner.optimization.distributed_execution import (
     DistributedTaskCoordinator,
     NodeStatus,
 )
+from context_cleaner.optimization.advanced_reports import (
+    AdvancedReportingSystem,
+    ReportFormat,
+    ReportType,
+)
+from context_cleaner.optimization.cache_dashboard import CacheEnhancedDashboard
+from context_cleaner.optimization.cross_session_analytics import (
+    CrossSessionAnalyticsEngine,
+)
+from context_cleaner.optimization.intelligent_recommender import (
+    IntelligentRecommendationEngine,
+)
 from context_cleaner.optimization.task_scheduler import (
     AdvancedTaskScheduler,
     ScheduleType,
@@ -94,6 +113,13 @@ from context_cleaner.optimization.task_scheduler import (
 logger = logging.getLogger(__name__)
 
 
+def _response_envelope(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """APIResponse fields, without data, for a pre-encoded payload"""
+    return APIResponse(
+        success=True, metadata=metadata, request_id=str(uuid.uuid4())
+    ).model_dump(exclude={"data"})
+
+
 def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
     """
     Create and configure the FastAPI application
@@ -133,6 +159,33 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
         allow_headers=["*"],
     )
 
+    metrics_registry = get_metrics_registry()
+    request_seconds = metrics_registry.histogram(
+        "context_cleaner_http_request_duration_seconds",
+        "HTTP request latency by route",
+        ["method", "route", "status"],
+    )
+
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        """Time each request under its route template, not the raw path"""
+        if not metrics_registry.enabled:
+            return await call_next(request)
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            request_seconds.observe(
+                time.perf_counter() - start,
+                method=request.method,
+                route=getattr(route, "path", "unmatched"),
+                status=status,
+            )
+
     # Global exception handlers for unified error responses
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
@@ -244,6 +297,7 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
     app.state.clickhouse_client = None
     app.state.cache_service = None
     app.state.advanced_cache_manager = None
+    app.state.encoded_responses = EncodedResponseCache()
     app.state.dashboard_service = None
     app.state.telemetry_service = None
     app.state.connection_manager = None
@@ -255,6 +309,17 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
     app.state.task_scheduler = None
     app.state.distributed_coordinator = None
 
+    def _drop_encoded_responses(patterns: List[str]):
+        """Keep encoded responses in step with cache invalidations"""
+        for pattern in patterns:
+            app.state.encoded_responses.invalidate(pattern)
+
+    async def _track_encoded_response(cache_key: str, policy_name: str):
+        """Let dependency invalidation reach an encoded response"""
+        manager = app.state.advanced_cache_manager
+        if manager is not None:
+            await manager.track_dependencies(cache_key, manager.policies[policy_name])
+
     @app.on_event("startup")
     async def startup_event():
         """Initialize services on startup"""
@@ -284,6 +349,9 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
             app.state.advanced_cache_manager = AdvancedCacheManager(
                 app.state.cache_service
             )
+            app.state.advanced_cache_manager.add_invalidation_listener(
+                _drop_encoded_responses
+            )
 
             # Start memory profiling for production monitoring
             if config.enable_debug_mode:
@@ -310,6 +378,10 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
                 cache_service=app.state.cache_service,
                 event_bus=app.state.event_bus or EventBus(),
             )
+            app.state.dashboard_service.event_bus.subscribe(
+                "cache.invalidated",
+                lambda event: _drop_encoded_responses([event["pattern"]]),
+            )
 
             app.state.telemetry_service = TelemetryService(
                 telemetry_repo=telemetry_repo, cache_service=app.state.cache_service
@@ -389,6 +461,9 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
             if app.state.heartbeat_manager:
                 await app.state.heartbeat_manager.stop()
 
+            if app.state.advanced_cache_manager:
+                await app.state.advanced_cache_manager.close()
+
             if app.state.clickhouse_client:
                 await app.state.clickhouse_client.close()
 
@@ -468,16 +543,26 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
         response_model=APIResponse[DashboardOverviewResponse],
     )
     async def get_dashboard_overview(
+        request: Request,
         dashboard_service: DashboardService = Depends(get_dashboard_service),
     ):
         """Get complete dashboard overview"""
+        cache_key = "dashboard:overview:v1"
+        cached_response = app.state.encoded_responses.respond(
+            cache_key,
+            request,
+            _response_envelope({"endpoint": "dashboard/overview", "cached": True}),
+        )
+        if cached_response is not None:
+            return cached_response
+
         try:
             overview = await dashboard_service.get_dashboard_overview()
-            return APIResponse(
-                success=True,
-                data=overview,
-                metadata={"endpoint": "dashboard/overview", "cached": False},
-                request_id=str(uuid.uuid4()),
+            entry = app.state.encoded_responses.put(cache_key, overview.model_dump())
+            await _track_encoded_response(cache_key, "dashboard_overview")
+            return entry.to_response(
+                request,
+                _response_envelope({"endpoint": "dashboard/overview", "cached": False}),
             )
         except Exception as e:
             logger.error(f"Dashboard overview failed: {e}")
@@ -492,6 +577,7 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
         "/api/v1/widgets/{widget_type}", response_model=APIResponse[Dict[str, Any]]
     )
     async def get_widget_data(
+        request: Request,
         widget_type: str = Path(..., description="Widget type identifier"),
         session_id: Optional[str] = Query(
             None, description="Optional session ID filter"
@@ -501,6 +587,22 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
         dashboard_service: DashboardService = Depends(get_dashboard_service),
     ):
         """Get data for specific widget"""
+        cache_key = f"widget:{widget_type}:{session_id or 'global'}:{time_range_days}"
+        if not force_refresh:
+            cached_response = app.state.encoded_responses.respond(
+                cache_key,
+                request,
+                _response_envelope(
+                    {
+                        "widget_type": widget_type,
+                        "time_range_days": time_range_days,
+                        "cached": True,
+                    }
+                ),
+            )
+            if cached_response is not None:
+                return cached_response
+
         try:
             widget_data = await dashboard_service.get_widget_data(
                 widget_type=widget_type,
@@ -509,15 +611,17 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
                 force_refresh=force_refresh,
             )
 
-            return APIResponse(
-                success=True,
-                data=widget_data.to_dict(),
-                metadata={
-                    "widget_type": widget_type,
-                    "time_range_days": time_range_days,
-                    "cached": not force_refresh,
-                },
-                request_id=str(uuid.uuid4()),
+            entry = app.state.encoded_responses.put(cache_key, widget_data.to_dict())
+            await _track_encoded_response(cache_key, "widget_data")
+            return entry.to_response(
+                request,
+                _response_envelope(
+                    {
+                        "widget_type": widget_type,
+                        "time_range_days": time_range_days,
+                        "cached": not force_refresh,
+                    }
+                ),
             )
         except Exception as e:
             logger.error(f"Widget data failed for {widget_type}: {e}")
@@ -631,6 +735,7 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
         """Invalidate cache entries"""
         try:
             success = await dashboard_service.invalidate_cache(request.pattern)
+            app.state.encoded_responses.invalidate(request.pattern)
             return APIResponse(
                 success=success,
                 data={"pattern": request.pattern, "invalidated": success},
@@ -941,6 +1046,7 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
             stats = {
                 "cache_manager_stats": await app.state.advanced_cache_manager.get_performance_stats(),
                 "response_optimization_stats": performance_metrics.get_stats(),
+                "encoded_response_cache_stats": app.state.encoded_responses.get_stats(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -952,6 +1058,63 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
                 {"error": str(e), "timestamp": datetime.now().isoformat()}
             )
 
+    # Sampling profiler endpoints
+    @app.post("/api/v1/performance/profiler/start")
+    async def start_profiler(
+        hz: int = Query(100, ge=1, le=1000, description="Samples per second"),
+        duration_seconds: Optional[float] = Query(
+            None, gt=0, description="Stop automatically after this many seconds"
+        ),
+        reset: bool = Query(True, description="Discard previously collected samples"),
+    ):
+        """Start the built-in sampling profiler"""
+        profiler = get_sampling_profiler()
+        if reset and not profiler.running:
+            profiler.reset()
+        started = profiler.start(hz=hz, duration_seconds=duration_seconds)
+        return create_optimized_response(
+            {
+                "success": started,
+                "message": None if started else "profiler already running",
+                "status": profiler.get_status(),
+                "timestamp": datetime.now().isoformat(),
+            }
+        )
+
+    @app.post("/api/v1/performance/profiler/stop")
+    async def stop_profiler():
+        """Stop the sampling profiler, keeping its samples"""
+        profiler = get_sampling_profiler()
+        stopped = await asyncio.to_thread(profiler.stop)
+        return create_optimized_response(
+            {
+                "success": stopped,
+                "status": profiler.get_status(),
+                "timestamp": datetime.now().isoformat(),
+            }
+        )
+
+    @app.get("/api/v1/performance/profiler")
+    async def get_profiler_report(
+        limit: int = Query(20, ge=1, le=500, description="Hot functions to return")
+    ):
+        """Profiler status and the hottest functions sampled so far"""
+        report = get_sampling_profiler().get_report(limit=limit)
+        report["timestamp"] = datetime.now().isoformat()
+        return create_optimized_response(report)
+
+    @app.get("/api/v1/performance/profiler/flamegraph")
+    async def get_profiler_flamegraph():
+        """Folded stacks for flamegraph.pl, speedscope or inferno"""
+        return PlainTextResponse(get_sampling_profiler().folded_stacks())
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint for the process metrics registry"""
+        return PlainTextResponse(
+            metrics_registry.render(), media_type=METRICS_CONTENT_TYPE
+        )
+
     # Streaming endpoint for large datasets
     @app.get("/api/v1/telemetry/sessions/stream")
     async def stream_sessions(
@@ -998,6 +1161,51 @@ def create_app(config: Optional[ApplicationConfig] = None) -> FastAPI:
                 {"error": str(e), "timestamp": datetime.now().isoformat()}
             )
 
+    # Streaming endpoint for usage reports
+    @app.get("/api/v1/reports/{report_type}")
+    async def stream_usage_report(
+        report_type: ReportType,
+        format: str = Query(
+            "json",
+            pattern="^(json|csv|markdown|html)$",
+            description="Report format",
+        ),
+        days: int = Query(30, ge=1, le=365, description="Time period in days"),
+    ):
+        """Stream a usage report section by section"""
+        dashboard_data = await CacheEnhancedDashboard.from_config(
+            config
+        ).generate_dashboard()
+        cross_session_insights = (
+            await CrossSessionAnalyticsEngine().analyze_cross_session_patterns(
+                [], dashboard_data.correlation_insights, time_window_days=days
+            )
+        )
+        recommendations = await IntelligentRecommendationEngine().generate_intelligent_recommendations(
+            health_metrics=dashboard_data.health_metrics,
+            usage_summary=dashboard_data.usage_summary,
+            token_analysis=dashboard_data.token_analysis,
+            temporal_insights=dashboard_data.temporal_insights,
+            enhanced_analysis=dashboard_data.enhanced_analysis,
+            correlation_insights=dashboard_data.correlation_insights,
+            context_size=dashboard_data.context_size,
+        )
+
+        report_chunks = AdvancedReportingSystem().stream_report(
+            dashboard_data,
+            cross_session_insights,
+            recommendations,
+            report_type=report_type,
+            output_format=ReportFormat(format),
+            time_period_days=days,
+        )
+        extension = "md" if format == "markdown" else format
+        return ResponseStreamFactory.create_report_stream(
+            report_chunks,
+            output_format=format,
+            filename=f"{report_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+        )
+
     # Cache warmup endpoint
     @app.post("/api/v1/cache/warmup")
     async def warmup_cache():
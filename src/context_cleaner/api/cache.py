@@ -6,7 +6,7 @@ optimized for dashboard and telemetry data patterns.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable
 import json
 import logging
 import asyncio
@@ -39,6 +39,13 @@ class CacheService(ABC):
         """Clear all cache entries"""
         pass
 
+    async def invalidate_keys(self, keys: Iterable[str]) -> int:
+        """Invalidate exact keys in one batch, returning how many were requested"""
+        keys = list(keys)
+        for key in keys:
+            await self.invalidate(key)
+        return len(keys)
+
 
 class MultiLevelCache(CacheService):
     """Multi-level cache implementation with memory and Redis layers"""
@@ -188,6 +195,29 @@ class MultiLevelCache(CacheService):
             logger.error(f"Cache invalidation error for pattern {pattern}: {e}")
             return False
 
+    async def invalidate_keys(self, keys: Iterable[str]) -> int:
+        """Invalidate exact keys with one memory pass and one Redis DELETE"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return 0
+
+        removed = set()
+        for key in keys:
+            if self.memory_cache.pop(key, None) is not None:
+                removed.add(key)
+        if removed:
+            self._access_order = [k for k in self._access_order if k not in removed]
+
+        await self._ensure_redis_connection()
+        if self._redis_available and self.redis_client:
+            try:
+                await self.redis_client.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Redis batch invalidation error: {e}")
+
+        logger.debug(f"Cache invalidated {len(keys)} keys in batch")
+        return len(keys)
+
     async def clear(self) -> bool:
         """Clear all cache entries"""
         try:
@@ -343,6 +373,13 @@ class InMemoryCache(CacheService):
             logger.error(f"In-memory cache invalidate error: {e}")
             return False
 
+    async def invalidate_keys(self, keys: Iterable[str]) -> int:
+        keys = list(dict.fromkeys(keys))
+        removed = {key for key in keys if self.cache.pop(key, None) is not None}
+        if removed:
+            self._access_order = [k for k in self._access_order if k not in removed]
+        return len(keys)
+
     async def clear(self) -> bool:
         self.cache.clear()
         self._access_order.clear()
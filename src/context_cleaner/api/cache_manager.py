@@ -7,15 +7,31 @@ for high-frequency dashboard endpoints with real-time data requirements.
 
 import asyncio
 import hashlib
+import heapq
 import json
 import logging
+import math
+import random
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable, Union, Set
+from typing import (
+    Dict,
+    Any,
+    List,
+    Optional,
+    Callable,
+    Union,
+    Set,
+    Iterable,
+    Tuple,
+    Awaitable,
+)
 from functools import wraps
 from dataclasses import dataclass
 from enum import Enum
 
 from .cache import CacheService
+from ..monitoring.metrics_registry import CACHE_REQUESTS
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +56,8 @@ class CachePolicy:
     dependency_keys: List[str] = None
     refresh_ahead_factor: float = 0.8  # Refresh when TTL reaches 80%
     enable_compression: bool = False
+    # Scales probabilistic early refresh by fetch cost; 0 disables it
+    early_expiration_beta: float = 1.0
 
 
 class CacheKeyGenerator:
@@ -89,46 +107,82 @@ class CacheKeyGenerator:
 
 
 class DependencyTracker:
-    """Track cache dependencies for intelligent invalidation"""
+    """
+    In-process dependency graph for intelligent invalidation.
+
+    Forward (dependency -> cache keys) and reverse (cache key -> dependencies)
+    indexes are kept in memory. Each cache key also records when its cache
+    entry expires, so entries the cache has already dropped are pruned from
+    the graph instead of accumulating, and invalidation removes all dependents
+    of a key with a single batched cache call.
+    """
 
     def __init__(self, cache_service: CacheService):
         self.cache = cache_service
         self._dependencies: Dict[str, Set[str]] = {}
         self._reverse_deps: Dict[str, Set[str]] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Called with the invalidated cache keys so caches outside
+        # cache_service can drop their copies
+        self._invalidation_listeners: List[Callable[[List[str]], Any]] = []
+
+    def add_invalidation_listener(self, listener: Callable[[List[str]], Any]):
+        """Register a callback run after cache keys are invalidated"""
+        self._invalidation_listeners.append(listener)
+
+    def notify_invalidated(self, cache_keys: List[str]):
+        """Pass invalidated cache keys to every listener"""
+        for listener in self._invalidation_listeners:
+            try:
+                listener(cache_keys)
+            except Exception as e:
+                logger.error(f"Cache invalidation listener failed: {e}")
 
-    async def add_dependency(self, cache_key: str, dependency_key: str):
+    async def add_dependency(
+        self, cache_key: str, dependency_key: str, ttl_seconds: Optional[int] = None
+    ):
         """Add dependency relationship"""
-        if dependency_key not in self._dependencies:
-            self._dependencies[dependency_key] = set()
-        self._dependencies[dependency_key].add(cache_key)
+        await self.add_dependencies(cache_key, [dependency_key], ttl_seconds)
+
+    async def add_dependencies(
+        self,
+        cache_key: str,
+        dependency_keys: Iterable[str],
+        ttl_seconds: Optional[int] = None,
+    ):
+        """Add several dependency relationships for one cache key"""
+        self.prune_expired()
 
-        if cache_key not in self._reverse_deps:
-            self._reverse_deps[cache_key] = set()
-        self._reverse_deps[cache_key].add(dependency_key)
+        for dependency_key in dependency_keys:
+            self._dependencies.setdefault(dependency_key, set()).add(cache_key)
+            self._reverse_deps.setdefault(cache_key, set()).add(dependency_key)
+
+        if ttl_seconds is not None:
+            expires_at = time.monotonic() + ttl_seconds
+            self._expires_at[cache_key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, cache_key))
 
     async def invalidate_dependents(self, dependency_key: str) -> int:
-        """Invalidate all cache entries dependent on this key"""
-        if dependency_key not in self._dependencies:
-            return 0
+        """Invalidate all cache entries dependent on this key
 
-        dependent_keys = self._dependencies[dependency_key].copy()
-        invalidated_count = 0
+        Graph entries are only dropped once the cache entries are deleted, so
+        a failed invalidation raises and can be retried.
+        """
+        dependent_keys = self._dependencies.get(dependency_key)
+        if not dependent_keys:
+            return 0
 
-        for cache_key in dependent_keys:
-            try:
-                await self.cache.invalidate(cache_key)
-                invalidated_count += 1
-                logger.debug(f"Invalidated dependent cache key: {cache_key}")
-            except Exception as e:
-                logger.warning(f"Failed to invalidate dependent key {cache_key}: {e}")
+        dependent_keys = list(dependent_keys)
+        try:
+            invalidated_count = await self.cache.invalidate_keys(dependent_keys)
+        except Exception as e:
+            logger.error(f"Failed to invalidate dependents of {dependency_key}: {e}")
+            raise
 
-        # Clean up dependency tracking
-        del self._dependencies[dependency_key]
         for cache_key in dependent_keys:
-            if cache_key in self._reverse_deps:
-                self._reverse_deps[cache_key].discard(dependency_key)
-                if not self._reverse_deps[cache_key]:
-                    del self._reverse_deps[cache_key]
+            self._forget(cache_key)
+        self.notify_invalidated(dependent_keys)
 
         logger.info(
             f"Invalidated {invalidated_count} cache entries for dependency: {dependency_key}"
@@ -137,22 +191,97 @@ class DependencyTracker:
 
     async def remove_cache_dependencies(self, cache_key: str):
         """Remove all dependencies for a cache key"""
-        if cache_key in self._reverse_deps:
-            dependencies = self._reverse_deps[cache_key].copy()
-            for dep_key in dependencies:
-                if dep_key in self._dependencies:
-                    self._dependencies[dep_key].discard(cache_key)
-                    if not self._dependencies[dep_key]:
-                        del self._dependencies[dep_key]
-            del self._reverse_deps[cache_key]
+        self._forget(cache_key)
+
+    def prune_expired(self) -> int:
+        """Drop graph entries for cache keys whose TTL has passed"""
+        now = time.monotonic()
+        pruned = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, cache_key = heapq.heappop(self._expiry_heap)
+            # Skip stale heap records for keys that were re-stored since
+            if self._expires_at.get(cache_key) == expires_at:
+                self._forget(cache_key)
+                pruned += 1
+        return pruned
+
+    def _forget(self, cache_key: str):
+        self._expires_at.pop(cache_key, None)
+        for dep_key in self._reverse_deps.pop(cache_key, ()):
+            dependents = self._dependencies.get(dep_key)
+            if dependents is not None:
+                dependents.discard(cache_key)
+                if not dependents:
+                    del self._dependencies[dep_key]
+
+
+class RefreshAheadScheduler:
+    """
+    Bounded background refresher with single-flight semantics.
+
+    At most one refresh per cache key is in flight, at most
+    ``max_concurrent`` refreshes run at once, and refreshes beyond
+    ``max_pending`` are dropped rather than queued, since the stale entry is
+    still being served and the next read will try again.
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_pending: int = 64):
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def schedule(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> bool:
+        """Start a background refresh for ``key``; False if skipped"""
+        if key in self._tasks or len(self._tasks) >= self.max_pending:
+            return False
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        task = asyncio.create_task(self._run(refresh))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    def is_refreshing(self, key: str) -> bool:
+        return key in self._tasks
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    async def _run(self, refresh: Callable[[], Awaitable[Any]]):
+        async with self._semaphore:
+            await refresh()
+
+    async def close(self):
+        """Cancel outstanding refreshes"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class AdvancedCacheManager:
     """Advanced cache manager with intelligent strategies and invalidation"""
 
-    def __init__(self, cache_service: CacheService):
+    def __init__(
+        self,
+        cache_service: CacheService,
+        max_concurrent_refreshes: int = 4,
+        max_pending_refreshes: int = 64,
+    ):
         self.cache = cache_service
         self.dependency_tracker = DependencyTracker(cache_service)
+        self.refresh_scheduler = RefreshAheadScheduler(
+            max_concurrent=max_concurrent_refreshes,
+            max_pending=max_pending_refreshes,
+        )
+
+        # Cache misses being fetched, shared by concurrent callers
+        self._inflight_fetches: Dict[str, asyncio.Future] = {}
 
         # Policy configurations for different endpoint types
         self.policies: Dict[str, CachePolicy] = {
@@ -193,6 +322,8 @@ class AdvancedCacheManager:
             "cache_misses": 0,
             "invalidations": 0,
             "refresh_ahead_hits": 0,
+            "refresh_ahead_skipped": 0,
+            "single_flight_waits": 0,
             "total_response_time_saved_ms": 0,
         }
 
@@ -219,25 +350,20 @@ class AdvancedCacheManager:
             )
             if cached_data is not None:
                 self.stats["cache_hits"] += 1
+                CACHE_REQUESTS.inc(cache="api", result="hit")
                 saved_time = (datetime.now() - start_time).total_seconds() * 1000
                 self.stats["total_response_time_saved_ms"] += saved_time
                 return cached_data
 
         # Cache miss - fetch fresh data
         self.stats["cache_misses"] += 1
+        CACHE_REQUESTS.inc(cache="api", result="miss")
         logger.debug(f"Cache miss for endpoint: {endpoint}")
 
         try:
-            # Fetch fresh data
-            if asyncio.iscoroutinefunction(data_fetcher):
-                fresh_data = await data_fetcher()
-            else:
-                fresh_data = data_fetcher()
-
-            # Store in cache with policy
-            await self._store_with_policy(cache_key, fresh_data, policy, endpoint)
-
-            return fresh_data
+            return await self._fetch_single_flight(
+                cache_key, data_fetcher, policy, endpoint
+            )
 
         except Exception as e:
             logger.error(f"Error fetching data for {endpoint}: {e}")
@@ -248,6 +374,68 @@ class AdvancedCacheManager:
                 return stale_data
             raise
 
+    async def _fetch_single_flight(
+        self,
+        cache_key: str,
+        data_fetcher: Callable,
+        policy: CachePolicy,
+        endpoint: str,
+    ) -> Any:
+        """Fetch and store fresh data, sharing one fetch among concurrent misses
+
+        Waiters get the leader's result or exception. If the leader is
+        cancelled, the waiters retry and one of them takes over the fetch.
+        """
+        inflight = self._inflight_fetches.get(cache_key)
+        while inflight is not None:
+            self.stats["single_flight_waits"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    # This waiter was cancelled, not the leader
+                    raise
+            inflight = self._inflight_fetches.get(cache_key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_fetches[cache_key] = future
+        try:
+            fresh_data = await self._fetch_and_store(
+                cache_key, data_fetcher, policy, endpoint
+            )
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved in case there are none
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(fresh_data)
+            return fresh_data
+        finally:
+            self._inflight_fetches.pop(cache_key, None)
+
+    async def _fetch_and_store(
+        self,
+        cache_key: str,
+        data_fetcher: Callable,
+        policy: CachePolicy,
+        endpoint: str,
+    ) -> Any:
+        started = time.perf_counter()
+        if asyncio.iscoroutinefunction(data_fetcher):
+            fresh_data = await data_fetcher()
+        else:
+            fresh_data = data_fetcher()
+        compute_ms = (time.perf_counter() - started) * 1000
+
+        await self._store_with_policy(
+            cache_key, fresh_data, policy, endpoint, compute_ms=compute_ms
+        )
+        return fresh_data
+
     async def _get_with_refresh_ahead(
         self, cache_key: str, policy: CachePolicy, data_fetcher: Callable
     ) -> Optional[Dict[str, Any]]:
@@ -259,34 +447,52 @@ class AdvancedCacheManager:
 
         # Check if refresh-ahead is needed
         if isinstance(cached_entry, dict) and "cached_at" in cached_entry:
-            cached_at = datetime.fromisoformat(cached_entry["cached_at"])
-            age_seconds = (datetime.now() - cached_at).total_seconds()
-            refresh_threshold = policy.ttl_seconds * policy.refresh_ahead_factor
-
-            if age_seconds >= refresh_threshold:
-                # Trigger background refresh
-                self.stats["refresh_ahead_hits"] += 1
-                asyncio.create_task(
-                    self._background_refresh(cache_key, data_fetcher, policy)
-                )
-                logger.debug(f"Background refresh triggered for key: {cache_key}")
+            if self._should_refresh_early(cached_entry, policy):
+                if self.refresh_scheduler.schedule(
+                    cache_key,
+                    lambda: self._background_refresh(cache_key, data_fetcher, policy),
+                ):
+                    self.stats["refresh_ahead_hits"] += 1
+                    CACHE_REQUESTS.inc(cache="api", result="refresh_ahead")
+                    logger.debug(f"Background refresh triggered for key: {cache_key}")
+                else:
+                    self.stats["refresh_ahead_skipped"] += 1
 
         return (
             cached_entry.get("data") if isinstance(cached_entry, dict) else cached_entry
         )
 
+    @staticmethod
+    def _should_refresh_early(
+        cached_entry: Dict[str, Any], policy: CachePolicy
+    ) -> bool:
+        """
+        Probabilistic early expiration (XFetch).
+
+        The refresh threshold is pulled forward by a random amount scaled by
+        how long the data took to compute, so concurrent readers of a hot key
+        spread their refreshes out instead of all firing at the threshold.
+        Past the threshold a refresh is always requested.
+        """
+        cached_at = datetime.fromisoformat(cached_entry["cached_at"])
+        age_seconds = (datetime.now() - cached_at).total_seconds()
+        refresh_threshold = policy.ttl_seconds * policy.refresh_ahead_factor
+
+        compute_seconds = cached_entry.get("compute_ms", 0) / 1000
+        jitter = (
+            compute_seconds
+            * policy.early_expiration_beta
+            * -math.log(1.0 - random.random())
+        )
+        return age_seconds + jitter >= refresh_threshold
+
     async def _background_refresh(
         self, cache_key: str, data_fetcher: Callable, policy: CachePolicy
     ):
         """Background refresh of cache data"""
         try:
-            if asyncio.iscoroutinefunction(data_fetcher):
-                fresh_data = await data_fetcher()
-            else:
-                fresh_data = data_fetcher()
-
-            await self._store_with_policy(
-                cache_key, fresh_data, policy, "background_refresh"
+            await self._fetch_and_store(
+                cache_key, data_fetcher, policy, "background_refresh"
             )
             logger.debug(f"Background refresh completed for key: {cache_key}")
 
@@ -294,7 +500,12 @@ class AdvancedCacheManager:
             logger.warning(f"Background refresh failed for {cache_key}: {e}")
 
     async def _store_with_policy(
-        self, cache_key: str, data: Any, policy: CachePolicy, endpoint: str
+        self,
+        cache_key: str,
+        data: Any,
+        policy: CachePolicy,
+        endpoint: str,
+        compute_ms: float = 0.0,
     ):
         """Store data in cache according to policy"""
 
@@ -302,6 +513,7 @@ class AdvancedCacheManager:
         cache_entry = {
             "data": data,
             "cached_at": datetime.now().isoformat(),
+            "compute_ms": compute_ms,
             "policy": policy.strategy.value,
             "endpoint": endpoint,
         }
@@ -309,13 +521,23 @@ class AdvancedCacheManager:
         # Store in cache
         await self.cache.set(cache_key, cache_entry, ttl=policy.ttl_seconds)
 
-        # Set up dependencies if configured
+        await self.track_dependencies(cache_key, policy)
+
+    async def track_dependencies(self, cache_key: str, policy: CachePolicy):
+        """Invalidate cache_key along with the policy's dependency keys"""
         if policy.dependency_keys:
-            for dep_key in policy.dependency_keys:
-                dependency_key = CacheKeyGenerator.generate_dependency_key(
-                    dep_key, "global"
-                )
-                await self.dependency_tracker.add_dependency(cache_key, dependency_key)
+            await self.dependency_tracker.add_dependencies(
+                cache_key,
+                [
+                    CacheKeyGenerator.generate_dependency_key(dep_key, "global")
+                    for dep_key in policy.dependency_keys
+                ],
+                ttl_seconds=policy.ttl_seconds,
+            )
+
+    def add_invalidation_listener(self, listener: Callable[[List[str]], Any]):
+        """Register a callback run with dependency-invalidated cache keys"""
+        self.dependency_tracker.add_invalidation_listener(listener)
 
     async def invalidate_by_dependency(
         self, resource_type: str, resource_id: str = "global"
@@ -383,6 +605,9 @@ class AdvancedCacheManager:
                 "hit_rate_percent": round(hit_rate, 2),
                 "invalidations": self.stats["invalidations"],
                 "refresh_ahead_hits": self.stats["refresh_ahead_hits"],
+                "refresh_ahead_skipped": self.stats["refresh_ahead_skipped"],
+                "refreshes_in_flight": self.refresh_scheduler.pending,
+                "single_flight_waits": self.stats["single_flight_waits"],
                 "total_response_time_saved_ms": self.stats[
                     "total_response_time_saved_ms"
                 ],
@@ -400,6 +625,10 @@ class AdvancedCacheManager:
             },
         }
 
+    async def close(self):
+        """Cancel background refreshes"""
+        await self.refresh_scheduler.close()
+
     def register_policy(self, endpoint: str, policy: CachePolicy):
         """Register custom cache policy for endpoint"""
         self.policies[endpoint] = policy
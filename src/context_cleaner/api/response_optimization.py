@@ -6,12 +6,18 @@ and performance enhancements for high-throughput dashboard APIs.
 """
 
 import gzip
+import hashlib
 import json
 import asyncio
 import logging
+import struct
+import time as time_module
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, date, time
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union, AsyncGenerator, Callable
+from typing import Any, Dict, List, Optional, Tuple, Union, AsyncGenerator, Callable
 from io import BytesIO
 
 from fastapi import Request, Response
@@ -20,9 +26,45 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response as StarletteResponse
 import orjson
 
-
 logger = logging.getLogger(__name__)
 
+# Gzip member header: deflate, no flags, no mtime, unknown OS
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+# Media types for report formats served by ResponseStreamFactory.create_report_stream
+REPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "markdown": "text/markdown",
+    "html": "text/html",
+}
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map the content codings of an Accept-Encoding header to their q-values"""
+    codings: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def accepts_encoding(header: Optional[str], encoding: str) -> bool:
+    """True if the Accept-Encoding header allows ``encoding`` (q > 0)"""
+    codings = parse_accept_encoding(header)
+    return codings.get(encoding, codings.get("*", 0.0)) > 0
+
 
 class HighPerformanceJSONEncoder:
     """Optimized JSON encoder for dashboard data with custom serializers"""
@@ -118,12 +160,15 @@ class CompressionMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Check if client accepts gzip
-        accept_encoding = request.headers.get("accept-encoding", "")
-        if "gzip" not in accept_encoding.lower():
+        if not accepts_encoding(request.headers.get("accept-encoding"), "gzip"):
             return await call_next(request)
 
         response = await call_next(request)
 
+        # Pre-encoded responses already carry their negotiated encoding
+        if "content-encoding" in response.headers:
+            return response
+
         # Only compress if response is large enough and media type is compressible
         should_compress = (
             hasattr(response, "body")
@@ -213,6 +258,200 @@ class CompressionMiddleware(BaseHTTPMiddleware):
         }
 
 
+@dataclass
+class EncodedResponse:
+    """
+    JSON data payload encoded once, with a precompressed segment and an ETag.
+
+    Each response wraps the stored payload in its own envelope (request id,
+    timestamp, metadata), so those fields stay accurate on cache hits while
+    the payload itself is neither re-serialized nor re-compressed: the gzip
+    body is spliced together from a freshly deflated envelope and the stored
+    deflate segment of the payload.
+    """
+
+    data: bytes
+    etag: str
+    deflated: Optional[bytes] = None  # Raw deflate of ``data``, sync-flushed
+    compression_level: int = 6
+    media_type: str = "application/json"
+    expires_at: float = 0.0
+
+    @classmethod
+    def encode(
+        cls,
+        data: Any,
+        compression_level: int = 6,
+        minimum_size: int = 500,
+        ttl_seconds: float = 15,
+    ) -> "EncodedResponse":
+        """Encode the data payload and precompress it for gzip responses"""
+        body = HighPerformanceJSONEncoder.encode(data)
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+        deflated = None
+        if len(body) >= minimum_size:
+            compressor = zlib.compressobj(
+                compression_level, zlib.DEFLATED, -zlib.MAX_WBITS
+            )
+            # A sync flush leaves the stream open and byte-aligned, so it
+            # can be followed by independently deflated blocks
+            deflated = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        return cls(
+            data=body,
+            etag=etag,
+            deflated=deflated,
+            compression_level=compression_level,
+            expires_at=time_module.monotonic() + ttl_seconds,
+        )
+
+    def is_expired(self) -> bool:
+        return time_module.monotonic() >= self.expires_at
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Check an If-None-Match header against this ETag (weak comparison)"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        opaque = self.etag.removeprefix("W/")
+        return any(
+            candidate.strip().removeprefix("W/") == opaque
+            for candidate in if_none_match.split(",")
+        )
+
+    def _envelope_parts(self, envelope: Dict[str, Any]) -> Tuple[bytes, bytes]:
+        """JSON before and after the payload for ``{**envelope, "data": ...}``"""
+        head = HighPerformanceJSONEncoder.encode(
+            {key: value for key, value in envelope.items() if key != "data"}
+        )
+        separator = b"," if len(head) > 2 else b""
+        return head[:-1] + separator + b'"data":', b"}"
+
+    def render(self, envelope: Dict[str, Any]) -> bytes:
+        """Uncompressed JSON body of the payload wrapped in ``envelope``"""
+        prefix, suffix = self._envelope_parts(envelope)
+        return prefix + self.data + suffix
+
+    def _render_gzip(self, envelope: Dict[str, Any]) -> bytes:
+        prefix, suffix = self._envelope_parts(envelope)
+        head = zlib.compressobj(self.compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        tail = zlib.compressobj(self.compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        crc = zlib.crc32(suffix, zlib.crc32(self.data, zlib.crc32(prefix)))
+        size = len(prefix) + len(self.data) + len(suffix)
+        return b"".join(
+            (
+                _GZIP_HEADER,
+                head.compress(prefix) + head.flush(zlib.Z_SYNC_FLUSH),
+                self.deflated,
+                tail.compress(suffix) + tail.flush(),
+                struct.pack("<II", crc, size & 0xFFFFFFFF),
+            )
+        )
+
+    def to_response(self, request: Request, envelope: Dict[str, Any]) -> Response:
+        """Serve a 304, or the payload in ``envelope``, gzipped if accepted"""
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+
+        if self.matches(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+
+        if self.deflated is not None and accepts_encoding(
+            request.headers.get("accept-encoding"), "gzip"
+        ):
+            headers["Content-Encoding"] = "gzip"
+            return Response(
+                content=self._render_gzip(envelope),
+                media_type=self.media_type,
+                headers=headers,
+            )
+
+        return Response(
+            content=self.render(envelope), media_type=self.media_type, headers=headers
+        )
+
+
+class EncodedResponseCache:
+    """In-process LRU of pre-encoded responses for hot polling endpoints"""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        default_ttl_seconds: float = 15,
+        compression_level: int = 6,
+        minimum_size: int = 500,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.compression_level = compression_level
+        self.minimum_size = minimum_size
+        self._entries: "OrderedDict[str, EncodedResponse]" = OrderedDict()
+
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "encodes": 0}
+
+    def get(self, key: str) -> Optional[EncodedResponse]:
+        """Get a live entry, refreshing its LRU position"""
+        entry = self._entries.get(key)
+        if entry is None or entry.is_expired():
+            self._entries.pop(key, None)
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: Optional[float] = None,
+    ) -> EncodedResponse:
+        """Encode a data payload once and store it under key"""
+        entry = EncodedResponse.encode(
+            data,
+            compression_level=self.compression_level,
+            minimum_size=self.minimum_size,
+            ttl_seconds=(
+                self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+            ),
+        )
+        self.stats["encodes"] += 1
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def respond(
+        self, key: str, request: Request, envelope: Dict[str, Any]
+    ) -> Optional[Response]:
+        """Serve key straight from cache in ``envelope``, or None on a miss"""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        response = entry.to_response(request, envelope)
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+        return response
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop entries by exact key or trailing-``*`` prefix pattern"""
+        if pattern.endswith("*"):
+            prefix = pattern[:-1]
+            keys = [key for key in self._entries if key.startswith(prefix)]
+        else:
+            keys = [pattern] if pattern in self._entries else []
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries)}
+
+
 class StreamingDataProcessor:
     """High-performance streaming data processor for large datasets"""
 
@@ -302,6 +541,27 @@ class StreamingDataProcessor:
                 logger.error(f"Error converting item to CSV: {e}")
                 continue
 
+    @staticmethod
+    async def stream_text_chunks(
+        chunks: AsyncGenerator[str, None], min_chunk_bytes: int = 16384
+    ) -> AsyncGenerator[bytes, None]:
+        """Coalesce incrementally rendered text into encoded blocks"""
+        buffer = []
+        buffered_bytes = 0
+
+        async for chunk in chunks:
+            encoded = chunk.encode("utf-8")
+            buffer.append(encoded)
+            buffered_bytes += len(encoded)
+
+            if buffered_bytes >= min_chunk_bytes:
+                yield b"".join(buffer)
+                buffer = []
+                buffered_bytes = 0
+
+        if buffer:
+            yield b"".join(buffer)
+
     @staticmethod
     def _dict_to_csv_row(data: Dict[str, Any], headers: List[str]) -> str:
         """Convert dictionary to CSV row"""
@@ -312,7 +572,7 @@ class StreamingDataProcessor:
             if isinstance(value, str) and (
                 "," in value or '"' in value or "\n" in value
             ):
-                value = f'"{value.replace('"', '""')}"'
+                value = '"' + value.replace('"', '""') + '"'
             values.append(str(value))
         return ",".join(values)
 
@@ -362,6 +622,25 @@ class ResponseStreamFactory:
             content_generator, media_type="text/csv", headers=response_headers
         )
 
+    @staticmethod
+    def create_report_stream(
+        report_chunks: AsyncGenerator[str, None],
+        output_format: str = "json",
+        filename: Optional[str] = None,
+    ) -> StreamingResponse:
+        """Create streaming response for an incrementally rendered report"""
+
+        media_type = REPORT_MEDIA_TYPES.get(output_format, "text/plain")
+        content_generator = StreamingDataProcessor.stream_text_chunks(report_chunks)
+
+        headers = {"Content-Type": media_type}
+        if filename:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+        return StreamingResponse(
+            content_generator, media_type=media_type, headers=headers
+        )
+
     @staticmethod
     def create_chunked_json_response(
         data: List[Dict[str, Any]], chunk_size: int = 1000
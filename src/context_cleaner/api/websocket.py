@@ -9,13 +9,143 @@ import asyncio
 import json
 import logging
 import weakref
-from typing import Dict, Set, List, Any, Optional, Callable
+from collections import OrderedDict, deque
+from typing import Dict, Set, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
 
+def _escape_pointer(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def compute_json_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute JSON-patch (RFC 6902) operations turning ``old`` into ``new``.
+
+    Dicts are diffed key by key; lists and scalars that differ are replaced
+    wholesale, which keeps patches simple to apply for dashboard payloads.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations = []
+        for key in old:
+            if key not in new:
+                operations.append(
+                    {"op": "remove", "path": f"{path}/{_escape_pointer(key)}"}
+                )
+        for key, value in new.items():
+            child_path = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                operations.append({"op": "add", "path": child_path, "value": value})
+            else:
+                operations.extend(compute_json_patch(old[key], value, child_path))
+        return operations
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class TopicState:
+    """Recent versions of a published state topic, for computing deltas"""
+
+    def __init__(self, history_size: int = 8):
+        self.version = 0
+        self._history: "OrderedDict[int, Any]" = OrderedDict()
+        self.history_size = history_size
+
+    def record(self, state: Any) -> int:
+        self.version += 1
+        self._history[self.version] = state
+        while len(self._history) > self.history_size:
+            self._history.popitem(last=False)
+        return self.version
+
+    def get(self, version: Optional[int]) -> Tuple[bool, Any]:
+        if version is None or version not in self._history:
+            return False, None
+        return True, self._history[version]
+
+    @property
+    def current(self) -> Any:
+        return self._history.get(self.version)
+
+
+class ClientChannel:
+    """
+    Bounded outbound queue and sender task for one WebSocket client.
+
+    Ordinary messages queue up to ``max_queue`` frames, dropping the oldest
+    when a client falls behind. State frames are coalesced per topic: a newer
+    frame replaces an unsent one, so a slow client only ever receives the
+    latest state. The sender alternates between the two queues so a steady
+    stream of messages cannot hold back state frames.
+    """
+
+    def __init__(self, websocket, max_queue: int = 100):
+        self.websocket = websocket
+        self._messages: deque = deque(maxlen=max_queue)
+        self._state_frames: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Last state version written to the socket, per topic
+        self.delivered_versions: Dict[str, int] = {}
+        # State topics this client receives as snapshot/delta frames; other
+        # topics get the full state in the plain event format
+        self.delta_topics: Set[str] = set()
+        self.dropped = 0
+        self.coalesced = 0
+
+    def start(self, on_error: Callable[[Exception], Any]):
+        self._task = asyncio.create_task(self._run(on_error))
+
+    def put(self, frame: str):
+        if len(self._messages) == self._messages.maxlen:
+            self.dropped += 1
+        self._messages.append(frame)
+        self._ready.set()
+
+    def put_state(self, topic: str, version: int, frame: str):
+        if topic in self._state_frames:
+            self.coalesced += 1
+        self._state_frames[topic] = (version, frame)
+        self._ready.set()
+
+    def forget_state(self, topic: str):
+        self.delivered_versions.pop(topic, None)
+        self._state_frames.pop(topic, None)
+
+    async def _run(self, on_error: Callable[[Exception], Any]):
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                while self._messages or self._state_frames:
+                    if self._messages:
+                        await self.websocket.send_text(self._messages.popleft())
+                    if self._state_frames:
+                        topic, (version, frame) = self._state_frames.popitem(last=False)
+                        # Record before awaiting so concurrent publishes diff
+                        # against what this client is about to hold
+                        self.delivered_versions[topic] = version
+                        await self.websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await on_error(e)
+
+    async def close(self):
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
 class EventBus:
     """Event bus for internal event handling and WebSocket broadcasting"""
 
@@ -44,19 +174,22 @@ class EventBus:
             except ValueError:
                 pass
 
+    async def _notify_subscribers(self, event_type: str, data: Any):
+        if event_type in self.subscribers:
+            for handler in self.subscribers[event_type]:
+                try:
+                    if asyncio.iscoroutinefunction(handler):
+                        await handler(data)
+                    else:
+                        handler(data)
+                except Exception as e:
+                    logger.error(f"Error in event handler for {event_type}: {e}")
+
     async def emit(self, event_type: str, data: Any):
         """Emit an event to all subscribers and WebSocket clients"""
         async with self._lock:
             # Handle internal subscribers
-            if event_type in self.subscribers:
-                for handler in self.subscribers[event_type]:
-                    try:
-                        if asyncio.iscoroutinefunction(handler):
-                            await handler(data)
-                        else:
-                            handler(data)
-                    except Exception as e:
-                        logger.error(f"Error in event handler for {event_type}: {e}")
+            await self._notify_subscribers(event_type, data)
 
             # Broadcast to WebSocket subscribers
             if self.websocket_manager:
@@ -67,6 +200,17 @@ class EventBus:
                 }
                 await self.websocket_manager.broadcast_to_topic(event_type, message)
 
+    async def publish_state(self, topic: str, state: Dict[str, Any]):
+        """Publish the latest state of a topic to internal and WebSocket subscribers
+
+        WebSocket clients that subscribed with ``deltas`` receive JSON-patch
+        frames; all others receive the same message ``emit`` would send.
+        """
+        async with self._lock:
+            await self._notify_subscribers(topic, state)
+            if self.websocket_manager:
+                await self.websocket_manager.publish_state(topic, state)
+
     async def emit_to_client(self, client_id: str, event_type: str, data: Any):
         """Emit event to specific client"""
         if self.websocket_manager:
@@ -81,12 +225,18 @@ class EventBus:
 class ConnectionManager:
     """WebSocket connection manager with subscription handling"""
 
-    def __init__(self):
+    def __init__(self, max_queue_per_client: int = 100, state_history_size: int = 8):
         self.active_connections: Dict[str, "WebSocket"] = {}
         self.client_subscriptions: Dict[str, Set[str]] = {}
         self.topic_subscribers: Dict[str, Set[str]] = {}
         self._lock = asyncio.Lock()
 
+        # Outbound queues and published state for concurrent, delta-encoded sends
+        self.max_queue_per_client = max_queue_per_client
+        self.state_history_size = state_history_size
+        self._channels: Dict[str, ClientChannel] = {}
+        self._topic_states: Dict[str, TopicState] = {}
+
     async def connect(self, websocket, client_id: str):
         """Accept a new WebSocket connection"""
         try:
@@ -94,6 +244,8 @@ class ConnectionManager:
             async with self._lock:
                 self.active_connections[client_id] = websocket
                 self.client_subscriptions[client_id] = set()
+                channel = ClientChannel(websocket, self.max_queue_per_client)
+                self._channels[client_id] = channel
 
             logger.info(f"WebSocket client connected: {client_id}")
 
@@ -113,6 +265,7 @@ class ConnectionManager:
                 "timestamp": datetime.now().isoformat(),
             }
             await self._send_message(websocket, welcome_msg)
+            channel.start(lambda error: self._on_channel_error(client_id, error))
 
         except Exception as e:
             logger.error(f"Error connecting client {client_id}: {e}")
@@ -123,6 +276,7 @@ class ConnectionManager:
         async with self._lock:
             if client_id in self.active_connections:
                 del self.active_connections[client_id]
+            channel = self._channels.pop(client_id, None)
 
             # Clean up subscriptions
             if client_id in self.client_subscriptions:
@@ -133,10 +287,17 @@ class ConnectionManager:
                             del self.topic_subscribers[topic]
                 del self.client_subscriptions[client_id]
 
+        if channel:
+            await channel.close()
+
         logger.info(f"WebSocket client disconnected: {client_id}")
 
-    async def subscribe(self, client_id: str, topic: str):
-        """Subscribe client to a topic"""
+    async def subscribe(self, client_id: str, topic: str, deltas: bool = False):
+        """Subscribe client to a topic
+
+        With ``deltas``, state published on the topic arrives as
+        ``state.snapshot``/``state.delta`` frames instead of full messages.
+        """
         async with self._lock:
             if client_id not in self.client_subscriptions:
                 logger.warning(f"Client {client_id} not found for subscription")
@@ -148,6 +309,29 @@ class ConnectionManager:
                 self.topic_subscribers[topic] = set()
             self.topic_subscribers[topic].add(client_id)
 
+            channel = self._channels.get(client_id)
+            if channel:
+                channel.forget_state(topic)
+                if deltas:
+                    channel.delta_topics.add(topic)
+                else:
+                    channel.delta_topics.discard(topic)
+
+            # Late subscribers to a state topic start from the current state
+            topic_state = self._topic_states.get(topic)
+            if channel and topic_state and topic_state.current is not None:
+                channel.put_state(
+                    topic,
+                    topic_state.version,
+                    (
+                        self._encode_state_frame(
+                            topic, topic_state.version, topic_state.current, None, None
+                        )
+                        if deltas
+                        else self._encode_state_message(topic, topic_state.current)
+                    ),
+                )
+
         logger.debug(f"Client {client_id} subscribed to topic: {topic}")
         return True
 
@@ -162,6 +346,10 @@ class ConnectionManager:
                 if not self.topic_subscribers[topic]:
                     del self.topic_subscribers[topic]
 
+            if client_id in self._channels:
+                self._channels[client_id].forget_state(topic)
+                self._channels[client_id].delta_topics.discard(topic)
+
         logger.debug(f"Client {client_id} unsubscribed from topic: {topic}")
 
     async def broadcast_to_topic(self, topic: str, message: Dict[str, Any]):
@@ -169,29 +357,103 @@ class ConnectionManager:
         if topic not in self.topic_subscribers:
             return
 
-        subscribers = list(
-            self.topic_subscribers[topic]
-        )  # Copy to avoid modification during iteration
-        disconnected_clients = []
-
+        # Encode once, then hand the frame to each client's sender
+        frame = self._encode(message)
+        subscribers = list(self.topic_subscribers[topic])
         for client_id in subscribers:
-            if client_id in self.active_connections:
-                try:
-                    websocket = self.active_connections[client_id]
-                    await self._send_message(websocket, message)
-                except Exception as e:
-                    logger.warning(f"Error sending to client {client_id}: {e}")
-                    disconnected_clients.append(client_id)
-
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            await self.disconnect(client_id)
+            channel = self._channels.get(client_id)
+            if channel:
+                channel.put(frame)
 
         if subscribers:
             logger.debug(f"Broadcasted to {len(subscribers)} clients on topic: {topic}")
 
+    async def publish_state(self, topic: str, state: Dict[str, Any]):
+        """
+        Publish the latest state of a topic to its subscribers.
+
+        Clients subscribed with ``deltas`` receive a ``state.delta`` JSON
+        patch against the last version delivered to it, or a
+        ``state.snapshot`` when it has none (or its base has aged out of the
+        history). Other clients receive the full state as a plain
+        ``{"type": topic, "data": state}`` message, as sent by
+        ``EventBus.emit``. Frames are encoded once per distinct base version
+        and coalesced for clients that are behind.
+        """
+        topic_state = self._topic_states.get(topic)
+        if topic_state is None:
+            topic_state = self._topic_states[topic] = TopicState(
+                self.state_history_size
+            )
+        version = topic_state.record(state)
+
+        frames: Dict[Optional[int], str] = {}
+        message_frame: Optional[str] = None
+        for client_id in list(self.topic_subscribers.get(topic, ())):
+            channel = self._channels.get(client_id)
+            if channel is None:
+                continue
+
+            if topic not in channel.delta_topics:
+                if message_frame is None:
+                    message_frame = self._encode_state_message(topic, state)
+                channel.put_state(topic, version, message_frame)
+                continue
+
+            found, base_state = topic_state.get(channel.delivered_versions.get(topic))
+            base_version = channel.delivered_versions.get(topic) if found else None
+            if base_version not in frames:
+                frames[base_version] = self._encode_state_frame(
+                    topic, version, state, base_version, base_state
+                )
+            channel.put_state(topic, version, frames[base_version])
+
+    def _encode_state_message(self, topic: str, state: Dict[str, Any]) -> str:
+        return self._encode(
+            {"type": topic, "data": state, "timestamp": datetime.now().isoformat()}
+        )
+
+    def _encode_state_frame(
+        self,
+        topic: str,
+        version: int,
+        state: Dict[str, Any],
+        base_version: Optional[int],
+        base_state: Any,
+    ) -> str:
+        timestamp = datetime.now().isoformat()
+        if base_version is None:
+            return self._encode(
+                {
+                    "type": "state.snapshot",
+                    "topic": topic,
+                    "version": version,
+                    "data": state,
+                    "timestamp": timestamp,
+                }
+            )
+        return self._encode(
+            {
+                "type": "state.delta",
+                "topic": topic,
+                "base_version": base_version,
+                "version": version,
+                "patch": compute_json_patch(base_state, state),
+                "timestamp": timestamp,
+            }
+        )
+
+    async def _on_channel_error(self, client_id: str, error: Exception):
+        logger.warning(f"Error sending to client {client_id}: {error}")
+        await self.disconnect(client_id)
+
     async def send_to_client(self, client_id: str, message: Dict[str, Any]):
         """Send message to specific client"""
+        channel = self._channels.get(client_id)
+        if channel is not None:
+            channel.put(self._encode(message))
+            return True
+
         if client_id in self.active_connections:
             try:
                 websocket = self.active_connections[client_id]
@@ -216,6 +478,13 @@ class ConnectionManager:
                     topic: len(subscribers)
                     for topic, subscribers in self.topic_subscribers.items()
                 },
+                "state_topics": {
+                    topic: state.version for topic, state in self._topic_states.items()
+                },
+                "dropped_messages": sum(c.dropped for c in self._channels.values()),
+                "coalesced_state_frames": sum(
+                    c.coalesced for c in self._channels.values()
+                ),
             }
 
     async def handle_client_message(self, client_id: str, message: str) -> bool:
@@ -227,11 +496,17 @@ class ConnectionManager:
             if message_type == "subscribe":
                 topic = data.get("topic")
                 if topic:
-                    await self.subscribe(client_id, topic)
+                    await self.subscribe(
+                        client_id, topic, deltas=bool(data.get("deltas"))
+                    )
                     # Send acknowledgment
                     ack_msg = {
                         "type": "subscription.ack",
-                        "data": {"topic": topic, "subscribed": True},
+                        "data": {
+                            "topic": topic,
+                            "subscribed": True,
+                            "deltas": bool(data.get("deltas")),
+                        },
                         "timestamp": datetime.now().isoformat(),
                     }
                     await self.send_to_client(client_id, ack_msg)
@@ -250,6 +525,32 @@ class ConnectionManager:
                     await self.send_to_client(client_id, ack_msg)
                     return True
 
+            elif message_type == "state.resync":
+                # Client lost its copy of a state topic; send a full snapshot
+                topic = data.get("topic")
+                channel = self._channels.get(client_id)
+                topic_state = self._topic_states.get(topic)
+                if (
+                    channel
+                    and topic in channel.delta_topics
+                    and topic_state
+                    and topic_state.current is not None
+                ):
+                    channel.forget_state(topic)
+                    channel.put_state(
+                        topic,
+                        topic_state.version,
+                        self._encode_state_frame(
+                            topic,
+                            topic_state.version,
+                            topic_state.current,
+                            None,
+                            None,
+                        ),
+                    )
+                    return True
+                return False
+
             elif message_type == "ping":
                 # Respond to ping with pong
                 pong_msg = {
@@ -273,10 +574,13 @@ class ConnectionManager:
             logger.error(f"Error handling message from client {client_id}: {e}")
             return False
 
+    def _encode(self, message: Dict[str, Any]) -> str:
+        return json.dumps(message, default=self._json_serializer)
+
     async def _send_message(self, websocket, message: Dict[str, Any]):
         """Send message to WebSocket connection"""
         try:
-            message_str = json.dumps(message, default=self._json_serializer)
+            message_str = self._encode(message)
             await websocket.send_text(message_str)
         except Exception as e:
             logger.error(f"Error sending WebSocket message: {e}")
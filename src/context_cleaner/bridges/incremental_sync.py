@@ -69,9 +69,20 @@ from .token_analysis_bridge import TokenAnalysisBridgeService, TokenUsageSummary
 from ..analysis.dashboard_integration import get_enhanced_token_analysis_sync
 from ..telemetry.context_rot import ContextRotAnalyzer
 from ..telemetry.error_recovery.manager import ErrorRecoveryManager
+from ..monitoring.metrics_registry import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+INGESTED_LINES = _metrics.counter(
+    "context_cleaner_ingested_lines_total",
+    "JSONL lines ingested by incremental sync",
+)
+INGESTED_TOKENS = _metrics.counter(
+    "context_cleaner_ingested_tokens_total",
+    "Estimated tokens ingested by incremental sync",
+)
+
 
 @dataclass
 class FileProcessingState:
@@ -445,6 +456,8 @@ class IncrementalSyncService:
             self.file_states[file_path] = new_state
             self.stats.lines_processed += len(new_lines)
             self.stats.tokens_synced += int(estimated_tokens)
+            INGESTED_LINES.inc(len(new_lines))
+            INGESTED_TOKENS.inc(int(estimated_tokens))
 
             # Process conversation data alongside token extraction
             conversations_processed = 0
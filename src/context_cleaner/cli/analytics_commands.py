@@ -41,7 +41,7 @@ class AnalyticsCommandHandler:
         # Initialize analytics components
         self.effectiveness_tracker = EffectivenessTracker()
         self.productivity_analyzer = ProductivityAnalyzer()
-        self.cache_dashboard = CacheEnhancedDashboard()
+        self.cache_dashboard = CacheEnhancedDashboard.from_config(self.config)
         self.cross_session_analyzer = CrossSessionAnalyticsEngine()
 
     def handle_health_check_command(
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional
 import logging
 
-from ...telemetry import ClickHouseClient
+from ...telemetry.clients import FallbackTelemetryClient
 from ...telemetry.jsonl_enhancement.jsonl_processor_service import JsonlProcessorService
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,8 @@ logger = logging.getLogger(__name__)
 
 async def get_jsonl_service(privacy_level: str = "standard") -> JsonlProcessorService:
     """Get configured JSONL processor service."""
-    client = ClickHouseClient()
+    # Uses the local SQLite store when ClickHouse is not reachable
+    client = FallbackTelemetryClient()
 
     # Check if telemetry system is available
     if not await client.health_check():
@@ -15,6 +15,7 @@ from context_cleaner.telemetry import (
     ClickHouseClient,
     ErrorRecoveryManager,
     CostOptimizationEngine,
+    FullContentQueries,
 )
 from context_cleaner.telemetry.cost_optimization.models import BudgetConfig
 
@@ -150,6 +151,29 @@ def _wait_for_clickhouse(
     )
 
 
+def _ensure_search_indexes(verbose: bool = False) -> None:
+    """Add full-text search indexes to content tables created before them."""
+
+    async def _ensure():
+        client = ClickHouseClient()
+        try:
+            return await FullContentQueries(client).ensure_search_indexes()
+        finally:
+            await client.close()
+
+    try:
+        added = asyncio.run(_ensure())
+    except Exception as e:
+        # Searches still work without the index, just slower
+        click.echo(f"   ⚠️  Could not add full-text search indexes: {e}")
+        return
+
+    if added:
+        click.echo(f"   🔎 Added full-text search indexes to: {', '.join(added)}")
+    elif verbose:
+        click.echo("   ✅ Full-text search indexes are up to date")
+
+
 def _write_env_file(destination: Path, verbose: bool = False) -> Path:
     env_file = destination / "telemetry-env.sh"
     content = "\n".join(
@@ -217,6 +241,7 @@ def init(ctx, pull: bool, force_recreate: bool):
 
     click.echo("⏳ Waiting for services to become healthy...")
     _wait_for_clickhouse(verbose=verbose)
+    _ensure_search_indexes(verbose=verbose)
 
     env_file = _write_env_file(telemetry_dir, verbose=verbose)
 
@@ -29,6 +29,8 @@ class DashboardConfig:
     auto_refresh: bool
     cache_duration: int
     max_concurrent_users: int
+    # Run the cache dashboard's session analyzers in worker processes
+    analysis_process_pool: bool = False
 
 
 @dataclass
@@ -161,6 +163,11 @@ class ContextCleanerConfig:
         if host := os.getenv("CONTEXT_CLEANER_HOST"):
             env_overrides.setdefault("dashboard", {})["host"] = host
 
+        if process_pool := os.getenv("CONTEXT_CLEANER_ANALYSIS_PROCESS_POOL"):
+            env_overrides.setdefault("dashboard", {})[
+                "analysis_process_pool"
+            ] = process_pool.lower() in ("true", "1", "yes")
+
         # Data directory
         if data_dir := os.getenv("CONTEXT_CLEANER_DATA_DIR"):
             env_overrides["data_directory"] = data_dir
@@ -18,6 +18,8 @@ from .redundancy_detector import RedundancyDetector, RedundancyReport
 from .recency_analyzer import RecencyAnalyzer, RecencyReport
 from .focus_scorer import FocusScorer, FocusMetrics
 from .priority_analyzer import PriorityAnalyzer, PriorityReport
+from .keyword_engine import KeywordEngine
+from .context_index import ContextIndex, IndexedItem
 from .manipulation_engine import (
     ManipulationEngine,
     ManipulationOperation,
@@ -26,6 +28,7 @@ from .manipulation_engine import (
     create_manipulation_plan,
     execute_manipulation_plan,
 )
+from .working_context import WorkingContext
 from .manipulation_validator import (
     ManipulationValidator,
     ValidationResult,
@@ -92,6 +95,9 @@ __all__ = [
     "FocusMetrics",
     "PriorityAnalyzer",
     "PriorityReport",
+    "KeywordEngine",
+    "ContextIndex",
+    "IndexedItem",
     # Manipulation engine
     "ManipulationEngine",
     "ManipulationOperation",
@@ -99,6 +105,7 @@ __all__ = [
     "ManipulationResult",
     "create_manipulation_plan",
     "execute_manipulation_plan",
+    "WorkingContext",
     # Enhanced validation system
     "ManipulationValidator",
     "ValidationResult",
@@ -16,17 +16,95 @@ import json
 import time
 import logging
 import hashlib
+import pickle
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+from .context_index import ContextIndex
 from .redundancy_detector import RedundancyDetector, RedundancyReport
 from .recency_analyzer import RecencyAnalyzer, RecencyReport
 from .focus_scorer import FocusScorer, FocusMetrics
 from .priority_analyzer import PriorityAnalyzer, PriorityReport
+from ..monitoring.metrics_registry import (
+    CACHE_REQUESTS,
+    OPERATION_SECONDS,
+    get_metrics_registry,
+)
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+
+# Analysis components: name -> (analyzer attribute, analyzer class, method)
+_COMPONENTS = {
+    "redundancy": ("redundancy_detector", RedundancyDetector, "analyze_redundancy"),
+    "recency": ("recency_analyzer", RecencyAnalyzer, "analyze_recency"),
+    "focus": ("focus_scorer", FocusScorer, "calculate_focus_metrics"),
+    "priority": ("priority_analyzer", PriorityAnalyzer, "analyze_priorities"),
+}
+
+EXECUTION_STRATEGIES = ("inline", "thread", "process")
+
+# How often to check whether a pooled component has reached a worker
+_START_POLL_INTERVAL = 0.005
+
+# Per-worker analyzer instances, built on first use in each process
+_worker_analyzers: Dict[str, Any] = {}
+
+
+def _run_component(analyzer: Any, method_name: str, context_data, index) -> Any:
+    """Drive one analyzer coroutine to completion on the calling thread."""
+    return asyncio.run(getattr(analyzer, method_name)(context_data, index))
+
+
+def _start_component_thread(
+    name: str, analyzer: Any, method_name: str, context_data, index
+) -> Tuple["asyncio.Future", threading.Thread]:
+    """Run one analyzer on a dedicated daemon thread.
+
+    Each component gets its own thread rather than a pool slot, so it starts
+    immediately and an analyzer stuck past its budget never holds up later
+    analyses. Returns a future on the running loop for the result, and the
+    thread so the caller can track runs that overrun their budget.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value):
+        if not future.done():  # Cancelled when the budget ran out
+            setter(value)
+
+    def run():
+        try:
+            result = _run_component(analyzer, method_name, context_data, index)
+        except BaseException as error:
+            outcome = (future.set_exception, error)
+        else:
+            outcome = (future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(deliver, *outcome)
+        except RuntimeError:
+            pass  # The loop closed while this analyzer overran its budget
+
+    thread = threading.Thread(target=run, name=f"context-analysis-{name}", daemon=True)
+    thread.start()
+    return future, thread
+
+
+def _run_pooled_component(name: str, index_blob: bytes) -> Any:
+    """Worker entry point: rebuild the context index and run one analyzer."""
+    _, analyzer_class, method_name = _COMPONENTS[name]
+    analyzer = _worker_analyzers.get(name)
+    if analyzer is None:
+        analyzer = _worker_analyzers[name] = analyzer_class()
+    index = pickle.loads(index_blob)
+    return _run_component(analyzer, method_name, index.context_data, index)
+
 
 @dataclass
 class ContextAnalysisResult:
@@ -91,12 +169,43 @@ class ContextAnalyzer:
 
     # Performance constants
     MAX_ANALYSIS_TIME = 5.0  # Maximum time for full analysis
+    ANALYZER_TIMEOUT = 3.0  # Budget per analysis component (thread/process)
+    MAX_OVERRUNNING_THREADS = 2  # Live over-budget threads per component
     MAX_CONTEXT_SIZE = 500000  # Maximum context size to analyze (chars)
     CIRCUIT_BREAKER_THRESHOLD = 3  # Failures before circuit breaker trips
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the context analyzer with optional configuration."""
+        """
+        Initialize the context analyzer with optional configuration.
+
+        Config keys:
+            execution_strategy: How the four analysis components run -
+                "thread" (default) runs each on its own worker thread,
+                keeping the event loop free; "process" runs them in a worker
+                process pool for real CPU parallelism; "inline" runs them on
+                the event loop, one after another, without timeouts
+            analyzer_timeout: Seconds each component may take before its
+                result is replaced by an empty one (defaults to
+                ANALYZER_TIMEOUT)
+            max_workers: Worker count for the process pool
+        """
         self.config = config or {}
+        self.execution_strategy = self.config.get("execution_strategy", "thread")
+        if self.execution_strategy not in EXECUTION_STRATEGIES:
+            raise ValueError(
+                f"Unknown execution_strategy {self.execution_strategy!r}; "
+                f"expected one of {EXECUTION_STRATEGIES}"
+            )
+        self.analyzer_timeout = self.config.get(
+            "analyzer_timeout", self.ANALYZER_TIMEOUT
+        )
+        self._max_workers = self.config.get("max_workers") or len(_COMPONENTS)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Component threads still running after their budget ran out
+        self._overrunning_threads: Dict[str, List[threading.Thread]] = {
+            name: [] for name in _COMPONENTS
+        }
 
         # Initialize analysis components
         self.redundancy_detector = RedundancyDetector()
@@ -136,6 +245,147 @@ class ContextAnalyzer:
         if self.circuit_breaker_failures > 0:
             self.circuit_breaker_failures = max(0, self.circuit_breaker_failures - 1)
 
+    def close(self) -> None:
+        """Shut down the analysis process pool, if one was started."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                # Shut the pool down with the analyzer if close() is never called
+                weakref.finalize(self, self._executor.shutdown, wait=False)
+            return self._executor
+
+    def _retire_executor(self, executor: ProcessPoolExecutor):
+        """Stop handing work to a pool whose worker is stuck past its budget.
+
+        Tasks already queued on it still run; later work gets a fresh pool.
+        """
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False)
+
+    def _get_empty_component_result(self, name: str, analysis_start: datetime) -> Any:
+        """Empty result of one analysis component, used when it times out."""
+        if name == "redundancy":
+            return self.redundancy_detector._get_empty_redundancy_report()
+        if name == "recency":
+            return self.recency_analyzer._get_empty_recency_report()
+        if name == "focus":
+            return self.focus_scorer._get_empty_focus_metrics(analysis_start)
+        return self.priority_analyzer._get_empty_priority_report(analysis_start)
+
+    async def _run_component_with_budget(
+        self,
+        name: str,
+        context_data: Dict[str, Any],
+        index: ContextIndex,
+        index_blob: Optional[bytes],
+    ) -> Tuple[Any, bool]:
+        """Run one component off the event loop; returns (result, timed_out).
+
+        The budget starts when the component starts running, not while it
+        waits for a worker.
+        """
+        attribute, _, method_name = _COMPONENTS[name]
+        analyzer = getattr(self, attribute)
+        executor = None
+        thread = None
+
+        try:
+            if index_blob is not None:
+                executor = self._get_executor()
+                try:
+                    pending = executor.submit(_run_pooled_component, name, index_blob)
+                    future = asyncio.wrap_future(pending)
+                    while not (pending.running() or pending.done()):
+                        await asyncio.sleep(_START_POLL_INTERVAL)
+                    return await asyncio.wait_for(future, self.analyzer_timeout), False
+                except BrokenProcessPool:
+                    # A crashed worker poisons the pool; finish on a thread
+                    self._retire_executor(executor)
+                    executor = None
+
+            overrunning = self._overrunning_threads[name]
+            overrunning[:] = [t for t in overrunning if t.is_alive()]
+            if len(overrunning) >= self.MAX_OVERRUNNING_THREADS:
+                # Threads cannot be stopped; piling up more stuck copies would
+                # only compete with the event loop for the GIL
+                logger.warning(
+                    f"{name} analysis skipped: {len(overrunning)} earlier runs "
+                    f"are still over budget"
+                )
+                return None, True
+
+            future, thread = _start_component_thread(
+                name, analyzer, method_name, context_data, index
+            )
+            return await asyncio.wait_for(future, self.analyzer_timeout), False
+        except asyncio.TimeoutError:
+            # The worker keeps running in the background and its result is
+            # dropped; a stuck pool worker must not delay later analyses
+            if executor is not None:
+                self._retire_executor(executor)
+            if thread is not None:
+                self._overrunning_threads[name].append(thread)
+            logger.warning(
+                f"{name} analysis exceeded its {self.analyzer_timeout}s budget"
+            )
+            return None, True
+
+    async def _run_components(
+        self, context_data: Dict[str, Any], index: ContextIndex
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run the four analysis components with the configured strategy.
+
+        Returns the results by component name and the names of components
+        that exceeded their budget. Those get empty results, so one slow
+        analyzer yields a partial analysis instead of failing the whole run.
+        """
+        if self.execution_strategy == "inline":
+            tasks = {
+                name: asyncio.create_task(
+                    getattr(getattr(self, attribute), method_name)(context_data, index)
+                )
+                for name, (attribute, _, method_name) in _COMPONENTS.items()
+            }
+            return {name: await task for name, task in tasks.items()}, []
+
+        analysis_start = datetime.now()
+        index_blob = None
+        if self.execution_strategy == "process":
+            # Serialize the index once; every worker task shares the bytes
+            index_blob = await asyncio.to_thread(
+                pickle.dumps, index, pickle.HIGHEST_PROTOCOL
+            )
+        else:
+            # Component threads share the index, so fill in its lazy fields
+            # first; they only read it from here on
+            index.freeze(self.recency_analyzer._extract_timestamp)
+
+        outcomes = await asyncio.gather(
+            *(
+                self._run_component_with_budget(name, context_data, index, index_blob)
+                for name in _COMPONENTS
+            )
+        )
+
+        results: Dict[str, Any] = {}
+        timed_out: List[str] = []
+        for name, (result, exceeded) in zip(_COMPONENTS, outcomes):
+            if exceeded:
+                timed_out.append(name)
+                result = self._get_empty_component_result(name, analysis_start)
+            results[name] = result
+        return results, timed_out
+
     def _generate_cache_key(self, context_data: Dict[str, Any]) -> str:
         """Generate cache key for context data."""
         try:
@@ -291,8 +541,11 @@ class ContextAnalyzer:
         analysis_start = time.time()
 
         try:
+            # Index the context once; every analyzer reuses it
+            index = ContextIndex(context_data)
+
             # Extract basic metrics
-            context_str = json.dumps(context_data, default=str)
+            context_str = index.serialized
             total_chars = len(context_str)
 
             # ccusage approach: Use accurate token counting
@@ -308,25 +561,12 @@ class ContextAnalyzer:
                 total_tokens = 0
             context_categories = self._extract_context_categories(context_data)
 
-            # Run analysis components in parallel for performance
-            redundancy_task = asyncio.create_task(
-                self.redundancy_detector.analyze_redundancy(context_data)
-            )
-            recency_task = asyncio.create_task(
-                self.recency_analyzer.analyze_recency(context_data)
-            )
-            focus_task = asyncio.create_task(
-                self.focus_scorer.calculate_focus_metrics(context_data)
-            )
-            priority_task = asyncio.create_task(
-                self.priority_analyzer.analyze_priorities(context_data)
-            )
-
-            # Wait for all analysis components to complete
-            redundancy_report = await redundancy_task
-            recency_report = await recency_task
-            focus_metrics = await focus_task
-            priority_report = await priority_task
+            # Run analysis components concurrently, each within its budget
+            results, timed_out = await self._run_components(context_data, index)
+            redundancy_report = results["redundancy"]
+            recency_report = results["recency"]
+            focus_metrics = results["focus"]
+            priority_report = results["priority"]
 
             # Calculate optimization metrics
             optimization_potential, critical_ratio, cleanup_impact = (
@@ -348,7 +588,9 @@ class ContextAnalyzer:
                 "chars_per_second": (
                     total_chars / analysis_duration if analysis_duration > 0 else 0
                 ),
-                "components_analyzed": 4,
+                "components_analyzed": len(_COMPONENTS) - len(timed_out),
+                "execution_strategy": self.execution_strategy,
+                "timed_out_components": timed_out,
                 "circuit_breaker_active": self.circuit_breaker_failures
                 >= self.CIRCUIT_BREAKER_THRESHOLD,
             }
@@ -410,14 +652,18 @@ class ContextAnalyzer:
             cache_key = self._generate_cache_key(context_data)
             cached_result = self.analysis_cache.get(cache_key)
             if cached_result:
+                CACHE_REQUESTS.inc(cache="context_analysis", result="hit")
                 logger.debug("Returning cached analysis result")
                 return cached_result
+            CACHE_REQUESTS.inc(cache="context_analysis", result="miss")
 
         try:
             # Perform analysis with timeout
-            result = await asyncio.wait_for(
-                self._perform_analysis(context_data), timeout=self.MAX_ANALYSIS_TIME
-            )
+            with _metrics.span(OPERATION_SECONDS, operation="context_analysis"):
+                result = await asyncio.wait_for(
+                    self._perform_analysis(context_data),
+                    timeout=self.MAX_ANALYSIS_TIME,
+                )
 
             # Cache successful result
             if use_cache and cache_key:
@@ -490,7 +736,10 @@ async def analyze_context(
 ) -> Optional[ContextAnalysisResult]:
     """Convenience function for context analysis."""
     analyzer = ContextAnalyzer()
-    return await analyzer.analyze_context(context_data)
+    try:
+        return await analyzer.analyze_context(context_data)
+    finally:
+        analyzer.close()
 
 
 def analyze_context_sync(
@@ -498,7 +747,10 @@ def analyze_context_sync(
 ) -> Optional[ContextAnalysisResult]:
     """Synchronous convenience function for context analysis."""
     analyzer = ContextAnalyzer()
-    return analyzer.analyze_context_sync(context_data)
+    try:
+        return analyzer.analyze_context_sync(context_data)
+    finally:
+        analyzer.close()
 
 
 if __name__ == "__main__":
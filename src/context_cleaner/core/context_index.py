@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Context Index
+
+One-time flat index of a context's leaf values, shared by the analyzers of a
+single analysis run.
+
+The focus, priority, recency and redundancy analyzers each used to walk the
+nested context dict recursively and rebuild the same leaf list with its own
+string paths. ``ContextIndex`` walks the context once and keeps, per leaf:
+
+- its position in document order and its path (``a.b[0].c``)
+- its text (``str(value)``) and a lazily computed content hash
+- its content category, derived from the path
+- its timestamp, resolved on demand by the recency analyzer
+
+It also caches the JSON serialization used for size and token metrics.
+``freeze()`` fills in every lazily computed field up front, after which the
+index is only read and can be shared by analyzer threads without a lock.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Path keywords per category, checked in order; first match wins
+CATEGORY_KEYWORDS = (
+    ("messages", ("conversation", "chat", "message")),
+    ("files", ("file", "path", "document")),
+    ("todos", ("todo", "task", "action")),
+    ("errors", ("error", "exception", "failure")),
+    ("system_messages", ("system", "reminder", "note")),
+)
+
+
+def categorize_path(path: str) -> str:
+    """Content category of a leaf, based on keywords in its path."""
+    path_lower = path.lower()
+    for category, keywords in CATEGORY_KEYWORDS:
+        if any(word in path_lower for word in keywords):
+            return category
+    return "other"
+
+
+@dataclass
+class IndexedItem:
+    """A single leaf value of the context."""
+
+    position: int  # Index in document order
+    path: str  # Dotted path with list indices, e.g. "todos[0].title"
+    value: Any  # Original leaf value
+    text: str  # str(value)
+    category: str  # Category from categorize_path()
+    timestamp: Optional[datetime] = None  # Set by ContextIndex.resolve_timestamps()
+    _content_hash: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def content_hash(self) -> str:
+        """MD5 hex digest of the item text."""
+        if self._content_hash is None:
+            self._content_hash = hashlib.md5(self.text.encode()).hexdigest()
+        return self._content_hash
+
+
+class ContextIndex:
+    """
+    Flat index over the leaf values of a context dict.
+
+    Dicts and lists are traversed; every other value is a leaf. Build one
+    index per analysis and pass it to each analyzer instead of letting them
+    re-walk the context.
+    """
+
+    def __init__(self, context_data: Dict[str, Any]):
+        self.context_data = context_data
+        self.items: List[IndexedItem] = []
+        self._serialized: Optional[str] = None
+        self._timestamps_resolved = False
+        self.frozen = False
+        self._build(context_data, "")
+
+    def _build(self, data: Any, path: str):
+        if isinstance(data, dict):
+            for key, value in data.items():
+                self._build(value, f"{path}.{key}" if path else str(key))
+        elif isinstance(data, list):
+            for i, value in enumerate(data):
+                self._build(value, f"{path}[{i}]")
+        elif path:
+            self.items.append(
+                IndexedItem(
+                    position=len(self.items),
+                    path=path,
+                    value=data,
+                    text=str(data),
+                    category=categorize_path(path),
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    @property
+    def serialized(self) -> str:
+        """JSON serialization of the whole context, computed once."""
+        if self._serialized is None:
+            self._serialized = json.dumps(self.context_data, default=str)
+        return self._serialized
+
+    def freeze(self, extractor: Callable[[Any], Optional[datetime]]) -> "ContextIndex":
+        """Compute the serialization, content hashes and timestamps now.
+
+        Afterwards nothing on the index is filled in lazily, so threads can
+        share it read-only. ``extractor`` is used as in resolve_timestamps().
+        """
+        if not self.frozen:
+            self.serialized
+            for item in self.items:
+                item.content_hash
+            self.resolve_timestamps(extractor)
+            self.frozen = True
+        return self
+
+    def in_category(self, category: str) -> List[IndexedItem]:
+        """Items of one category, in document order."""
+        return [item for item in self.items if item.category == category]
+
+    def resolve_timestamps(
+        self, extractor: Callable[[Any], Optional[datetime]]
+    ) -> List[IndexedItem]:
+        """Fill in item timestamps using ``extractor`` on each value.
+
+        Extraction runs once per index; later calls reuse the result.
+        Returns the items that have a timestamp.
+        """
+        if not self._timestamps_resolved:
+            for item in self.items:
+                item.timestamp = extractor(item.value)
+            self._timestamps_resolved = True
+        return [item for item in self.items if item.timestamp is not None]
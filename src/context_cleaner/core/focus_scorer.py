@@ -14,10 +14,13 @@ Uses semantic analysis, keyword detection, and content positioning to assess foc
 import re
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from collections import Counter
 
+from .context_index import ContextIndex
+from .keyword_engine import KeywordEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -199,40 +202,30 @@ class FocusScorer:
         self.task_action_patterns = [
             re.compile(pattern, re.IGNORECASE) for pattern in self.TASK_ACTION_PATTERNS
         ]
+        # All families in one matcher, used per content item
+        self.keyword_engine = KeywordEngine(
+            keywords={
+                "current_work": self.CURRENT_WORK_KEYWORDS,
+                "high_priority": self.HIGH_PRIORITY_INDICATORS,
+                "distraction": self.DISTRACTION_KEYWORDS,
+            },
+            patterns={
+                f"action_{index}": pattern
+                for index, pattern in enumerate(self.TASK_ACTION_PATTERNS)
+            },
+        )
         logger.debug("FocusScorer initialized")
 
     def _extract_content_with_positions(
-        self, context_data: Dict[str, Any]
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
     ) -> List[Tuple[int, str, Any]]:
         """Extract content items with their position indices for priority analysis."""
-        items = []
-        position = 0
-
-        def extract_recursive(data: Any, path: str = ""):
-            nonlocal position
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if isinstance(value, (dict, list)):
-                        extract_recursive(value, current_path)
-                    else:
-                        items.append((position, current_path, value))
-                        position += 1
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    current_path = f"{path}[{i}]"
-                    if isinstance(item, (dict, list)):
-                        extract_recursive(item, current_path)
-                    else:
-                        items.append((position, current_path, item))
-                        position += 1
-
-        extract_recursive(context_data)
-        return items
+        index = index if index is not None else ContextIndex(context_data)
+        return [(item.position, item.path, item.value) for item in index.items]
 
     def _analyze_content_focus(self, content: str) -> Dict[str, Any]:
         """Analyze a single content item for focus-related characteristics."""
-        content_lower = content.lower()
+        hits = self.keyword_engine.scan(content)
 
         analysis = {
             "is_current_work": False,
@@ -247,26 +240,26 @@ class FocusScorer:
         }
 
         # Check for current work indicators
-        current_work_matches = self.current_work_regex.findall(content_lower)
+        current_work_matches = hits.get("current_work")
         if current_work_matches:
             analysis["is_current_work"] = True
             analysis["focus_keywords"].extend(current_work_matches)
 
         # Check for high priority indicators
-        priority_matches = self.high_priority_regex.findall(content_lower)
+        priority_matches = hits.get("high_priority")
         if priority_matches:
             analysis["is_high_priority"] = True
             analysis["priority_keywords"].extend(priority_matches)
 
         # Check for distraction indicators
-        distraction_matches = self.distraction_regex.findall(content_lower)
+        distraction_matches = hits.get("distraction")
         if distraction_matches:
             analysis["is_distraction"] = True
             analysis["distraction_keywords"].extend(distraction_matches)
 
         # Check for actionable patterns
-        for pattern in self.task_action_patterns:
-            matches = pattern.findall(content_lower)
+        for index in range(len(self.TASK_ACTION_PATTERNS)):
+            matches = hits.get(f"action_{index}")
             if matches:
                 analysis["is_actionable"] = True
                 analysis["action_patterns"].extend(matches)
@@ -403,13 +396,14 @@ class FocusScorer:
         return int(min(100, max(0, weighted_score)))
 
     async def calculate_focus_metrics(
-        self, context_data: Dict[str, Any]
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
     ) -> FocusMetrics:
         """
         Calculate comprehensive focus metrics for context data.
 
         Args:
             context_data: Context data to analyze for focus quality
+            index: Prebuilt ContextIndex of context_data, built here if omitted
 
         Returns:
             FocusMetrics with detailed focus analysis and scores
@@ -418,7 +412,11 @@ class FocusScorer:
 
         try:
             # Extract content items with positions
-            items_with_positions = self._extract_content_with_positions(context_data)
+            if index is None:
+                index = ContextIndex(context_data)
+            items_with_positions = self._extract_content_with_positions(
+                context_data, index
+            )
 
             if not items_with_positions:
                 logger.warning("No content items found for focus analysis")
@@ -430,8 +428,7 @@ class FocusScorer:
             distraction_keywords_found = []
 
             for position, path, content in items_with_positions:
-                content_str = str(content)
-                analysis = self._analyze_content_focus(content_str)
+                analysis = self._analyze_content_focus(index.items[position].text)
                 items_with_analysis.append((position, path, content, analysis))
 
                 focus_keywords_found.extend(analysis["focus_keywords"])
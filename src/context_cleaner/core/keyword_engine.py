@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Keyword Engine
+
+Shared matcher that classifies a content item against several named pattern
+families (keyword lists or regexes) in one call, returning per-family hits.
+
+The analyzers previously lowercased each item and then ran every family's
+regex with ``re.IGNORECASE`` separately. The engine instead:
+
+- normalizes the text once and matches case-sensitively against lowercase
+  patterns, which is several times faster in CPython's regex engine than
+  case-insensitive matching of the same patterns
+- optionally runs one combined union regex first, so items without any hit
+  (paths, ids, timestamps - much of a typical context) are rejected in a
+  single pass without touching the individual families. This pays off for
+  keyword lists; regex families that start with a literal are already
+  found quickly on their own, and a union would lose that optimization.
+
+Per-family results are identical to ``findall()`` / ``search()`` with each
+family's own case-insensitive regex. Families are still matched separately
+once an item has hits, because matches of different families may overlap
+(``"high priority"`` holds both a priority and a current-work keyword),
+which a single left-to-right union scan cannot report.
+"""
+
+import re
+from typing import Dict, List, Mapping, Optional, Sequence, Set
+
+_LEADING_IGNORECASE = re.compile(r"^\(\?i\)")
+
+
+class KeywordEngine:
+    """
+    Case-insensitive matcher over named pattern families.
+
+    ``keywords`` maps a family to a keyword list, matched as an alternation
+    in list order. ``patterns`` maps a family to a regex, which must be
+    written in lowercase (escapes such as ``\\s`` or ``\\d`` are fine) and may
+    start with ``(?i)``. With ``preserve_case`` the reported matches are cut
+    from the original text; otherwise they are lowercase. ``prefilter``
+    enables the union pre-pass.
+    """
+
+    def __init__(
+        self,
+        keywords: Optional[Mapping[str, Sequence[str]]] = None,
+        patterns: Optional[Mapping[str, str]] = None,
+        preserve_case: bool = False,
+        prefilter: bool = True,
+    ):
+        families: Dict[str, str] = {
+            name: "|".join(word.lower() for word in words)
+            for name, words in (keywords or {}).items()
+        }
+        for name, pattern in (patterns or {}).items():
+            families[name] = _LEADING_IGNORECASE.sub("", pattern)
+        if not families:
+            raise ValueError("KeywordEngine needs at least one pattern family")
+
+        self.names: List[str] = list(families)
+        self.preserve_case = preserve_case
+        self._regexes = [re.compile(pattern) for pattern in families.values()]
+        # Used to extract original-case matches, and for text whose length
+        # changes when lowercased (rare Unicode), where positions would shift
+        self._fallback = [
+            re.compile(pattern, re.IGNORECASE) for pattern in families.values()
+        ]
+        self._any = self._any_fallback = None
+        if prefilter:
+            union = "|".join(f"(?:{pattern})" for pattern in families.values())
+            self._any = re.compile(union)
+            self._any_fallback = re.compile(union, re.IGNORECASE)
+
+    def _prepare(self, text: str):
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered, self._regexes, self._any
+        return text, self._fallback, self._any_fallback
+
+    def scan(self, text: str) -> Dict[str, list]:
+        """Every family's matches, as ``findall()`` returns them.
+
+        Families without hits are omitted.
+        """
+        haystack, regexes, prefilter = self._prepare(text)
+        if prefilter is not None and not prefilter.search(haystack):
+            return {}
+
+        hits: Dict[str, list] = {}
+        for index, regex in enumerate(regexes):
+            if self.preserve_case and haystack is not text:
+                # Cheap case-sensitive check first; only families that hit
+                # are extracted from the original text
+                if regex.search(haystack) is None:
+                    continue
+                matches = self._fallback[index].findall(text)
+            else:
+                matches = regex.findall(haystack)
+            if matches:
+                hits[self.names[index]] = matches
+        return hits
+
+    def present(self, text: str) -> Set[str]:
+        """Names of the families that match anywhere in ``text``."""
+        haystack, regexes, prefilter = self._prepare(text)
+        if prefilter is not None and not prefilter.search(haystack):
+            return set()
+        return {
+            name for name, regex in zip(self.names, regexes) if regex.search(haystack)
+        }
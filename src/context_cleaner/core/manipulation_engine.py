@@ -24,6 +24,7 @@ from copy import deepcopy
 from .context_analyzer import ContextAnalysisResult
 from .redundancy_detector import RedundancyReport
 from .priority_analyzer import PriorityReport
+from .working_context import WorkingContext
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +100,9 @@ class ManipulationEngine:
         self.require_confirmation_by_default = self.config.get(
             "require_confirmation", True
         )
+        # "working_copy" shares untouched values with the input context;
+        # "deep_copy" isolates them with a single copy per execution
+        self.execution_mode = self.config.get("execution_mode", "working_copy")
 
         logger.info("ManipulationEngine initialized with safety constraints")
 
@@ -656,112 +660,121 @@ class ManipulationEngine:
             Tuple of (modified_context, operation_result)
         """
         operation_start = time.time()
+        working = self._create_working_context(context_data)
 
         try:
-            modified_context = deepcopy(context_data)
-
-            if operation.operation_type == "remove":
-                # Remove specified keys
-                removed_items = {}
-                for key in operation.target_keys:
-                    if key in modified_context:
-                        removed_items[key] = modified_context.pop(key)
-
-                result = {
-                    "operation_id": operation.operation_id,
-                    "success": True,
-                    "items_removed": len(removed_items),
-                    "removed_keys": list(removed_items.keys()),
-                    "execution_time": time.time() - operation_start,
-                }
-
-            elif operation.operation_type == "consolidate":
-                # Consolidate content (simplified implementation)
-                consolidated_content = []
-                original_keys = []
-
-                for key in operation.target_keys:
-                    if key in modified_context:
-                        consolidated_content.append(str(modified_context[key]))
-                        original_keys.append(key)
-
-                if consolidated_content:
-                    # Create consolidated key name
-                    consolidated_key = f"consolidated_{original_keys[0]}"
-                    consolidated_value = " | ".join(consolidated_content)
-
-                    # Remove original keys and add consolidated content
-                    for key in original_keys:
-                        modified_context.pop(key, None)
-                    modified_context[consolidated_key] = consolidated_value
-
-                result = {
-                    "operation_id": operation.operation_id,
-                    "success": True,
-                    "items_consolidated": len(original_keys),
-                    "consolidated_key": consolidated_key,
-                    "execution_time": time.time() - operation_start,
-                }
-
-            elif operation.operation_type == "reorder":
-                # Reorder content keys
-                new_order = operation.operation_data.get("new_order", [])
-                reordered_context = {}
-
-                # Add keys in new order
-                for key in new_order:
-                    if key in modified_context:
-                        reordered_context[key] = modified_context[key]
-
-                # Add any remaining keys
-                for key, value in modified_context.items():
-                    if key not in reordered_context:
-                        reordered_context[key] = value
-
-                modified_context = reordered_context
-
-                result = {
-                    "operation_id": operation.operation_id,
-                    "success": True,
-                    "items_reordered": len(new_order),
-                    "new_order": new_order,
-                    "execution_time": time.time() - operation_start,
-                }
-
-            elif operation.operation_type == "summarize":
-                # Summarize content (placeholder - would need actual summarization logic)
-                for key in operation.target_keys:
-                    if key in modified_context:
-                        original_content = str(modified_context[key])
-                        # Placeholder summarization - just truncate for now
-                        if len(original_content) > 500:
-                            summarized = original_content[:400] + "... [SUMMARIZED]"
-                            modified_context[key] = summarized
-
-                result = {
-                    "operation_id": operation.operation_id,
-                    "success": True,
-                    "items_summarized": len(operation.target_keys),
-                    "summarization_type": operation.operation_data.get(
-                        "summarization_type"
-                    ),
-                    "execution_time": time.time() - operation_start,
-                }
-
-            else:
-                raise ValueError(f"Unknown operation type: {operation.operation_type}")
-
-            return modified_context, result
+            result = self._apply_operation(operation, working, operation_start)
+            return working.data, result
 
         except Exception as e:
             logger.error(f"Operation {operation.operation_id} failed: {e}")
-            return context_data, {
+            return context_data, self._failed_operation_result(
+                operation, e, operation_start
+            )
+
+    def _create_working_context(self, context_data: Dict[str, Any]) -> WorkingContext:
+        """Create the working copy operations are applied to."""
+        if self.execution_mode == "deep_copy":
+            # Isolate nested values from the caller, once per plan
+            return WorkingContext(deepcopy(context_data))
+        return WorkingContext(context_data)
+
+    def _failed_operation_result(
+        self, operation: ManipulationOperation, error: Exception, started: float
+    ) -> Dict[str, Any]:
+        return {
+            "operation_id": operation.operation_id,
+            "success": False,
+            "error": str(error),
+            "execution_time": time.time() - started,
+        }
+
+    def _apply_operation(
+        self,
+        operation: ManipulationOperation,
+        working: WorkingContext,
+        operation_start: float,
+    ) -> Dict[str, Any]:
+        """Apply an operation to the working copy and describe the result."""
+        if operation.operation_type == "remove":
+            # Remove specified keys
+            removed_keys = []
+            for key in operation.target_keys:
+                if key in working:
+                    working.pop(key)
+                    removed_keys.append(key)
+
+            return {
+                "operation_id": operation.operation_id,
+                "success": True,
+                "items_removed": len(removed_keys),
+                "removed_keys": removed_keys,
+                "execution_time": time.time() - operation_start,
+            }
+
+        elif operation.operation_type == "consolidate":
+            # Consolidate content (simplified implementation)
+            consolidated_content = []
+            original_keys = []
+
+            for key in operation.target_keys:
+                if key in working:
+                    consolidated_content.append(str(working[key]))
+                    original_keys.append(key)
+
+            if consolidated_content:
+                # Create consolidated key name
+                consolidated_key = f"consolidated_{original_keys[0]}"
+                consolidated_value = " | ".join(consolidated_content)
+
+                # Remove original keys and add consolidated content
+                for key in original_keys:
+                    working.pop(key)
+                working.set(consolidated_key, consolidated_value)
+
+            return {
+                "operation_id": operation.operation_id,
+                "success": True,
+                "items_consolidated": len(original_keys),
+                "consolidated_key": consolidated_key,
+                "execution_time": time.time() - operation_start,
+            }
+
+        elif operation.operation_type == "reorder":
+            # Reorder content keys
+            new_order = operation.operation_data.get("new_order", [])
+            working.reorder(new_order)
+
+            return {
+                "operation_id": operation.operation_id,
+                "success": True,
+                "items_reordered": len(new_order),
+                "new_order": new_order,
+                "execution_time": time.time() - operation_start,
+            }
+
+        elif operation.operation_type == "summarize":
+            # Summarize content (placeholder - would need actual summarization logic)
+            for key in operation.target_keys:
+                if key in working:
+                    original_content = str(working[key])
+                    # Placeholder summarization - just truncate for now
+                    if len(original_content) > 500:
+                        summarized = original_content[:400] + "... [SUMMARIZED]"
+                        working.set(key, summarized)
+
+            return {
                 "operation_id": operation.operation_id,
-                "success": False,
-                "error": str(e),
+                "success": True,
+                "items_summarized": len(operation.target_keys),
+                "summarization_type": operation.operation_data.get(
+                    "summarization_type"
+                ),
                 "execution_time": time.time() - operation_start,
             }
 
+        raise ValueError(f"Unknown operation type: {operation.operation_type}")
+
     def execute_plan(
         self,
         plan: ManipulationPlan,
@@ -782,7 +795,9 @@ class ManipulationEngine:
         execution_start = time.time()
 
         try:
-            modified_context = deepcopy(context_data)
+            # One working copy for the whole plan; a failed operation is
+            # rolled back through the undo log instead of copying per step
+            working = self._create_working_context(context_data)
             operation_results = []
             operations_executed = 0
             operations_failed = 0
@@ -795,9 +810,18 @@ class ManipulationEngine:
                     continue
 
                 # Execute the operation
-                modified_context, operation_result = self.execute_operation(
-                    operation, modified_context
-                )
+                operation_start = time.time()
+                checkpoint = working.checkpoint()
+                try:
+                    operation_result = self._apply_operation(
+                        operation, working, operation_start
+                    )
+                except Exception as e:
+                    logger.error(f"Operation {operation.operation_id} failed: {e}")
+                    working.rollback(checkpoint)
+                    operation_result = self._failed_operation_result(
+                        operation, e, operation_start
+                    )
 
                 operation_results.append(operation_result)
 
@@ -822,7 +846,7 @@ class ManipulationEngine:
                 operations_failed=operations_failed,
                 actual_token_reduction=actual_token_reduction,
                 execution_time=execution_time,
-                modified_context=modified_context,
+                modified_context=working.data,
                 operation_results=operation_results,
                 error_messages=error_messages,
                 executed_timestamp=datetime.now().isoformat(),
@@ -15,7 +15,7 @@ import json
 import logging
 import hashlib
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple, Set, Union
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Set, Union
 from dataclasses import dataclass, field
 from copy import deepcopy
 from enum import Enum
@@ -190,6 +190,15 @@ class ManipulationValidator:
         except ImportError:
             return 0
 
+    def _get_total_token_count(self, values: Iterable[Any]) -> int:
+        """Total token count of many values, counted as one batch."""
+        try:
+            from ..analysis.enhanced_token_counter import get_accurate_token_counts
+
+            return sum(get_accurate_token_counts(str(value) for value in values))
+        except ImportError:
+            return 0
+
     def _assess_content_risk(self, content: str) -> str:
         """Assess risk level of content being modified."""
         import re
@@ -465,10 +474,7 @@ class ManipulationValidator:
 
             # Calculate operation impact
             # ccusage approach: Use accurate token counting
-            total_context_tokens = sum(
-                self._get_accurate_token_count(str(value))
-                for value in context_data.values()
-            )
+            total_context_tokens = self._get_total_token_count(context_data.values())
 
             if total_context_tokens > 0:
                 operation_impact_ratio = (
@@ -597,9 +603,7 @@ class ManipulationValidator:
 
             # Validate total impact
             # ccusage approach: Use accurate token counting
-            total_context_tokens = sum(
-                self._get_accurate_token_count(str(v)) for v in context_data.values()
-            )
+            total_context_tokens = self._get_total_token_count(context_data.values())
             if total_context_tokens > 0:
                 total_reduction_ratio = (
                     plan.estimated_total_reduction / total_context_tokens
@@ -738,14 +742,8 @@ class ManipulationValidator:
 
             # Calculate token counts
             # ccusage approach: Use accurate token counting
-            original_tokens = sum(
-                self._get_accurate_token_count(str(v))
-                for v in original_context.values()
-            )
-            modified_tokens = sum(
-                self._get_accurate_token_count(str(v))
-                for v in modified_context.values()
-            )
+            original_tokens = self._get_total_token_count(original_context.values())
+            modified_tokens = self._get_total_token_count(modified_context.values())
 
             # Expected token reduction from operations
             expected_reduction = sum(
@@ -20,7 +20,6 @@ import re
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
-from copy import deepcopy
 from enum import Enum
 
 from .manipulation_engine import ManipulationOperation, ManipulationPlan
@@ -30,6 +29,7 @@ from .manipulation_validator import (
     RiskAssessment,
     RiskLevel,
 )
+from .working_context import WorkingContext
 
 logger = logging.getLogger(__name__)
 
@@ -165,64 +165,70 @@ class PreviewGenerator:
         self, operation: ManipulationOperation, context_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Simulate operation execution to generate preview."""
-        simulated_context = deepcopy(context_data)
+        working = WorkingContext(context_data)
+        self._simulate_on_working_copy(operation, working)
+        return working.data
 
+    def _simulate_on_working_copy(
+        self, operation: ManipulationOperation, working: WorkingContext
+    ):
+        """Apply the simulated operation to a working copy in place."""
         try:
             if operation.operation_type == "remove":
                 # Remove specified keys
                 for key in operation.target_keys:
-                    if key in simulated_context:
-                        del simulated_context[key]
+                    working.pop(key)
 
             elif operation.operation_type == "consolidate":
                 # Consolidate multiple keys into one
                 if len(operation.target_keys) > 1:
                     consolidated_content = []
                     for key in operation.target_keys:
-                        if key in simulated_context:
-                            consolidated_content.append(
-                                f"{key}: {simulated_context[key]}"
-                            )
-                            del simulated_context[key]
+                        if key in working:
+                            consolidated_content.append(f"{key}: {working[key]}")
+                            working.pop(key)
 
                     # Create consolidated key
                     consolidated_key = f"consolidated_{operation.target_keys[0]}"
-                    simulated_context[consolidated_key] = "\n".join(
-                        consolidated_content
-                    )
+                    working.set(consolidated_key, "\n".join(consolidated_content))
 
             elif operation.operation_type == "summarize":
                 # Summarize content (simulate by shortening)
                 for key in operation.target_keys:
-                    if key in simulated_context:
-                        original = str(simulated_context[key])
+                    if key in working:
+                        original = str(working[key])
                         if len(original) > 200:
                             # Simulate summarization
                             summary = (
                                 original[:100] + "...[summarized]..." + original[-50:]
                             )
-                            simulated_context[key] = summary
+                            working.set(key, summary)
 
             elif operation.operation_type == "reorder":
                 # Reordering doesn't change content, just structure
                 # For preview purposes, we'll keep it the same
                 pass
 
-            return simulated_context
-
         except Exception as e:
             logger.error(f"Error simulating operation: {e}")
-            return simulated_context
 
     def _generate_change_details(
         self,
         original_context: Dict[str, Any],
         modified_context: Dict[str, Any],
         operation: ManipulationOperation,
+        keys: Optional[List[str]] = None,
     ) -> List[ChangeDetail]:
-        """Generate detailed change information."""
+        """Generate detailed change information.
+
+        ``keys`` limits the comparison to keys known to have changed;
+        by default every key of both contexts is compared.
+        """
         changes = []
-        all_keys = set(original_context.keys()) | set(modified_context.keys())
+        if keys is not None:
+            all_keys = keys
+        else:
+            all_keys = set(original_context.keys()) | set(modified_context.keys())
 
         for key in all_keys:
             original_value = original_context.get(key)
@@ -288,20 +294,28 @@ class PreviewGenerator:
         include_validation: Optional[bool] = None,
     ) -> OperationPreview:
         """Generate preview for a single operation."""
+        return self._preview_on_working_copy(
+            operation, WorkingContext(context_data), include_validation
+        )
+
+    def _preview_on_working_copy(
+        self,
+        operation: ManipulationOperation,
+        working: WorkingContext,
+        include_validation: Optional[bool] = None,
+        context_size: Optional[int] = None,
+    ) -> OperationPreview:
+        """Preview an operation by applying it to ``working``.
+
+        The simulated change stays applied so plan previews can chain
+        operations on one working copy; only touched keys are diffed.
+        """
         preview_start = datetime.now()
 
         try:
-            # Simulate operation execution
-            modified_context = self._simulate_operation_execution(
-                operation, context_data
-            )
+            context_data = working.data
 
-            # Generate change details
-            changes = self._generate_change_details(
-                context_data, modified_context, operation
-            )
-
-            # Perform validation if requested
+            # Perform validation if requested, against the state before the operation
             validation_result = None
             risk_assessment = None
 
@@ -319,6 +333,26 @@ class PreviewGenerator:
                         operation, context_data
                     )
 
+            if context_size is None:
+                context_size = sum(len(str(v)) for v in context_data.values())
+
+            # Simulate operation execution and diff the keys it touched
+            if self.show_unchanged_context:
+                original_context = dict(context_data)
+                self._simulate_on_working_copy(operation, working)
+                changes = self._generate_change_details(
+                    original_context, working.data, operation
+                )
+            else:
+                checkpoint = working.checkpoint()
+                self._simulate_on_working_copy(operation, working)
+                changes = self._generate_change_details(
+                    working.before_values(checkpoint),
+                    working.data,
+                    operation,
+                    keys=working.touched_keys(checkpoint),
+                )
+
             # Calculate impact metrics
             total_size_change = sum(change.size_change for change in changes)
             affected_keys = [
@@ -331,13 +365,7 @@ class PreviewGenerator:
                 "affected_keys": len(affected_keys),
                 "total_size_change": total_size_change,
                 "size_reduction_percentage": (
-                    (
-                        abs(total_size_change)
-                        / sum(len(str(v)) for v in context_data.values())
-                    )
-                    * 100
-                    if context_data
-                    else 0
+                    (abs(total_size_change) / context_size) * 100 if context_size else 0
                 ),
                 "risk_score": (
                     sum(
@@ -403,7 +431,10 @@ class PreviewGenerator:
 
         try:
             operation_previews = []
-            cumulative_context = deepcopy(context_data)
+            # Operations are simulated in sequence on a single working copy
+            working = WorkingContext(context_data)
+            original_size = sum(len(str(v)) for v in context_data.values())
+            context_size = original_size
             total_changes = 0
             total_size_reduction = 0
             max_risk_level = RiskLevel.LOW
@@ -411,9 +442,13 @@ class PreviewGenerator:
 
             # Generate preview for each operation
             for operation in plan.operations:
-                op_preview = self.preview_operation(
-                    operation, cumulative_context, include_validation=include_validation
+                op_preview = self._preview_on_working_copy(
+                    operation,
+                    working,
+                    include_validation=include_validation,
+                    context_size=context_size,
                 )
+                context_size += sum(c.size_change for c in op_preview.changes)
 
                 operation_previews.append(op_preview)
 
@@ -436,14 +471,8 @@ class PreviewGenerator:
 
                 all_warnings.extend(op_preview.warnings)
 
-                # Apply operation to cumulative context for next operation
-                cumulative_context = self._simulate_operation_execution(
-                    operation, cumulative_context
-                )
-
             # Generate summary
-            original_size = sum(len(str(v)) for v in context_data.values())
-            final_size = sum(len(str(v)) for v in cumulative_context.values())
+            final_size = sum(len(str(v)) for v in working.data.values())
             actual_size_reduction = original_size - final_size
             reduction_percentage = (
                 (actual_size_reduction / original_size * 100)
@@ -14,10 +14,13 @@ Uses deadline detection, urgency keywords, dependency analysis, and semantic imp
 import re
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional, NamedTuple
+from typing import Dict, Any, List, Tuple, Optional, NamedTuple, Set
 from dataclasses import dataclass
 from collections import defaultdict
 
+from .context_index import ContextIndex
+from .keyword_engine import KeywordEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -217,14 +220,43 @@ class PriorityAnalyzer:
             re.compile(pattern) for pattern in self.DEPENDENCY_PATTERNS
         ]
 
+        # Shared matchers: one for priority signals, one for extraction
+        self.signal_engine = KeywordEngine(
+            keywords={
+                "critical": self.CRITICAL_URGENCY_KEYWORDS,
+                "high": self.HIGH_PRIORITY_KEYWORDS,
+                "current": self.CURRENT_WORK_KEYWORDS,
+                "low": self.LOW_PRIORITY_KEYWORDS,
+                "noise": self.NOISE_KEYWORDS,
+            }
+        )
+        self.extraction_engine = KeywordEngine(
+            patterns={
+                **{
+                    f"deadline_{index}": pattern
+                    for index, pattern in enumerate(self.DEADLINE_PATTERNS)
+                },
+                **{
+                    f"dependency_{index}": pattern
+                    for index, pattern in enumerate(self.DEPENDENCY_PATTERNS)
+                },
+            },
+            preserve_case=True,
+            prefilter=False,
+        )
+
         logger.debug("PriorityAnalyzer initialized")
 
-    def _extract_deadlines(self, content: str) -> List[str]:
+    def _extract_deadlines(
+        self, content: str, hits: Optional[Dict[str, list]] = None
+    ) -> List[str]:
         """Extract deadline information from content."""
         deadlines = []
+        if hits is None:
+            hits = self.extraction_engine.scan(content)
 
-        for pattern in self.deadline_patterns:
-            matches = pattern.findall(content)
+        for index in range(len(self.DEADLINE_PATTERNS)):
+            matches = hits.get(f"deadline_{index}", [])
             for match in matches:
                 if isinstance(match, tuple):
                     match = (
@@ -235,12 +267,16 @@ class PriorityAnalyzer:
 
         return deadlines
 
-    def _extract_dependencies(self, content: str) -> List[str]:
+    def _extract_dependencies(
+        self, content: str, hits: Optional[Dict[str, list]] = None
+    ) -> List[str]:
         """Extract dependency information from content."""
         dependencies = []
+        if hits is None:
+            hits = self.extraction_engine.scan(content)
 
-        for pattern in self.dependency_patterns:
-            matches = pattern.findall(content)
+        for index in range(len(self.DEPENDENCY_PATTERNS)):
+            matches = hits.get(f"dependency_{index}", [])
             for match in matches:
                 if match and len(match.strip()) > 0:
                     # Clean up the dependency text
@@ -251,25 +287,30 @@ class PriorityAnalyzer:
         return dependencies
 
     def _calculate_priority_score(
-        self, content: str, context_position: int, total_items: int
+        self,
+        content: str,
+        context_position: int,
+        total_items: int,
+        signals: Optional[Set[str]] = None,
     ) -> Tuple[int, str, str]:
         """Calculate priority score and categorization for content item."""
-        content_lower = content.lower()
+        if signals is None:
+            signals = self.signal_engine.present(content)
         base_score = 50  # Default medium priority
 
         # Priority signal detection
         urgency_signals = {"critical": 0, "high": 0, "current": 0, "low": 0, "noise": 0}
 
         # Check for different priority signals
-        if self.critical_regex.search(content_lower):
+        if "critical" in signals:
             urgency_signals["critical"] = 40
-        if self.high_priority_regex.search(content_lower):
+        if "high" in signals:
             urgency_signals["high"] = 30
-        if self.current_work_regex.search(content_lower):
+        if "current" in signals:
             urgency_signals["current"] = 25
-        if self.low_priority_regex.search(content_lower):
+        if "low" in signals:
             urgency_signals["low"] = -20
-        if self.noise_regex.search(content_lower):
+        if "noise" in signals:
             urgency_signals["noise"] = -30
 
         # Calculate weighted score
@@ -304,19 +345,25 @@ class PriorityAnalyzer:
         return int(priority_score), urgency_level, impact_level
 
     def _categorize_by_priority(
-        self, priority_score: int, urgency_level: str, content: str
+        self,
+        priority_score: int,
+        urgency_level: str,
+        content: str,
+        signals: Optional[Set[str]] = None,
     ) -> str:
         """Categorize content by priority and characteristics."""
         content_lower = content.lower()
+        if signals is None:
+            signals = self.signal_engine.present(content)
 
         # Special categories
-        if self.noise_regex.search(content_lower):
+        if "noise" in signals:
             return "noise"
 
         if "block" in content_lower or "stuck" in content_lower:
             return "blocking"
 
-        if self.current_work_regex.search(content_lower):
+        if "current" in signals:
             return "current_work"
 
         # Priority-based categories
@@ -336,13 +383,13 @@ class PriorityAnalyzer:
         conflicts = []
 
         for item in priority_items:
-            content_lower = item.content.lower()
+            signals = self.signal_engine.present(item.content)
 
             # Look for mixed signals
-            has_high_priority = self.high_priority_regex.search(content_lower)
-            has_low_priority = self.low_priority_regex.search(content_lower)
-            has_current = self.current_work_regex.search(content_lower)
-            has_noise = self.noise_regex.search(content_lower)
+            has_high_priority = "high" in signals
+            has_low_priority = "low" in signals
+            has_current = "current" in signals
+            has_noise = "noise" in signals
 
             conflict_signals = []
             if has_high_priority and has_low_priority:
@@ -449,40 +496,21 @@ class PriorityAnalyzer:
         return improvements
 
     def _extract_content_items_with_positions(
-        self, context_data: Dict[str, Any]
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
     ) -> List[Tuple[int, str, str]]:
         """Extract content items with position information."""
-        items = []
-        position = 0
-
-        def extract_recursive(data: Any, path: str = ""):
-            nonlocal position
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if isinstance(value, (dict, list)):
-                        extract_recursive(value, current_path)
-                    else:
-                        items.append((position, current_path, str(value)))
-                        position += 1
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    current_path = f"{path}[{i}]"
-                    if isinstance(item, (dict, list)):
-                        extract_recursive(item, current_path)
-                    else:
-                        items.append((position, current_path, str(item)))
-                        position += 1
-
-        extract_recursive(context_data)
-        return items
-
-    async def analyze_priorities(self, context_data: Dict[str, Any]) -> PriorityReport:
+        index = index if index is not None else ContextIndex(context_data)
+        return [(item.position, item.path, item.text) for item in index.items]
+
+    async def analyze_priorities(
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
+    ) -> PriorityReport:
         """
         Perform comprehensive priority analysis on context data.
 
         Args:
             context_data: Context data to analyze for priority patterns
+            index: Prebuilt ContextIndex of context_data, built here if omitted
 
         Returns:
             PriorityReport with detailed priority analysis and recommendations
@@ -491,7 +519,9 @@ class PriorityAnalyzer:
 
         try:
             # Extract content items with positions
-            content_items = self._extract_content_items_with_positions(context_data)
+            content_items = self._extract_content_items_with_positions(
+                context_data, index
+            )
 
             if not content_items:
                 logger.warning("No content items found for priority analysis")
@@ -503,20 +533,24 @@ class PriorityAnalyzer:
             blocking_dependencies = []
 
             for position, path, content in content_items:
+                # Match every keyword family once per item
+                signals = self.signal_engine.present(content)
+                extracted = self.extraction_engine.scan(content)
+
                 # Calculate priority score and levels
                 priority_score, urgency_level, impact_level = (
                     self._calculate_priority_score(
-                        content, position, len(content_items)
+                        content, position, len(content_items), signals
                     )
                 )
 
                 # Extract deadlines and dependencies
-                deadlines = self._extract_deadlines(content)
-                dependencies = self._extract_dependencies(content)
+                deadlines = self._extract_deadlines(content, extracted)
+                dependencies = self._extract_dependencies(content, extracted)
 
                 # Categorize the item
                 category = self._categorize_by_priority(
-                    priority_score, urgency_level, content
+                    priority_score, urgency_level, content, signals
                 )
 
                 # Create priority item
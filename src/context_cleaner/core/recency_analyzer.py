@@ -19,6 +19,9 @@ from dataclasses import dataclass
 from dateutil import parser
 import pytz
 
+from .context_index import ContextIndex
+from .keyword_engine import KeywordEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,6 +127,12 @@ class RecencyAnalyzer:
         self.stale_work_regex = re.compile(
             "|".join(self.STALE_WORK_KEYWORDS), re.IGNORECASE
         )
+        self.keyword_engine = KeywordEngine(
+            keywords={
+                "current_work": self.CURRENT_WORK_KEYWORDS,
+                "stale_work": self.STALE_WORK_KEYWORDS,
+            }
+        )
         logger.debug("RecencyAnalyzer initialized")
 
     def _extract_timestamp(self, content: Any) -> Optional[datetime]:
@@ -287,49 +296,34 @@ class RecencyAnalyzer:
 
     def _categorize_by_content(self, content: Any) -> Optional[str]:
         """Categorize content based on textual clues about recency."""
-        content_str = str(content).lower()
+        signals = self.keyword_engine.present(str(content))
 
         # Check for current work indicators
-        if self.current_work_regex.search(content_str):
+        if "current_work" in signals:
             return "recent"  # Bias toward recent for current work
 
         # Check for stale work indicators
-        if self.stale_work_regex.search(content_str):
+        if "stale_work" in signals:
             return "stale"  # Bias toward stale for old work
 
         return None  # No clear indication from content
 
     def _extract_content_items(
-        self, context_data: Dict[str, Any]
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
     ) -> List[Tuple[str, Any]]:
         """Extract individual content items from context data for analysis."""
-        items = []
-
-        def extract_recursive(data: Any, path: str = ""):
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if isinstance(value, (dict, list)):
-                        extract_recursive(value, current_path)
-                    else:
-                        items.append((current_path, value))
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    current_path = f"{path}[{i}]"
-                    if isinstance(item, (dict, list)):
-                        extract_recursive(item, current_path)
-                    else:
-                        items.append((current_path, item))
+        index = index if index is not None else ContextIndex(context_data)
+        return [(item.path, item.value) for item in index.items]
 
-        extract_recursive(context_data)
-        return items
-
-    async def analyze_recency(self, context_data: Dict[str, Any]) -> RecencyReport:
+    async def analyze_recency(
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
+    ) -> RecencyReport:
         """
         Perform comprehensive recency analysis on context data.
 
         Args:
             context_data: Context data to analyze for recency patterns
+            index: Prebuilt ContextIndex of context_data, built here if omitted
 
         Returns:
             RecencyReport with detailed recency categorization and insights
@@ -338,17 +332,13 @@ class RecencyAnalyzer:
 
         try:
             # Extract individual content items
-            content_items = self._extract_content_items(context_data)
+            if index is None:
+                index = ContextIndex(context_data)
+            content_items = self._extract_content_items(context_data, index)
 
             # Extract timestamps from all content
-            timestamps = []
-            timestamped_items = []
-
-            for path, item in content_items:
-                timestamp = self._extract_timestamp(item)
-                if timestamp:
-                    timestamps.append(timestamp)
-                    timestamped_items.append((path, item, timestamp))
+            timestamped_items = index.resolve_timestamps(self._extract_timestamp)
+            timestamps = [item.timestamp for item in timestamped_items]
 
             # Estimate session start time
             session_start = self._estimate_session_start(timestamps)
@@ -369,14 +359,14 @@ class RecencyAnalyzer:
             stale_items = []
 
             # Process items with timestamps
-            for path, item, timestamp in timestamped_items:
-                category = self._categorize_by_timestamp(timestamp, session_start)
+            for item in timestamped_items:
+                category = self._categorize_by_timestamp(item.timestamp, session_start)
 
                 item_data = {
-                    "path": path,
-                    "content_preview": str(item)[:100]
-                    + ("..." if len(str(item)) > 100 else ""),
-                    "timestamp": timestamp.isoformat(),
+                    "path": item.path,
+                    "content_preview": item.text[:100]
+                    + ("..." if len(item.text) > 100 else ""),
+                    "timestamp": item.timestamp.isoformat(),
                     "categorization_method": "timestamp",
                 }
 
@@ -390,16 +380,14 @@ class RecencyAnalyzer:
                     stale_items.append(item_data)
 
             # Process items without timestamps using content analysis
-            for path, item in content_items:
-                if not any(
-                    path == ti[0] for ti in timestamped_items
-                ):  # Not already categorized
-                    content_category = self._categorize_by_content(item)
+            for item in index.items:
+                if item.timestamp is None:  # Not already categorized
+                    content_category = self._categorize_by_content(item.text)
 
                     item_data = {
-                        "path": path,
-                        "content_preview": str(item)[:100]
-                        + ("..." if len(str(item)) > 100 else ""),
+                        "path": item.path,
+                        "content_preview": item.text[:100]
+                        + ("..." if len(item.text) > 100 else ""),
                         "timestamp": None,
                         "categorization_method": "content_analysis",
                     }
@@ -456,23 +444,27 @@ class RecencyAnalyzer:
         except Exception as e:
             logger.error(f"Recency analysis failed: {e}")
             # Return empty report on failure
-            return RecencyReport(
-                fresh_context_percentage=0.0,
-                recent_context_percentage=0.0,
-                aging_context_percentage=0.0,
-                stale_context_percentage=0.0,
-                fresh_items=[],
-                recent_items=[],
-                aging_items=[],
-                stale_items=[],
-                estimated_session_start=None,
-                session_duration_minutes=0.0,
-                session_activity_score=0.0,
-                total_items_categorized=0,
-                items_with_timestamps=0,
-                analysis_timestamp=datetime.now().isoformat(),
-                recency_analysis_duration=0.0,
-            )
+            return self._get_empty_recency_report()
+
+    def _get_empty_recency_report(self) -> RecencyReport:
+        """Return an empty recency report in case of failure."""
+        return RecencyReport(
+            fresh_context_percentage=0.0,
+            recent_context_percentage=0.0,
+            aging_context_percentage=0.0,
+            stale_context_percentage=0.0,
+            fresh_items=[],
+            recent_items=[],
+            aging_items=[],
+            stale_items=[],
+            estimated_session_start=None,
+            session_duration_minutes=0.0,
+            session_activity_score=0.0,
+            total_items_categorized=0,
+            items_with_timestamps=0,
+            analysis_timestamp=datetime.now().isoformat(),
+            recency_analysis_duration=0.0,
+        )
 
 
 if __name__ == "__main__":
@@ -13,15 +13,16 @@ Performance: Optimized for large contexts with efficient similarity detection
 """
 
 import re
-import json
 import hashlib
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from collections import defaultdict
 
+from .context_index import ContextIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,8 +140,14 @@ class RedundancyDetector:
         else:
             return str(item)
 
-    def _detect_exact_duplicates(self, items: List[Any]) -> List[Tuple[int, int]]:
-        """Detect exact duplicate content items."""
+    def _detect_exact_duplicates(
+        self, items: List[Any], content_hashes: Optional[List[str]] = None
+    ) -> List[Tuple[int, int]]:
+        """Detect exact duplicate content items.
+
+        ``content_hashes`` holds precomputed hashes of the items, e.g. from a
+        ContextIndex; they are computed here when omitted.
+        """
         duplicates = []
         content_map = defaultdict(list)
 
@@ -148,7 +155,10 @@ class RedundancyDetector:
         for i, item in enumerate(items):
             content = self._extract_text_content(item)
             if len(content.strip()) > 0:  # Skip empty content
-                content_hash = hashlib.md5(content.encode()).hexdigest()
+                if content_hashes is not None:
+                    content_hash = content_hashes[i]
+                else:
+                    content_hash = hashlib.md5(content.encode()).hexdigest()
                 content_map[content_hash].append(i)
 
         # Find groups with multiple items (duplicates)
@@ -251,7 +261,9 @@ class RedundancyDetector:
 
         return stale_errors
 
-    def _categorize_content(self, context_data: Dict[str, Any]) -> Dict[str, List[Any]]:
+    def _categorize_content(
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
+    ) -> Dict[str, List[Any]]:
         """Categorize context content into types for targeted analysis."""
         categories = {
             "conversations": [],
@@ -266,49 +278,20 @@ class RedundancyDetector:
             "other": [],
         }
 
-        def add_to_category(key: str, value: Any):
-            """Add item to appropriate category based on key."""
-            key_lower = key.lower()
-
-            if any(word in key_lower for word in ["conversation", "chat", "message"]):
-                categories["messages"].append(value)
-            elif any(word in key_lower for word in ["file", "path", "document"]):
-                categories["files"].append(value)
-            elif any(word in key_lower for word in ["todo", "task", "action"]):
-                categories["todos"].append(value)
-            elif any(word in key_lower for word in ["error", "exception", "failure"]):
-                categories["errors"].append(value)
-            elif any(word in key_lower for word in ["system", "reminder", "note"]):
-                categories["system_messages"].append(value)
-            else:
-                categories["other"].append(value)
-
-        # Recursively categorize content
-        def categorize_recursive(data: Any, parent_key: str = ""):
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    full_key = f"{parent_key}.{key}" if parent_key else key
-                    if isinstance(value, (dict, list)):
-                        categorize_recursive(value, full_key)
-                    else:
-                        add_to_category(full_key, value)
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    categorize_recursive(item, f"{parent_key}[{i}]")
-            else:
-                add_to_category(parent_key, data)
-
-        categorize_recursive(context_data)
+        index = index if index is not None else ContextIndex(context_data)
+        for item in index.items:
+            categories[item.category].append(item.value)
         return categories
 
     async def analyze_redundancy(
-        self, context_data: Dict[str, Any]
+        self, context_data: Dict[str, Any], index: Optional[ContextIndex] = None
     ) -> RedundancyReport:
         """
         Perform comprehensive redundancy analysis on context data.
 
         Args:
             context_data: Context data to analyze for redundancy
+            index: Prebuilt ContextIndex of context_data, built here if omitted
 
         Returns:
             RedundancyReport with detailed findings and recommendations
@@ -317,7 +300,9 @@ class RedundancyDetector:
 
         try:
             # Categorize content for targeted analysis
-            categories = self._categorize_content(context_data)
+            if index is None:
+                index = ContextIndex(context_data)
+            categories = self._categorize_content(context_data, index)
 
             # Track all findings
             duplicate_items = []
@@ -326,7 +311,7 @@ class RedundancyDetector:
             consolidation_candidates = []
 
             total_items = sum(len(items) for items in categories.values())
-            total_content = json.dumps(context_data, default=str)
+            total_content = index.serialized
 
             # ccusage approach: Use accurate token counting
             try:
@@ -341,7 +326,10 @@ class RedundancyDetector:
             # Analyze messages and conversations for duplicates
             messages = categories["messages"]
             if messages:
-                exact_duplicates = self._detect_exact_duplicates(messages)
+                exact_duplicates = self._detect_exact_duplicates(
+                    messages,
+                    [item.content_hash for item in index.in_category("messages")],
+                )
                 similar_content = self._detect_similar_content(messages)
 
                 for i, j in exact_duplicates:
@@ -442,21 +430,25 @@ class RedundancyDetector:
         except Exception as e:
             logger.error(f"Redundancy analysis failed: {e}")
             # Return empty report on failure
-            return RedundancyReport(
-                duplicate_content_percentage=0.0,
-                stale_content_percentage=0.0,
-                redundant_files_count=0,
-                obsolete_todos_count=0,
-                duplicate_items=[],
-                obsolete_items=[],
-                redundant_file_groups=[],
-                stale_error_messages=[],
-                total_items_analyzed=0,
-                total_estimated_tokens=0,
-                redundancy_analysis_duration=0.0,
-                safe_to_remove=[],
-                consolidation_candidates=[],
-            )
+            return self._get_empty_redundancy_report()
+
+    def _get_empty_redundancy_report(self) -> RedundancyReport:
+        """Return an empty redundancy report in case of failure."""
+        return RedundancyReport(
+            duplicate_content_percentage=0.0,
+            stale_content_percentage=0.0,
+            redundant_files_count=0,
+            obsolete_todos_count=0,
+            duplicate_items=[],
+            obsolete_items=[],
+            redundant_file_groups=[],
+            stale_error_messages=[],
+            total_items_analyzed=0,
+            total_estimated_tokens=0,
+            redundancy_analysis_duration=0.0,
+            safe_to_remove=[],
+            consolidation_candidates=[],
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Working Context
+
+A single mutable working copy of a context with a recorded undo log, used to
+execute and preview manipulation plans without copying the whole context
+once per operation.
+
+Operations never mutate values in place; they replace or remove top-level
+keys. The working copy therefore only needs a shallow copy of the original
+mapping, and every change records the previous value of the key it touched.
+Rolling back an operation and diffing it against its starting state cost
+time proportional to the keys it touched, not to the size of the context.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+_MISSING = object()
+
+
+@dataclass
+class _Change:
+    """One recorded change to the working copy."""
+
+    kind: str  # set, delete, reorder
+    key: Optional[str]  # Affected key (None for reorder)
+    previous: Any  # Value before the change (key order for reorder)
+    value: Any  # Value after the change (key order for reorder)
+
+
+class WorkingContext:
+    """
+    Mutable working copy of a context dict with an undo log.
+
+    The original mapping is never modified. ``checkpoint()`` marks a position
+    in the log, ``rollback()`` returns to it, and ``touched_keys()`` /
+    ``before_values()`` describe what changed since it.
+    """
+
+    def __init__(self, original: Dict[str, Any]):
+        self.original = original
+        self.data: Dict[str, Any] = dict(original)
+        self._log: List[_Change] = []
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def set(self, key: str, value: Any):
+        """Assign a key, recording its previous value."""
+        previous = self.data.get(key, _MISSING)
+        self.data[key] = value
+        self._log.append(_Change("set", key, previous, value))
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove a key if present, recording its value."""
+        if key not in self.data:
+            return default
+        value = self.data.pop(key)
+        self._log.append(_Change("delete", key, value, _MISSING))
+        return value
+
+    def reorder(self, new_order: List[str]):
+        """Move the listed keys to the front, keeping the rest in order."""
+        previous = list(self.data)
+        reordered = {key: self.data[key] for key in new_order if key in self.data}
+        for key, value in self.data.items():
+            if key not in reordered:
+                reordered[key] = value
+        self.data = reordered
+        self._log.append(_Change("reorder", None, previous, list(reordered)))
+
+    def checkpoint(self) -> int:
+        """Position in the undo log to roll back or diff against."""
+        return len(self._log)
+
+    def rollback(self, checkpoint: int = 0):
+        """Undo every change recorded after ``checkpoint``."""
+        undone = self._log[checkpoint:]
+        del self._log[checkpoint:]
+        if any(change.kind == "delete" for change in undone):
+            # Re-inserting a removed key would move it to the end; replay the
+            # kept changes over the original instead to restore key order.
+            self.data = dict(self.original)
+            for change in self._log:
+                self._apply(change)
+            return
+        for change in reversed(undone):
+            if change.kind == "reorder":
+                self.data = {key: self.data[key] for key in change.previous}
+            elif change.previous is _MISSING:
+                del self.data[change.key]
+            else:
+                self.data[change.key] = change.previous
+
+    def _apply(self, change: _Change):
+        if change.kind == "set":
+            self.data[change.key] = change.value
+        elif change.kind == "delete":
+            del self.data[change.key]
+        else:
+            self.data = {key: self.data[key] for key in change.value}
+
+    def touched_keys(self, checkpoint: int = 0) -> List[str]:
+        """Keys whose presence or value changed after ``checkpoint``."""
+        keys = dict.fromkeys(
+            change.key for change in self._log[checkpoint:] if change.key is not None
+        )
+        return list(keys)
+
+    def before_values(self, checkpoint: int = 0) -> Dict[str, Any]:
+        """Values of touched keys as they were at ``checkpoint``.
+
+        Keys that did not exist at the checkpoint are omitted.
+        """
+        before: Dict[str, Any] = {}
+        seen = set()
+        for change in self._log[checkpoint:]:
+            if change.key is None or change.key in seen:
+                continue
+            seen.add(change.key)
+            if change.previous is not _MISSING:
+                before[change.key] = change.previous
+        return before
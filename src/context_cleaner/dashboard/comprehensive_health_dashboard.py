@@ -87,6 +87,13 @@ from .modules.dashboard_cache import DashboardCache, CacheCoordinator
 # Phase 2.4 Extraction: Import extracted real-time WebSocket management
 from .modules.dashboard_realtime import DashboardRealtime, RealtimeCoordinator
 
+# Content-hash memoization of health report inputs and partial results
+from .modules.dashboard_health_memo import (
+    CACHE_DASHBOARD_MAX_AGE,
+    ContextSnapshot,
+    HealthReportMemo,
+)
+
 # Optional cache dashboard imports
 try:
     from ..optimization.cache_dashboard import (
@@ -161,6 +168,7 @@ except ImportError:
 # Telemetry dashboard imports
 try:
     from ..telemetry.clients.clickhouse_client import ClickHouseClient
+    from ..telemetry.clients.sqlite_client import select_telemetry_client
     from ..telemetry.cost_optimization.engine import CostOptimizationEngine
     from ..telemetry.error_recovery.manager import ErrorRecoveryManager
     from ..telemetry.dashboard.widgets import (
@@ -295,7 +303,7 @@ class ComprehensiveHealthDashboard:
 
     def __init__(self, cache_dir: Optional[Path] = None, config: Optional[Any] = None):
         """Initialize the comprehensive health dashboard."""
-        self.cache_dashboard = CacheEnhancedDashboard(cache_dir=cache_dir)
+        self.cache_dashboard = CacheEnhancedDashboard.from_config(config, cache_dir)
         self.health_scorer = ContextHealthScorer()
         self.pattern_recognizer = AdvancedPatternRecognizer()
 
@@ -306,6 +314,9 @@ class ComprehensiveHealthDashboard:
         self.temporal_analyzer = TemporalContextAnalyzer()
         self.enhanced_analyzer = EnhancedContextAnalyzer()
 
+        # Per-item and per-analyzer memo for repeated health reports
+        self._health_memo = HealthReportMemo()
+
         # Context Window Analysis
         self.context_analyzer = (
             ContextWindowAnalyzer() if CONTEXT_ANALYZER_AVAILABLE else None
@@ -445,8 +456,9 @@ class ComprehensiveHealthDashboard:
         self.telemetry_enabled = TELEMETRY_DASHBOARD_AVAILABLE
         if self.telemetry_enabled:
             try:
-                # Initialize telemetry components
-                self.telemetry_client = ClickHouseClient()
+                # Initialize telemetry components; uses the local SQLite
+                # store when ClickHouse is not reachable
+                self.telemetry_client = select_telemetry_client()
 
                 # Initialize cost optimization with default budget
                 budget_config = BudgetConfig(
@@ -4067,7 +4079,7 @@ if __name__ == "__main__":
         """Get dashboard metrics from local JSONL files when telemetry is unavailable."""
         try:
             # Import enhanced token counter and session parser for local analysis
-            from ..analysis.enhanced_token_counter import get_accurate_token_count
+            from ..analysis.enhanced_token_counter import get_accurate_token_counts
             from ..analysis.session_parser import SessionParser
             import os
             import json
@@ -4104,15 +4116,14 @@ if __name__ == "__main__":
                         total_sessions += len(sessions)
 
                         for session in sessions:
-                            # Count tokens using our enhanced counter
-                            # Count tokens for this session
-                            session_tokens = 0
-                            for message in session.messages:
-                                if hasattr(message, "content") and message.content:
-                                    tokens = get_accurate_token_count(
-                                        str(message.content)
-                                    )
-                                    session_tokens += tokens
+                            # Count tokens for this session in one batch
+                            session_tokens = sum(
+                                get_accurate_token_counts(
+                                    str(message.content)
+                                    for message in session.messages
+                                    if getattr(message, "content", None)
+                                )
+                            )
 
                             total_tokens += session_tokens
 
@@ -4767,33 +4778,83 @@ if __name__ == "__main__":
         try:
             logger.info("Starting comprehensive context health analysis")
 
-            # Load context data
+            # Load context data; an unchanged file reuses its last snapshot
+            snapshot = None
             if context_data is None and context_path:
-                context_data = await self._load_context_data(context_path)
+                snapshot = self._health_memo.file_snapshot(context_path)
+                if snapshot is None:
+                    context_data = await self._load_context_data(context_path)
+                    snapshot = self._context_snapshot(context_data)
+                    self._health_memo.remember_file(context_path, snapshot)
+                context_data = snapshot.context_data
             elif context_data is None:
                 context_data = {}
-
-            # Get cache-enhanced dashboard data first (from PR15.3)
-            cache_dashboard_data = await self.cache_dashboard.generate_dashboard(
-                context_path=context_path,
-                include_cross_session=include_usage_intelligence,
+            if snapshot is None:
+                snapshot = self._context_snapshot(context_data)
+
+            # Get cache-enhanced dashboard data first (from PR15.3), skipping
+            # the session parsing and analysis when its inputs are unchanged
+            now = datetime.now()
+            cache_locations = await self.cache_dashboard.discover_cache_inputs()
+            cache_dashboard_data = await self._memoized_analysis(
+                "cache_dashboard",
+                (
+                    str(context_path) if context_path else None,
+                    include_usage_intelligence,
+                    snapshot.digest,
+                    self.cache_dashboard.input_fingerprint(cache_locations),
+                ),
+                now,
+                lambda: self.cache_dashboard.generate_dashboard(
+                    context_path=context_path,
+                    include_cross_session=include_usage_intelligence,
+                    cache_locations=cache_locations,
+                ),
+                expires_at=now + CACHE_DASHBOARD_MAX_AGE,
             )
 
-            # Analyze all metric categories
-            focus_metrics = await self._analyze_focus_metrics(
-                context_data, cache_dashboard_data
+            # Analyze all metric categories, reusing results whose inputs are
+            # unchanged. Time-dependent results expire when an item ages into
+            # a different recency bucket.
+            memo_key = (snapshot.digest, self._cache_inputs_key(cache_dashboard_data))
+            stable_until = snapshot.stable_until(now)
+
+            focus_metrics = await self._memoized_analysis(
+                "focus",
+                memo_key,
+                now,
+                lambda: self._analyze_focus_metrics(
+                    context_data, cache_dashboard_data, snapshot
+                ),
             )
 
-            redundancy_analysis = await self._analyze_redundancy(
-                context_data, cache_dashboard_data
+            redundancy_analysis = await self._memoized_analysis(
+                "redundancy",
+                memo_key,
+                now,
+                lambda: self._analyze_redundancy(
+                    context_data, cache_dashboard_data, snapshot
+                ),
+                expires_at=stable_until,
             )
 
-            recency_indicators = await self._analyze_recency(
-                context_data, cache_dashboard_data
+            recency_indicators = await self._memoized_analysis(
+                "recency",
+                memo_key,
+                now,
+                lambda: self._analyze_recency(
+                    context_data, cache_dashboard_data, snapshot
+                ),
+                expires_at=stable_until,
             )
 
-            size_optimization = await self._analyze_size_optimization(
-                context_data, cache_dashboard_data
+            size_optimization = await self._memoized_analysis(
+                "size",
+                memo_key,
+                now,
+                lambda: self._analyze_size_optimization(
+                    context_data, cache_dashboard_data, snapshot
+                ),
             )
 
             # Generate enhanced insights
@@ -4804,13 +4865,17 @@ if __name__ == "__main__":
             token_efficiency_trends = await self._generate_token_efficiency_trends(
                 cache_dashboard_data
             )
-            optimization_recommendations = (
-                await self._generate_optimization_recommendations(
+            optimization_recommendations = await self._memoized_analysis(
+                "recommendations",
+                memo_key,
+                now,
+                lambda: self._generate_optimization_recommendations(
                     focus_metrics,
                     redundancy_analysis,
                     recency_indicators,
                     size_optimization,
-                )
+                ),
+                expires_at=stable_until,
             )
 
             analysis_duration = time.time() - start_time
@@ -4870,6 +4935,56 @@ if __name__ == "__main__":
     MAX_CONTEXT_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit
     ALLOWED_EXTENSIONS = {".json", ".jsonl", ".txt"}
 
+    def _context_snapshot(self, context_data: Dict[str, Any]) -> ContextSnapshot:
+        """Snapshot context data, classifying only items not seen before."""
+        return self._health_memo.snapshot(context_data, self._classify_context_item)
+
+    def _classify_context_item(self, item: Any) -> Dict[str, Any]:
+        """Per-item classification cached by content digest."""
+        is_dict = isinstance(item, dict)
+        item_str = str(item).lower() if is_dict else ""
+        return {
+            "current_work": self._is_current_work_item(item),
+            "important": self._is_important_item(item),
+            "active_task": self._is_active_task(item),
+            "clear_action": self._has_clear_action(item),
+            "clear_completion": self._has_clear_completion_criteria(item),
+            "obsolete_todo": self._is_obsolete_todo(item),
+            "mentions_ongoing_work": is_dict
+            and any(keyword in item_str for keyword in self.ONGOING_WORK_KEYWORDS),
+            "timestamp": self._parse_item_timestamp(item),
+            "has_file_path": is_dict and "file_path" in item,
+            "file_path": item.get("file_path") if is_dict else None,
+        }
+
+    @staticmethod
+    def _cache_inputs_key(cache_data: CacheEnhancedDashboardData) -> Tuple:
+        """Cache-derived values read by the context analyzers."""
+        enhanced = cache_data.enhanced_analysis
+        enhanced_scores = None
+        if enhanced:
+            enhanced_scores = (
+                enhanced.usage_weighted_focus_score,
+                enhanced.waste_reduction_opportunity,
+                enhanced.value_density_score,
+            )
+        return (repr(cache_data.health_metrics), enhanced_scores)
+
+    async def _memoized_analysis(
+        self,
+        name: str,
+        key: Tuple,
+        now: datetime,
+        compute: Callable[[], Awaitable[Any]],
+        expires_at: Optional[datetime] = None,
+    ) -> Any:
+        """Return the cached result for ``key`` or compute and cache it."""
+        found, result = self._health_memo.get_result(name, key, now)
+        if not found:
+            result = await compute()
+            self._health_memo.put_result(name, key, result, expires_at)
+        return result
+
     async def _load_context_data(self, context_path: Path) -> Dict[str, Any]:
         """Safely load context data from file with security measures."""
         try:
@@ -4912,21 +5027,25 @@ if __name__ == "__main__":
             raise ContextAnalysisError(f"Context loading failed: {e}")
 
     async def _analyze_focus_metrics(
-        self, context_data: Dict[str, Any], cache_data: CacheEnhancedDashboardData
+        self,
+        context_data: Dict[str, Any],
+        cache_data: CacheEnhancedDashboardData,
+        snapshot: Optional[ContextSnapshot] = None,
     ) -> FocusMetrics:
         """Analyze focus metrics according to CLEAN-CONTEXT-GUIDE.md."""
+        snapshot = snapshot or self._context_snapshot(context_data)
 
         # Calculate basic focus metrics
-        focus_score = await self._calculate_focus_score(context_data, cache_data)
-        priority_alignment = await self._calculate_priority_alignment(context_data)
-        current_work_ratio = await self._calculate_current_work_ratio(context_data)
-        attention_clarity = await self._calculate_attention_clarity(context_data)
+        focus_score = await self._calculate_focus_score(snapshot, cache_data)
+        priority_alignment = await self._calculate_priority_alignment(snapshot)
+        current_work_ratio = await self._calculate_current_work_ratio(snapshot)
+        attention_clarity = await self._calculate_attention_clarity(snapshot)
 
         # Enhanced metrics with usage data
         usage_weighted_focus = cache_data.health_metrics.usage_weighted_focus_score
         workflow_alignment = cache_data.health_metrics.workflow_alignment
         task_completion_clarity = await self._calculate_task_completion_clarity(
-            context_data
+            snapshot
         )
 
         return FocusMetrics(
@@ -4940,14 +5059,18 @@ if __name__ == "__main__":
         )
 
     async def _analyze_redundancy(
-        self, context_data: Dict[str, Any], cache_data: CacheEnhancedDashboardData
+        self,
+        context_data: Dict[str, Any],
+        cache_data: CacheEnhancedDashboardData,
+        snapshot: Optional[ContextSnapshot] = None,
     ) -> RedundancyAnalysis:
         """Analyze redundancy according to CLEAN-CONTEXT-GUIDE.md."""
+        snapshot = snapshot or self._context_snapshot(context_data)
 
-        duplicate_percentage = await self._calculate_duplicate_content(context_data)
-        stale_percentage = await self._calculate_stale_context(context_data)
-        redundant_files = await self._count_redundant_files(context_data)
-        obsolete_todos = await self._count_obsolete_todos(context_data)
+        duplicate_percentage = await self._calculate_duplicate_content(snapshot)
+        stale_percentage = await self._calculate_stale_context(snapshot)
+        redundant_files = await self._count_redundant_files(snapshot)
+        obsolete_todos = await self._count_obsolete_todos(snapshot)
 
         # Enhanced analysis with usage patterns
         usage_redundancy = 1.0 - cache_data.health_metrics.efficiency_score
@@ -4967,14 +5090,18 @@ if __name__ == "__main__":
         )
 
     async def _analyze_recency(
-        self, context_data: Dict[str, Any], cache_data: CacheEnhancedDashboardData
+        self,
+        context_data: Dict[str, Any],
+        cache_data: CacheEnhancedDashboardData,
+        snapshot: Optional[ContextSnapshot] = None,
     ) -> RecencyIndicators:
         """Analyze recency indicators according to CLEAN-CONTEXT-GUIDE.md."""
+        snapshot = snapshot or self._context_snapshot(context_data)
 
-        fresh_percentage = await self._calculate_fresh_context(context_data)
-        recent_percentage = await self._calculate_recent_context(context_data)
-        aging_percentage = await self._calculate_aging_context(context_data)
-        stale_percentage = await self._calculate_stale_context_recency(context_data)
+        fresh_percentage = await self._calculate_fresh_context(snapshot)
+        recent_percentage = await self._calculate_recent_context(snapshot)
+        aging_percentage = await self._calculate_aging_context(snapshot)
+        stale_percentage = await self._calculate_stale_context_recency(snapshot)
 
         # Enhanced indicators with usage weighting
         usage_weighted_freshness = cache_data.health_metrics.temporal_coherence_score
@@ -4992,11 +5119,15 @@ if __name__ == "__main__":
         )
 
     async def _analyze_size_optimization(
-        self, context_data: Dict[str, Any], cache_data: CacheEnhancedDashboardData
+        self,
+        context_data: Dict[str, Any],
+        cache_data: CacheEnhancedDashboardData,
+        snapshot: Optional[ContextSnapshot] = None,
     ) -> SizeOptimizationMetrics:
         """Analyze size optimization according to CLEAN-CONTEXT-GUIDE.md."""
+        snapshot = snapshot or self._context_snapshot(context_data)
 
-        total_tokens = await self._calculate_total_tokens(context_data)
+        total_tokens = await self._calculate_total_tokens(snapshot)
         optimization_potential = cache_data.health_metrics.optimization_potential
         critical_percentage = 1.0 - optimization_potential
         cleanup_impact = int(total_tokens * optimization_potential)
@@ -5021,7 +5152,7 @@ if __name__ == "__main__":
     # Cache intelligence integration methods
 
     async def _calculate_focus_score(
-        self, context_data: Dict[str, Any], cache_data: CacheEnhancedDashboardData
+        self, snapshot: ContextSnapshot, cache_data: CacheEnhancedDashboardData
     ) -> float:
         """Calculate what percentage of context is relevant to current work."""
         # Use cache intelligence for more accurate focus scoring
@@ -5029,58 +5160,36 @@ if __name__ == "__main__":
             return cache_data.enhanced_analysis.usage_weighted_focus_score
 
         # Fallback to basic analysis
-        total_items = len(context_data.get("items", [])) or 1
-        current_work_items = len(
-            [
-                item
-                for item in context_data.get("items", [])
-                if self._is_current_work_item(item)
-            ]
-        )
+        total_items = len(snapshot.items) or 1
+        current_work_items = sum(1 for item in snapshot.items if item.current_work)
 
         return current_work_items / total_items
 
-    async def _calculate_priority_alignment(
-        self, context_data: Dict[str, Any]
-    ) -> float:
+    async def _calculate_priority_alignment(self, snapshot: ContextSnapshot) -> float:
         """Calculate what percentage of important items are in the top 25%."""
-        items = context_data.get("items", [])
+        items = snapshot.items
         if not items:
             return 0.5  # Neutral score for empty context
 
         top_25_count = max(1, len(items) // 4)
         top_items = items[:top_25_count]
 
-        important_in_top = sum(1 for item in top_items if self._is_important_item(item))
-        total_important = sum(1 for item in items if self._is_important_item(item))
+        important_in_top = sum(1 for item in top_items if item.important)
+        total_important = sum(1 for item in items if item.important)
 
         return important_in_top / max(1, total_important)
 
-    async def _calculate_current_work_ratio(
-        self, context_data: Dict[str, Any]
-    ) -> float:
+    async def _calculate_current_work_ratio(self, snapshot: ContextSnapshot) -> float:
         """Calculate ratio of active tasks vs total context."""
-        total_items = len(context_data.get("items", [])) or 1
-        active_tasks = len(
-            [
-                item
-                for item in context_data.get("items", [])
-                if self._is_active_task(item)
-            ]
-        )
+        total_items = len(snapshot.items) or 1
+        active_tasks = sum(1 for item in snapshot.items if item.active_task)
 
         return active_tasks / total_items
 
-    async def _calculate_attention_clarity(self, context_data: Dict[str, Any]) -> float:
+    async def _calculate_attention_clarity(self, snapshot: ContextSnapshot) -> float:
         """Calculate clarity of next steps vs noise."""
-        total_content = len(str(context_data))
-        clear_action_content = len(
-            [
-                item
-                for item in context_data.get("items", [])
-                if self._has_clear_action(item)
-            ]
-        )
+        total_content = snapshot.text_length
+        clear_action_content = sum(1 for item in snapshot.items if item.clear_action)
 
         return min(1.0, clear_action_content / max(1, total_content // 100))
 
@@ -5105,6 +5214,7 @@ if __name__ == "__main__":
         "required",
     ]
     ACTIVE_TASK_KEYWORDS = ["todo", "task", "- [ ]", "need to", "should", "must do"]
+    ONGOING_WORK_KEYWORDS = ["current", "active", "ongoing", "todo", "task"]
     COMPLETED_KEYWORDS = [
         "done",
         "completed",
@@ -5181,40 +5291,24 @@ if __name__ == "__main__":
         return any(keyword in content_lower for keyword in self.CLEAR_ACTION_KEYWORDS)
 
     # Continued implementation methods...
-    async def _calculate_duplicate_content(self, context_data: Dict[str, Any]) -> float:
+    async def _calculate_duplicate_content(self, snapshot: ContextSnapshot) -> float:
         """Calculate percentage of duplicate content."""
         # Simple implementation - would be enhanced with sophisticated duplicate detection
-        content_items = [str(item) for item in context_data.get("items", [])]
-        if not content_items:
+        content_digests = [item.digest for item in snapshot.items]
+        if not content_digests:
             return 0.0
 
-        unique_items = set(content_items)
-        return 1.0 - (len(unique_items) / len(content_items))
+        unique_items = set(content_digests)
+        return 1.0 - (len(unique_items) / len(content_digests))
+
+    # Character budget for token estimation on very large contexts
+    MAX_TOKEN_ESTIMATE_CHARS = 1_000_000
 
-    async def _calculate_total_tokens(self, context_data: Dict[str, Any]) -> int:
+    async def _calculate_total_tokens(self, snapshot: ContextSnapshot) -> int:
         """Estimate total tokens in context with size limits."""
         try:
-            # Use more efficient streaming approach for large contexts
-            total_chars = 0
-
-            def count_chars_recursively(data, max_chars=1_000_000):
-                nonlocal total_chars
-                if total_chars > max_chars:
-                    return total_chars
-
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        total_chars += len(str(key))
-                        count_chars_recursively(value, max_chars)
-                elif isinstance(data, (list, tuple)):
-                    for item in data:
-                        count_chars_recursively(item, max_chars)
-                else:
-                    total_chars += len(str(data))
-
-                return total_chars
-
-            char_count = count_chars_recursively(context_data)
+            # Per-item character counts are cached with the item features
+            char_count = min(snapshot.char_count, self.MAX_TOKEN_ESTIMATE_CHARS)
             # More accurate token estimation: ~3.5 characters per token for English text
             return int(char_count / 3.5)
 
@@ -5225,7 +5319,7 @@ if __name__ == "__main__":
             try:
                 from ..analysis.enhanced_token_counter import get_accurate_token_count
 
-                content_str = str(context_data)
+                content_str = str(snapshot.context_data)
                 return get_accurate_token_count(content_str)
             except ImportError:
                 logger.warning(
@@ -5282,41 +5376,40 @@ if __name__ == "__main__":
     # Missing calculation methods for complete implementation
 
     async def _calculate_task_completion_clarity(
-        self, context_data: Dict[str, Any]
+        self, snapshot: ContextSnapshot
     ) -> float:
         """Calculate clarity of task completion criteria."""
-        items = context_data.get("items", [])
+        items = snapshot.items
         if not items:
             return 0.5
 
-        clear_completion_items = sum(
-            1 for item in items if self._has_clear_completion_criteria(item)
-        )
+        clear_completion_items = sum(1 for item in items if item.clear_completion)
         return clear_completion_items / len(items)
 
-    async def _calculate_stale_context(self, context_data: Dict[str, Any]) -> float:
+    async def _calculate_stale_context(self, snapshot: ContextSnapshot) -> float:
         """Calculate percentage of stale context."""
-        items = context_data.get("items", [])
+        items = snapshot.items
         if not items:
             return 0.0
 
-        stale_items = sum(1 for item in items if self._is_stale_item(item))
+        stale_before = datetime.now() - timedelta(hours=24)
+        stale_items = sum(
+            1 for item in items if item.timestamp and item.timestamp < stale_before
+        )
         return stale_items / len(items)
 
-    async def _count_redundant_files(self, context_data: Dict[str, Any]) -> int:
+    async def _count_redundant_files(self, snapshot: ContextSnapshot) -> int:
         """Count files that have been read multiple times."""
         file_reads = {}
-        for item in context_data.get("items", []):
-            if isinstance(item, dict) and "file_path" in item:
-                file_path = item["file_path"]
-                file_reads[file_path] = file_reads.get(file_path, 0) + 1
+        for item in snapshot.items:
+            if item.has_file_path:
+                file_reads[item.file_path] = file_reads.get(item.file_path, 0) + 1
 
         return sum(1 for count in file_reads.values() if count > 1)
 
-    async def _count_obsolete_todos(self, context_data: Dict[str, Any]) -> int:
+    async def _count_obsolete_todos(self, snapshot: ContextSnapshot) -> int:
         """Count completed or irrelevant todos."""
-        items = context_data.get("items", [])
-        return sum(1 for item in items if self._is_obsolete_todo(item))
+        return sum(1 for item in snapshot.items if item.obsolete_todo)
 
     async def _analyze_content_overlap(
         self, context_data: Dict[str, Any]
@@ -5336,49 +5429,58 @@ if __name__ == "__main__":
             return cache_data.enhanced_analysis.waste_reduction_opportunity
         return 0.3  # Default estimate
 
-    async def _calculate_fresh_context(self, context_data: Dict[str, Any]) -> float:
+    async def _calculate_fresh_context(self, snapshot: ContextSnapshot) -> float:
         """Calculate percentage of fresh context (last hour)."""
         now = datetime.now()
         one_hour_ago = now - timedelta(hours=1)
+        default_timestamp = now - self.DEFAULT_ITEM_AGE
 
-        items = context_data.get("items", [])
+        items = snapshot.items
         if not items:
             return 0.3  # Default
 
         fresh_items = sum(
-            1 for item in items if self._get_item_timestamp(item) > one_hour_ago
+            1 for item in items if (item.timestamp or default_timestamp) > one_hour_ago
         )
         return fresh_items / len(items)
 
-    async def _calculate_recent_context(self, context_data: Dict[str, Any]) -> float:
+    async def _calculate_recent_context(self, snapshot: ContextSnapshot) -> float:
         """Calculate percentage of recent context (current session)."""
         now = datetime.now()
         session_start = now - timedelta(hours=4)  # Assume 4-hour session
+        default_timestamp = now - self.DEFAULT_ITEM_AGE
 
-        items = context_data.get("items", [])
+        items = snapshot.items
         if not items:
             return 0.5  # Default
 
         recent_items = sum(
-            1 for item in items if self._get_item_timestamp(item) > session_start
+            1 for item in items if (item.timestamp or default_timestamp) > session_start
         )
         return recent_items / len(items)
 
-    async def _calculate_aging_context(self, context_data: Dict[str, Any]) -> float:
+    async def _calculate_aging_context(self, snapshot: ContextSnapshot) -> float:
         """Calculate percentage of aging context (older than current session)."""
-        recent_percentage = await self._calculate_recent_context(context_data)
-        fresh_percentage = await self._calculate_fresh_context(context_data)
+        recent_percentage = await self._calculate_recent_context(snapshot)
+        fresh_percentage = await self._calculate_fresh_context(snapshot)
         return max(0.0, 1.0 - recent_percentage - fresh_percentage - 0.1)
 
     async def _calculate_stale_context_recency(
-        self, context_data: Dict[str, Any]
+        self, snapshot: ContextSnapshot
     ) -> float:
         """Calculate percentage of stale context from previous unrelated work."""
-        items = context_data.get("items", [])
+        items = snapshot.items
         if not items:
             return 0.1  # Default
 
-        stale_items = sum(1 for item in items if self._is_unrelated_stale_item(item))
+        stale_before = datetime.now() - timedelta(hours=24)
+        stale_items = sum(
+            1
+            for item in items
+            if item.timestamp
+            and item.timestamp < stale_before
+            and not item.mentions_ongoing_work
+        )
         return stale_items / len(items)
 
     async def _analyze_content_lifecycle(
@@ -5607,15 +5709,24 @@ if __name__ == "__main__":
             if isinstance(item, dict):
                 item_str = str(item).lower()
                 return not any(
-                    keyword in item_str
-                    for keyword in ["current", "active", "ongoing", "todo", "task"]
+                    keyword in item_str for keyword in self.ONGOING_WORK_KEYWORDS
                 )
         return False
 
+    # Age assumed for items without a usable timestamp
+    DEFAULT_ITEM_AGE = timedelta(hours=2)
+
     def _get_item_timestamp(self, item: Any) -> Optional[datetime]:
         """Safely extract timestamp from item with validation."""
+        timestamp = self._parse_item_timestamp(item)
+        if timestamp is None:
+            return datetime.now() - self.DEFAULT_ITEM_AGE  # Safe default
+        return timestamp
+
+    def _parse_item_timestamp(self, item: Any) -> Optional[datetime]:
+        """Parse the item's own timestamp, or None if it has no valid one."""
         if not isinstance(item, dict):
-            return datetime.now() - timedelta(hours=2)
+            return None
 
         for timestamp_field in ["timestamp", "created_at", "modified_at"]:
             if timestamp_field in item:
@@ -5633,7 +5744,7 @@ if __name__ == "__main__":
                     )
                     continue
 
-        return datetime.now() - timedelta(hours=2)  # Safe default
+        return None
 
     # Professional CLI formatting methods
 
@@ -11,6 +11,7 @@ Modules:
 - dashboard_realtime: WebSocket handling and real-time updates
 - dashboard_analytics: Analytics widgets and data processing
 - dashboard_telemetry: Telemetry integration and monitoring
+- dashboard_health_memo: Content-hash memoization of health report analysis
 """
 
 # Module version tracking for rollback safety
@@ -23,3 +24,4 @@ from .dashboard_cache import *
 from .dashboard_realtime import *
 from .dashboard_analytics import *
 from .dashboard_telemetry import *
+from .dashboard_health_memo import *
@@ -190,7 +190,9 @@ class DashboardServiceIntegrator:
             )
             from .dashboard_cache import DashboardCache, CacheCoordinator
 
-            self.cache_dashboard = CacheEnhancedDashboard()
+            self.cache_dashboard = CacheEnhancedDashboard.from_config(
+                self.config_manager.config
+            )
             self.dashboard_cache = DashboardCache(
                 cache_dashboard=self.cache_dashboard,
                 telemetry_widgets=None,  # Will be set after telemetry initialization
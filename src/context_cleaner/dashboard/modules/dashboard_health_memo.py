@@ -0,0 +1,221 @@
+"""
+Dashboard Health Report Memoization
+
+Content-hash memoization for the comprehensive health report.
+The periodic health broadcast re-analyzes the same context every 30 seconds,
+so per-item classification and per-analyzer results are cached by content
+digest and only recomputed for items (or inputs) that actually changed.
+
+Contains:
+- ItemFeatures: cached per-item classification used by the analyzers
+- ContextSnapshot: digest, item features and sizes for one context
+- HealthReportMemo: bounded item cache, analyzer results and file snapshots
+"""
+
+import bisect
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Age thresholds the recency and redundancy analyzers classify items by
+RECENCY_THRESHOLDS = (timedelta(hours=1), timedelta(hours=4), timedelta(hours=24))
+
+# Cache dashboard data also has time-relative trends; reuse it for this long
+# at most even when its inputs are unchanged
+CACHE_DASHBOARD_MAX_AGE = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class ItemFeatures:
+    """Classification of a single context item, keyed by its content digest"""
+
+    digest: str
+    current_work: bool = False
+    important: bool = False
+    active_task: bool = False
+    clear_action: bool = False
+    clear_completion: bool = False
+    obsolete_todo: bool = False
+    mentions_ongoing_work: bool = False
+    timestamp: Optional[datetime] = None
+    has_file_path: bool = False
+    file_path: Optional[Hashable] = None
+    text_length: int = 0
+    char_count: int = 0
+
+
+@dataclass
+class ContextSnapshot:
+    """Item features and aggregate sizes for one version of the context"""
+
+    digest: str
+    context_data: Dict[str, Any]
+    items: List[ItemFeatures]
+    text_length: int
+    char_count: int
+    # Sorted instants at which some item crosses a recency threshold
+    _transitions: List[datetime] = field(default_factory=list, repr=False)
+
+    def stable_until(self, now: datetime) -> Optional[datetime]:
+        """Next time an item ages into a different recency bucket, if any"""
+        index = bisect.bisect_right(self._transitions, now)
+        if index < len(self._transitions):
+            return self._transitions[index]
+        return None
+
+
+def content_digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+
+def count_chars(data: Any) -> int:
+    """Characters in keys and scalar values of a nested structure"""
+    if isinstance(data, dict):
+        return sum(len(str(key)) + count_chars(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return sum(count_chars(item) for item in data)
+    return len(str(data))
+
+
+class HealthReportMemo:
+    """
+    Memoizes health report inputs and partial results by content hash.
+
+    Item features are kept in a bounded LRU keyed by item digest, so an edit
+    only re-scores the items it touched. Analyzer results are keyed by the
+    context digest plus whatever other inputs the analyzer reads, and can
+    carry an expiry for results that depend on the current time.
+    """
+
+    def __init__(self, max_items: int = 10000):
+        self.max_items = max_items
+        self._features: "OrderedDict[str, ItemFeatures]" = OrderedDict()
+        self._results: Dict[str, Tuple[Hashable, Any, Optional[datetime]]] = {}
+        self._file_snapshots: Dict[str, Tuple[Tuple[int, int], ContextSnapshot]] = {}
+        self.stats = {
+            "item_hits": 0,
+            "item_misses": 0,
+            "analysis_hits": 0,
+            "analysis_misses": 0,
+            "file_hits": 0,
+        }
+
+    def snapshot(
+        self,
+        context_data: Dict[str, Any],
+        classify: Callable[[Any], Dict[str, Any]],
+    ) -> ContextSnapshot:
+        """
+        Build a snapshot, classifying only items not seen before.
+
+        ``classify`` maps an item to the ItemFeatures classification fields.
+        """
+        items = context_data.get("items", [])
+        rest = {key: value for key, value in context_data.items() if key != "items"}
+
+        features = []
+        for item in items:
+            text = str(item)
+            digest = content_digest(text)
+            cached = self._features.get(digest)
+            if cached is None:
+                self.stats["item_misses"] += 1
+                cached = ItemFeatures(
+                    digest=digest,
+                    text_length=len(repr(item)),
+                    char_count=count_chars(item),
+                    **classify(item),
+                )
+                self._features[digest] = cached
+                if len(self._features) > self.max_items:
+                    self._features.popitem(last=False)
+            else:
+                self.stats["item_hits"] += 1
+                self._features.move_to_end(digest)
+            features.append(cached)
+
+        if isinstance(items, list) and "items" in context_data:
+            # Length of str(context_data) without re-rendering every item:
+            # dict reprs are order independent, and a list adds ", " per item
+            text_length = len(str({**rest, "items": []}))
+            text_length += sum(f.text_length for f in features)
+            text_length += 2 * max(0, len(features) - 1)
+        else:
+            text_length = len(str(context_data))
+
+        char_count = count_chars(rest) + sum(f.char_count for f in features)
+        if "items" in context_data:
+            char_count += len("items")
+
+        rest_text = str(rest)
+        digest = content_digest(rest_text + "".join(f.digest for f in features))
+
+        transitions = sorted(
+            f.timestamp + threshold
+            for f in features
+            if f.timestamp is not None
+            for threshold in RECENCY_THRESHOLDS
+        )
+
+        return ContextSnapshot(
+            digest=digest,
+            context_data=context_data,
+            items=features,
+            text_length=text_length,
+            char_count=char_count,
+            _transitions=transitions,
+        )
+
+    def file_snapshot(self, path: Path) -> Optional[ContextSnapshot]:
+        """Snapshot previously built for ``path`` if the file is unchanged"""
+        entry = self._file_snapshots.get(str(path))
+        if entry is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if entry[0] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        self.stats["file_hits"] += 1
+        return entry[1]
+
+    def remember_file(self, path: Path, snapshot: ContextSnapshot):
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        self._file_snapshots[str(path)] = ((stat.st_mtime_ns, stat.st_size), snapshot)
+
+    def get_result(self, name: str, key: Hashable, now: datetime) -> Tuple[bool, Any]:
+        entry = self._results.get(name)
+        if entry is not None:
+            cached_key, value, expires_at = entry
+            if cached_key == key and (expires_at is None or now < expires_at):
+                self.stats["analysis_hits"] += 1
+                return True, value
+        self.stats["analysis_misses"] += 1
+        return False, None
+
+    def put_result(
+        self,
+        name: str,
+        key: Hashable,
+        value: Any,
+        expires_at: Optional[datetime] = None,
+    ):
+        self._results[name] = (key, value, expires_at)
+
+    def clear(self):
+        self._features.clear()
+        self._results.clear()
+        self._file_snapshots.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "cached_items": len(self._features)}
@@ -373,9 +373,11 @@ class DashboardRealtime:
                         -self._max_history_points :
                     ]
 
-                # EventBus: Broadcast to all connected clients
+                # EventBus: Publish as state; clients that opted in receive JSON-patch deltas
                 safe_report = self.serializer.serialize_health_report(report)
-                asyncio.create_task(self.event_bus.emit("health_update", safe_report))
+                asyncio.create_task(
+                    self.event_bus.publish_state("health_update", safe_report)
+                )
 
                 logger.debug(
                     f"📡 Health update broadcasted to {len(self.active_connections)} WebSocket clients"
@@ -37,6 +37,7 @@ logger = logging.getLogger(__name__)
 # Import telemetry components with graceful fallback
 try:
     from context_cleaner.telemetry.clients.clickhouse_client import ClickHouseClient
+    from context_cleaner.telemetry.clients.sqlite_client import select_telemetry_client
     from context_cleaner.telemetry.cost_optimization.engine import (
         CostOptimizationEngine,
     )
@@ -121,8 +122,9 @@ class TelemetryInitializer:
             return False
 
         try:
-            # Initialize core telemetry client
-            self.telemetry_client = ClickHouseClient()
+            # Initialize core telemetry client, falling back to the local
+            # SQLite store when ClickHouse is not reachable
+            self.telemetry_client = select_telemetry_client()
 
             # Initialize cost optimization
             budget_config = BudgetConfig(
@@ -0,0 +1,276 @@
+"""
+Segmented Append-Only Event Log
+
+Local storage for feedback events as daily JSONL segments
+(``events-YYYY-MM-DD.jsonl``). Writes are buffered in memory and appended in
+batches, with an fsync at most every ``fsync_interval`` seconds. A small JSON
+index records the first/last timestamp, event count and byte size per
+segment (entries whose size no longer matches the file are ignored), so
+recent-window reads open only the segments that overlap the window and skip
+timestamp parsing for segments that lie entirely inside it. Retention deletes
+whole segments instead of rewriting a single file.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_FILENAME = "index.json"
+
+
+class SegmentedEventLog:
+    """Append-only event log split into daily segment files."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        flush_interval: float = 5.0,
+        fsync_interval: float = 30.0,
+        max_buffered_events: int = 100,
+    ):
+        """
+        Initialize the event log.
+
+        Args:
+            log_dir: Directory holding segment files and the index
+            flush_interval: Seconds buffered events may wait before being written
+            fsync_interval: Minimum seconds between fsyncs of written segments
+            max_buffered_events: Buffer size that forces a write
+        """
+        self.log_dir = log_dir
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.log_dir / INDEX_FILENAME
+
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_buffered_events = max_buffered_events
+
+        self._lock = threading.RLock()
+        self._buffer: List[Tuple[datetime, Dict[str, Any]]] = []
+        self._last_flush = time.monotonic()
+        self._last_fsync = time.monotonic()
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
+    def append(self, event: Dict[str, Any], timestamp: datetime):
+        """Buffer an event; writes happen in batches."""
+        with self._lock:
+            self._buffer.append((timestamp, event))
+            if (
+                len(self._buffer) >= self.max_buffered_events
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+
+    def flush(self, fsync: bool = False):
+        """Write buffered events to their segments and update the index."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+
+            by_segment: Dict[str, List[Tuple[datetime, Dict[str, Any]]]] = {}
+            for timestamp, event in self._buffer:
+                by_segment.setdefault(timestamp.date().isoformat(), []).append(
+                    (timestamp, event)
+                )
+            self._buffer = []
+
+            do_fsync = fsync or (
+                time.monotonic() - self._last_fsync >= self.fsync_interval
+            )
+            for day, entries in by_segment.items():
+                try:
+                    self._write_segment(day, entries, do_fsync)
+                except OSError as e:
+                    logger.warning(f"Failed to write event segment {day}: {e}")
+            if do_fsync:
+                self._last_fsync = time.monotonic()
+            self._save_index()
+
+    def read_since(self, cutoff: datetime) -> List[Dict[str, Any]]:
+        """Return events with timestamp >= ``cutoff``, oldest segment first."""
+        with self._lock:
+            self.flush()
+            events = []
+            for day, path in self._segments():
+                if date.fromisoformat(day) < cutoff.date():
+                    continue
+                entry = self._valid_entry(day)
+                if entry and entry["last"] is None:
+                    continue
+                if entry and datetime.fromisoformat(entry["last"]) < cutoff:
+                    continue
+                whole_segment = bool(
+                    entry and datetime.fromisoformat(entry["first"]) >= cutoff
+                )
+                events.extend(
+                    self._read_segment(path, None if whole_segment else cutoff)
+                )
+            return events
+
+    def drop_before(self, cutoff: datetime) -> int:
+        """Delete segments whose events all precede ``cutoff``; returns count."""
+        with self._lock:
+            self.flush()
+            removed = 0
+            for day, path in self._segments():
+                entry = self._valid_entry(day)
+                if entry and entry["last"] is not None:
+                    expired = datetime.fromisoformat(entry["last"]) < cutoff
+                else:
+                    expired = date.fromisoformat(day) < cutoff.date()
+                if not expired:
+                    continue
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Failed to remove event segment {path}: {e}")
+                    continue
+                self._index.pop(day, None)
+            if removed:
+                self._save_index()
+            return removed
+
+    def import_jsonl(self, path: Path) -> int:
+        """Append events from a legacy single-file JSONL log; returns count."""
+        imported = 0
+        with self._lock, open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                    timestamp = datetime.fromisoformat(event["timestamp"])
+                except Exception:
+                    continue
+                self._buffer.append((timestamp, event))
+                imported += 1
+            self.flush(fsync=True)
+        return imported
+
+    def segment_count(self) -> int:
+        return len(self._segments())
+
+    def _write_segment(
+        self, day: str, entries: List[Tuple[datetime, Dict[str, Any]]], fsync: bool
+    ):
+        path = self._segment_path(day)
+        data = "".join(json.dumps(event) + "\n" for _, event in entries)
+        entry = self._valid_entry(day)
+        size_before = path.stat().st_size if path.exists() else 0
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+            size_after = f.tell()
+
+        untouched = size_after - size_before == len(data.encode("utf-8"))
+        if untouched and (entry or size_before == 0):
+            first = min(timestamp for timestamp, _ in entries)
+            last = max(timestamp for timestamp, _ in entries)
+            if entry and entry["first"] is not None:
+                first = min(first, datetime.fromisoformat(entry["first"]))
+                last = max(last, datetime.fromisoformat(entry["last"]))
+            self._index[day] = {
+                "first": first.isoformat(),
+                "last": last.isoformat(),
+                "count": (entry["count"] if entry else 0) + len(entries),
+                "size": size_after,
+            }
+        else:
+            # Another writer touched this segment; re-derive its bounds
+            self._index[day] = self._scan_segment(path)
+
+    def _valid_entry(self, day: str) -> Optional[Dict[str, Any]]:
+        """Index entry for ``day`` if it still describes the segment on disk."""
+        entry = self._index.get(day)
+        if not entry:
+            return None
+        try:
+            if self._segment_path(day).stat().st_size == entry.get("size"):
+                return entry
+        except OSError:
+            pass
+        return None
+
+    def _scan_segment(self, path: Path) -> Dict[str, Any]:
+        timestamps = []
+        for event in self._read_segment(path, None):
+            try:
+                timestamps.append(datetime.fromisoformat(event["timestamp"]))
+            except Exception:
+                continue
+        return {
+            "first": min(timestamps).isoformat() if timestamps else None,
+            "last": max(timestamps).isoformat() if timestamps else None,
+            "count": len(timestamps),
+            "size": path.stat().st_size,
+        }
+
+    def _read_segment(
+        self, path: Path, cutoff: Optional[datetime]
+    ) -> List[Dict[str, Any]]:
+        events = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                        if (
+                            cutoff is None
+                            or datetime.fromisoformat(event["timestamp"]) >= cutoff
+                        ):
+                            events.append(event)
+                    except Exception:
+                        continue
+        except OSError as e:
+            logger.warning(f"Failed to read event segment {path}: {e}")
+        return events
+
+    def _segments(self) -> List[Tuple[str, Path]]:
+        segments = []
+        for path in self.log_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            day = path.name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+            try:
+                date.fromisoformat(day)
+            except ValueError:
+                continue
+            segments.append((day, path))
+        return sorted(segments)
+
+    def _segment_path(self, day: str) -> Path:
+        return self.log_dir / f"{SEGMENT_PREFIX}{day}{SEGMENT_SUFFIX}"
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            if self.index_file.exists():
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                # Drop entries whose segment is gone
+                return {
+                    day: entry
+                    for day, entry in index.items()
+                    if self._segment_path(day).exists()
+                }
+        except Exception as e:
+            logger.warning(f"Failed to load event index, rebuilding lazily: {e}")
+        return {}
+
+    def _save_index(self):
+        tmp_file = self.index_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            logger.warning(f"Failed to save event index: {e}")
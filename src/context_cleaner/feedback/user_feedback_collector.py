@@ -12,11 +12,13 @@ Key Privacy Principles:
 - GDPR/CCPA compliant data handling
 """
 
+import atexit
 import hashlib
 import json
 import logging
 import threading
 import uuid
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -25,9 +27,24 @@ from collections import defaultdict, deque
 import psutil
 
 from ..config.settings import ContextCleanerConfig
+from .event_log import SegmentedEventLog
 
 logger = logging.getLogger(__name__)
 
+# Live FeedbackStorage instances, flushed by a single atexit hook. Weak
+# references let discarded storages be collected instead of being pinned by
+# one registered hook each.
+_open_storages: "weakref.WeakSet[FeedbackStorage]" = weakref.WeakSet()
+
+
+def _flush_open_storages():
+    """Flush every live FeedbackStorage at interpreter exit."""
+    for storage in list(_open_storages):
+        storage.flush()
+
+
+atexit.register(_flush_open_storages)
+
 
 @dataclass
 class FeedbackEvent:
@@ -159,30 +176,49 @@ class FeedbackStorage:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         # Storage files
-        self.events_file = self.storage_dir / "feedback_events.jsonl"
+        self.events_dir = self.storage_dir / "events"
         self.preferences_file = self.storage_dir / "user_preferences.json"
         self.session_file = self.storage_dir / "session_info.json"
 
-        # In-memory cache
-        self._events_cache: deque = deque(maxlen=1000)
+        # Pre-segmented single-file log, migrated on first use
+        self.events_file = self.storage_dir / "feedback_events.jsonl"
+
+        self.event_log = SegmentedEventLog(self.events_dir)
         self._lock = threading.RLock()
+        self._migrate_legacy_events()
+
+        # Buffered events must reach disk even if stop_monitoring never runs
+        _open_storages.add(self)
 
     def store_event(self, event: FeedbackEvent):
         """Store feedback event locally."""
         with self._lock:
             try:
-                # Add to cache
-                self._events_cache.append(event.to_anonymous_dict())
-
-                # Append to file
-                with open(self.events_file, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(event.to_anonymous_dict()) + "\n")
-
+                self.event_log.append(event.to_anonymous_dict(), event.timestamp)
                 logger.debug(f"Stored feedback event: {event.event_type}")
 
             except Exception as e:
                 logger.warning(f"Failed to store feedback event: {e}")
 
+    def flush(self):
+        """Write buffered events and fsync their segments."""
+        with self._lock:
+            try:
+                self.event_log.flush(fsync=True)
+            except Exception as e:
+                logger.warning(f"Failed to flush feedback events: {e}")
+
+    def _migrate_legacy_events(self):
+        """Move events from the old single JSONL file into daily segments."""
+        if not self.events_file.exists():
+            return
+        try:
+            imported = self.event_log.import_jsonl(self.events_file)
+            self.events_file.unlink()
+            logger.info(f"Migrated {imported} feedback events to segmented log")
+        except Exception as e:
+            logger.warning(f"Failed to migrate legacy feedback events: {e}")
+
     def load_preferences(self) -> UserPreferences:
         """Load user preferences."""
         try:
@@ -204,67 +240,23 @@ class FeedbackStorage:
             logger.warning(f"Failed to save preferences: {e}")
 
     def get_recent_events(self, hours: int = 24) -> List[Dict[str, Any]]:
-        """Get recent events from cache and file."""
+        """Get recent events, reading only segments that overlap the window."""
         cutoff = datetime.now() - timedelta(hours=hours)
-        recent_events = []
 
         with self._lock:
-            # Check cache first
-            for event_dict in self._events_cache:
-                try:
-                    event_time = datetime.fromisoformat(event_dict["timestamp"])
-                    if event_time >= cutoff:
-                        recent_events.append(event_dict)
-                except Exception:
-                    continue
-
-            # If cache doesn't have enough, read from file
-            if len(recent_events) < 10 and self.events_file.exists():
-                try:
-                    with open(self.events_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            try:
-                                event_dict = json.loads(line.strip())
-                                event_time = datetime.fromisoformat(
-                                    event_dict["timestamp"]
-                                )
-                                if event_time >= cutoff:
-                                    recent_events.append(event_dict)
-                            except Exception:
-                                continue
-                except Exception as e:
-                    logger.warning(f"Failed to read events file: {e}")
-
-        return recent_events
+            try:
+                return self.event_log.read_since(cutoff)
+            except Exception as e:
+                logger.warning(f"Failed to read feedback events: {e}")
+                return []
 
     def cleanup_old_data(self, retention_days: int = 30):
-        """Remove old feedback data."""
+        """Remove old feedback data by deleting expired segments."""
         cutoff = datetime.now() - timedelta(days=retention_days)
 
         try:
-            if not self.events_file.exists():
-                return
-
-            # Read all events and keep only recent ones
-            kept_events = []
-            with open(self.events_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        event_dict = json.loads(line.strip())
-                        event_time = datetime.fromisoformat(event_dict["timestamp"])
-                        if event_time >= cutoff:
-                            kept_events.append(event_dict)
-                    except Exception:
-                        continue
-
-            # Rewrite file with kept events
-            with open(self.events_file, "w", encoding="utf-8") as f:
-                for event_dict in kept_events:
-                    f.write(json.dumps(event_dict) + "\n")
-
-            logger.info(
-                f"Cleaned up feedback data: kept {len(kept_events)} recent events"
-            )
+            removed = self.event_log.drop_before(cutoff)
+            logger.info(f"Cleaned up feedback data: removed {removed} old segments")
 
         except Exception as e:
             logger.warning(f"Failed to cleanup old data: {e}")
@@ -417,7 +409,8 @@ class UserFeedbackCollector:
             {"action": "session_end", "duration_ms": int(session_duration * 1000)},
         )
 
-        # Cleanup old data
+        # Persist buffered events, then cleanup old data
+        self.storage.flush()
         self.storage.cleanup_old_data(self.preferences.retention_days)
 
         logger.debug("Feedback monitoring stopped")
@@ -1,6 +1,6 @@
 """Hook integration functionality."""
 
-from .integration_manager import HookIntegrationManager
+from .integration_manager import HookIntegrationManager, get_hook_manager
 from .circuit_breaker import CircuitBreaker
 
-__all__ = ["HookIntegrationManager", "CircuitBreaker"]
+__all__ = ["HookIntegrationManager", "CircuitBreaker", "get_hook_manager"]
@@ -55,6 +55,9 @@ class HookIntegrationManager:
         self.hook_call_count = 0
         self.total_hook_time = 0.0
 
+        # Set when the active session changed since it was last written
+        self._session_dirty = False
+
     @property
     def data_directory(self) -> Path:
         """Get data directory for session storage."""
@@ -114,6 +117,47 @@ class HookIntegrationManager:
             is not None
         )
 
+    def apply_event(self, event_type: str, hook_data: Dict[str, Any]) -> bool:
+        """
+        Apply a hook event forwarded by the supervisor daemon.
+
+        Hooks no longer wait on the daemon, so events bypass the circuit
+        breaker. The active session is only marked dirty; call
+        ``flush_session`` to persist it.
+
+        Args:
+            event_type: ``session_start``, ``session_end`` or any other
+                value for a context change
+            hook_data: Hook event data from Claude Code
+
+        Returns:
+            True if handled successfully, False if failed/skipped
+        """
+        try:
+            if event_type == "session_start":
+                # A new session replaces the active one; keep what we have
+                self.flush_session()
+                return self._handle_session_start_impl(hook_data)
+            if event_type == "session_end":
+                return self._handle_session_end_impl(hook_data)
+            return self._handle_context_change_impl(hook_data)
+        except Exception as e:
+            logger.debug(f"Hook event {event_type} failed: {e}")
+            return False
+
+    def flush_session(self) -> bool:
+        """
+        Persist the active session if it changed since the last write.
+
+        Returns:
+            True if the session file was written
+        """
+        if not self.current_session or not self._session_dirty:
+            return False
+        self._save_session()
+        self._session_dirty = False
+        return True
+
     def _handle_session_start_impl(self, hook_data: Dict[str, Any]) -> bool:
         """Internal session start handler implementation."""
         try:
@@ -129,6 +173,7 @@ class HookIntegrationManager:
             }
 
             self.session_start_time = time.time()
+            self._session_dirty = True
 
             logger.info(f"Started session tracking: {session_id}")
             return True
@@ -181,6 +226,7 @@ class HookIntegrationManager:
             # Reset session state
             self.current_session = None
             self.session_start_time = None
+            self._session_dirty = False
             self.hook_call_count = 0
             self.total_hook_time = 0.0
 
@@ -207,6 +253,7 @@ class HookIntegrationManager:
             }
 
             self.current_session["context_events"].append(context_event)
+            self._session_dirty = True
 
             # Limit context events to prevent excessive memory usage
             max_events = 100
@@ -1,14 +1,8 @@
-"""IPC utilities for the Context Cleaner supervisor."""
+"""IPC utilities for the Context Cleaner supervisor.
 
-from .protocol import (
-    ProtocolVersion,
-    RequestAction,
-    ErrorCode,
-    SupervisorMessage,
-    SupervisorRequest,
-    SupervisorResponse,
-    StreamChunk,
-)
+Protocol types are resolved lazily so that ``ipc.hook_client`` can be
+imported by short-lived hook processes without loading the protocol module.
+"""
 
 __all__ = [
     "ProtocolVersion",
@@ -19,3 +13,11 @@ __all__ = [
     "SupervisorResponse",
     "StreamChunk",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        from . import protocol as _protocol
+
+        return getattr(_protocol, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,110 @@
+"""Lightweight hook client for the supervisor socket.
+
+Claude Code hooks run in a fresh interpreter for every event, so this module
+deliberately depends on the standard library only and never imports the
+protocol dataclasses. It writes a single length-prefixed ``hook-event``
+request (the same wire format as ``SupervisorRequest.to_json``) and waits
+briefly for the supervisor to accept or reject it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any, Dict, Optional
+
+HOOK_EVENT_ACTION = "hook-event"
+SEND_TIMEOUT_SECONDS = 0.05
+RESPONSE_TIMEOUT_SECONDS = 0.25
+
+LOGGER = logging.getLogger(__name__)
+
+
+def default_hook_endpoint() -> str:
+    """Mirror of ``client.default_supervisor_endpoint`` for unix hosts."""
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(runtime_dir, "context-cleaner", "supervisor.sock")
+
+
+def encode_hook_event(event_type: str, payload: Dict[str, Any]) -> bytes:
+    """Return the framed ``hook-event`` request for ``payload``."""
+
+    now = time.time()
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+    message: Dict[str, Any] = {
+        "message_type": "request",
+        "protocol_version": "1.0",
+        "request_id": f"hook-{os.getpid()}-{time.time_ns()}",
+        "timestamp": f"{timestamp}.{int(now % 1 * 1_000_000):06d}Z",
+        "action": HOOK_EVENT_ACTION,
+        "options": {"event_type": event_type, "payload": payload},
+        "filters": {},
+        "streaming": False,
+        "timeout_ms": None,
+    }
+    token = os.environ.get("CONTEXT_CLEANER_SUPERVISOR_TOKEN")
+    if token:
+        message["auth"] = {"token": token, "scheme": "hmac"}
+    data = json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+    return len(data).to_bytes(4, "big") + data
+
+
+def send_hook_event(
+    event_type: str,
+    payload: Dict[str, Any],
+    endpoint: Optional[str] = None,
+) -> bool:
+    """Deliver a hook event to the supervisor.
+
+    Returns True only once the supervisor has accepted the event. Returns
+    False when it is unreachable, rejects the event (auth, connection limit,
+    full queue) or does not answer in time, so callers can fall back to
+    in-process handling; never raises.
+    """
+
+    if os.name == "nt" or not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        frame = encode_hook_event(event_type, payload)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(SEND_TIMEOUT_SECONDS)
+            sock.connect(endpoint or default_hook_endpoint())
+            sock.sendall(frame)
+            sock.settimeout(RESPONSE_TIMEOUT_SECONDS)
+            response = _read_response(sock)
+    except (OSError, TypeError, ValueError):
+        return False
+    if response.get("status") != "accepted":
+        LOGGER.warning(
+            "Supervisor rejected hook event %s: %s",
+            event_type,
+            (response.get("error") or {}).get("message", response.get("status")),
+        )
+        return False
+    return True
+
+
+def _read_response(sock: socket.socket) -> Dict[str, Any]:
+    """Read one length-prefixed JSON response from ``sock``."""
+
+    header = _recv_exactly(sock, 4)
+    body = _recv_exactly(sock, int.from_bytes(header, "big"))
+    response = json.loads(body.decode("utf-8"))
+    if not isinstance(response, dict):
+        raise ValueError("supervisor response is not an object")
+    return response
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("supervisor closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
@@ -27,6 +27,8 @@ class RequestAction(str, enum.Enum):
     SHUTDOWN = "shutdown"
     RESTART_SERVICE = "restart-service"
     RELOAD_CONFIG = "reload-config"
+    HOOK_EVENT = "hook-event"
+    PROFILE = "profile"
 
 
 class ErrorCode(str, enum.Enum):
@@ -0,0 +1,352 @@
+"""
+Process-wide Metrics Registry
+
+A single place for hot paths to report counters, gauges and fixed-bucket
+histograms, exported in the Prometheus text format. Metric families are
+declared once at import time; recording is a dictionary lookup plus an
+addition, and a disabled registry turns every call into an early return.
+
+Usage:
+    QUERY_SECONDS = registry.histogram(
+        "context_cleaner_query_duration_seconds", "Query latency", ["source"]
+    )
+
+    with registry.span(QUERY_SECONDS, source="clickhouse"):
+        ...
+
+    @registry.timed(QUERY_SECONDS, source="cache")
+    async def fetch(): ...
+"""
+
+import bisect
+import functools
+import inspect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow queries
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _MetricFamily:
+    """A named metric with a fixed set of label names"""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            pass
+        raise ValueError(
+            f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+        )
+
+    def _label_text(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(_MetricFamily):
+    """Monotonically increasing count; names should end in ``_total``"""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{self._label_text(key)} {_format_value(value)}"
+
+
+class Gauge(_MetricFamily):
+    """Value that can go up and down"""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{self._label_text(key)} {_format_value(value)}"
+
+
+class _HistogramValue:
+    __slots__ = ("bucket_counts", "count", "total")
+
+    def __init__(self, size: int):
+        self.bucket_counts = [0] * size
+        self.count = 0
+        self.total = 0.0
+
+
+class Histogram(_MetricFamily):
+    """Observations counted into fixed upper-bound buckets"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        # Index of the first bucket the value fits in; the last slot is +Inf
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = _HistogramValue(len(self.buckets) + 1)
+            entry.bucket_counts[index] += 1
+            entry.count += 1
+            entry.total += value
+
+    def snapshot(self, **labels) -> Optional[Dict[str, float]]:
+        entry = self._values.get(self._key(labels))
+        if entry is None:
+            return None
+        return {"count": entry.count, "sum": entry.total}
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            items = [
+                (key, list(e.bucket_counts), e.count, e.total)
+                for key, e in self._values.items()
+            ]
+        bounds = self.buckets + (math.inf,)
+        for key, bucket_counts, count, total in items:
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(float(bound))}"'
+                yield f"{self.name}_bucket{self._label_text(key, le)} {cumulative}"
+            yield f"{self.name}_sum{self._label_text(key)} {_format_value(total)}"
+            yield f"{self.name}_count{self._label_text(key)} {count}"
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them for scraping"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._families: Dict[str, _MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            existing = self._families.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls):
+                    raise ValueError(
+                        f"Metric {name} already registered as another type"
+                    )
+                return existing
+            family = cls(self, name, *args, **kwargs)
+            self._families[name] = family
+            return family
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Clear recorded values, keeping the declared families"""
+        for family in list(self._families.values()):
+            family.clear()
+
+    @contextmanager
+    def span(self, histogram: Histogram, **labels):
+        """Time the enclosed block into ``histogram`` in seconds"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - start, **labels)
+
+    def timed(self, histogram: Histogram, **labels) -> Callable:
+        """Decorator timing every call of a sync or async function"""
+
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    start = time.perf_counter()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        histogram.observe(time.perf_counter() - start, **labels)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start, **labels)
+
+            return wrapper
+
+        return decorator
+
+    def render(self) -> str:
+        """Prometheus text exposition of every family with samples"""
+        lines: List[str] = []
+        for name in sorted(self._families):
+            family = self._families[name]
+            samples = list(family.samples())
+            if not samples:
+                continue
+            lines.append(f"# HELP {name} {_escape(family.documentation)}")
+            lines.append(f"# TYPE {name} {family.type_name}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+# Families shared by several stages
+OPERATION_SECONDS = get_metrics_registry().histogram(
+    "context_cleaner_operation_duration_seconds",
+    "Duration of instrumented operations",
+    ["operation"],
+)
+CACHE_REQUESTS = get_metrics_registry().counter(
+    "context_cleaner_cache_requests_total",
+    "Cache lookups by cache and result",
+    ["cache", "result"],
+)
@@ -13,6 +13,7 @@ from dataclasses import dataclass, asdict
 
 from ..config.settings import ContextCleanerConfig
 from ..tracking.storage import EncryptedStorage
+from .metrics_registry import OPERATION_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -408,6 +409,7 @@ class OperationTracker:
 
         # Calculate operation duration
         duration_ms = (time.perf_counter() - self.start_time) * 1000
+        OPERATION_SECONDS.observe(duration_ms / 1000, operation=self.operation_name)
 
         # Record timing
         if self.operation_name not in self.optimizer.operation_timings:
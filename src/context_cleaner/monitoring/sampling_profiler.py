@@ -0,0 +1,228 @@
+"""
+Built-in Sampling Profiler
+
+An opt-in statistical profiler for finding where a live dashboard or sync
+service spends its time without attaching external tools. A daemon thread
+wakes at the configured rate, reads every thread's current stack through
+``sys._current_frames()`` and counts the stack in folded form
+(``thread;module:function;...``). Nothing is traced between samples, so the
+overhead is proportional to the sampling rate, not to the code being run.
+
+A thread sampler is used rather than SIGPROF because signal handlers only
+run on the main thread, while the dashboard and sync work happen on worker
+threads and event loops.
+
+Output:
+- folded stacks, consumable by flamegraph.pl, speedscope and inferno
+- a top-N table of hot functions by self and total samples
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MIN_HZ = 1
+MAX_HZ = 1000
+
+
+@dataclass
+class HotFunction:
+    """Samples attributed to one function"""
+
+    function: str
+    self_samples: int
+    total_samples: int
+    self_percent: float
+    total_percent: float
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads at a fixed rate.
+
+    ``max_stacks`` bounds memory: once that many distinct stacks have been
+    seen, new stacks are counted under a single overflow entry.
+    """
+
+    OVERFLOW_STACK = "[other stacks]"
+
+    def __init__(self, hz: int = 100, max_depth: int = 64, max_stacks: int = 20000):
+        self.hz = hz
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+        self._stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at: Optional[datetime] = None
+        self._stopped_at: Optional[datetime] = None
+        self._deadline: Optional[float] = None
+        self.samples_taken = 0
+        self.sampling_overhead_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self, hz: Optional[int] = None, duration_seconds: Optional[float] = None
+    ) -> bool:
+        """Start sampling; returns False if already running."""
+        if self.running:
+            return False
+        if hz is not None:
+            if not MIN_HZ <= hz <= MAX_HZ:
+                raise ValueError(f"hz must be between {MIN_HZ} and {MAX_HZ}")
+            self.hz = hz
+
+        self._stop_event.clear()
+        self._deadline = (
+            time.monotonic() + duration_seconds if duration_seconds else None
+        )
+        self._started_at = datetime.now()
+        self._stopped_at = None
+        self._thread = threading.Thread(
+            target=self._run, name="context-cleaner-sampler", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Sampling profiler started at {self.hz} Hz")
+        return True
+
+    def stop(self) -> bool:
+        """Stop sampling, keeping collected samples; returns False if idle."""
+        if not self.running:
+            return False
+        self._stop_event.set()
+        self._thread.join(timeout=2)
+        logger.info(f"Sampling profiler stopped after {self.samples_taken} samples")
+        return True
+
+    def reset(self):
+        with self._lock:
+            self._stacks.clear()
+            self.samples_taken = 0
+            self.sampling_overhead_seconds = 0.0
+
+    def _run(self):
+        interval = 1.0 / self.hz
+        own_id = threading.get_ident()
+        next_tick = time.monotonic()
+        try:
+            while not self._stop_event.is_set():
+                if self._deadline is not None and time.monotonic() >= self._deadline:
+                    break
+                started = time.perf_counter()
+                self.sample(exclude=own_id)
+                self.sampling_overhead_seconds += time.perf_counter() - started
+
+                next_tick += interval
+                delay = next_tick - time.monotonic()
+                if delay < 0:
+                    # Fell behind; skip missed ticks rather than bursting
+                    next_tick = time.monotonic()
+                    delay = 0
+                self._stop_event.wait(delay)
+        finally:
+            self._stopped_at = datetime.now()
+
+    def sample(self, exclude: Optional[int] = None):
+        """Record the current stack of every thread once."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        folded = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == exclude:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self.max_depth:
+                code = frame.f_code
+                module = os.path.splitext(os.path.basename(code.co_filename))[0]
+                frames.append(f"{module}:{code.co_name}")
+                frame = frame.f_back
+            frames.append(names.get(thread_id, f"thread-{thread_id}"))
+            folded.append(";".join(reversed(frames)))
+
+        with self._lock:
+            for stack in folded:
+                if stack in self._stacks or len(self._stacks) < self.max_stacks:
+                    self._stacks[stack] += 1
+                else:
+                    self._stacks[self.OVERFLOW_STACK] += 1
+            self.samples_taken += 1
+
+    def folded_stacks(self) -> str:
+        """Collected stacks in collapsed format, one ``stack count`` per line"""
+        with self._lock:
+            items = self._stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def top_functions(self, limit: int = 20) -> List[HotFunction]:
+        """Functions ranked by samples where they were on top of the stack"""
+        with self._lock:
+            items = list(self._stacks.items())
+
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        total_samples = 0
+        for stack, count in items:
+            # The first element is the thread name, not a function
+            functions = stack.split(";")[1:]
+            if not functions:
+                continue
+            total_samples += count
+            self_counts[functions[-1]] += count
+            for function in set(functions):
+                total_counts[function] += count
+
+        if not total_samples:
+            return []
+        ranked = sorted(
+            total_counts, key=lambda f: (self_counts[f], total_counts[f]), reverse=True
+        )
+        return [
+            HotFunction(
+                function=function,
+                self_samples=self_counts[function],
+                total_samples=total_counts[function],
+                self_percent=round(100.0 * self_counts[function] / total_samples, 2),
+                total_percent=round(100.0 * total_counts[function] / total_samples, 2),
+            )
+            for function in ranked[:limit]
+        ]
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            distinct_stacks = len(self._stacks)
+        return {
+            "running": self.running,
+            "hz": self.hz,
+            "samples_taken": self.samples_taken,
+            "distinct_stacks": distinct_stacks,
+            "sampling_overhead_seconds": round(self.sampling_overhead_seconds, 4),
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "stopped_at": self._stopped_at.isoformat() if self._stopped_at else None,
+        }
+
+    def get_report(self, limit: int = 20) -> Dict[str, Any]:
+        return {
+            **self.get_status(),
+            "top_functions": [asdict(f) for f in self.top_functions(limit)],
+        }
+
+
+_sampling_profiler: Optional[SamplingProfiler] = None
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """Get the process-wide sampling profiler."""
+    global _sampling_profiler
+    if _sampling_profiler is None:
+        _sampling_profiler = SamplingProfiler()
+    return _sampling_profiler
@@ -6,9 +6,13 @@ cache analysis and cross-session data for detailed optimization insights.
 """
 
 import asyncio
+import csv
+from abc import ABC, abstractmethod
+import html
+import io
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
@@ -38,6 +42,7 @@ class ReportFormat(Enum):
     JSON = "json"
     HTML = "html"
     MARKDOWN = "markdown"
+    CSV = "csv"
     PDF = "pdf"
 
 
@@ -97,6 +102,200 @@ class UsageReport:
     next_analysis_date: datetime
 
 
+class ReportWriter(ABC):
+    """
+    Incremental report renderer.
+
+    A report is rendered as ``begin(header)``, one ``write_section`` call per
+    section and ``end(footer)``; each call returns the text for that part only,
+    so callers can emit it and drop the section before the next one is built.
+    """
+
+    def begin(self, header: Dict[str, Any]) -> str:
+        return ""
+
+    @abstractmethod
+    def write_section(self, section: ReportSection) -> str:
+        """Render one section."""
+
+    def end(self, footer: Dict[str, Any]) -> str:
+        return ""
+
+
+class JSONReportWriter(ReportWriter):
+    """Streams a single JSON object whose ``sections`` array is written last."""
+
+    def __init__(self):
+        self._first_section = True
+
+    def begin(self, header: Dict[str, Any]) -> str:
+        fields = [
+            f"{json.dumps(key)}: {json.dumps(value, default=str)}"
+            for key, value in header.items()
+        ]
+        fields.append('"sections": [')
+        return "{" + ", ".join(fields)
+
+    def write_section(self, section: ReportSection) -> str:
+        prefix = "" if self._first_section else ", "
+        self._first_section = False
+        return prefix + json.dumps(asdict(section), default=str)
+
+    def end(self, footer: Dict[str, Any]) -> str:
+        fields = "".join(
+            f", {json.dumps(key)}: {json.dumps(value, default=str)}"
+            for key, value in footer.items()
+        )
+        return "]" + fields + "}"
+
+
+class CSVReportWriter(ReportWriter):
+    """Flattens the report into ``section,kind,value`` rows."""
+
+    def _rows(self, rows: List[Tuple[str, str, Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue()
+
+    def begin(self, header: Dict[str, Any]) -> str:
+        rows = [("section", "kind", "value")]
+        rows.append(("Report", "report_id", header.get("report_id", "")))
+        rows.append(("Report", "generated_at", header.get("generated_at", "")))
+        rows.append(
+            ("Executive Summary", "content", header.get("executive_summary", ""))
+        )
+        for name, value in header.get("key_metrics", {}).items():
+            rows.append(("Key Metrics", name, value))
+        for insight in header.get("critical_insights", []):
+            rows.append(("Critical Insights", "insight", insight))
+        return self._rows(rows)
+
+    def write_section(self, section: ReportSection) -> str:
+        rows = [(section.title, "content", section.content)]
+        rows.extend((section.title, "insight", i) for i in section.insights)
+        rows.extend(
+            (section.title, "recommendation", r) for r in section.recommendations
+        )
+        return self._rows(rows)
+
+    def end(self, footer: Dict[str, Any]) -> str:
+        return self._rows(
+            [
+                ("Optimization Recommendations", "recommendation", rec.get("title"))
+                for rec in footer.get("optimization_recommendations", [])
+            ]
+        )
+
+
+class MarkdownReportWriter(ReportWriter):
+    """Markdown rendering matching the layout of persisted Markdown reports."""
+
+    def begin(self, header: Dict[str, Any]) -> str:
+        metrics = header.get("key_metrics", {})
+        time_period = header.get("time_period", {})
+        insights = "\n".join(f"- {i}" for i in header.get("critical_insights", []))
+        return (
+            "# Context Cleaner Optimization Report\n\n"
+            f"**Generated:** {header.get('generated_at')}\n"
+            f"**Report Type:** {str(header.get('report_type', '')).title()}\n"
+            f"**Time Period:** {time_period.get('start')} to {time_period.get('end')}\n\n"
+            f"## Executive Summary\n\n{header.get('executive_summary', '')}\n\n"
+            "## Key Metrics\n\n"
+            f"- **Overall Health Score:** {metrics.get('overall_health_score', 0):.1%}\n"
+            f"- **Efficiency Score:** {metrics.get('efficiency_score', 0):.1%}\n"
+            f"- **Sessions Analyzed:** {metrics.get('sessions_analyzed', 0)}\n\n"
+            f"## Critical Insights\n\n{insights}\n\n"
+        )
+
+    def write_section(self, section: ReportSection) -> str:
+        parts = [f"## {section.title}\n\n{section.content}\n\n"]
+        if section.insights:
+            insights = "\n".join(f"- {i}" for i in section.insights)
+            parts.append(f"### Insights\n\n{insights}\n\n")
+        if section.recommendations:
+            recs = "\n".join(f"- {r}" for r in section.recommendations)
+            parts.append(f"### Recommendations\n\n{recs}\n\n")
+        return "".join(parts)
+
+    def end(self, footer: Dict[str, Any]) -> str:
+        recs = "\n".join(
+            f"### {rec.get('title', 'Unknown')}\n{rec.get('description', '')}\n"
+            for rec in footer.get("optimization_recommendations", [])[:5]
+        )
+        return (
+            f"## Optimization Recommendations\n\n{recs}\n"
+            "---\n*Report generated by Context Cleaner Advanced Analytics*\n"
+        )
+
+
+class HTMLReportWriter(ReportWriter):
+    """HTML rendering with one ``<section>`` element per report section."""
+
+    def begin(self, header: Dict[str, Any]) -> str:
+        title = html.escape(str(header.get("report_type", "")).title())
+        insights = "\n".join(
+            f'<div class="insight">{html.escape(str(i))}</div>'
+            for i in header.get("critical_insights", [])
+        )
+        health = header.get("key_metrics", {}).get("overall_health_score", 0)
+        return (
+            "<!DOCTYPE html>\n<html>\n<head>\n"
+            f"<title>{title} Report</title>\n"
+            "<style>\n"
+            "body { font-family: Arial, sans-serif; margin: 40px; }\n"
+            ".metric { background: #f5f5f5; padding: 10px; margin: 10px 0; }\n"
+            ".insight { background: #e8f4fd; padding: 10px; margin: 10px 0; }\n"
+            ".recommendation { background: #fff3cd; padding: 10px; margin: 10px 0; }\n"
+            "</style>\n</head>\n<body>\n"
+            "<h1>Context Cleaner Optimization Report</h1>\n"
+            f"<p>Generated: {html.escape(str(header.get('generated_at')))}</p>\n"
+            "<h2>Executive Summary</h2>\n"
+            f"<p>{html.escape(header.get('executive_summary', ''))}</p>\n"
+            "<h2>Key Metrics</h2>\n"
+            f'<div class="metric"><strong>Overall Health Score:</strong> {health:.1%}</div>\n'
+            f"<h2>Critical Insights</h2>\n{insights}\n"
+        )
+
+    def write_section(self, section: ReportSection) -> str:
+        insights = "".join(
+            f'<div class="insight">{html.escape(str(i))}</div>\n'
+            for i in section.insights
+        )
+        recs = "".join(
+            f'<div class="recommendation">{html.escape(str(r))}</div>\n'
+            for r in section.recommendations
+        )
+        return (
+            f"<section>\n<h2>{html.escape(section.title)}</h2>\n"
+            f"<pre>{html.escape(section.content)}</pre>\n{insights}{recs}</section>\n"
+        )
+
+    def end(self, footer: Dict[str, Any]) -> str:
+        recs = "\n".join(
+            f'<div class="recommendation">{html.escape(str(rec.get("title", "Unknown")))}</div>'
+            for rec in footer.get("optimization_recommendations", [])[:5]
+        )
+        return f"<h2>Recommendations</h2>\n{recs}\n</body>\n</html>\n"
+
+
+_REPORT_WRITERS = {
+    ReportFormat.JSON: JSONReportWriter,
+    ReportFormat.CSV: CSVReportWriter,
+    ReportFormat.MARKDOWN: MarkdownReportWriter,
+    ReportFormat.HTML: HTMLReportWriter,
+}
+
+
+def create_report_writer(output_format: ReportFormat) -> ReportWriter:
+    """Return a fresh streaming writer for ``output_format``."""
+    try:
+        return _REPORT_WRITERS[output_format]()
+    except KeyError:
+        raise ValueError(
+            f"Streaming is not supported for {output_format.value} reports"
+        ) from None
+
+
 class AdvancedReportingSystem:
     """
     Advanced reporting system that generates comprehensive reports
@@ -235,6 +434,114 @@ class AdvancedReportingSystem:
 
         return report
 
+    async def stream_report(
+        self,
+        dashboard_data: CacheEnhancedDashboardData,
+        cross_session_insights: CrossSessionInsights,
+        recommendations: List[IntelligentRecommendation],
+        personalization_profile: Optional[PersonalizationProfile] = None,
+        report_type: ReportType = ReportType.DETAILED_ANALYSIS,
+        output_format: ReportFormat = ReportFormat.JSON,
+        time_period_days: int = 30,
+    ) -> AsyncIterator[str]:
+        """
+        Render a report incrementally, one section at a time.
+
+        Unlike generate_comprehensive_report, no UsageReport (with its raw
+        data dump and chart payloads) is assembled: the header is emitted
+        first, then each section is rendered and released before the next one
+        is built, so memory is bounded by the largest section.
+
+        Args:
+            dashboard_data: Cache-enhanced dashboard data
+            cross_session_insights: Cross-session analysis results
+            recommendations: Intelligent recommendations
+            personalization_profile: User personalization profile
+            report_type: Type of report to generate
+            output_format: JSON, CSV, Markdown or HTML
+            time_period_days: Time period for analysis
+
+        Yields:
+            Rendered report text, in order
+        """
+        writer = create_report_writer(output_format)
+        end_date = datetime.now()
+
+        header = {
+            "report_id": f"{report_type.value}_{end_date.strftime('%Y%m%d_%H%M%S')}",
+            "report_type": report_type.value,
+            "generated_at": end_date,
+            "time_period": {
+                "start": end_date - timedelta(days=time_period_days),
+                "end": end_date,
+            },
+            "executive_summary": await self._generate_executive_summary(
+                dashboard_data, cross_session_insights, recommendations
+            ),
+            "key_metrics": self._extract_key_metrics(
+                dashboard_data, cross_session_insights
+            ),
+            "performance_indicators": self._calculate_performance_indicators(
+                dashboard_data, cross_session_insights
+            ),
+            "critical_insights": self._extract_critical_insights(
+                dashboard_data, cross_session_insights, recommendations
+            ),
+        }
+        yield writer.begin(header)
+        del header
+
+        async for section in self._iter_report_sections(
+            report_type,
+            dashboard_data,
+            cross_session_insights,
+            recommendations,
+            personalization_profile,
+        ):
+            yield writer.write_section(section)
+
+        yield writer.end(
+            {
+                "optimization_recommendations": self._format_optimization_recommendations(
+                    recommendations
+                ),
+                "automation_opportunities": cross_session_insights.automation_opportunities,
+                "confidence_score": self._calculate_confidence_score(
+                    dashboard_data, cross_session_insights
+                ),
+                "data_completeness": self._calculate_data_completeness(
+                    dashboard_data, cross_session_insights
+                ),
+                "next_analysis_date": end_date + timedelta(days=7),
+            }
+        )
+
+    async def export_report(
+        self,
+        output_path: Path,
+        dashboard_data: CacheEnhancedDashboardData,
+        cross_session_insights: CrossSessionInsights,
+        recommendations: List[IntelligentRecommendation],
+        personalization_profile: Optional[PersonalizationProfile] = None,
+        report_type: ReportType = ReportType.DETAILED_ANALYSIS,
+        output_format: ReportFormat = ReportFormat.JSON,
+        time_period_days: int = 30,
+    ) -> Path:
+        """Stream a report straight to ``output_path`` and return the path."""
+        output_path = Path(output_path)
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            async for chunk in self.stream_report(
+                dashboard_data,
+                cross_session_insights,
+                recommendations,
+                personalization_profile=personalization_profile,
+                report_type=report_type,
+                output_format=output_format,
+                time_period_days=time_period_days,
+            ):
+                f.write(chunk)
+        return output_path
+
     async def _generate_executive_summary(
         self,
         dashboard_data: CacheEnhancedDashboardData,
@@ -316,344 +623,313 @@ class AdvancedReportingSystem:
         personalization_profile: Optional[PersonalizationProfile],
     ) -> List[ReportSection]:
         """Generate report sections based on report type."""
-        sections = []
+        return [
+            section
+            async for section in self._iter_report_sections(
+                report_type,
+                dashboard_data,
+                cross_session_insights,
+                recommendations,
+                personalization_profile,
+            )
+        ]
 
+    async def _iter_report_sections(
+        self,
+        report_type: ReportType,
+        dashboard_data: CacheEnhancedDashboardData,
+        cross_session_insights: CrossSessionInsights,
+        recommendations: List[IntelligentRecommendation],
+        personalization_profile: Optional[PersonalizationProfile],
+    ) -> AsyncIterator[ReportSection]:
+        """Yield report sections for ``report_type`` as each group is built."""
         if report_type == ReportType.EXECUTIVE_SUMMARY:
-            sections.extend(
-                await self._generate_executive_sections(
-                    dashboard_data, cross_session_insights, recommendations
-                )
+            builder = self._generate_executive_sections(
+                dashboard_data, cross_session_insights, recommendations
             )
         elif report_type == ReportType.DETAILED_ANALYSIS:
-            sections.extend(
-                await self._generate_detailed_sections(
-                    dashboard_data, cross_session_insights, recommendations
-                )
+            builder = self._generate_detailed_sections(
+                dashboard_data, cross_session_insights, recommendations
             )
         elif report_type == ReportType.TREND_REPORT:
-            sections.extend(
-                await self._generate_trend_sections(
-                    dashboard_data, cross_session_insights
-                )
+            builder = self._generate_trend_sections(
+                dashboard_data, cross_session_insights
             )
         elif report_type == ReportType.OPTIMIZATION_REPORT:
-            sections.extend(
-                await self._generate_optimization_sections(
-                    recommendations, cross_session_insights
-                )
+            builder = self._generate_optimization_sections(
+                recommendations, cross_session_insights
             )
         elif report_type == ReportType.PERSONALIZATION_REPORT:
-            sections.extend(
-                await self._generate_personalization_sections(
-                    personalization_profile, recommendations
-                )
+            builder = self._generate_personalization_sections(
+                personalization_profile, recommendations
             )
         elif report_type == ReportType.COMPARATIVE_ANALYSIS:
-            sections.extend(
-                await self._generate_comparative_sections(
-                    dashboard_data, cross_session_insights
-                )
+            builder = self._generate_comparative_sections(
+                dashboard_data, cross_session_insights
             )
+        else:
+            return
 
-        return sections
+        async for section in builder:
+            yield section
 
     async def _generate_executive_sections(
         self,
         dashboard_data: CacheEnhancedDashboardData,
         cross_session_insights: CrossSessionInsights,
         recommendations: List[IntelligentRecommendation],
-    ) -> List[ReportSection]:
+    ) -> AsyncIterator[ReportSection]:
         """Generate executive-level sections."""
-        sections = []
-
         # Health Overview
         health_content = self._format_health_overview(dashboard_data.health_metrics)
-        sections.append(
-            ReportSection(
-                title="Context Health Overview",
-                content=health_content,
-                charts=[
-                    {
-                        "type": "health_gauge",
-                        "data": asdict(dashboard_data.health_metrics),
-                    }
-                ],
-                insights=[
-                    f"Overall health score: {dashboard_data.health_metrics.overall_health_score:.1%}",
-                    f"Usage-weighted focus: {dashboard_data.health_metrics.usage_weighted_focus_score:.1%}",
-                    f"Token efficiency: {dashboard_data.health_metrics.efficiency_score:.1%}",
-                ],
-                recommendations=[r.title for r in recommendations[:3]],
-                metadata={"importance": "high", "audience": "executive"},
-            )
+        yield ReportSection(
+            title="Context Health Overview",
+            content=health_content,
+            charts=[
+                {
+                    "type": "health_gauge",
+                    "data": asdict(dashboard_data.health_metrics),
+                }
+            ],
+            insights=[
+                f"Overall health score: {dashboard_data.health_metrics.overall_health_score:.1%}",
+                f"Usage-weighted focus: {dashboard_data.health_metrics.usage_weighted_focus_score:.1%}",
+                f"Token efficiency: {dashboard_data.health_metrics.efficiency_score:.1%}",
+            ],
+            recommendations=[r.title for r in recommendations[:3]],
+            metadata={"importance": "high", "audience": "executive"},
         )
 
         # Key Performance Indicators
         kpi_content = self._format_kpi_summary(cross_session_insights)
-        sections.append(
-            ReportSection(
-                title="Key Performance Indicators",
-                content=kpi_content,
-                charts=[
-                    {
-                        "type": "kpi_dashboard",
-                        "data": cross_session_insights.efficiency_trends,
-                    }
-                ],
-                insights=[
-                    f"User adaptation score: {cross_session_insights.user_adaptation_score:.1%}",
-                    f"Sessions analyzed: {cross_session_insights.sessions_analyzed}",
-                    f"Workflow templates identified: {len(cross_session_insights.workflow_templates)}",
-                ],
-                recommendations=[],
-                metadata={"importance": "medium", "audience": "executive"},
-            )
+        yield ReportSection(
+            title="Key Performance Indicators",
+            content=kpi_content,
+            charts=[
+                {
+                    "type": "kpi_dashboard",
+                    "data": cross_session_insights.efficiency_trends,
+                }
+            ],
+            insights=[
+                f"User adaptation score: {cross_session_insights.user_adaptation_score:.1%}",
+                f"Sessions analyzed: {cross_session_insights.sessions_analyzed}",
+                f"Workflow templates identified: {len(cross_session_insights.workflow_templates)}",
+            ],
+            recommendations=[],
+            metadata={"importance": "medium", "audience": "executive"},
         )
 
-        return sections
-
     async def _generate_detailed_sections(
         self,
         dashboard_data: CacheEnhancedDashboardData,
         cross_session_insights: CrossSessionInsights,
         recommendations: List[IntelligentRecommendation],
-    ) -> List[ReportSection]:
+    ) -> AsyncIterator[ReportSection]:
         """Generate detailed analysis sections."""
-        sections = []
-
         # Usage Pattern Analysis
         if dashboard_data.usage_summary:
             usage_content = self._format_usage_analysis(dashboard_data.usage_summary)
-            sections.append(
-                ReportSection(
-                    title="Usage Pattern Analysis",
-                    content=usage_content,
-                    charts=[
-                        {"type": "usage_heatmap", "data": dashboard_data.usage_trends}
-                    ],
-                    insights=[
-                        f"Workflow efficiency: {dashboard_data.usage_summary.workflow_efficiency:.1%}",
-                        f"File patterns identified: {len(dashboard_data.usage_summary.file_patterns)}",
-                        f"Most accessed files show clear usage patterns",
-                    ],
-                    recommendations=[
-                        r.title
-                        for r in recommendations
-                        if r.category.value == "workflow_alignment"
-                    ],
-                    metadata={"importance": "high", "technical_level": "detailed"},
-                )
+            yield ReportSection(
+                title="Usage Pattern Analysis",
+                content=usage_content,
+                charts=[{"type": "usage_heatmap", "data": dashboard_data.usage_trends}],
+                insights=[
+                    f"Workflow efficiency: {dashboard_data.usage_summary.workflow_efficiency:.1%}",
+                    f"File patterns identified: {len(dashboard_data.usage_summary.file_patterns)}",
+                    f"Most accessed files show clear usage patterns",
+                ],
+                recommendations=[
+                    r.title
+                    for r in recommendations
+                    if r.category.value == "workflow_alignment"
+                ],
+                metadata={"importance": "high", "technical_level": "detailed"},
             )
 
         # Token Efficiency Deep Dive
         if dashboard_data.token_analysis:
             token_content = self._format_token_analysis(dashboard_data.token_analysis)
-            sections.append(
-                ReportSection(
-                    title="Token Efficiency Analysis",
-                    content=token_content,
-                    charts=[
-                        {
-                            "type": "waste_breakdown",
-                            "data": dashboard_data.efficiency_trends,
-                        }
-                    ],
-                    insights=[
-                        f"Token waste: {dashboard_data.token_analysis.waste_percentage:.1f}%",
-                        f"Efficiency opportunities: {len(dashboard_data.token_analysis.waste_patterns)}",
-                        f"Cache optimization potential identified",
-                    ],
-                    recommendations=[
-                        r.title
-                        for r in recommendations
-                        if r.category.value == "token_efficiency"
-                    ],
-                    metadata={"importance": "high", "technical_level": "detailed"},
-                )
-            )
-
-        # Cross-Session Patterns
-        pattern_content = self._format_pattern_analysis(cross_session_insights)
-        sections.append(
-            ReportSection(
-                title="Cross-Session Pattern Analysis",
-                content=pattern_content,
+            yield ReportSection(
+                title="Token Efficiency Analysis",
+                content=token_content,
                 charts=[
                     {
-                        "type": "pattern_evolution",
-                        "data": cross_session_insights.pattern_evolution,
+                        "type": "waste_breakdown",
+                        "data": dashboard_data.efficiency_trends,
                     }
                 ],
                 insights=[
-                    f"Patterns tracked: {len(cross_session_insights.pattern_evolution)}",
-                    f"Session clusters: {len(cross_session_insights.session_clusters)}",
-                    f"Automation opportunities: {len(cross_session_insights.automation_opportunities)}",
+                    f"Token waste: {dashboard_data.token_analysis.waste_percentage:.1f}%",
+                    f"Efficiency opportunities: {len(dashboard_data.token_analysis.waste_patterns)}",
+                    f"Cache optimization potential identified",
                 ],
-                recommendations=cross_session_insights.optimization_recommendations,
-                metadata={"importance": "medium", "technical_level": "detailed"},
+                recommendations=[
+                    r.title
+                    for r in recommendations
+                    if r.category.value == "token_efficiency"
+                ],
+                metadata={"importance": "high", "technical_level": "detailed"},
             )
-        )
 
-        return sections
+        # Cross-Session Patterns
+        pattern_content = self._format_pattern_analysis(cross_session_insights)
+        yield ReportSection(
+            title="Cross-Session Pattern Analysis",
+            content=pattern_content,
+            charts=[
+                {
+                    "type": "pattern_evolution",
+                    "data": cross_session_insights.pattern_evolution,
+                }
+            ],
+            insights=[
+                f"Patterns tracked: {len(cross_session_insights.pattern_evolution)}",
+                f"Session clusters: {len(cross_session_insights.session_clusters)}",
+                f"Automation opportunities: {len(cross_session_insights.automation_opportunities)}",
+            ],
+            recommendations=cross_session_insights.optimization_recommendations,
+            metadata={"importance": "medium", "technical_level": "detailed"},
+        )
 
     async def _generate_trend_sections(
         self,
         dashboard_data: CacheEnhancedDashboardData,
         cross_session_insights: CrossSessionInsights,
-    ) -> List[ReportSection]:
+    ) -> AsyncIterator[ReportSection]:
         """Generate trend analysis sections."""
-        sections = []
-
         # Efficiency Trends
         trend_content = self._format_trend_analysis(
             cross_session_insights.efficiency_trends
         )
-        sections.append(
-            ReportSection(
-                title="Efficiency Trends Over Time",
-                content=trend_content,
-                charts=[
-                    {
-                        "type": "line_chart",
-                        "data": cross_session_insights.efficiency_trends,
-                    }
-                ],
-                insights=[
-                    "Overall efficiency shows positive trend",
-                    "Focus improvement correlates with optimization actions",
-                    "Session productivity varies with context size",
-                ],
-                recommendations=[
-                    "Continue current optimization strategy",
-                    "Monitor for trend reversals",
-                ],
-                metadata={"importance": "medium", "time_series": True},
-            )
+        yield ReportSection(
+            title="Efficiency Trends Over Time",
+            content=trend_content,
+            charts=[
+                {
+                    "type": "line_chart",
+                    "data": cross_session_insights.efficiency_trends,
+                }
+            ],
+            insights=[
+                "Overall efficiency shows positive trend",
+                "Focus improvement correlates with optimization actions",
+                "Session productivity varies with context size",
+            ],
+            recommendations=[
+                "Continue current optimization strategy",
+                "Monitor for trend reversals",
+            ],
+            metadata={"importance": "medium", "time_series": True},
         )
 
         # Pattern Evolution
         evolution_content = self._format_pattern_evolution(
             cross_session_insights.pattern_evolution
         )
-        sections.append(
-            ReportSection(
-                title="Pattern Evolution Analysis",
-                content=evolution_content,
-                charts=[
-                    {
-                        "type": "evolution_chart",
-                        "data": cross_session_insights.pattern_evolution,
-                    }
-                ],
-                insights=[
-                    "Workflow patterns show increasing stability",
-                    "User adaptation to optimization suggestions is positive",
-                    "Some patterns could benefit from automation",
-                ],
-                recommendations=[
-                    "Implement automation for stable patterns",
-                    "Continue monitoring adaptation",
-                ],
-                metadata={"importance": "low", "predictive": True},
-            )
+        yield ReportSection(
+            title="Pattern Evolution Analysis",
+            content=evolution_content,
+            charts=[
+                {
+                    "type": "evolution_chart",
+                    "data": cross_session_insights.pattern_evolution,
+                }
+            ],
+            insights=[
+                "Workflow patterns show increasing stability",
+                "User adaptation to optimization suggestions is positive",
+                "Some patterns could benefit from automation",
+            ],
+            recommendations=[
+                "Implement automation for stable patterns",
+                "Continue monitoring adaptation",
+            ],
+            metadata={"importance": "low", "predictive": True},
         )
 
-        return sections
-
     async def _generate_optimization_sections(
         self,
         recommendations: List[IntelligentRecommendation],
         cross_session_insights: CrossSessionInsights,
-    ) -> List[ReportSection]:
+    ) -> AsyncIterator[ReportSection]:
         """Generate optimization-focused sections."""
-        sections = []
-
         # Priority Recommendations
         high_priority = [
             r for r in recommendations if r.priority.value in ["critical", "high"]
         ]
         rec_content = self._format_recommendations(high_priority)
-        sections.append(
-            ReportSection(
-                title="High Priority Optimizations",
-                content=rec_content,
-                charts=[
-                    {
-                        "type": "priority_matrix",
-                        "data": [asdict(r) for r in high_priority],
-                    }
-                ],
-                insights=[
-                    f"{len(high_priority)} high-priority items identified",
-                    "Estimated significant efficiency gains possible",
-                    "Implementation can be largely automated",
-                ],
-                recommendations=[r.title for r in high_priority],
-                metadata={"importance": "critical", "actionable": True},
-            )
+        yield ReportSection(
+            title="High Priority Optimizations",
+            content=rec_content,
+            charts=[
+                {
+                    "type": "priority_matrix",
+                    "data": [asdict(r) for r in high_priority],
+                }
+            ],
+            insights=[
+                f"{len(high_priority)} high-priority items identified",
+                "Estimated significant efficiency gains possible",
+                "Implementation can be largely automated",
+            ],
+            recommendations=[r.title for r in high_priority],
+            metadata={"importance": "critical", "actionable": True},
         )
 
         # Automation Opportunities
         automation_content = self._format_automation_opportunities(
             cross_session_insights.automation_opportunities
         )
-        sections.append(
-            ReportSection(
-                title="Automation Opportunities",
-                content=automation_content,
-                charts=[
-                    {
-                        "type": "automation_potential",
-                        "data": cross_session_insights.automation_opportunities,
-                    }
-                ],
-                insights=[
-                    f"Found {len(cross_session_insights.automation_opportunities)} automation candidates",
-                    "High-frequency patterns are prime for automation",
-                    "Estimated time savings significant",
-                ],
-                recommendations=[
-                    "Implement automated workflows",
-                    "Monitor automation effectiveness",
-                ],
-                metadata={"importance": "medium", "automation_focused": True},
-            )
+        yield ReportSection(
+            title="Automation Opportunities",
+            content=automation_content,
+            charts=[
+                {
+                    "type": "automation_potential",
+                    "data": cross_session_insights.automation_opportunities,
+                }
+            ],
+            insights=[
+                f"Found {len(cross_session_insights.automation_opportunities)} automation candidates",
+                "High-frequency patterns are prime for automation",
+                "Estimated time savings significant",
+            ],
+            recommendations=[
+                "Implement automated workflows",
+                "Monitor automation effectiveness",
+            ],
+            metadata={"importance": "medium", "automation_focused": True},
         )
 
-        return sections
-
     async def _generate_personalization_sections(
         self,
         personalization_profile: Optional[PersonalizationProfile],
         recommendations: List[IntelligentRecommendation],
-    ) -> List[ReportSection]:
+    ) -> AsyncIterator[ReportSection]:
         """Generate personalization-focused sections."""
-        sections = []
-
         if personalization_profile:
             # User Profile Analysis
             profile_content = self._format_profile_analysis(personalization_profile)
-            sections.append(
-                ReportSection(
-                    title="User Profile Analysis",
-                    content=profile_content,
-                    charts=[
-                        {
-                            "type": "profile_radar",
-                            "data": asdict(personalization_profile),
-                        }
-                    ],
-                    insights=[
-                        f"Profile confidence: {personalization_profile.profile_confidence:.1%}",
-                        f"Sessions tracked: {personalization_profile.session_count}",
-                        f"Automation comfort: {personalization_profile.automation_comfort_level:.1%}",
-                    ],
-                    recommendations=[
-                        "Continue building profile data",
-                        "Adjust automation based on comfort level",
-                    ],
-                    metadata={"importance": "medium", "personalized": True},
-                )
+            yield ReportSection(
+                title="User Profile Analysis",
+                content=profile_content,
+                charts=[
+                    {
+                        "type": "profile_radar",
+                        "data": asdict(personalization_profile),
+                    }
+                ],
+                insights=[
+                    f"Profile confidence: {personalization_profile.profile_confidence:.1%}",
+                    f"Sessions tracked: {personalization_profile.session_count}",
+                    f"Automation comfort: {personalization_profile.automation_comfort_level:.1%}",
+                ],
+                recommendations=[
+                    "Continue building profile data",
+                    "Adjust automation based on comfort level",
+                ],
+                metadata={"importance": "medium", "personalized": True},
             )
 
             # Personalized Recommendations
@@ -663,63 +939,53 @@ class AdvancedReportingSystem:
             pers_rec_content = self._format_personalized_recommendations(
                 personalized_recs
             )
-            sections.append(
-                ReportSection(
-                    title="Personalized Optimization Strategy",
-                    content=pers_rec_content,
-                    charts=[
-                        {
-                            "type": "personalization_fit",
-                            "data": [asdict(r) for r in personalized_recs],
-                        }
-                    ],
-                    insights=[
-                        f"{len(personalized_recs)} recommendations highly aligned with preferences",
-                        "Personalization improves recommendation acceptance",
-                        "Historical effectiveness guides future suggestions",
-                    ],
-                    recommendations=[r.title for r in personalized_recs[:5]],
-                    metadata={"importance": "high", "personalized": True},
-                )
+            yield ReportSection(
+                title="Personalized Optimization Strategy",
+                content=pers_rec_content,
+                charts=[
+                    {
+                        "type": "personalization_fit",
+                        "data": [asdict(r) for r in personalized_recs],
+                    }
+                ],
+                insights=[
+                    f"{len(personalized_recs)} recommendations highly aligned with preferences",
+                    "Personalization improves recommendation acceptance",
+                    "Historical effectiveness guides future suggestions",
+                ],
+                recommendations=[r.title for r in personalized_recs[:5]],
+                metadata={"importance": "high", "personalized": True},
             )
 
-        return sections
-
     async def _generate_comparative_sections(
         self,
         dashboard_data: CacheEnhancedDashboardData,
         cross_session_insights: CrossSessionInsights,
-    ) -> List[ReportSection]:
+    ) -> AsyncIterator[ReportSection]:
         """Generate comparative analysis sections."""
-        sections = []
-
         # Historical Comparison
         comparison_content = self._format_historical_comparison(cross_session_insights)
-        sections.append(
-            ReportSection(
-                title="Historical Performance Comparison",
-                content=comparison_content,
-                charts=[
-                    {
-                        "type": "comparison_chart",
-                        "data": cross_session_insights.efficiency_trends,
-                    }
-                ],
-                insights=[
-                    "Performance improvement over time period",
-                    "Optimization effectiveness varies by category",
-                    "User adaptation shows positive trend",
-                ],
-                recommendations=[
-                    "Continue successful optimization patterns",
-                    "Address declining areas",
-                ],
-                metadata={"importance": "medium", "comparative": True},
-            )
+        yield ReportSection(
+            title="Historical Performance Comparison",
+            content=comparison_content,
+            charts=[
+                {
+                    "type": "comparison_chart",
+                    "data": cross_session_insights.efficiency_trends,
+                }
+            ],
+            insights=[
+                "Performance improvement over time period",
+                "Optimization effectiveness varies by category",
+                "User adaptation shows positive trend",
+            ],
+            recommendations=[
+                "Continue successful optimization patterns",
+                "Address declining areas",
+            ],
+            metadata={"importance": "medium", "comparative": True},
         )
 
-        return sections
-
     def _extract_key_metrics(
         self,
         dashboard_data: CacheEnhancedDashboardData,
@@ -1244,7 +1510,7 @@ Addressing identified waste patterns could improve efficiency by {token_analysis
 
 ## Optimization Recommendations
 
-{chr(10).join([f'### {rec.get("title", "Unknown")}\\n{rec.get("description", "")}\\n' for rec in report.optimization_recommendations[:5]])}
+{chr(10).join([f'### {rec.get("title", "Unknown")}{chr(10)}{rec.get("description", "")}{chr(10)}' for rec in report.optimization_recommendations[:5]])}
 
 ---
 *Report generated by Context Cleaner Advanced Analytics*
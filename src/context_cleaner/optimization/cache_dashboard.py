@@ -6,6 +6,11 @@ to provide usage-based context health scoring and optimization insights.
 """
 
 import asyncio
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
@@ -14,6 +19,7 @@ from enum import Enum
 
 from ..analysis import (
     CacheDiscoveryService,
+    CacheLocation,
     SessionCacheParser,
     UsagePatternAnalyzer,
     TokenEfficiencyAnalyzer,
@@ -28,6 +34,32 @@ from ..analysis import (
 )
 from ..analytics.advanced_patterns import AdvancedPatternRecognizer
 
+# Analyses that may run in worker processes: name -> (analyzer class, method)
+_POOLED_ANALYSES = {
+    "usage": ("UsagePatternAnalyzer", "analyze_usage_patterns"),
+    "token": ("TokenEfficiencyAnalyzer", "analyze_token_efficiency"),
+    "temporal": ("TemporalContextAnalyzer", "analyze_temporal_patterns"),
+    "correlation": (
+        "CrossSessionCorrelationAnalyzer",
+        "analyze_cross_session_patterns",
+    ),
+}
+
+# Per-worker analyzer instances, built on first use in each process
+_worker_analyzers: Dict[str, Any] = {}
+
+
+def _run_pooled_analysis(kind: str, session_blob: bytes) -> Any:
+    """Worker entry point: rebuild the parsed sessions and run one analysis."""
+    class_name, method_name = _POOLED_ANALYSES[kind]
+    analyzer = _worker_analyzers.get(kind)
+    if analyzer is None:
+        from .. import analysis
+
+        analyzer = _worker_analyzers[kind] = getattr(analysis, class_name)()
+    sessions = pickle.loads(session_blob)
+    return getattr(analyzer, method_name)(sessions)
+
 
 def _get_health_scorer_classes():
     """Lazy import to avoid circular dependency."""
@@ -140,8 +172,26 @@ class CacheEnhancedDashboard:
     with cache-based usage patterns for enhanced insights.
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None):
-        """Initialize the cache-enhanced dashboard."""
+    # Below this many sessions, process start-up and pickling cost more
+    # than the GIL contention they avoid.
+    PROCESS_POOL_MIN_SESSIONS = 20
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        use_process_pool: bool = False,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the cache-enhanced dashboard.
+
+        Args:
+            cache_dir: Optional cache directory override
+            use_process_pool: Run the CPU-bound session analyzers in worker
+                processes instead of threads
+            max_workers: Worker process count (defaults to the CPU count,
+                capped at the number of pooled analyses)
+        """
         self.cache_discovery = CacheDiscoveryService()
         self.session_parser = SessionCacheParser()
         self.usage_analyzer = UsagePatternAnalyzer()
@@ -158,11 +208,38 @@ class CacheEnhancedDashboard:
         self._cache_dir = cache_dir
         self._analysis_cache: Dict[str, Any] = {}
 
+        self.use_process_pool = use_process_pool
+        self._max_workers = max_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+        # Sessions list of the current run and its pickled form, so the
+        # parsed sessions are serialized once and shared by every worker task
+        self._session_blob: Optional[Tuple[List[Any], Optional[bytes]]] = None
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Any] = None, cache_dir: Optional[Path] = None
+    ) -> "CacheEnhancedDashboard":
+        """
+        Create a dashboard honouring ``dashboard.analysis_process_pool``.
+
+        Accepts either ``ContextCleanerConfig`` or ``ApplicationConfig``;
+        without a config the analyzers run in threads.
+        """
+        dashboard_config = getattr(config, "dashboard", None)
+        return cls(
+            cache_dir=cache_dir,
+            use_process_pool=bool(
+                getattr(dashboard_config, "analysis_process_pool", False)
+            ),
+        )
+
     async def generate_dashboard(
         self,
         context_path: Optional[Path] = None,
         include_cross_session: bool = True,
         max_sessions: int = 50,
+        cache_locations: Optional[List[CacheLocation]] = None,
     ) -> CacheEnhancedDashboardData:
         """
         Generate comprehensive cache-enhanced dashboard data.
@@ -171,23 +248,32 @@ class CacheEnhancedDashboard:
             context_path: Path to context file (if analyzing specific context)
             include_cross_session: Whether to include cross-session analysis
             max_sessions: Maximum number of sessions to analyze
+            cache_locations: Already discovered cache locations, if any
 
         Returns:
             Complete dashboard data with usage-based insights
         """
         try:
-            # Discover cache locations
-            cache_locations = await self._discover_cache_locations()
+            # Discover cache locations unless the caller already has them
+            if cache_locations is None:
+                cache_paths = await self._discover_cache_locations()
+            else:
+                cache_paths = [loc.path for loc in cache_locations]
 
-            if not cache_locations:
+            if not cache_paths:
                 return await self._generate_basic_dashboard(context_path)
 
             # Parse sessions from cache
-            sessions = await self._parse_recent_sessions(cache_locations, max_sessions)
+            sessions = await self._parse_recent_sessions(cache_paths, max_sessions)
 
             if not sessions:
                 return await self._generate_basic_dashboard(context_path)
 
+            if self._should_use_process_pool(sessions):
+                self._session_blob = await asyncio.to_thread(
+                    self._serialize_sessions, sessions
+                )
+
             # Run all analyses in parallel for efficiency
             analysis_tasks = [
                 self._analyze_usage_patterns(sessions),
@@ -286,17 +372,92 @@ class CacheEnhancedDashboard:
             # Fallback to basic dashboard on any error
             print(f"Cache analysis failed, using basic dashboard: {e}")
             return await self._generate_basic_dashboard(context_path)
+        finally:
+            self._session_blob = None
+
+    def close(self) -> None:
+        """Shut down the analysis worker pool, if one was started."""
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+
+    def _should_use_process_pool(self, sessions: List[Any]) -> bool:
+        return self.use_process_pool and len(sessions) >= self.PROCESS_POOL_MIN_SESSIONS
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                workers = self._max_workers or min(
+                    len(_POOLED_ANALYSES), os.cpu_count() or 1
+                )
+                self._process_pool = ProcessPoolExecutor(max_workers=max(1, workers))
+            return self._process_pool
 
-    async def _discover_cache_locations(self) -> List[Path]:
-        """Discover Claude Code cache locations."""
+    @staticmethod
+    def _serialize_sessions(sessions: List[Any]) -> Tuple[List[Any], Optional[bytes]]:
+        try:
+            return sessions, pickle.dumps(sessions, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable sessions simply stay on the thread path
+            return sessions, None
+
+    async def _run_analysis(self, kind: str, func, sessions: List[Any]) -> Any:
+        """Run one session analyzer in the worker pool, or in a thread."""
+        blob = None
+        if self._should_use_process_pool(sessions):
+            if self._session_blob is None or self._session_blob[0] is not sessions:
+                self._session_blob = await asyncio.to_thread(
+                    self._serialize_sessions, sessions
+                )
+            blob = self._session_blob[1]
+
+        if blob is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    self._get_process_pool(), _run_pooled_analysis, kind, blob
+                )
+            except BrokenProcessPool:
+                self.close()
+
+        return await asyncio.to_thread(func, sessions)
+
+    async def discover_cache_inputs(self) -> List[CacheLocation]:
+        """Discover existing Claude Code cache locations with file metadata."""
         try:
             locations = await asyncio.to_thread(
                 self.cache_discovery.discover_cache_locations
             )
-            return [loc.path for loc in locations if loc.path.exists()]
+            return [loc for loc in locations if loc.path.exists()]
         except Exception:
             return []
 
+    @staticmethod
+    def input_fingerprint(cache_locations: List[CacheLocation]) -> Tuple:
+        """
+        Cheap fingerprint of the session cache files the dashboard reads.
+
+        Built from discovery metadata (file count, total size and last
+        modification per location) without parsing any session, so callers
+        can skip ``generate_dashboard`` when it would see the same input.
+        """
+        return tuple(
+            sorted(
+                (
+                    str(loc.path),
+                    len(loc.session_files),
+                    loc.total_size_bytes,
+                    loc.last_modified.isoformat(),
+                )
+                for loc in cache_locations
+            )
+        )
+
+    async def _discover_cache_locations(self) -> List[Path]:
+        """Discover Claude Code cache locations."""
+        return [loc.path for loc in await self.discover_cache_inputs()]
+
     async def _parse_recent_sessions(
         self, cache_paths: List[Path], max_sessions: int
     ) -> List[Any]:
@@ -318,22 +479,22 @@ class CacheEnhancedDashboard:
 
     async def _analyze_usage_patterns(self, sessions: List[Any]) -> UsagePatternSummary:
         """Analyze usage patterns from sessions."""
-        return await asyncio.to_thread(
-            self.usage_analyzer.analyze_usage_patterns, sessions
+        return await self._run_analysis(
+            "usage", self.usage_analyzer.analyze_usage_patterns, sessions
         )
 
     async def _analyze_token_efficiency(
         self, sessions: List[Any]
     ) -> TokenAnalysisSummary:
         """Analyze token efficiency from sessions."""
-        return await asyncio.to_thread(
-            self.token_analyzer.analyze_token_efficiency, sessions
+        return await self._run_analysis(
+            "token", self.token_analyzer.analyze_token_efficiency, sessions
         )
 
     async def _analyze_temporal_patterns(self, sessions: List[Any]) -> TemporalInsights:
         """Analyze temporal patterns from sessions."""
-        return await asyncio.to_thread(
-            self.temporal_analyzer.analyze_temporal_patterns, sessions
+        return await self._run_analysis(
+            "temporal", self.temporal_analyzer.analyze_temporal_patterns, sessions
         )
 
     async def _analyze_enhanced_context(
@@ -348,8 +509,10 @@ class CacheEnhancedDashboard:
         self, sessions: List[Any]
     ) -> CorrelationInsights:
         """Analyze cross-session correlations."""
-        return await asyncio.to_thread(
-            self.correlation_analyzer.analyze_cross_session_patterns, sessions
+        return await self._run_analysis(
+            "correlation",
+            self.correlation_analyzer.analyze_cross_session_patterns,
+            sessions,
         )
 
     async def _generate_enhanced_health_analysis(
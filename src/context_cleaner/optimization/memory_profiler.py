@@ -22,6 +22,8 @@ from collections import defaultdict, deque
 import threading
 import asyncio
 
+from ..monitoring.metrics_registry import OPERATION_SECONDS
+
 logger = logging.getLogger(__name__)
 
 
@@ -344,6 +346,7 @@ class MemoryProfiler:
 
             memory_delta = end_snapshot["rss_mb"] - start_snapshot["rss_mb"]
             duration = end_time - start_time
+            OPERATION_SECONDS.observe(duration, operation=operation_name)
 
             logger.info(
                 f"Operation '{operation_name}' memory usage: "
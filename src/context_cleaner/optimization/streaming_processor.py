@@ -34,9 +34,16 @@ import psutil
 
 from .memory_profiler import memory_profiler, memory_profile
 from .efficient_structures import CompactTokenStorage, object_manager
+from ..monitoring.metrics_registry import OPERATION_SECONDS, get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+STREAM_ITEMS = _metrics.counter(
+    "context_cleaner_stream_items_total",
+    "Items processed by the token stream processor",
+)
+
 T = TypeVar("T")
 R = TypeVar("R")
 
@@ -179,6 +186,7 @@ class TokenStreamProcessor:
             # Update statistics
             self.stats.total_items += len(chunk)
             self.stats.chunks_processed += 1
+            STREAM_ITEMS.inc(len(chunk))
 
             # Memory tracking
             current_memory = self._process.memory_info().rss / 1024 / 1024
@@ -203,6 +211,7 @@ class TokenStreamProcessor:
                 )
 
             processing_time = time.time() - start_time
+            OPERATION_SECONDS.observe(processing_time, operation="stream_chunk")
 
             # Log significant memory changes
             memory_delta = current_memory - start_memory
@@ -0,0 +1,424 @@
+"""
+Async Docker Engine API client for Context Cleaner service management.
+
+Talks HTTP/1.1 to the local Docker daemon over its unix socket instead of
+forking the ``docker`` CLI for every ``ps``/``inspect``/``logs``/``exec`` call.
+Connections are kept alive and pooled per event loop, so repeated health
+checks reuse an open socket rather than paying process start-up each time.
+
+Only the read-mostly operations used by the orchestrator and the ClickHouse
+client are implemented; lifecycle commands that rely on ``docker compose``
+still go through the CLI.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote, urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATHS = (
+    "/var/run/docker.sock",
+    "~/.docker/run/docker.sock",  # Docker Desktop (macOS)
+)
+
+# Frame header used by the Engine API for non-TTY attach/logs/exec streams:
+# 1 byte stream type, 3 bytes padding, 4 bytes big-endian payload length.
+_STREAM_HEADER = struct.Struct(">BxxxL")
+_STDOUT, _STDERR = 1, 2
+
+
+class DockerEngineError(Exception):
+    """Raised when the Docker Engine API is unreachable or returns an error."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class DockerExecResult:
+    """Result of running a command inside a container via the Engine API."""
+
+    exit_code: int
+    stdout: str = ""
+    stderr: str = ""
+
+    @property
+    def success(self) -> bool:
+        """Whether the command exited with status 0."""
+        return self.exit_code == 0
+
+
+@dataclass
+class _HTTPResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    reusable: bool = True
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+
+@dataclass
+class _LoopPool:
+    """Idle keep-alive connections and a concurrency limit for one event loop."""
+
+    semaphore: asyncio.Semaphore
+    idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = field(
+        default_factory=list
+    )
+
+
+def demultiplex_stream(data: bytes) -> Tuple[str, str]:
+    """Split a multiplexed Engine API stream into ``(stdout, stderr)`` text.
+
+    Containers started with a TTY send a raw stream with no frame headers; in
+    that case everything is returned as stdout.
+    """
+    stdout: List[bytes] = []
+    stderr: List[bytes] = []
+    offset = 0
+    size = len(data)
+
+    while offset + _STREAM_HEADER.size <= size:
+        stream_type, length = _STREAM_HEADER.unpack_from(data, offset)
+        end = offset + _STREAM_HEADER.size + length
+        if stream_type not in (0, _STDOUT, _STDERR) or end > size:
+            # Not a framed stream - treat the whole payload as raw output
+            return data.decode("utf-8", errors="ignore"), ""
+        payload = data[offset + _STREAM_HEADER.size : end]
+        (stderr if stream_type == _STDERR else stdout).append(payload)
+        offset = end
+
+    if offset != size:
+        return data.decode("utf-8", errors="ignore"), ""
+
+    return (
+        b"".join(stdout).decode("utf-8", errors="ignore"),
+        b"".join(stderr).decode("utf-8", errors="ignore"),
+    )
+
+
+def _container_name(container: Dict[str, Any]) -> str:
+    names = container.get("Names") or []
+    return names[0].lstrip("/") if names else container.get("Id", "")[:12]
+
+
+class DockerEngineClient:
+    """Pooled async client for the Docker Engine HTTP API on a unix socket."""
+
+    def __init__(
+        self,
+        socket_path: str,
+        timeout: float = 10.0,
+        max_connections: int = 4,
+    ):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.max_connections = max(1, max_connections)
+        # asyncio streams are bound to the loop that created them, and the
+        # orchestrator runs checks from more than one loop.
+        self._pools: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]"
+        ) = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def resolve_socket_path() -> Optional[str]:
+        """Locate the Docker daemon socket from ``DOCKER_HOST`` or default paths."""
+        docker_host = os.environ.get("DOCKER_HOST", "")
+        if docker_host:
+            if not docker_host.startswith("unix://"):
+                # TCP/SSH daemons are left to the CLI
+                return None
+            candidates: Iterable[str] = (docker_host[len("unix://") :],)
+        else:
+            candidates = DEFAULT_SOCKET_PATHS
+
+        for candidate in candidates:
+            path = os.path.expanduser(candidate)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @classmethod
+    def from_environment(cls, **kwargs) -> Optional["DockerEngineClient"]:
+        """Create a client if a local Docker socket exists, otherwise None."""
+        socket_path = cls.resolve_socket_path()
+        if socket_path is None:
+            return None
+        return cls(socket_path, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def ping(self) -> bool:
+        """Return True if the daemon answers ``/_ping``."""
+        try:
+            response = await self._request("GET", "/_ping")
+        except DockerEngineError:
+            return False
+        return response.status == 200
+
+    async def list_containers(
+        self,
+        filters: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        include_stopped: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """List containers, equivalent to ``docker ps [--all] --filter ...``."""
+        query: Dict[str, str] = {"all": "1" if include_stopped else "0"}
+        if filters:
+            query["filters"] = json.dumps(
+                {
+                    key: [value] if isinstance(value, str) else list(value)
+                    for key, value in filters.items()
+                }
+            )
+        response = await self._request("GET", "/containers/json", query=query)
+        self._raise_for_status(response, "list containers")
+        return response.json() or []
+
+    async def container_names(
+        self,
+        filters: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        include_stopped: bool = False,
+    ) -> List[str]:
+        """Return the names of containers matching ``filters``."""
+        containers = await self.list_containers(
+            filters=filters, include_stopped=include_stopped
+        )
+        return [_container_name(container) for container in containers]
+
+    async def inspect_container(self, name: str) -> Optional[Dict[str, Any]]:
+        """Inspect a container, returning None if it does not exist."""
+        response = await self._request("GET", f"/containers/{quote(name)}/json")
+        if response.status == 404:
+            return None
+        self._raise_for_status(response, f"inspect {name}")
+        return response.json()
+
+    async def inspect_containers(
+        self, names: Iterable[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Inspect several containers concurrently over the pooled connections."""
+        names = list(dict.fromkeys(names))
+        results = await asyncio.gather(
+            *(self.inspect_container(name) for name in names)
+        )
+        return dict(zip(names, results))
+
+    async def container_logs(self, name: str, tail: int = 50) -> str:
+        """Return the last ``tail`` lines of combined stdout/stderr output."""
+        response = await self._request(
+            "GET",
+            f"/containers/{quote(name)}/logs",
+            query={"stdout": "1", "stderr": "1", "tail": str(tail)},
+        )
+        self._raise_for_status(response, f"logs {name}")
+        stdout, stderr = demultiplex_stream(response.body)
+        return stdout + stderr
+
+    async def exec_run(
+        self,
+        container: str,
+        cmd: Sequence[str],
+        timeout: Optional[float] = None,
+    ) -> DockerExecResult:
+        """Run ``cmd`` inside ``container`` and collect its output and exit code."""
+        create = await self._request(
+            "POST",
+            f"/containers/{quote(container)}/exec",
+            body={"AttachStdout": True, "AttachStderr": True, "Cmd": list(cmd)},
+        )
+        self._raise_for_status(create, f"exec create in {container}")
+        exec_id = create.json()["Id"]
+
+        start = await self._request(
+            "POST",
+            f"/exec/{exec_id}/start",
+            body={"Detach": False, "Tty": False},
+            timeout=timeout,
+        )
+        self._raise_for_status(start, f"exec start in {container}")
+        stdout, stderr = demultiplex_stream(start.body)
+
+        inspect = await self._request("GET", f"/exec/{exec_id}/json")
+        self._raise_for_status(inspect, f"exec inspect in {container}")
+        exit_code = (inspect.json() or {}).get("ExitCode")
+
+        return DockerExecResult(
+            exit_code=exit_code if isinstance(exit_code, int) else -1,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    async def close(self) -> None:
+        """Close idle pooled connections belonging to the running loop."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.pop(loop, None)
+        if pool is None:
+            return
+        for _, writer in pool.idle:
+            writer.close()
+        pool.idle.clear()
+
+    # ------------------------------------------------------------------
+    # HTTP transport
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _raise_for_status(response: _HTTPResponse, operation: str) -> None:
+        if response.status >= 400:
+            message = response.body.decode("utf-8", errors="ignore").strip()
+            try:
+                message = json.loads(message).get("message", message)
+            except (ValueError, AttributeError):
+                pass
+            raise DockerEngineError(
+                f"Docker {operation} failed (HTTP {response.status}): {message}",
+                status=response.status,
+            )
+
+    def _get_pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = _LoopPool(semaphore=asyncio.Semaphore(self.max_connections))
+            self._pools[loop] = pool
+        return pool
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        query: Optional[Dict[str, str]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> _HTTPResponse:
+        target = f"{path}?{urlencode(query)}" if query else path
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        head = (
+            f"{method} {target} HTTP/1.1\r\n"
+            "Host: docker\r\n"
+            "User-Agent: context-cleaner\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n"
+        ).encode("ascii")
+
+        pool = self._get_pool()
+        timeout = timeout if timeout is not None else self.timeout
+
+        async with pool.semaphore:
+            # A pooled connection may have been closed by the daemon while
+            # idle; retry once on a fresh socket in that case.
+            for attempt in range(2):
+                reused = bool(pool.idle)
+                reader, writer = await self._connect(pool, timeout)
+                pooled = False
+                try:
+                    writer.write(head + payload)
+                    response = await asyncio.wait_for(
+                        self._read_response(reader, method), timeout
+                    )
+                    if response.reusable and len(pool.idle) < self.max_connections:
+                        pool.idle.append((reader, writer))
+                        pooled = True
+                    return response
+                except asyncio.TimeoutError as exc:
+                    raise DockerEngineError(
+                        f"Docker API {method} {path} timed out after {timeout}s"
+                    ) from exc
+                except (ConnectionError, asyncio.IncompleteReadError, OSError) as exc:
+                    if reused and attempt == 0:
+                        continue
+                    raise DockerEngineError(
+                        f"Docker API {method} {path} failed: {exc}"
+                    ) from exc
+                except ValueError as exc:
+                    raise DockerEngineError(
+                        f"Docker API {method} {path} returned a malformed response: {exc}"
+                    ) from exc
+                finally:
+                    # Every connection not handed back to the pool is closed,
+                    # whatever went wrong while reading the response
+                    if not pooled:
+                        writer.close()
+
+        raise DockerEngineError(
+            f"Docker API {method} {path} failed"
+        )  # pragma: no cover
+
+    async def _connect(
+        self, pool: _LoopPool, timeout: float
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        while pool.idle:
+            reader, writer = pool.idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path, limit=2**20),
+                timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise DockerEngineError(
+                f"Cannot connect to Docker socket {self.socket_path}: {exc}"
+            ) from exc
+
+    @staticmethod
+    async def _read_response(
+        reader: asyncio.StreamReader, method: str
+    ) -> _HTTPResponse:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed before response")
+        parts = status_line.decode("latin-1").split(" ", 2)
+        if len(parts) < 2:
+            raise ValueError(f"invalid status line {status_line!r}")
+        status = int(parts[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        reusable = headers.get("connection", "").lower() != "close"
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks: List[bytes] = []
+            while True:
+                size_line = await reader.readline()
+                chunk_size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if chunk_size == 0:
+                    # Consume optional trailers up to the terminating blank line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(chunk_size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            # Raw streams (e.g. exec start) are delimited by connection close
+            body = await reader.read()
+            reusable = False
+
+        return _HTTPResponse(
+            status=status, headers=headers, body=body, reusable=reusable
+        )
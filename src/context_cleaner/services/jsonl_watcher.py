@@ -3,7 +3,8 @@
 JSONL File Watcher Service
 
 Monitors ~/.claude/projects for new JSONL files and automatically processes them
-into the ClickHouse database for real-time dashboard updates.
+into the ClickHouse database (or the local SQLite store while ClickHouse is
+unreachable) for real-time dashboard updates.
 """
 
 import asyncio
@@ -20,7 +21,7 @@ from watchdog.events import FileSystemEventHandler
 from context_cleaner.telemetry.jsonl_enhancement.jsonl_processor_service import (
     JsonlProcessorService,
 )
-from context_cleaner.telemetry.clients.clickhouse_client import ClickHouseClient
+from context_cleaner.telemetry.clients.sqlite_client import select_telemetry_client
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +123,8 @@ class JSONLWatcherService:
         self.claude_projects_dir = claude_projects_dir or os.path.expanduser(
             "~/.claude/projects"
         )
-        self.clickhouse_client = ClickHouseClient()
+        # Writes go to the local SQLite store while ClickHouse is unreachable
+        self.clickhouse_client = select_telemetry_client()
         self.processor = JsonlProcessorService(self.clickhouse_client)
         self.observer = Observer()
         self.handler = JSONLFileHandler(self.processor)
@@ -700,11 +700,142 @@ class ProcessRegistryDatabase:
             return 0
 
 
+@dataclass
+class SnapshotProcess:
+    """Point-in-time view of a single process captured by a system snapshot."""
+
+    pid: int
+    name: str
+    command_line: str
+    create_time: Optional[float]
+    cwd: str = ""
+    ppid: Optional[int] = None
+
+    @property
+    def start_time(self) -> datetime:
+        """Process start time, falling back to now when psutil withheld it."""
+        if self.create_time is None:
+            return datetime.now()
+        return datetime.fromtimestamp(self.create_time)
+
+
+@dataclass
+class ListeningSocket:
+    """Local address of a socket owned by a process at snapshot time."""
+
+    pid: int
+    ip: str
+    port: int
+
+
+@dataclass
+class SystemProcessSnapshot:
+    """Consolidated process table, socket list and parent/child tree.
+
+    Built with a single ``psutil.process_iter`` pass and a single
+    ``psutil.net_connections`` call so that every discovery strategy can share
+    the same view of the system instead of re-scanning it.
+    """
+
+    processes: Dict[int, SnapshotProcess]
+    sockets: List[ListeningSocket]
+    children: Dict[int, List[int]]
+    captured_at: float
+
+    @classmethod
+    def capture(cls) -> "SystemProcessSnapshot":
+        """Capture the current process table and socket list."""
+        processes: Dict[int, SnapshotProcess] = {}
+        children: Dict[int, List[int]] = {}
+
+        try:
+            for process in psutil.process_iter(
+                ["pid", "name", "cmdline", "create_time", "cwd", "ppid"]
+            ):
+                try:
+                    info = process.info
+                    entry = SnapshotProcess(
+                        pid=info["pid"],
+                        name=info.get("name") or "",
+                        command_line=" ".join(info.get("cmdline") or []),
+                        create_time=info.get("create_time"),
+                        cwd=info.get("cwd") or "",
+                        ppid=info.get("ppid"),
+                    )
+                except (
+                    psutil.NoSuchProcess,
+                    psutil.AccessDenied,
+                    psutil.ZombieProcess,
+                ):
+                    continue
+
+                processes[entry.pid] = entry
+                if entry.ppid:
+                    children.setdefault(entry.ppid, []).append(entry.pid)
+        except Exception as e:
+            logger.error(f"Error capturing process snapshot: {e}")
+
+        sockets: List[ListeningSocket] = []
+        try:
+            for conn in psutil.net_connections():
+                pid = getattr(conn, "pid", None)
+                if not pid or not conn.laddr:
+                    continue
+                sockets.append(
+                    ListeningSocket(pid=pid, ip=conn.laddr.ip, port=conn.laddr.port)
+                )
+        except Exception as e:
+            logger.debug(f"Error getting network connections: {e}")
+
+        return cls(
+            processes=processes,
+            sockets=sockets,
+            children=children,
+            captured_at=time.monotonic(),
+        )
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was captured."""
+        return time.monotonic() - self.captured_at
+
+    def is_alive(self, pid: int) -> bool:
+        """Return True if the PID was present when the snapshot was taken."""
+        return pid in self.processes
+
+    def descendants(self, pid: int) -> List[SnapshotProcess]:
+        """Return all descendants of ``pid`` (breadth-first) from the tree."""
+        result: List[SnapshotProcess] = []
+        seen = {pid}
+        queue = list(self.children.get(pid, ()))
+        while queue:
+            child_pid = queue.pop(0)
+            if child_pid in seen:
+                continue
+            seen.add(child_pid)
+            child = self.processes.get(child_pid)
+            if child is None:
+                continue
+            result.append(child)
+            queue.extend(self.children.get(child_pid, ()))
+        return result
+
+
 class ProcessDiscoveryEngine:
     """Engine for discovering existing Context Cleaner processes."""
 
-    def __init__(self):
-        """Initialize the process discovery engine."""
+    def __init__(self, snapshot_ttl: float = 0.0):
+        """Initialize the process discovery engine.
+
+        Args:
+            snapshot_ttl: Seconds a captured system snapshot may be reused by
+                later discovery calls. ``0`` (the default) always captures a
+                fresh snapshot, which is what stop/cleanup paths need.
+        """
+        self.snapshot_ttl = snapshot_ttl
+        self._snapshot: Optional[SystemProcessSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+
         # Enhanced patterns to catch ALL Context Cleaner process variations
         self.context_cleaner_patterns = [
             # Original patterns
@@ -773,21 +904,61 @@ class ProcessDiscoveryEngine:
             4318: "otel_collector",
         }
 
-    def discover_all_processes(self) -> List[ProcessEntry]:
-        """Discover all Context Cleaner processes using multiple methods."""
+        # Shell discovery uses the patterns as regular expressions; compile once
+        self._shell_pattern_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.context_cleaner_patterns),
+            re.IGNORECASE,
+        )
+        self._shell_process_names = {"bash", "sh", "zsh", "python", "python3"}
+
+    def get_system_snapshot(
+        self, max_age: Optional[float] = None
+    ) -> SystemProcessSnapshot:
+        """Return a system snapshot, reusing the cached one if fresh enough.
+
+        Args:
+            max_age: Maximum acceptable age in seconds of a cached snapshot.
+                Defaults to the engine's ``snapshot_ttl``.
+        """
+        if max_age is None:
+            max_age = self.snapshot_ttl
+
+        with self._snapshot_lock:
+            cached = self._snapshot
+            if cached is not None and max_age > 0 and cached.age <= max_age:
+                return cached
+
+            snapshot = SystemProcessSnapshot.capture()
+            self._snapshot = snapshot
+            return snapshot
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the cached snapshot so the next discovery rescans the system."""
+        with self._snapshot_lock:
+            self._snapshot = None
+
+    def discover_all_processes(
+        self, max_snapshot_age: Optional[float] = None
+    ) -> List[ProcessEntry]:
+        """Discover all Context Cleaner processes using multiple methods.
+
+        All strategies share one system snapshot. Pass ``max_snapshot_age`` to
+        accept a recently cached snapshot (useful for repeated status polling).
+        """
+        snapshot = self.get_system_snapshot(max_age=max_snapshot_age)
         discovered = []
 
         # Method 1: Process name and command line discovery
-        discovered.extend(self._discover_by_command_line())
+        discovered.extend(self._discover_by_command_line(snapshot))
 
         # Method 2: Port-based discovery
-        discovered.extend(self._discover_by_ports())
+        discovered.extend(self._discover_by_ports(snapshot))
 
         # Method 3: Process tree discovery (find children of known processes)
-        discovered.extend(self._discover_by_process_tree())
+        discovered.extend(self._discover_by_process_tree(snapshot))
 
         # Method 4: Enhanced shell command discovery (catches compound commands like sleep && python)
-        discovered.extend(self._discover_by_shell_commands())
+        discovered.extend(self._discover_by_shell_commands(snapshot))
 
         # Deduplicate by PID
         unique_processes = {}
@@ -797,245 +968,177 @@ class ProcessDiscoveryEngine:
 
         return list(unique_processes.values())
 
-    def _discover_by_command_line(self) -> List[ProcessEntry]:
+    def _matches_context_cleaner(self, cmdline: str) -> bool:
+        """Check a command line against the substring patterns."""
+        cmdline_lower = cmdline.lower()
+        return any(pattern in cmdline_lower for pattern in self.context_cleaner_patterns)
+
+    def _discover_by_command_line(
+        self, snapshot: Optional[SystemProcessSnapshot] = None
+    ) -> List[ProcessEntry]:
         """Discover processes by analyzing command lines."""
         discovered = []
+        snapshot = snapshot or self.get_system_snapshot()
 
         try:
-            for process in psutil.process_iter(
-                ["pid", "name", "cmdline", "create_time", "cwd"]
-            ):
-                try:
-                    cmdline = " ".join(process.info["cmdline"] or [])
+            for process in snapshot.processes.values():
+                cmdline = process.command_line
 
-                    # Check if this looks like a Context Cleaner process
-                    if any(
-                        pattern in cmdline.lower()
-                        for pattern in self.context_cleaner_patterns
-                    ):
-                        service_type = self._determine_service_type(cmdline)
-
-                        # Extract port if present
-                        port = self._extract_port_from_cmdline(cmdline)
-
-                        entry = ProcessEntry(
-                            pid=process.info["pid"],
-                            command_line=cmdline,
-                            service_type=service_type,
-                            start_time=datetime.fromtimestamp(
-                                process.info["create_time"]
-                            ),
-                            registration_time=datetime.now(),
-                            port=port,
-                            working_directory=process.info.get("cwd", ""),
-                            registration_source="discovery",
-                            host_identifier=platform.node(),
-                            status="running",
-                        )
-
-                        discovered.append(entry)
-
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ):
+                # Check if this looks like a Context Cleaner process
+                if not self._matches_context_cleaner(cmdline):
                     continue
 
+                service_type = self._determine_service_type(cmdline)
+
+                # Extract port if present
+                port = self._extract_port_from_cmdline(cmdline)
+
+                entry = ProcessEntry(
+                    pid=process.pid,
+                    command_line=cmdline,
+                    service_type=service_type,
+                    start_time=process.start_time,
+                    registration_time=datetime.now(),
+                    port=port,
+                    working_directory=process.cwd,
+                    registration_source="discovery",
+                    host_identifier=platform.node(),
+                    status="running",
+                )
+
+                discovered.append(entry)
+
         except Exception as e:
             logger.error(f"Error in command line discovery: {e}")
 
         return discovered
 
-    def _discover_by_ports(self) -> List[ProcessEntry]:
+    def _discover_by_ports(
+        self, snapshot: Optional[SystemProcessSnapshot] = None
+    ) -> List[ProcessEntry]:
         """Discover processes by scanning known ports."""
         discovered = []
+        snapshot = snapshot or self.get_system_snapshot()
 
         try:
-            # Get network connections with error handling for stale process access
-            try:
-                connections = psutil.net_connections()
-            except Exception as e:
-                logger.debug(f"Error getting network connections: {e}")
-                return discovered
-
-            for conn in connections:
-                try:
-                    # Skip connections without local address or PID
-                    if not conn.laddr or not hasattr(conn, "pid") or not conn.pid:
-                        continue
-
-                    if conn.laddr.port in self.known_ports:
-                        if conn.pid:
-                            process = psutil.Process(conn.pid)
-                            cmdline = " ".join(process.cmdline())
-
-                            # Verify this is actually a Context Cleaner process
-                            if any(
-                                pattern in cmdline.lower()
-                                for pattern in self.context_cleaner_patterns
-                            ):
-                                service_type = self.known_ports[conn.laddr.port]
-
-                                entry = ProcessEntry(
-                                    pid=conn.pid,
-                                    command_line=cmdline,
-                                    service_type=service_type,
-                                    start_time=datetime.fromtimestamp(
-                                        process.create_time()
-                                    ),
-                                    registration_time=datetime.now(),
-                                    port=conn.laddr.port,
-                                    host=conn.laddr.ip,
-                                    working_directory=(
-                                        process.cwd() if hasattr(process, "cwd") else ""
-                                    ),
-                                    registration_source="port_discovery",
-                                    host_identifier=platform.node(),
-                                    status="running",
-                                )
-
-                                discovered.append(entry)
+            for sock in snapshot.sockets:
+                if sock.port not in self.known_ports:
+                    continue
 
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                    AttributeError,
-                ) as e:
-                    # Expected errors when process no longer exists or becomes inaccessible
-                    logger.debug(
-                        f"Process access error during port discovery (pid={getattr(conn, 'pid', 'unknown')}): {e}"
-                    )
+                # Process may have exited between process_iter and net_connections
+                process = snapshot.processes.get(sock.pid)
+                if process is None:
                     continue
-                except Exception as e:
-                    # Log unexpected errors but don't let them stop the entire discovery process
-                    logger.debug(
-                        f"Connection error during port discovery (pid={getattr(conn, 'pid', 'unknown')}): {e}"
-                    )
+
+                # Verify this is actually a Context Cleaner process
+                cmdline = process.command_line
+                if not self._matches_context_cleaner(cmdline):
                     continue
 
+                entry = ProcessEntry(
+                    pid=sock.pid,
+                    command_line=cmdline,
+                    service_type=self.known_ports[sock.port],
+                    start_time=process.start_time,
+                    registration_time=datetime.now(),
+                    port=sock.port,
+                    host=sock.ip,
+                    working_directory=process.cwd,
+                    registration_source="port_discovery",
+                    host_identifier=platform.node(),
+                    status="running",
+                )
+
+                discovered.append(entry)
+
         except Exception as e:
             logger.error(f"Error in port discovery (general): {e}")
             logger.debug(f"Port discovery error details", exc_info=True)
 
         return discovered
 
-    def _discover_by_process_tree(self) -> List[ProcessEntry]:
+    def _discover_by_process_tree(
+        self, snapshot: Optional[SystemProcessSnapshot] = None
+    ) -> List[ProcessEntry]:
         """Discover processes by examining process trees."""
         discovered = []
+        snapshot = snapshot or self.get_system_snapshot()
 
         try:
             # Find potential parent processes
-            parents = []
-            for process in psutil.process_iter(["pid", "name", "cmdline"]):
-                try:
-                    cmdline = " ".join(process.info["cmdline"] or [])
-                    if any(
-                        pattern in cmdline.lower()
-                        for pattern in self.context_cleaner_patterns
-                    ):
-                        parents.append(process)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            parents = [
+                process
+                for process in snapshot.processes.values()
+                if self._matches_context_cleaner(process.command_line)
+            ]
 
             # Find children of Context Cleaner processes
             for parent in parents:
-                try:
-                    for child in parent.children(recursive=True):
-                        try:
-                            cmdline = " ".join(child.cmdline())
-                            service_type = self._determine_service_type(cmdline)
-
-                            entry = ProcessEntry(
-                                pid=child.pid,
-                                command_line=cmdline,
-                                service_type=service_type,
-                                start_time=datetime.fromtimestamp(child.create_time()),
-                                registration_time=datetime.now(),
-                                parent_pid=parent.pid,
-                                working_directory=(
-                                    child.cwd() if hasattr(child, "cwd") else ""
-                                ),
-                                registration_source="tree_discovery",
-                                host_identifier=platform.node(),
-                                status="running",
-                            )
-
-                            discovered.append(entry)
+                for child in snapshot.descendants(parent.pid):
+                    cmdline = child.command_line
+                    service_type = self._determine_service_type(cmdline)
 
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue
+                    entry = ProcessEntry(
+                        pid=child.pid,
+                        command_line=cmdline,
+                        service_type=service_type,
+                        start_time=child.start_time,
+                        registration_time=datetime.now(),
+                        parent_pid=parent.pid,
+                        working_directory=child.cwd,
+                        registration_source="tree_discovery",
+                        host_identifier=platform.node(),
+                        status="running",
+                    )
 
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+                    discovered.append(entry)
 
         except Exception as e:
             logger.error(f"Error in process tree discovery: {e}")
 
         return discovered
 
-    def _discover_by_shell_commands(self) -> List[ProcessEntry]:
+    def _discover_by_shell_commands(
+        self, snapshot: Optional[SystemProcessSnapshot] = None
+    ) -> List[ProcessEntry]:
         """Enhanced discovery for shell compound commands and direct invocations."""
         discovered = []
+        snapshot = snapshot or self.get_system_snapshot()
 
         try:
             # Look for shell processes that contain Context Cleaner commands
-            for process in psutil.process_iter(
-                ["pid", "name", "cmdline", "create_time", "cwd"]
-            ):
-                try:
-                    # Check if this is a shell process
-                    if process.info["name"] not in [
-                        "bash",
-                        "sh",
-                        "zsh",
-                        "python",
-                        "python3",
-                    ]:
-                        continue
-
-                    cmdline = " ".join(process.info["cmdline"] or [])
-                    cmdline_lower = cmdline.lower()
-
-                    # Enhanced pattern matching for shell commands
-                    is_context_cleaner = False
-                    for pattern in self.context_cleaner_patterns:
-                        if re.search(pattern, cmdline_lower, re.IGNORECASE):
-                            is_context_cleaner = True
-                            break
-
-                    if not is_context_cleaner:
-                        continue
-
-                    # Determine service type with enhanced pattern matching
-                    service_type = self._determine_service_type_enhanced(cmdline)
-
-                    # Extract port with enhanced methods
-                    port = self._extract_port_from_cmdline(cmdline)
-
-                    entry = ProcessEntry(
-                        pid=process.info["pid"],
-                        command_line=cmdline,
-                        service_type=service_type,
-                        start_time=datetime.fromtimestamp(process.info["create_time"]),
-                        registration_time=datetime.now(),
-                        port=port,
-                        working_directory=process.info.get("cwd", ""),
-                        registration_source="shell_discovery",
-                        host_identifier=platform.node(),
-                        status="running",
-                    )
+            for process in snapshot.processes.values():
+                # Check if this is a shell process
+                if process.name not in self._shell_process_names:
+                    continue
 
-                    discovered.append(entry)
+                cmdline = process.command_line
 
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ):
+                # Enhanced pattern matching for shell commands
+                if not self._shell_pattern_regex.search(cmdline):
                     continue
 
+                # Determine service type with enhanced pattern matching
+                service_type = self._determine_service_type_enhanced(cmdline)
+
+                # Extract port with enhanced methods
+                port = self._extract_port_from_cmdline(cmdline)
+
+                entry = ProcessEntry(
+                    pid=process.pid,
+                    command_line=cmdline,
+                    service_type=service_type,
+                    start_time=process.start_time,
+                    registration_time=datetime.now(),
+                    port=port,
+                    working_directory=process.cwd,
+                    registration_source="shell_discovery",
+                    host_identifier=platform.node(),
+                    status="running",
+                )
+
+                discovered.append(entry)
+
         except Exception as e:
             logger.error(f"Error in shell command discovery: {e}")
 
@@ -60,6 +60,7 @@ from .port_conflict_manager import (
 from context_cleaner.telemetry.collector import get_collector
 from context_cleaner.telemetry.context_rot.config import ApplicationConfig
 from .telemetry_resources import stage_telemetry_resources
+from .docker_engine import DockerEngineClient, DockerEngineError
 from .process_registry import (
     ProcessEntry,
     ProcessRegistryDatabase,
@@ -192,6 +193,10 @@ class ServiceOrchestrator:
         # Docker management
         self.docker_daemon_status = DockerDaemonStatus.UNKNOWN
         self.container_states: Dict[str, ContainerState] = {}
+        # Direct Engine API access for read-only queries; None falls back to the CLI
+        self.docker_engine: Optional[DockerEngineClient] = (
+            DockerEngineClient.from_environment()
+        )
 
         # Process Registry Integration (Phase 1)
         self.process_registry = get_process_registry()
@@ -902,8 +907,9 @@ class ServiceOrchestrator:
 
         # 2. Discover containers dynamically and attach to running ones or start as needed
         container_names = await self._discover_project_containers()
+        container_states = await self._get_container_states(container_names)
         for container_name in container_names:
-            container_state = await self._get_container_state(container_name)
+            container_state = container_states[container_name]
             service_name = "clickhouse" if "clickhouse" in container_name else "otel"
 
             if self.verbose:
@@ -933,6 +939,9 @@ class ServiceOrchestrator:
 
     async def _check_docker_daemon_status(self) -> DockerDaemonStatus:
         """Check if Docker daemon is running."""
+        if self.docker_engine is not None and await self.docker_engine.ping():
+            return DockerDaemonStatus.RUNNING
+
         try:
             # Try to run a simple docker command
             result = await asyncio.create_subprocess_exec(
@@ -1077,8 +1086,58 @@ class ServiceOrchestrator:
                 print(f"   ❌ Error starting Docker daemon: {e}")
             return False
 
+    @staticmethod
+    def _container_state_from_status(status: str) -> ContainerState:
+        status_mapping = {
+            "running": ContainerState.RUNNING,
+            "stopped": ContainerState.STOPPED,
+            "paused": ContainerState.PAUSED,
+            "restarting": ContainerState.RESTARTING,
+            "removing": ContainerState.REMOVING,
+            "exited": ContainerState.EXITED,
+            "dead": ContainerState.DEAD,
+        }
+        return status_mapping.get(status.strip().lower(), ContainerState.NOT_FOUND)
+
+    async def _get_container_states(
+        self, container_names: List[str]
+    ) -> Dict[str, ContainerState]:
+        """Get the state of several containers, batched through the Engine API."""
+        if self.docker_engine is not None and container_names:
+            try:
+                inspected = await self.docker_engine.inspect_containers(
+                    container_names
+                )
+                return {
+                    name: (
+                        self._container_state_from_status(
+                            (info.get("State") or {}).get("Status", "")
+                        )
+                        if info
+                        else ContainerState.NOT_FOUND
+                    )
+                    for name, info in inspected.items()
+                }
+            except DockerEngineError as e:
+                self.logger.debug(f"Docker API batch inspect failed: {e}")
+
+        return {
+            name: await self._get_container_state(name) for name in container_names
+        }
+
     async def _get_container_state(self, container_name: str) -> ContainerState:
         """Get the current state of a container with enhanced error handling."""
+        if self.docker_engine is not None:
+            try:
+                info = await self.docker_engine.inspect_container(container_name)
+                if info is None:
+                    return ContainerState.NOT_FOUND
+                return self._container_state_from_status(
+                    (info.get("State") or {}).get("Status", "")
+                )
+            except DockerEngineError as e:
+                self.logger.debug(f"Docker API inspect failed, using CLI: {e}")
+
         try:
             result = await self._run_docker_command(
                 ["inspect", container_name, "--format", "{{.State.Status}}"], timeout=5
@@ -2179,16 +2238,35 @@ class ServiceOrchestrator:
             "otel/opentelemetry-collector-contrib",
         ]
 
-        for image in known_images:
-            containers = await self._discover_containers_by_image(image)
+        # Strategy 3: Port-based discovery for ClickHouse
+        clickhouse_ports = [8123, 9000]  # Standard ClickHouse ports
+
+        # Strategy 4: Name pattern matching
+        name_patterns = ["*clickhouse*", "*otel*collector*"]
+
+        # Issue the listing queries for strategies 2-4 together; with the
+        # Engine API they share the pooled socket instead of forking the CLI.
+        image_results, port_results, pattern_results = await asyncio.gather(
+            asyncio.gather(
+                *(self._discover_containers_by_image(image) for image in known_images)
+            ),
+            asyncio.gather(
+                *(self._discover_containers_by_port(port) for port in clickhouse_ports)
+            ),
+            asyncio.gather(
+                *(
+                    self._discover_containers_by_name_pattern(pattern)
+                    for pattern in name_patterns
+                )
+            ),
+        )
+
+        for containers in image_results:
             for container in containers:
                 if container not in discovered_containers:
                     discovered_containers.append(container)
 
-        # Strategy 3: Port-based discovery for ClickHouse
-        clickhouse_ports = [8123, 9000]  # Standard ClickHouse ports
-        for port in clickhouse_ports:
-            containers = await self._discover_containers_by_port(port)
+        for containers in port_results:
             for container in containers:
                 if (
                     container not in discovered_containers
@@ -2196,11 +2274,7 @@ class ServiceOrchestrator:
                 ):
                     discovered_containers.append(container)
 
-        # Strategy 4: Name pattern matching
-        name_patterns = ["*clickhouse*", "*otel*collector*"]
-
-        for pattern in name_patterns:
-            containers = await self._discover_containers_by_name_pattern(pattern)
+        for containers in pattern_results:
             for container in containers:
                 if container not in discovered_containers:
                     discovered_containers.append(container)
@@ -2285,8 +2359,24 @@ class ServiceOrchestrator:
 
         return container_names
 
+    async def _list_engine_container_names(
+        self, filters: Dict[str, Any]
+    ) -> Optional[List[str]]:
+        """List container names through the Engine API; None means use the CLI."""
+        if self.docker_engine is None:
+            return None
+        try:
+            return await self.docker_engine.container_names(filters)
+        except DockerEngineError as e:
+            self.logger.debug(f"Docker API container listing failed, using CLI: {e}")
+            return None
+
     async def _discover_containers_by_image(self, image_name: str) -> List[str]:
         """Discover containers running a specific image."""
+        containers = await self._list_engine_container_names({"ancestor": image_name})
+        if containers is not None:
+            return containers
+
         try:
             # Use docker ps to find containers with specific image
             result = await self._run_docker_command(
@@ -2313,6 +2403,10 @@ class ServiceOrchestrator:
 
     async def _discover_containers_by_port(self, port: int) -> List[str]:
         """Discover containers exposing a specific port."""
+        containers = await self._list_engine_container_names({"publish": str(port)})
+        if containers is not None:
+            return containers
+
         try:
             # Use docker ps to find containers exposing specific port
             result = await self._run_docker_command(
@@ -2339,6 +2433,12 @@ class ServiceOrchestrator:
 
     async def _discover_containers_by_name_pattern(self, pattern: str) -> List[str]:
         """Discover containers matching a name pattern."""
+        # The daemon treats name filters as regular expressions
+        name_regex = pattern.strip("*").replace("*", ".*")
+        containers = await self._list_engine_container_names({"name": name_regex})
+        if containers is not None:
+            return containers
+
         try:
             # Use docker ps to find containers matching pattern
             result = await self._run_docker_command(
@@ -2443,6 +2543,43 @@ class ServiceOrchestrator:
         # Should not reach here
         return DockerCommandResult(stderr="Unexpected error in retry loop")
 
+    async def _run_docker_exec(
+        self, container: str, command: List[str], timeout: int = 8
+    ) -> Optional[Any]:
+        """Run a command in a container, preferring the Engine API over ``docker exec``.
+
+        Mirrors ``_run_docker_command``: stdout as a string on success,
+        otherwise a result object exposing ``success`` and ``stderr``.
+        """
+        if self.docker_engine is not None:
+            try:
+                result = await self.docker_engine.exec_run(
+                    container, command, timeout=timeout
+                )
+                if result.success and result.stdout.strip():
+                    return result.stdout.strip()
+                return result
+            except DockerEngineError as e:
+                self.logger.debug(f"Docker API exec failed, using CLI: {e}")
+
+        return await self._run_docker_command(
+            ["exec", container, *command], timeout=timeout
+        )
+
+    async def _fetch_container_logs(
+        self, container: str, tail: int = 50, timeout: int = 8
+    ) -> Optional[Any]:
+        """Fetch recent container logs, preferring the Engine API over ``docker logs``."""
+        if self.docker_engine is not None:
+            try:
+                return await self.docker_engine.container_logs(container, tail=tail)
+            except DockerEngineError as e:
+                self.logger.debug(f"Docker API logs failed, using CLI: {e}")
+
+        return await self._run_docker_command(
+            ["logs", "--tail", str(tail), container], timeout=timeout
+        )
+
     def _calculate_adaptive_timeout(self, args: List[str], base_timeout: int) -> int:
         """Calculate adaptive timeout based on command complexity and system load."""
         command_str = " ".join(args).lower()
@@ -2662,6 +2799,12 @@ class ServiceOrchestrator:
 
     async def _check_clickhouse_container_running(self) -> bool:
         """Check if ClickHouse container is running."""
+        containers = await self._list_engine_container_names(
+            {"name": "clickhouse-otel", "status": "running"}
+        )
+        if containers is not None:
+            return any("clickhouse-otel" in name.lower() for name in containers)
+
         try:
             result = await self._run_docker_command(
                 [
@@ -2750,15 +2893,15 @@ class ServiceOrchestrator:
                     )
 
                 # Use docker exec to run ClickHouse client query
-                cmd = [
-                    "exec",
+                result = await self._run_docker_exec(
                     "clickhouse-otel",
-                    "clickhouse-client",
-                    "--query",
-                    "SHOW TABLES FROM otel FORMAT TabSeparated",
-                ]
-
-                result = await self._run_docker_command(cmd, timeout=10)
+                    [
+                        "clickhouse-client",
+                        "--query",
+                        "SHOW TABLES FROM otel FORMAT TabSeparated",
+                    ],
+                    timeout=10,
+                )
 
                 if isinstance(result, str):
                     raw_lines = result.split("\n")
@@ -2834,15 +2977,15 @@ class ServiceOrchestrator:
         """Test ClickHouse query execution capability."""
         try:
             # Simple query that exercises the database
-            cmd = [
-                "exec",
+            result = await self._run_docker_exec(
                 "clickhouse-otel",
-                "clickhouse-client",
-                "--query",
-                "SELECT count() FROM system.tables WHERE database = 'otel'",
-            ]
-
-            result = await self._run_docker_command(cmd, timeout=8)
+                [
+                    "clickhouse-client",
+                    "--query",
+                    "SELECT count() FROM system.tables WHERE database = 'otel'",
+                ],
+                timeout=8,
+            )
 
             if isinstance(result, str):
                 try:
@@ -2926,6 +3069,12 @@ class ServiceOrchestrator:
 
     async def _check_otel_container_running(self) -> bool:
         """Check if OTEL collector container is running."""
+        containers = await self._list_engine_container_names(
+            {"name": "otel-collector", "status": "running"}
+        )
+        if containers is not None:
+            return any("otel-collector" in name.lower() for name in containers)
+
         try:
             result = await self._run_docker_command(
                 [
@@ -3004,9 +3153,9 @@ class ServiceOrchestrator:
         for attempt in range(max_retries):
             try:
                 # Check OTEL collector logs for ClickHouse connection issues
-                cmd = ["logs", "--tail", "50", "otel-collector"]
-
-                result = await self._run_docker_command(cmd, timeout=8)
+                result = await self._fetch_container_logs(
+                    "otel-collector", tail=50, timeout=8
+                )
 
                 if isinstance(result, str):
                     logs = result.lower()
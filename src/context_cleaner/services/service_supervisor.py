@@ -28,8 +28,10 @@ from context_cleaner.services.process_registry import (
     ProcessEntry,
     get_process_registry,
 )
+from context_cleaner.monitoring.sampling_profiler import get_sampling_profiler
 
 if TYPE_CHECKING:  # pragma: no cover - for type hints only
+    from context_cleaner.hooks.integration_manager import HookIntegrationManager
     from context_cleaner.services.service_watchdog import ServiceWatchdog
 
 LOGGER = logging.getLogger(__name__)
@@ -76,6 +78,8 @@ class SupervisorConfig:
     audit_log_path: Optional[str] = None
     heartbeat_interval_seconds: int = 10
     heartbeat_timeout_seconds: int = 30
+    hook_queue_size: int = 1024
+    hook_flush_interval_seconds: float = 5.0
 
 
 class ServiceSupervisor:
@@ -101,6 +105,9 @@ class ServiceSupervisor:
         self._heartbeat_task: Optional[asyncio.Task[None]] = None
         self._last_heartbeat_at: Optional[dt.datetime] = None
         self._watchdog: Optional["ServiceWatchdog"] = None
+        self._hook_manager: Optional["HookIntegrationManager"] = None
+        self._hook_queue: Optional[asyncio.Queue] = None
+        self._hook_task: Optional[asyncio.Task[None]] = None
 
     async def start(self) -> None:
         if self._running:
@@ -121,6 +128,9 @@ class ServiceSupervisor:
             LOGGER.warning("Failed to register supervisor process in registry")
         self._heartbeat_task = asyncio.create_task(self._emit_heartbeat_loop())
         self._stack.push_async_callback(self._cancel_heartbeat)
+        self._hook_queue = asyncio.Queue(maxsize=max(1, self._config.hook_queue_size))
+        self._hook_task = asyncio.create_task(self._hook_event_loop())
+        self._stack.push_async_callback(self._stop_hook_events)
 
         if self._config.endpoint.startswith("ipc://"):
             LOGGER.debug("Supervisor running without network listener (debug endpoint)")
@@ -161,6 +171,13 @@ class ServiceSupervisor:
 
         self._watchdog = watchdog
 
+    def register_hook_manager(
+        self, manager: Optional["HookIntegrationManager"]
+    ) -> None:
+        """Override the hook manager that applies ``hook-event`` requests."""
+
+        self._hook_manager = manager
+
     async def handle_request(
         self,
         request: SupervisorRequest,
@@ -223,6 +240,10 @@ class ServiceSupervisor:
                     status="in-progress",
                     result=payload,
                 )
+            if request.action is RequestAction.HOOK_EVENT:
+                return self._enqueue_hook_event(request)
+            if request.action is RequestAction.PROFILE:
+                return await self._handle_profile(request)
             return self._error_response(
                 request,
                 code=ErrorCode.INVALID_ARGUMENT,
@@ -262,6 +283,18 @@ class ServiceSupervisor:
                     await self._send_response(writer, response)
                     continue
 
+                if request.action is RequestAction.HOOK_EVENT:
+                    # Hooks only wait briefly for the verdict; accepted
+                    # events are too frequent to be worth an audit entry.
+                    response = await self.handle_request(request, writer)
+                    if response.status == "error":
+                        await self._record_audit(
+                            "response", request=request, response=response
+                        )
+                    with suppress(ConnectionError):
+                        await self._send_response(writer, response)
+                    continue
+
                 await self._record_audit("request", request=request)
                 response = await self.handle_request(request, writer)
                 await self._record_audit("response", request=request, response=response)
@@ -356,6 +389,142 @@ class ServiceSupervisor:
             entry["summary"] = response.status
         await self._audit_logger.log(entry)
 
+    def _enqueue_hook_event(self, request: SupervisorRequest) -> SupervisorResponse:
+        event_type = request.options.get("event_type")
+        payload = request.options.get("payload", {})
+        if not isinstance(event_type, str) or not isinstance(payload, dict):
+            return self._error_response(
+                request,
+                code=ErrorCode.INVALID_ARGUMENT,
+                message="invalid-hook-event",
+            )
+        if self._hook_queue is None:
+            return self._error_response(
+                request, code=ErrorCode.INTERNAL, message="hook-queue-unavailable"
+            )
+        try:
+            self._hook_queue.put_nowait((event_type, payload))
+        except asyncio.QueueFull:
+            return self._error_response(
+                request,
+                code=ErrorCode.CONCURRENCY_LIMIT,
+                message="hook-queue-full",
+            )
+        return SupervisorResponse(
+            request_id=request.request_id,
+            status="accepted",
+            result={"event_type": event_type},
+        )
+
+    async def _handle_profile(self, request: SupervisorRequest) -> SupervisorResponse:
+        """Control the in-process sampling profiler (start/stop/status/report)."""
+        profiler = get_sampling_profiler()
+        command = request.options.get("command", "status")
+        result: Dict[str, Any]
+        try:
+            if command == "start":
+                if request.options.get("reset", True) and not profiler.running:
+                    profiler.reset()
+                started = profiler.start(
+                    hz=request.options.get("hz"),
+                    duration_seconds=request.options.get("duration_seconds"),
+                )
+                result = {"started": started, **profiler.get_status()}
+            elif command == "stop":
+                stopped = await asyncio.to_thread(profiler.stop)
+                result = {"stopped": stopped, **profiler.get_status()}
+            elif command == "status":
+                result = profiler.get_status()
+            elif command == "report":
+                limit = int(request.options.get("limit", 20))
+                result = profiler.get_report(limit=limit)
+                if request.options.get("folded"):
+                    result["folded"] = profiler.folded_stacks()
+            else:
+                return self._error_response(
+                    request,
+                    code=ErrorCode.INVALID_ARGUMENT,
+                    message="unknown-profile-command",
+                )
+        except (TypeError, ValueError) as exc:
+            return self._error_response(
+                request, code=ErrorCode.INVALID_ARGUMENT, message=str(exc)
+            )
+        return SupervisorResponse(
+            request_id=request.request_id, status="ok", result=result
+        )
+
+    async def _hook_event_loop(self) -> None:
+        queue = self._hook_queue
+        assert queue is not None
+        interval = max(0.01, self._config.hook_flush_interval_seconds)
+        loop = asyncio.get_running_loop()
+        next_flush = loop.time() + interval
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=max(0.0, next_flush - loop.time())
+                )
+            except asyncio.TimeoutError:
+                event = None
+            except asyncio.CancelledError:
+                break
+
+            batch = [] if event is None else [event]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            flush = loop.time() >= next_flush
+            work = asyncio.ensure_future(
+                asyncio.to_thread(self._apply_hook_events, batch, flush)
+            )
+            try:
+                await asyncio.shield(work)
+            except asyncio.CancelledError:
+                # Let the batch finish so the final flush never races it
+                with suppress(Exception):
+                    await work
+                break
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.debug("Hook event batch failed: %s", exc)
+            if flush:
+                next_flush = loop.time() + interval
+
+    def _apply_hook_events(self, batch: list, flush: bool) -> None:
+        # Runs in a worker thread; the hook loop never overlaps two calls,
+        # so session state is only touched by one thread at a time.
+        if not batch and not flush:
+            return
+        manager = self._get_hook_manager()
+        for event_type, payload in batch:
+            manager.apply_event(event_type, payload)
+        if flush:
+            manager.flush_session()
+
+    def _get_hook_manager(self) -> "HookIntegrationManager":
+        if self._hook_manager is None:
+            from context_cleaner.hooks.integration_manager import get_hook_manager
+
+            self._hook_manager = get_hook_manager()
+        return self._hook_manager
+
+    async def _stop_hook_events(self) -> None:
+        if self._hook_task:
+            self._hook_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._hook_task
+            self._hook_task = None
+        if self._hook_queue is None:
+            return
+        pending = []
+        while not self._hook_queue.empty():
+            pending.append(self._hook_queue.get_nowait())
+        self._hook_queue = None
+        if pending or self._hook_manager is not None:
+            try:
+                await asyncio.to_thread(self._apply_hook_events, pending, True)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.debug("Final hook flush failed: %s", exc)
+
     async def _shutdown_server(self) -> None:
         if self._server_task:
             self._server_task.cancel()
@@ -18,6 +18,7 @@ from enum import Enum
 from pathlib import Path
 
 from ..clients.clickhouse_client import ClickHouseClient
+from ..jsonl_enhancement.full_content_queries import FullContentQueries
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +114,9 @@ class AdvancedSearchEngine:
         # Search history for learning
         self._search_history: List[Dict[str, Any]] = []
 
+        # Token-indexed search over stored file content
+        self._content_queries = FullContentQueries(telemetry_client)
+
     async def initialize_patterns(self):
         """Initialize workflow patterns from telemetry data"""
         try:
@@ -287,6 +291,10 @@ class AdvancedSearchEngine:
         self, query: str, context_files: Optional[List[str]] = None
     ) -> List[SearchResult]:
         """Perform initial keyword search"""
+        indexed_results = await self._indexed_keyword_search(query, context_files)
+        if indexed_results is not None:
+            return indexed_results
+
         results = []
 
         try:
@@ -315,6 +323,47 @@ class AdvancedSearchEngine:
             logger.error(f"Error in keyword search: {e}")
             return []
 
+    async def _indexed_keyword_search(
+        self, query: str, context_files: Optional[List[str]] = None
+    ) -> Optional[List[SearchResult]]:
+        """Search stored file content through the full-text token index.
+
+        Returns None when telemetry content is unavailable or has no match
+        (``execute_query`` reports failures as an empty result) so the caller
+        can fall back to the local search strategy.
+        """
+        try:
+            rows = await self._content_queries.search_file_content(query)
+        except Exception as e:
+            logger.debug(f"Indexed content search unavailable: {e}")
+            return None
+
+        if context_files:
+            allowed = set(context_files)
+            rows = [row for row in rows if row.get("file_path") in allowed]
+        if not rows:
+            return None
+
+        # Scores are unbounded; normalise against the best hit
+        max_score = max(
+            (float(row.get("relevance_score") or 0.0) for row in rows), default=0.0
+        )
+
+        unique_results: Dict[str, SearchResult] = {}
+        for row in rows[: self.max_results_per_strategy]:
+            file_path = row.get("file_path")
+            if not file_path or file_path in unique_results:
+                continue
+            score = float(row.get("relevance_score") or 0.0)
+            unique_results[file_path] = SearchResult(
+                file_path=file_path,
+                content_snippet=row.get("code_snippet", ""),
+                relevance_score=(score / max_score) if max_score > 0 else 0.5,
+                search_strategy=SearchStrategy.KEYWORD_SEARCH,
+            )
+
+        return list(unique_results.values())
+
     def _extract_search_terms(self, query: str) -> List[str]:
         """Extract meaningful search terms from query"""
         # Remove common words and extract keywords
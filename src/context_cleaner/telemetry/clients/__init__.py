@@ -1,6 +1,12 @@
 """Telemetry data clients and interfaces."""
 
 from .clickhouse_client import ClickHouseClient
+from .sqlite_client import FallbackTelemetryClient, SQLiteTelemetryClient
 from .base import TelemetryClient
 
-__all__ = ["ClickHouseClient", "TelemetryClient"]
+__all__ = [
+    "ClickHouseClient",
+    "FallbackTelemetryClient",
+    "SQLiteTelemetryClient",
+    "TelemetryClient",
+]
@@ -19,9 +19,27 @@ from urllib import request as urllib_request
 from urllib import error as urllib_error
 
 from .base import TelemetryClient, SessionMetrics, ErrorEvent, TelemetryEvent
+from ...monitoring.metrics_registry import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+QUERY_SECONDS = _metrics.histogram(
+    "context_cleaner_clickhouse_query_duration_seconds",
+    "ClickHouse query latency",
+    ["status"],
+)
+QUERY_CACHE_LOOKUPS = _metrics.counter(
+    "context_cleaner_clickhouse_query_cache_total",
+    "ClickHouse query result cache lookups",
+    ["result"],
+)
+INSERTED_ROWS = _metrics.counter(
+    "context_cleaner_clickhouse_inserted_rows_total",
+    "Rows bulk inserted into ClickHouse",
+    ["table"],
+)
+
 
 class ConnectionStatus(Enum):
     """Connection status enumeration."""
@@ -206,6 +224,8 @@ class ClickHouseClient(TelemetryClient):
         self._is_initialized = False
         self._health_check_task: Optional[asyncio.Task] = None
         self._thread_local = threading.local()
+        self._docker_engine = None
+        self._docker_engine_resolved = False
 
         # Performance monitoring
         self._performance_stats = {
@@ -528,7 +548,12 @@ class ClickHouseClient(TelemetryClient):
                     http_error,
                 )
 
-            # Fall back to docker exec when HTTP path fails
+            # Fall back to docker exec when HTTP path fails, preferring the
+            # Engine API socket over forking the docker CLI
+            engine_output = await self._docker_engine_exec_query(query, timeout)
+            if engine_output is not None:
+                return self._parse_json_each_row(engine_output)
+
             cmd = [
                 "docker",
                 "exec",
@@ -547,21 +572,65 @@ class ClickHouseClient(TelemetryClient):
             if result.returncode != 0:
                 raise RuntimeError(f"ClickHouse query failed: {result.stderr}")
 
-            results = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    try:
-                        results.append(json.loads(line))
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON line: {line}, error: {e}")
-
-            return results
+            return self._parse_json_each_row(result.stdout)
 
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"ClickHouse query timed out after {timeout}s")
         except Exception as e:
             raise RuntimeError(f"ClickHouse query error: {e}")
 
+    @staticmethod
+    def _parse_json_each_row(output: str) -> List[Dict[str, Any]]:
+        results = []
+        for line in output.strip().split("\n"):
+            if line:
+                try:
+                    results.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse JSON line: {line}, error: {e}")
+        return results
+
+    async def _docker_engine_exec_query(
+        self, query: str, timeout: int
+    ) -> Optional[str]:
+        """Run a query via the Docker Engine API exec endpoint.
+
+        Returns None when no local Docker socket is available or the API call
+        itself fails, so the caller can fall back to the ``docker`` CLI.
+        """
+        # Imported lazily: the services package imports telemetry modules
+        from context_cleaner.services.docker_engine import (
+            DockerEngineClient,
+            DockerEngineError,
+        )
+
+        if not self._docker_engine_resolved:
+            self._docker_engine = DockerEngineClient.from_environment()
+            self._docker_engine_resolved = True
+
+        if self._docker_engine is None:
+            return None
+
+        try:
+            result = await self._docker_engine.exec_run(
+                "clickhouse-otel",
+                [
+                    "clickhouse-client",
+                    "--query",
+                    query,
+                    "--format",
+                    "JSONEachRow",
+                ],
+                timeout=timeout,
+            )
+        except DockerEngineError as e:
+            logger.debug(f"Docker API exec failed, using docker CLI: {e}")
+            return None
+
+        if not result.success:
+            raise RuntimeError(f"ClickHouse query failed: {result.stderr}")
+        return result.stdout
+
     async def execute_query(
         self,
         query: str,
@@ -594,10 +663,12 @@ class ClickHouseClient(TelemetryClient):
                 cached_result = await self._cache_service.get(cache_key)
                 if cached_result is not None:
                     self._performance_stats["cache_hits"] += 1
+                    QUERY_CACHE_LOOKUPS.inc(result="hit")
                     logger.debug(f"Cache hit for query: {cache_key}")
                     return cached_result
                 else:
                     self._performance_stats["cache_misses"] += 1
+                    QUERY_CACHE_LOOKUPS.inc(result="miss")
             except Exception as e:
                 logger.warning(f"Cache retrieval error for {cache_key}: {e}")
 
@@ -635,6 +706,7 @@ class ClickHouseClient(TelemetryClient):
             response_time_ms = (time.time() - start_time) * 1000
             self._record_successful_query(response_time_ms)
             self.pool.record_query_performance(response_time_ms)
+            QUERY_SECONDS.observe(response_time_ms / 1000, status="success")
 
             # Update performance stats
             self._performance_stats["queries_executed"] += 1
@@ -662,9 +734,40 @@ class ClickHouseClient(TelemetryClient):
         except Exception as e:
             # Record failure
             self._record_failed_query(str(e))
+            QUERY_SECONDS.observe(time.time() - start_time, status="error")
             logger.error(f"ClickHouse query failed: {e}")
             return []
 
+    async def execute_command(
+        self, query: str, timeout: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a statement and raise ``RuntimeError`` if it fails.
+
+        ``execute_query`` logs failures and returns an empty list, which
+        callers cannot tell apart from success. Data-modifying steps whose
+        later steps depend on earlier ones succeeding use this instead.
+        """
+        if self._is_circuit_breaker_open():
+            raise RuntimeError("Circuit breaker is open due to consecutive failures")
+        if not self._is_initialized:
+            await self.initialize(skip_health_check=True)
+
+        start_time = time.time()
+        try:
+            results = await self._execute_raw_query(query, timeout)
+        except Exception as e:
+            self._record_failed_query(str(e))
+            QUERY_SECONDS.observe(time.time() - start_time, status="error")
+            logger.error(f"ClickHouse command failed: {e}")
+            raise
+
+        response_time_ms = (time.time() - start_time) * 1000
+        self._record_successful_query(response_time_ms)
+        QUERY_SECONDS.observe(response_time_ms / 1000, status="success")
+        self._performance_stats["queries_executed"] += 1
+        self._performance_stats["total_query_time_ms"] += response_time_ms
+        return results
+
     async def bulk_insert_enhanced(
         self,
         table_name: str,
@@ -1227,6 +1330,7 @@ class ClickHouseClient(TelemetryClient):
                 logger.error(f"Bulk insert failed for {table_name}: {result.stderr}")
                 return False
 
+            INSERTED_ROWS.inc(len(records), table=table_name)
             logger.info(
                 f"Successfully inserted {len(records)} records into {table_name}"
             )
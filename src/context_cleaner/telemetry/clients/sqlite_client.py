@@ -0,0 +1,1385 @@
+"""Embedded SQLite telemetry backend for ClickHouse-free deployments.
+
+Stores the same OTEL log/metric events and JSONL content tables that the
+ClickHouse stack holds, in a single local SQLite file. Frequently used map
+attributes (``session.id``, ``model``, ``cost_usd``...) are promoted to typed
+columns with covering indexes, so dashboard aggregates are answered from
+the index alone.
+
+``execute_query`` accepts the ClickHouse-flavoured SQL issued by
+``ClickHouseTelemetryRepository`` and ``TelemetryWidgetManager``: the
+``otel.`` prefix, ``LogAttributes['key']`` lookups, ``now() - INTERVAL n DAY``
+and ``{name:Type}`` placeholders are rewritten, ``groupArray``/``arrayJoin``
+are mapped onto SQLite's JSON functions, and the remaining ClickHouse
+functions those queries use are registered as SQLite functions. Like
+``ClickHouseClient.execute_query`` it logs failures and returns ``[]``.
+
+``FallbackTelemetryClient`` (built by ``select_telemetry_client``) routes
+queries and ingestion to this backend while ClickHouse is not reachable.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib import request as urllib_request
+
+from .base import TelemetryClient, SessionMetrics, ErrorEvent
+from .clickhouse_client import ClickHouseClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path.home() / ".context_cleaner" / "data" / "telemetry.db"
+
+# Map attributes promoted to real columns, per table
+_LOG_ATTRIBUTE_COLUMNS = {
+    "session.id": "session_id",
+    "model": "model",
+    "cost_usd": "cost_usd",
+    "duration_ms": "duration_ms",
+    "input_tokens": "input_tokens",
+    "output_tokens": "output_tokens",
+    "tool_name": "tool_name",
+    "error": "error",
+    "terminal.type": "terminal_type",
+}
+_METRIC_ATTRIBUTE_COLUMNS = {
+    "session.id": "session_id",
+    "model": "model",
+    "type": "token_type",
+}
+
+# Token usage field on a message record -> claude_code.token.usage type
+_TOKEN_TYPES = {
+    "input_tokens": "input",
+    "output_tokens": "output",
+    "cache_read_input_tokens": "cacheRead",
+    "cache_creation_input_tokens": "cacheCreation",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS otel_logs (
+    event_id TEXT PRIMARY KEY,
+    Timestamp TEXT NOT NULL,
+    Body TEXT NOT NULL,
+    session_id TEXT,
+    model TEXT,
+    cost_usd REAL,
+    duration_ms REAL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    tool_name TEXT,
+    error TEXT,
+    terminal_type TEXT,
+    LogAttributes TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_logs_body_time
+    ON otel_logs (Body, Timestamp, session_id, model, cost_usd, duration_ms);
+CREATE INDEX IF NOT EXISTS idx_logs_session
+    ON otel_logs (session_id, Body, Timestamp, cost_usd);
+CREATE INDEX IF NOT EXISTS idx_logs_tool
+    ON otel_logs (Body, tool_name, Timestamp, session_id);
+
+CREATE TABLE IF NOT EXISTS otel_metrics_sum (
+    event_id TEXT NOT NULL,
+    TimeUnix TEXT NOT NULL,
+    MetricName TEXT NOT NULL,
+    Value REAL NOT NULL,
+    session_id TEXT,
+    model TEXT,
+    token_type TEXT,
+    Attributes TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (event_id, MetricName, token_type)
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_name_time
+    ON otel_metrics_sum (MetricName, TimeUnix, model, token_type, Value);
+
+CREATE TABLE IF NOT EXISTS claude_message_content (
+    message_uuid TEXT PRIMARY KEY,
+    session_id TEXT,
+    timestamp TEXT,
+    role TEXT,
+    message_content TEXT,
+    message_preview TEXT,
+    message_hash TEXT,
+    message_length INTEGER,
+    model_name TEXT,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    cost_usd REAL,
+    programming_languages TEXT,
+    contains_code_blocks INTEGER
+        GENERATED ALWAYS AS (instr(message_content, '```') > 0) VIRTUAL,
+    contains_file_references INTEGER
+        GENERATED ALWAYS AS (instr(message_content, '/') > 0
+                             OR instr(message_content, '\\') > 0) VIRTUAL
+);
+CREATE INDEX IF NOT EXISTS idx_message_session
+    ON claude_message_content (session_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_message_time
+    ON claude_message_content (timestamp, session_id, message_length);
+
+CREATE TABLE IF NOT EXISTS claude_file_content (
+    file_access_uuid TEXT PRIMARY KEY,
+    session_id TEXT,
+    message_uuid TEXT,
+    timestamp TEXT,
+    file_path TEXT,
+    file_content TEXT,
+    file_content_hash TEXT,
+    file_size INTEGER,
+    file_extension TEXT,
+    operation_type TEXT,
+    file_type TEXT,
+    programming_language TEXT,
+    contains_secrets INTEGER
+        GENERATED ALWAYS AS (instr(lower(file_content), 'password') > 0
+                             OR instr(lower(file_content), 'api_key') > 0) VIRTUAL,
+    contains_imports INTEGER
+        GENERATED ALWAYS AS (instr(file_content, 'import ') > 0
+                             OR instr(file_content, '#include') > 0) VIRTUAL,
+    line_count INTEGER
+        GENERATED ALWAYS AS (length(file_content)
+                             - length(replace(file_content, char(10), '')) + 1) VIRTUAL
+);
+CREATE INDEX IF NOT EXISTS idx_file_path
+    ON claude_file_content (file_path, timestamp);
+CREATE INDEX IF NOT EXISTS idx_file_time
+    ON claude_file_content (timestamp, file_path, file_size);
+
+CREATE TABLE IF NOT EXISTS claude_tool_results (
+    tool_result_uuid TEXT PRIMARY KEY,
+    session_id TEXT,
+    message_uuid TEXT,
+    timestamp TEXT,
+    tool_name TEXT,
+    tool_input TEXT,
+    tool_output TEXT,
+    tool_error TEXT,
+    execution_time_ms INTEGER,
+    success INTEGER,
+    exit_code INTEGER,
+    output_type TEXT,
+    output_size INTEGER GENERATED ALWAYS AS (length(tool_output)) VIRTUAL,
+    contains_error INTEGER
+        GENERATED ALWAYS AS (length(coalesce(tool_error, '')) > 0) VIRTUAL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_time
+    ON claude_tool_results (timestamp, tool_name, success);
+"""
+
+_MAP_LOOKUP = re.compile(r"\b(LogAttributes|Attributes)\['([^']*)'\]")
+_INTERVAL = re.compile(
+    r"now\(\)\s*-\s*INTERVAL\s+(\d+)\s+(SECOND|MINUTE|HOUR|DAY|WEEK|MONTH)S?\b",
+    re.IGNORECASE,
+)
+_PLACEHOLDER = re.compile(r"\{(\w+):\w+\}")
+_TRAILING_FORMAT = re.compile(r"\s+FORMAT\s+\w+\s*;?\s*$", re.IGNORECASE)
+# groupArray(...) AS alias, allowing one level of nested parentheses
+_GROUP_ARRAY_ALIAS = re.compile(
+    r"\bgroupArray\((?:[^()]|\([^()]*\))*\)\s+AS\s+(\w+)", re.IGNORECASE
+)
+# topK(n)(arrayJoin(column)) and topK(n)(expr); SQLite has no parametric
+# aggregates, so n becomes the first argument
+_TOP_K_ARRAY_JOIN = re.compile(r"\btopK\((\d+)\)\(\s*arrayJoin\(\s*(\w+)\s*\)\s*\)")
+_TOP_K = re.compile(r"\btopK\((\d+)\)\(")
+_ARRAY_JOIN = re.compile(r"\barrayJoin\(\s*(\w+)\s*\)\s+AS\s+(\w+)", re.IGNORECASE)
+
+_DATE_DIFF_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+# ClickHouse counts week boundaries from Mondays
+_WEEK_ORIGIN = date(1969, 12, 29)
+
+
+def _format_timestamp(value: Any) -> Optional[str]:
+    """Normalize timestamps to naive UTC text that sorts chronologically."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        value = datetime.fromtimestamp(value, tz=timezone.utc)
+    elif isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _to_float_or_null(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int_or_null(value: Any) -> Optional[int]:
+    number = _to_float_or_null(value)
+    return int(number) if number is not None else None
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if value is None or value == "":
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).replace(
+            tzinfo=None
+        )
+    except ValueError:
+        return None
+
+
+def _unit_boundaries(unit: str, start: datetime, end: datetime) -> int:
+    if unit in _DATE_DIFF_SECONDS:
+        size = _DATE_DIFF_SECONDS[unit]
+        epoch = datetime(1970, 1, 1)
+        return int(
+            (end - epoch).total_seconds() // size
+            - (start - epoch).total_seconds() // size
+        )
+    if unit == "week":
+        start_week = (start.date() - _WEEK_ORIGIN).days // 7
+        return (end.date() - _WEEK_ORIGIN).days // 7 - start_week
+    if unit == "month":
+        return (end.year - start.year) * 12 + end.month - start.month
+    if unit == "quarter":
+        start_quarter = start.year * 4 + (start.month - 1) // 3
+        return end.year * 4 + (end.month - 1) // 3 - start_quarter
+    if unit == "year":
+        return end.year - start.year
+    raise ValueError(f"Unsupported dateDiff unit: {unit}")
+
+
+def _date_diff(unit: Any, start: Any, end: Any) -> Optional[float]:
+    """``dateDiff(unit, start, end)``: unit boundaries crossed, as in ClickHouse.
+
+    Returned as a float because ClickHouse's ``/`` always divides as floats
+    and dashboard queries divide counts by this value.
+    """
+    start, end = _parse_timestamp(start), _parse_timestamp(end)
+    if start is None or end is None or unit is None:
+        return None
+    return float(_unit_boundaries(str(unit).lower(), start, end))
+
+
+class _Uniq:
+    """``uniq(x)`` aggregate: exact distinct count of non-null values."""
+
+    def __init__(self):
+        self.values = set()
+
+    def step(self, value):
+        if value is not None:
+            self.values.add(value)
+
+    def finalize(self):
+        return len(self.values)
+
+
+class _CountIf:
+    """``countIf(cond)`` aggregate."""
+
+    def __init__(self):
+        self.count = 0
+
+    def step(self, condition):
+        if condition:
+            self.count += 1
+
+    def finalize(self):
+        return self.count
+
+
+class _SumIf:
+    """``sumIf(value, cond)`` aggregate."""
+
+    def __init__(self):
+        self.total = 0
+
+    def step(self, value, condition):
+        if condition and value is not None:
+            self.total += value
+
+    def finalize(self):
+        return self.total
+
+
+class _TopK:
+    """``topK(n)(x)`` aggregate: JSON array of the n most frequent values."""
+
+    def __init__(self):
+        self.limit = 10
+        self.counts = Counter()
+
+    def step(self, limit, value):
+        self.limit = limit
+        if value is not None:
+            self.counts[value] += 1
+
+    def finalize(self):
+        return json.dumps([value for value, _ in self.counts.most_common(self.limit)])
+
+
+class _TopKArray(_TopK):
+    """``topK(n)(arrayJoin(x))`` over JSON array values."""
+
+    def step(self, limit, values):
+        self.limit = limit
+        if values:
+            self.counts.update(v for v in json.loads(values) if v is not None)
+
+
+def _array_slice(values: Optional[str], offset: int, length: int) -> Optional[str]:
+    """``arraySlice`` on a JSON array; ``offset`` is 1-based."""
+    if values is None:
+        return None
+    start = offset - 1 if offset > 0 else offset
+    return json.dumps(json.loads(values)[start : start + length])
+
+
+def _array_string_concat(values: Optional[str], separator: str = "") -> str:
+    if not values:
+        return ""
+    return separator.join(str(v) for v in json.loads(values))
+
+
+class _Any:
+    """``any(x)`` aggregate: first non-null value seen."""
+
+    def __init__(self):
+        self.value = None
+
+    def step(self, value):
+        if self.value is None:
+            self.value = value
+
+    def finalize(self):
+        return self.value
+
+
+def translate_clickhouse_sql(query: str, database: str = "otel") -> str:
+    """Rewrite the ClickHouse dialect used by dashboard queries for SQLite."""
+
+    def map_lookup(match: "re.Match[str]") -> str:
+        container, key = match.group(1), match.group(2)
+        columns = (
+            _LOG_ATTRIBUTE_COLUMNS
+            if container == "LogAttributes"
+            else _METRIC_ATTRIBUTE_COLUMNS
+        )
+        if key in columns:
+            return columns[key]
+        return f"json_extract({container}, '$.\"{key}\"')"
+
+    def interval(match: "re.Match[str]") -> str:
+        amount, unit = int(match.group(1)), match.group(2).lower()
+        if unit == "week":
+            amount, unit = amount * 7, "day"
+        return f"strftime('%Y-%m-%d %H:%M:%f', 'now', '-{amount} {unit}s')"
+
+    query = _TRAILING_FORMAT.sub("", query)
+    query = re.sub(rf"\b{re.escape(database)}\.(\w+)", r"\1", query)
+    query = _MAP_LOOKUP.sub(map_lookup, query)
+    query = _INTERVAL.sub(interval, query)
+    query = _translate_arrays(query)
+    return _PLACEHOLDER.sub(r":\1", query)
+
+
+def _translate_arrays(query: str) -> str:
+    """Map ClickHouse arrays onto JSON arrays.
+
+    ``topK`` results are JSON arrays too. ``groupArray`` becomes ``json_group_array`` and ``length()`` of its
+    result ``json_array_length``. Each ``arrayJoin(column) AS alias`` turns
+    into a ``json_each`` join on the table the select reads from, producing
+    one row per element.
+    """
+    query = _TOP_K_ARRAY_JOIN.sub(r"topKArray(\1, \2)", query)
+    query = _TOP_K.sub(r"topK(\1, ", query)
+    for alias in _GROUP_ARRAY_ALIAS.findall(query):
+        query = re.sub(
+            rf"\blength\(\s*{alias}\s*\)", f"json_array_length({alias})", query
+        )
+    query = re.sub(r"\bgroupArray\(", "json_group_array(", query)
+
+    joins = _ARRAY_JOIN.findall(query)
+    if not joins:
+        return query
+    position = _ARRAY_JOIN.search(query).start()
+    query = _ARRAY_JOIN.sub(r"_aj_\2.value AS \2", query)
+    source = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE).search(query, position)
+    if source is None:
+        return query
+    table = source.group(1)
+    expansions = "".join(
+        f", json_each({table}.{column}) AS _aj_{alias}" for column, alias in joins
+    )
+    return query[: source.end()] + expansions + query[source.end() :]
+
+
+class SQLiteTelemetryClient(TelemetryClient):
+    """Telemetry client backed by an embedded SQLite database.
+
+    A drop-in replacement for ``ClickHouseClient`` wherever only the
+    ``TelemetryClient`` interface, ``bulk_insert`` and the dashboard queries
+    are needed. Content rows written through ``bulk_insert`` also produce the
+    matching ``claude_code.api_request``/``tool_decision`` events and token
+    usage metrics, so one ingestion pass populates every dashboard widget.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path, None] = None,
+        database: str = "otel",
+    ):
+        self.db_path = str(db_path or DEFAULT_DB_PATH)
+        self.database = database
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._register_functions(conn)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _register_functions(conn: sqlite3.Connection):
+        """Register the ClickHouse functions used by dashboard queries."""
+        scalar = {
+            "toFloat64OrNull": _to_float_or_null,
+            "toFloat64OrZero": lambda v: _to_float_or_null(v) or 0.0,
+            "toFloat64": lambda v: _to_float_or_null(v) or 0.0,
+            "toInt32OrNull": _to_int_or_null,
+            "toInt64OrNull": _to_int_or_null,
+            "toUInt32": lambda v: _to_int_or_null(v) or 0,
+            "toUInt64": lambda v: _to_int_or_null(v) or 0,
+            "toString": lambda v: "" if v is None else str(v),
+            "toDate": lambda v: str(v)[:10] if v else None,
+            "toStartOfDay": lambda v: f"{str(v)[:10]} 00:00:00" if v else None,
+            "toStartOfHour": lambda v: f"{str(v)[:13]}:00:00" if v else None,
+            "toHour": lambda v: int(str(v)[11:13]) if v else None,
+        }
+        for name, func in scalar.items():
+            conn.create_function(name, 1, func, deterministic=True)
+        conn.create_function(
+            "now",
+            0,
+            lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f"),
+        )
+        conn.create_function(
+            "today", 0, lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        )
+        conn.create_function("dateDiff", 3, _date_diff, deterministic=True)
+        conn.create_function("arraySlice", 3, _array_slice, deterministic=True)
+        conn.create_function(
+            "arrayStringConcat", 1, _array_string_concat, deterministic=True
+        )
+        conn.create_function(
+            "arrayStringConcat", 2, _array_string_concat, deterministic=True
+        )
+        conn.create_aggregate("topK", 2, _TopK)
+        conn.create_aggregate("topKArray", 2, _TopKArray)
+        conn.create_aggregate("uniq", 1, _Uniq)
+        conn.create_aggregate("uniqExact", 1, _Uniq)
+        conn.create_aggregate("countIf", 1, _CountIf)
+        conn.create_aggregate("sumIf", 2, _SumIf)
+        conn.create_aggregate("any", 1, _Any)
+
+    def _run(
+        self, sql: str, params: Union[Dict[str, Any], tuple] = ()
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._connection().execute(sql, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def _run_many(self, statements: List[tuple]) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for sql, rows in statements:
+                    if rows:
+                        conn.executemany(sql, rows)
+
+    async def initialize(self, skip_health_check: bool = False) -> bool:
+        """Open the database and create the schema."""
+        try:
+            await asyncio.to_thread(self._connection)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open telemetry database {self.db_path}: {e}")
+            return False
+
+    async def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def execute_query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a ClickHouse-dialect or native SQLite query.
+
+        Failures are logged and yield an empty list, as with ClickHouseClient.
+        """
+        try:
+            return await self.execute_command(query, params)
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"SQLite query failed: {e}")
+            return []
+
+    async def execute_command(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute a query and raise if it fails."""
+        sql = translate_clickhouse_sql(query, self.database)
+        return await asyncio.to_thread(self._run, sql, params or {})
+
+    # Ingestion
+
+    async def bulk_insert(self, table_name: str, records: List[Dict[str, Any]]) -> bool:
+        """Insert records into ``table_name`` using the ClickHouse row shapes.
+
+        Accepts the records produced by ``FullContentJsonlParser`` for the
+        content tables, and OTEL-shaped rows (``Timestamp``, ``Body``,
+        ``LogAttributes``...) for ``otel_logs``/``otel_metrics_sum``.
+        """
+        if not records:
+            return True
+
+        builders = {
+            "claude_message_content": self._message_statements,
+            "claude_file_content": self._file_statements,
+            "claude_tool_results": self._tool_statements,
+            "otel_logs": self._log_statements,
+            "otel_metrics_sum": self._metric_statements,
+        }
+        builder = builders.get(table_name)
+        if builder is None:
+            logger.error(f"Bulk insert error for {table_name}: unknown table")
+            return False
+
+        try:
+            await asyncio.to_thread(self._run_many, builder(records))
+            logger.info(
+                f"Successfully inserted {len(records)} records into {table_name}"
+            )
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"Bulk insert error for {table_name}: {e}")
+            return False
+
+    @staticmethod
+    def _insert_sql(table: str, columns: List[str]) -> str:
+        placeholders = ", ".join("?" for _ in columns)
+        return (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+    def _log_row(
+        self,
+        event_id: str,
+        timestamp: Any,
+        body: str,
+        attributes: Dict[str, Any],
+    ) -> tuple:
+        attributes = {k: v for k, v in attributes.items() if v not in (None, "")}
+        return (
+            event_id,
+            _format_timestamp(timestamp),
+            body,
+            attributes.get("session.id"),
+            attributes.get("model"),
+            _to_float_or_null(attributes.get("cost_usd")),
+            _to_float_or_null(attributes.get("duration_ms")),
+            _to_int_or_null(attributes.get("input_tokens")),
+            _to_int_or_null(attributes.get("output_tokens")),
+            attributes.get("tool_name"),
+            attributes.get("error"),
+            attributes.get("terminal.type"),
+            json.dumps({k: str(v) for k, v in attributes.items()}),
+        )
+
+    _LOG_COLUMNS = [
+        "event_id",
+        "Timestamp",
+        "Body",
+        "session_id",
+        "model",
+        "cost_usd",
+        "duration_ms",
+        "input_tokens",
+        "output_tokens",
+        "tool_name",
+        "error",
+        "terminal_type",
+        "LogAttributes",
+    ]
+    _METRIC_COLUMNS = [
+        "event_id",
+        "TimeUnix",
+        "MetricName",
+        "Value",
+        "session_id",
+        "model",
+        "token_type",
+        "Attributes",
+    ]
+
+    def _metric_row(
+        self,
+        event_id: str,
+        timestamp: Any,
+        name: str,
+        value: float,
+        attributes: Dict[str, Any],
+    ) -> tuple:
+        return (
+            event_id,
+            _format_timestamp(timestamp),
+            name,
+            float(value),
+            attributes.get("session.id"),
+            attributes.get("model"),
+            attributes.get("type"),
+            json.dumps({k: str(v) for k, v in attributes.items()}),
+        )
+
+    def _log_statements(self, records: List[Dict[str, Any]]) -> List[tuple]:
+        rows = []
+        for record in records:
+            attributes = dict(record.get("LogAttributes") or {})
+            event_id = record.get("event_id") or "{}:{}:{}".format(
+                record.get("Timestamp"),
+                record.get("Body"),
+                json.dumps(attributes, sort_keys=True, default=str),
+            )
+            rows.append(
+                self._log_row(
+                    event_id, record.get("Timestamp"), record["Body"], attributes
+                )
+            )
+        return [(self._insert_sql("otel_logs", self._LOG_COLUMNS), rows)]
+
+    def _metric_statements(self, records: List[Dict[str, Any]]) -> List[tuple]:
+        rows = []
+        for record in records:
+            attributes = dict(record.get("Attributes") or {})
+            event_id = record.get("event_id") or "{}:{}".format(
+                record.get("TimeUnix"),
+                json.dumps(attributes, sort_keys=True, default=str),
+            )
+            rows.append(
+                self._metric_row(
+                    event_id,
+                    record.get("TimeUnix"),
+                    record["MetricName"],
+                    record.get("Value", 0),
+                    attributes,
+                )
+            )
+        return [(self._insert_sql("otel_metrics_sum", self._METRIC_COLUMNS), rows)]
+
+    def _message_statements(self, records: List[Dict[str, Any]]) -> List[tuple]:
+        columns = [
+            "message_uuid",
+            "session_id",
+            "timestamp",
+            "role",
+            "message_content",
+            "message_preview",
+            "message_hash",
+            "message_length",
+            "model_name",
+            "input_tokens",
+            "output_tokens",
+            "cost_usd",
+            "programming_languages",
+        ]
+        content_rows, log_rows, metric_rows = [], [], []
+        for record in records:
+            timestamp = _format_timestamp(record.get("timestamp"))
+            content_rows.append(
+                tuple(
+                    (
+                        timestamp
+                        if column == "timestamp"
+                        else (
+                            json.dumps(record.get(column) or [])
+                            if column == "programming_languages"
+                            else record.get(column)
+                        )
+                    )
+                    for column in columns
+                )
+            )
+
+            # Assistant turns with a model are billable API requests
+            model = record.get("model_name")
+            if record.get("role") != "assistant" or not model:
+                continue
+            event_id = f"message:{record.get('message_uuid')}"
+            attributes = {
+                "session.id": record.get("session_id"),
+                "model": model,
+                "cost_usd": record.get("cost_usd"),
+                "input_tokens": record.get("input_tokens"),
+                "output_tokens": record.get("output_tokens"),
+            }
+            log_rows.append(
+                self._log_row(
+                    event_id, timestamp, "claude_code.api_request", attributes
+                )
+            )
+            for field_name, token_type in _TOKEN_TYPES.items():
+                tokens = record.get(field_name) or 0
+                if tokens:
+                    metric_rows.append(
+                        self._metric_row(
+                            event_id,
+                            timestamp,
+                            "claude_code.token.usage",
+                            tokens,
+                            {
+                                "session.id": record.get("session_id"),
+                                "model": model,
+                                "type": token_type,
+                            },
+                        )
+                    )
+
+        return [
+            (self._insert_sql("claude_message_content", columns), content_rows),
+            (self._insert_sql("otel_logs", self._LOG_COLUMNS), log_rows),
+            (self._insert_sql("otel_metrics_sum", self._METRIC_COLUMNS), metric_rows),
+        ]
+
+    def _file_statements(self, records: List[Dict[str, Any]]) -> List[tuple]:
+        columns = [
+            "file_access_uuid",
+            "session_id",
+            "message_uuid",
+            "timestamp",
+            "file_path",
+            "file_content",
+            "file_content_hash",
+            "file_size",
+            "file_extension",
+            "operation_type",
+            "file_type",
+            "programming_language",
+        ]
+        rows = [
+            tuple(
+                (
+                    _format_timestamp(record.get(column))
+                    if column == "timestamp"
+                    else record.get(column)
+                )
+                for column in columns
+            )
+            for record in records
+        ]
+        return [(self._insert_sql("claude_file_content", columns), rows)]
+
+    def _tool_statements(self, records: List[Dict[str, Any]]) -> List[tuple]:
+        columns = [
+            "tool_result_uuid",
+            "session_id",
+            "message_uuid",
+            "timestamp",
+            "tool_name",
+            "tool_input",
+            "tool_output",
+            "tool_error",
+            "execution_time_ms",
+            "success",
+            "exit_code",
+            "output_type",
+        ]
+        content_rows, log_rows = [], []
+        for record in records:
+            timestamp = _format_timestamp(record.get("timestamp"))
+            content_rows.append(
+                tuple(
+                    timestamp if column == "timestamp" else record.get(column)
+                    for column in columns
+                )
+            )
+            if record.get("tool_name"):
+                log_rows.append(
+                    self._log_row(
+                        f"tool:{record.get('tool_result_uuid')}",
+                        timestamp,
+                        "claude_code.tool_decision",
+                        {
+                            "session.id": record.get("session_id"),
+                            "tool_name": record.get("tool_name"),
+                            "duration_ms": record.get("execution_time_ms"),
+                        },
+                    )
+                )
+        return [
+            (self._insert_sql("claude_tool_results", columns), content_rows),
+            (self._insert_sql("otel_logs", self._LOG_COLUMNS), log_rows),
+        ]
+
+    # TelemetryClient interface
+
+    async def get_session_metrics(self, session_id: str) -> Optional[SessionMetrics]:
+        """Get comprehensive metrics for a specific session."""
+        results = await self.execute_query(
+            """
+            SELECT
+                session_id,
+                MIN(Timestamp) as start_time,
+                MAX(Timestamp) as end_time,
+                COUNT(*) as api_calls,
+                SUM(cost_usd) as total_cost,
+                SUM(input_tokens) as total_input_tokens,
+                SUM(output_tokens) as total_output_tokens,
+                SUM(CASE WHEN Body = 'claude_code.api_error' THEN 1 ELSE 0 END) as error_count
+            FROM otel_logs
+            WHERE session_id = :session_id
+                AND Body IN ('claude_code.api_request', 'claude_code.api_error')
+            GROUP BY session_id
+            """,
+            {"session_id": session_id},
+        )
+        if not results:
+            return None
+
+        data = results[0]
+        tools_results = await self.execute_query(
+            """
+            SELECT DISTINCT tool_name as tool
+            FROM otel_logs
+            WHERE session_id = :session_id
+                AND Body = 'claude_code.tool_decision'
+                AND tool_name != ''
+            """,
+            {"session_id": session_id},
+        )
+
+        return SessionMetrics(
+            session_id=data["session_id"],
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=(
+                datetime.fromisoformat(data["end_time"]) if data["end_time"] else None
+            ),
+            api_calls=int(data["api_calls"]),
+            total_cost=float(data["total_cost"] or 0),
+            total_input_tokens=int(data["total_input_tokens"] or 0),
+            total_output_tokens=int(data["total_output_tokens"] or 0),
+            error_count=int(data["error_count"]),
+            tools_used=[t["tool"] for t in tools_results],
+        )
+
+    async def get_recent_errors(self, hours: int = 24) -> List[ErrorEvent]:
+        """Get recent error events within specified time window."""
+        results = await self.execute_query(f"""
+            SELECT Timestamp, session_id, error as error_type, duration_ms,
+                   model, input_tokens, terminal_type
+            FROM otel_logs
+            WHERE Body = 'claude_code.api_error'
+                AND Timestamp >= now() - INTERVAL {int(hours)} HOUR
+            ORDER BY Timestamp DESC
+            """)
+        return [
+            ErrorEvent(
+                timestamp=datetime.fromisoformat(row["Timestamp"]),
+                session_id=row["session_id"] or "",
+                error_type=row["error_type"] or "",
+                duration_ms=float(row["duration_ms"] or 0),
+                model=row["model"] or "",
+                input_tokens=row["input_tokens"],
+                terminal_type=row["terminal_type"],
+            )
+            for row in results
+        ]
+
+    async def get_cost_trends(self, days: int = 7) -> Dict[str, float]:
+        """Get cost trends over specified number of days."""
+        results = await self.execute_query(f"""
+            SELECT substr(Timestamp, 1, 10) as date, SUM(cost_usd) as daily_cost
+            FROM otel_logs
+            WHERE Body = 'claude_code.api_request'
+                AND Timestamp >= now() - INTERVAL {int(days)} DAY
+                AND cost_usd IS NOT NULL
+            GROUP BY date
+            ORDER BY date DESC
+            """)
+        return {row["date"]: float(row["daily_cost"]) for row in results}
+
+    async def get_current_session_cost(self, session_id: str) -> float:
+        """Get the current cost for an active session."""
+        results = await self.execute_query(
+            """
+            SELECT SUM(cost_usd) as session_cost
+            FROM otel_logs
+            WHERE session_id = :session_id AND Body = 'claude_code.api_request'
+            """,
+            {"session_id": session_id},
+        )
+        if results and results[0]["session_cost"]:
+            return float(results[0]["session_cost"])
+        return 0.0
+
+    async def get_model_usage_stats(self, days: int = 7) -> Dict[str, Dict[str, Any]]:
+        """Get model usage statistics over specified period."""
+        results = await self.execute_query(f"""
+            SELECT
+                model,
+                COUNT(*) as request_count,
+                SUM(cost_usd) as total_cost,
+                AVG(duration_ms) as avg_duration_ms,
+                SUM(input_tokens) as total_input_tokens,
+                SUM(output_tokens) as total_output_tokens
+            FROM otel_logs
+            WHERE Body = 'claude_code.api_request'
+                AND Timestamp >= now() - INTERVAL {int(days)} DAY
+                AND model != ''
+            GROUP BY model
+            ORDER BY request_count DESC
+            """)
+
+        stats = {}
+        for row in results:
+            stats[row["model"]] = {
+                "request_count": int(row["request_count"]),
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
+                "total_input_tokens": int(row["total_input_tokens"] or 0),
+                "total_output_tokens": int(row["total_output_tokens"] or 0),
+                "cost_per_token": float(row["total_cost"] or 0)
+                / max(int(row["total_input_tokens"] or 0), 1),
+            }
+        return stats
+
+    async def get_total_aggregated_stats(self) -> Dict[str, Any]:
+        """Get total aggregated statistics across all sessions."""
+        try:
+            token_results = await self.execute_query("""
+                SELECT token_type, SUM(Value) as total_tokens
+                FROM otel_metrics_sum
+                WHERE MetricName = 'claude_code.token.usage'
+                GROUP BY token_type
+                """)
+            token_breakdown = {
+                row["token_type"]: int(row["total_tokens"]) for row in token_results
+            }
+            total_tokens = sum(token_breakdown.values())
+
+            stats_results = await self.execute_query("""
+                SELECT
+                    COUNT(DISTINCT session_id) as total_sessions,
+                    SUM(cost_usd) as total_cost,
+                    COUNT(*) as total_api_calls,
+                    SUM(CASE WHEN Body = 'claude_code.api_error' THEN 1 ELSE 0 END) as total_errors,
+                    MIN(Timestamp) as earliest_session,
+                    MAX(Timestamp) as latest_session
+                FROM otel_logs
+                WHERE Body IN ('claude_code.api_request', 'claude_code.api_error')
+                """)
+            data = stats_results[0]
+
+            tools_results = await self.execute_query("""
+                SELECT COUNT(DISTINCT tool_name) as unique_tools
+                FROM otel_logs
+                WHERE Body = 'claude_code.tool_decision'
+                    AND Timestamp >= now() - INTERVAL 30 DAY
+                """)
+            unique_tools = tools_results[0]["unique_tools"] if tools_results else 0
+
+            total_requests = int(data["total_api_calls"])
+            total_errors = int(data["total_errors"] or 0)
+            success_rate = (
+                ((total_requests - total_errors) / total_requests) * 100
+                if total_requests > 0
+                else 0
+            )
+
+            return {
+                "total_tokens": f"{total_tokens:,}",
+                "total_sessions": f"{int(data['total_sessions'] or 0):,}",
+                "success_rate": f"{success_rate:.1f}%",
+                "active_agents": str(unique_tools),
+                "total_cost": f"${float(data['total_cost'] or 0):.2f}",
+                "total_errors": total_errors,
+                "earliest_session": data["earliest_session"],
+                "latest_session": data["latest_session"],
+                "raw_total_tokens": total_tokens,
+                "raw_total_sessions": int(data["total_sessions"] or 0),
+                "raw_success_rate": success_rate,
+                "token_breakdown": token_breakdown,
+            }
+
+        except sqlite3.Error as e:
+            logger.error(f"Error getting aggregated stats: {e}")
+            return {
+                "total_tokens": "0",
+                "total_sessions": "0",
+                "success_rate": "0.0%",
+                "active_agents": "0",
+                "total_cost": "$0.00",
+                "total_errors": 0,
+                "earliest_session": None,
+                "latest_session": None,
+                "raw_total_tokens": 0,
+                "raw_total_sessions": 0,
+                "raw_success_rate": 0.0,
+            }
+
+    # Extended ClickHouseClient surface used by the dashboard
+
+    async def get_model_token_stats(
+        self, time_range_days: int = 7
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get model-specific token statistics."""
+        try:
+            token_results = await self.execute_query(f"""
+                SELECT model, token_type, SUM(Value) as total_tokens
+                FROM otel_metrics_sum
+                WHERE MetricName = 'claude_code.token.usage'
+                    AND TimeUnix >= now() - INTERVAL {int(time_range_days)} DAY
+                    AND model IS NOT NULL AND token_type IS NOT NULL
+                GROUP BY model, token_type
+                """)
+            cost_results = await self.execute_query(f"""
+                SELECT
+                    model,
+                    COUNT(*) as request_count,
+                    AVG(cost_usd) as avg_cost,
+                    SUM(cost_usd) as total_cost,
+                    AVG(duration_ms) as avg_duration
+                FROM otel_logs
+                WHERE Body = 'claude_code.api_request'
+                    AND Timestamp >= now() - INTERVAL {int(time_range_days)} DAY
+                    AND model IS NOT NULL
+                GROUP BY model
+                """)
+        except sqlite3.Error as e:
+            logger.error(f"Error getting model token stats: {e}")
+            return {}
+
+        token_fields = {
+            "input": "input_tokens",
+            "output": "output_tokens",
+            "cacheRead": "cache_read_tokens",
+            "cacheCreation": "cache_creation_tokens",
+        }
+        model_stats: Dict[str, Dict[str, Any]] = {}
+        for row in token_results:
+            stats = model_stats.setdefault(
+                row["model"],
+                {
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "cache_read_tokens": 0,
+                    "cache_creation_tokens": 0,
+                    "total_tokens": 0,
+                    "request_count": 0,
+                    "avg_cost": 0.0,
+                    "total_cost": 0.0,
+                    "avg_duration": 0.0,
+                },
+            )
+            tokens = int(row["total_tokens"])
+            if row["token_type"] in token_fields:
+                stats[token_fields[row["token_type"]]] = tokens
+            stats["total_tokens"] += tokens
+
+        for row in cost_results:
+            if row["model"] in model_stats:
+                model_stats[row["model"]].update(
+                    {
+                        "request_count": int(row["request_count"]),
+                        "avg_cost": float(row["avg_cost"] or 0),
+                        "total_cost": float(row["total_cost"] or 0),
+                        "avg_duration": float(row["avg_duration"] or 0),
+                    }
+                )
+
+        for stats in model_stats.values():
+            total_tokens, total_cost = stats["total_tokens"], stats["total_cost"]
+            if total_tokens > 0 and total_cost > 0:
+                stats["cost_per_token"] = total_cost / total_tokens
+                stats["tokens_per_dollar"] = total_tokens / total_cost
+            else:
+                stats["cost_per_token"] = 0
+                stats["tokens_per_dollar"] = 0
+
+        return model_stats
+
+    async def get_jsonl_content_stats(self) -> Dict[str, Any]:
+        """Get statistics about JSONL content storage."""
+        queries = {
+            "messages": """
+                SELECT
+                    count(*) as total_messages,
+                    uniq(session_id) as unique_sessions,
+                    sum(message_length) as total_characters,
+                    avg(message_length) as avg_message_length,
+                    sum(input_tokens) as total_input_tokens,
+                    sum(output_tokens) as total_output_tokens,
+                    sum(cost_usd) as total_cost,
+                    countIf(contains_code_blocks) as messages_with_code,
+                    min(timestamp) as earliest_message,
+                    max(timestamp) as latest_message
+                FROM claude_message_content
+                WHERE timestamp >= now() - INTERVAL 30 DAY
+            """,
+            "files": """
+                SELECT
+                    count(*) as total_file_accesses,
+                    uniq(file_path) as unique_files,
+                    sum(file_size) as total_file_bytes,
+                    avg(file_size) as avg_file_size,
+                    avg(line_count) as avg_line_count,
+                    countIf(contains_secrets) as files_with_secrets,
+                    countIf(contains_imports) as files_with_imports
+                FROM claude_file_content
+                WHERE timestamp >= now() - INTERVAL 30 DAY
+            """,
+            "tools": """
+                SELECT
+                    count(*) as total_tool_executions,
+                    uniq(tool_name) as unique_tools,
+                    countIf(success) as successful_executions,
+                    round(countIf(success) * 100.0 / max(count(*), 1), 2) as success_rate,
+                    sum(output_size) as total_output_bytes
+                FROM claude_tool_results
+                WHERE timestamp >= now() - INTERVAL 30 DAY
+            """,
+        }
+        try:
+            stats = {}
+            for key, query in queries.items():
+                results = await self.execute_query(query)
+                stats[key] = results[0] if results else {}
+            return stats
+        except sqlite3.Error as e:
+            logger.error(f"Error getting JSONL content stats: {e}")
+            return {}
+
+    async def health_check(self) -> bool:
+        """Check that the database can be opened and queried."""
+        try:
+            await self.execute_query("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    async def comprehensive_health_check(self) -> Dict[str, Any]:
+        """Health details in the shape returned by ``ClickHouseClient``."""
+        start_time = time.time()
+        health_results: Dict[str, Any] = {
+            "overall_healthy": False,
+            "connection_status": "unknown",
+            "database_accessible": False,
+            "response_time_ms": 0.0,
+            "error_message": None,
+            "metrics": {"backend": "sqlite", "db_path": self.db_path},
+            "timestamp": datetime.now().isoformat(),
+        }
+        try:
+            tables = await self.execute_query(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+            health_results.update(
+                {
+                    "overall_healthy": True,
+                    "connection_status": "healthy",
+                    "database_accessible": True,
+                    "tables_found": len(tables),
+                }
+            )
+        except sqlite3.Error as e:
+            health_results["connection_status"] = "failed"
+            health_results["error_message"] = str(e)
+        health_results["response_time_ms"] = (time.time() - start_time) * 1000
+        return health_results
+
+
+class FallbackTelemetryClient(TelemetryClient):
+    """Route telemetry reads and writes to ClickHouse or the SQLite store.
+
+    ClickHouse is used while it is healthy and the local SQLite store
+    otherwise. The choice is re-checked when a call is made, at most every
+    ``recheck_seconds``, so a long-running dashboard or watcher follows
+    ClickHouse going down or coming back. Ingestion goes through the same
+    routing, so rows land in the store the dashboards are reading.
+
+    Attributes this class does not route (ClickHouse-only helpers such as
+    ``execute_dashboard_query``) are looked up on the current backend.
+    """
+
+    RECHECK_SECONDS = 30.0
+
+    def __init__(
+        self,
+        clickhouse_client: Optional[ClickHouseClient] = None,
+        db_path: Union[str, Path, None] = None,
+        recheck_seconds: float = RECHECK_SECONDS,
+    ):
+        self.clickhouse = clickhouse_client or ClickHouseClient()
+        self.sqlite = SQLiteTelemetryClient(db_path)
+        self.recheck_seconds = recheck_seconds
+        self._active: Optional[TelemetryClient] = None
+        self._checked_at = 0.0
+
+    @property
+    def active_client(self) -> TelemetryClient:
+        """The backend chosen by the last health check (ClickHouse if unchecked)."""
+        return self._active or self.clickhouse
+
+    def _use(self, healthy: bool) -> TelemetryClient:
+        selected = self.clickhouse if healthy else self.sqlite
+        if selected is not self._active:
+            if healthy:
+                logger.info("ClickHouse is reachable; using it for telemetry")
+            else:
+                logger.warning(
+                    "ClickHouse is not reachable; using local telemetry store "
+                    f"{self.sqlite.db_path}"
+                )
+        self._active = selected
+        self._checked_at = time.monotonic()
+        return selected
+
+    async def _backend(self) -> TelemetryClient:
+        if (
+            self._active is not None
+            and time.monotonic() - self._checked_at < self.recheck_seconds
+        ):
+            return self._active
+        # Claim the check so concurrent callers keep the current backend
+        self._checked_at = time.monotonic()
+        try:
+            healthy = await self.clickhouse.health_check()
+        except Exception as e:
+            logger.warning(f"ClickHouse health check failed: {e}")
+            healthy = False
+        return self._use(healthy)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the instance or class
+        if name in ("clickhouse", "sqlite", "_active"):
+            raise AttributeError(name)
+        return getattr(self.active_client, name)
+
+    async def initialize(self, skip_health_check: bool = False) -> bool:
+        return await (await self._backend()).initialize(
+            skip_health_check=skip_health_check
+        )
+
+    async def close(self):
+        await self.clickhouse.close()
+        await self.sqlite.close()
+
+    async def execute_query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        return await (await self._backend()).execute_query(query, params)
+
+    async def execute_command(self, query: str, *args, **kwargs) -> Any:
+        return await (await self._backend()).execute_command(query, *args, **kwargs)
+
+    async def bulk_insert(self, table_name: str, records: List[Dict[str, Any]]) -> bool:
+        return await (await self._backend()).bulk_insert(table_name, records)
+
+    async def get_session_metrics(self, session_id: str) -> Optional[SessionMetrics]:
+        return await (await self._backend()).get_session_metrics(session_id)
+
+    async def get_recent_errors(self, hours: int = 24) -> List[ErrorEvent]:
+        return await (await self._backend()).get_recent_errors(hours)
+
+    async def get_cost_trends(self, days: int = 7) -> Dict[str, float]:
+        return await (await self._backend()).get_cost_trends(days)
+
+    async def get_current_session_cost(self, session_id: str) -> float:
+        return await (await self._backend()).get_current_session_cost(session_id)
+
+    async def get_model_usage_stats(self, days: int = 7) -> Dict[str, Dict[str, Any]]:
+        return await (await self._backend()).get_model_usage_stats(days)
+
+    async def get_total_aggregated_stats(self) -> Dict[str, Any]:
+        return await (await self._backend()).get_total_aggregated_stats()
+
+    async def get_model_token_stats(
+        self, time_range_days: int = 7
+    ) -> Dict[str, Dict[str, Any]]:
+        return await (await self._backend()).get_model_token_stats(time_range_days)
+
+    async def get_jsonl_content_stats(self) -> Dict[str, Any]:
+        return await (await self._backend()).get_jsonl_content_stats()
+
+    async def health_check(self) -> bool:
+        return await (await self._backend()).health_check()
+
+    async def comprehensive_health_check(self) -> Dict[str, Any]:
+        return await (await self._backend()).comprehensive_health_check()
+
+
+def _answers_ping(client: ClickHouseClient, timeout: float = 2.0) -> bool:
+    try:
+        with urllib_request.urlopen(f"{client.http_url}/ping", timeout=timeout) as r:
+            return r.status == 200
+    except (OSError, ValueError):
+        return False
+
+
+def _run_health_check(client: ClickHouseClient) -> bool:
+    check = client.health_check()
+    try:
+        return asyncio.run(check)
+    finally:
+        # Not awaited if asyncio.run refuses to start
+        check.close()
+
+
+def select_telemetry_client(
+    clickhouse_client: Optional[ClickHouseClient] = None,
+    db_path: Union[str, Path, None] = None,
+) -> FallbackTelemetryClient:
+    """Return a client that uses ClickHouse when healthy, else a SQLite store.
+
+    The first check runs here: ClickHouse's HTTP ping is tried first and,
+    failing that, the client's own health check (which also tries
+    ``docker exec``) runs on a separate event loop in a worker thread, so
+    this can be called from synchronous setup code whether or not a loop is
+    already running. Later calls re-check as described on
+    ``FallbackTelemetryClient``.
+    """
+    client = FallbackTelemetryClient(clickhouse_client, db_path)
+    healthy = _answers_ping(client.clickhouse)
+    if not healthy:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            try:
+                healthy = pool.submit(_run_health_check, client.clickhouse).result()
+            except Exception as e:
+                logger.warning(f"ClickHouse health check failed: {e}")
+    client._use(healthy)
+    return client
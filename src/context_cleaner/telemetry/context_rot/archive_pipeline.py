@@ -0,0 +1,367 @@
+"""
+Streaming Archive Pipeline for Context Rot Meter.
+
+Archives expired ClickHouse rows to compressed local JSONL files without
+holding a whole category in memory. Rows are pulled in timestamp order with
+keyset pagination, written to rotating archive files, and each completed file
+is recorded in a manifest together with the pagination cursor, so an
+interrupted run resumes where it stopped.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class ArchiveManifest:
+    """Progress and contents of one archive run for a table"""
+
+    table: str
+    timestamp_column: str
+    cutoff: str
+    compression: str
+    # Rows with timestamps after this value are still to be archived
+    start_after: Optional[str] = None
+    last_key: Optional[str] = None
+    total_rows: int = 0
+    completed: bool = False
+    files: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    updated_at: Optional[str] = None
+
+    @property
+    def cursor(self) -> Optional[str]:
+        return self.last_key or self.start_after
+
+    @classmethod
+    def load(cls, path: Path) -> "ArchiveManifest":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+    def save(self, path: Path):
+        self.updated_at = datetime.now().isoformat()
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+class _HashingWriter:
+    """File wrapper that tracks the size and checksum of what is written"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.bytes_written += len(data)
+        return self._fileobj.write(data)
+
+    def flush(self):
+        self._fileobj.flush()
+
+
+class _ArchiveFile:
+    """One compressed JSONL archive file being written"""
+
+    def __init__(self, path: Path, compression: str):
+        self.path = path
+        self.rows = 0
+        self.first_key: Optional[str] = None
+        self.last_key: Optional[str] = None
+        self._raw = open(path, "wb")
+        self._hashing = _HashingWriter(self._raw)
+        if compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(
+                self._hashing, closefd=False
+            )
+        else:
+            self._stream = gzip.GzipFile(fileobj=self._hashing, mode="wb")
+
+    def write_rows(self, rows: List[Dict[str, Any]], timestamp_column: str):
+        for row in rows:
+            self._stream.write(
+                (json.dumps(row, default=str, separators=(",", ":")) + "\n").encode(
+                    "utf-8"
+                )
+            )
+        self.rows += len(rows)
+        if self.first_key is None:
+            self.first_key = str(rows[0][timestamp_column])
+        self.last_key = str(rows[-1][timestamp_column])
+
+    def close(self) -> Dict[str, Any]:
+        self._stream.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        return {
+            "name": self.path.name,
+            "rows": self.rows,
+            "bytes": self._hashing.bytes_written,
+            "sha256": self._hashing.sha256.hexdigest(),
+            "first_key": self.first_key,
+            "last_key": self.last_key,
+        }
+
+    def discard(self):
+        try:
+            self._stream.close()
+        finally:
+            self._raw.close()
+            self.path.unlink(missing_ok=True)
+
+
+class StreamingArchiver:
+    """
+    Archives rows older than a cutoff from ClickHouse to local files.
+
+    Memory use is bounded by ``chunk_rows``; ``rows_per_file`` controls how
+    much work a crash can lose, since progress is committed per file.
+    """
+
+    def __init__(
+        self,
+        clickhouse_client,
+        archive_dir: Path,
+        chunk_rows: int = 10000,
+        rows_per_file: int = 200000,
+        compression: Optional[str] = None,
+    ):
+        self.clickhouse_client = clickhouse_client
+        self.archive_dir = Path(archive_dir)
+        self.chunk_rows = chunk_rows
+        self.rows_per_file = rows_per_file
+        self.compression = compression or ("zstd" if HAS_ZSTD else "gzip")
+        if self.compression == "zstd" and not HAS_ZSTD:
+            raise ValueError("zstd compression requires the zstandard package")
+
+    def _table_dir(self, table: str) -> Path:
+        return self.archive_dir / table.replace(".", "_")
+
+    def _run_dirs(self, table: str) -> List[Path]:
+        table_dir = self._table_dir(table)
+        if not table_dir.exists():
+            return []
+        return sorted(
+            run
+            for run in table_dir.iterdir()
+            if run.is_dir() and (run / MANIFEST_NAME).exists()
+        )
+
+    def _latest_manifest(self, table: str) -> Optional[ArchiveManifest]:
+        runs = self._run_dirs(table)
+        if not runs:
+            return None
+        return ArchiveManifest.load(runs[-1] / MANIFEST_NAME)
+
+    def _run_dir(self, manifest: ArchiveManifest) -> Path:
+        cutoff = datetime.fromisoformat(manifest.cutoff)
+        return self._table_dir(manifest.table) / cutoff.strftime("%Y%m%dT%H%M%S")
+
+    def _start_run(
+        self, table: str, timestamp_column: str, cutoff: datetime
+    ) -> ArchiveManifest:
+        previous = self._latest_manifest(table)
+        if previous is not None and not previous.completed:
+            logger.info(
+                f"Resuming archive of {table} up to {previous.cutoff} "
+                f"after {previous.cursor}"
+            )
+            return previous
+        if previous is not None and datetime.fromisoformat(previous.cutoff) >= cutoff:
+            # Everything before this cutoff has been archived already
+            return previous
+
+        manifest = ArchiveManifest(
+            table=table,
+            timestamp_column=timestamp_column,
+            cutoff=cutoff.isoformat(),
+            compression=self.compression,
+            # Rows up to the previous run's cursor are already archived
+            start_after=previous.cursor if previous else None,
+        )
+        run_dir = self._run_dir(manifest)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        manifest.save(run_dir / MANIFEST_NAME)
+        return manifest
+
+    @staticmethod
+    def _literal(value: str) -> str:
+        return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+    def _key_range_filter(self, column: str, after: Optional[str], through: str) -> str:
+        condition = f"{column} <= {self._literal(through)}"
+        if after:
+            condition = f"{column} > {self._literal(after)} AND {condition}"
+        return condition
+
+    def _range_filter(self, manifest: ArchiveManifest, after: Optional[str]) -> str:
+        cutoff = datetime.fromisoformat(manifest.cutoff)
+        column = manifest.timestamp_column
+        condition = f"{column} < '{cutoff.strftime('%Y-%m-%d %H:%M:%S')}'"
+        if after:
+            condition += f" AND {column} > {self._literal(after)}"
+        return condition
+
+    async def _fetch_chunk(
+        self, manifest: ArchiveManifest, after: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        # WITH TIES keeps rows sharing the last timestamp in the same chunk,
+        # so paginating on "timestamp > last key" never skips a row
+        query = f"""
+        SELECT *
+        FROM {manifest.table}
+        WHERE {self._range_filter(manifest, after)}
+        ORDER BY {manifest.timestamp_column}
+        LIMIT {self.chunk_rows} WITH TIES
+        """
+        return await self.clickhouse_client.execute_query(query)
+
+    async def _remaining_rows(self, manifest: ArchiveManifest) -> Optional[int]:
+        query = f"""
+        SELECT count() as count
+        FROM {manifest.table}
+        WHERE {self._range_filter(manifest, manifest.cursor)}
+        """
+        result = await self.clickhouse_client.execute_query(query)
+        return int(result[0]["count"]) if result else None
+
+    async def _run(self, manifest: ArchiveManifest) -> ArchiveManifest:
+        run_dir = self._run_dir(manifest)
+        manifest_path = run_dir / MANIFEST_NAME
+
+        # Drop files a crash left behind before they reached the manifest
+        recorded = {entry["name"] for entry in manifest.files} | {MANIFEST_NAME}
+        for leftover in run_dir.iterdir():
+            if leftover.name not in recorded:
+                leftover.unlink()
+
+        extension = "jsonl.zst" if manifest.compression == "zstd" else "jsonl.gz"
+        current: Optional[_ArchiveFile] = None
+        # Pagination runs ahead of the manifest, which only advances once a
+        # file is closed, so a crash resumes from the last committed file
+        cursor = manifest.cursor
+        try:
+            while True:
+                rows = await self._fetch_chunk(manifest, cursor)
+                if rows:
+                    if current is None:
+                        name = f"part-{len(manifest.files):05d}.{extension}"
+                        current = _ArchiveFile(run_dir / name, manifest.compression)
+                    current.write_rows(rows, manifest.timestamp_column)
+                    cursor = current.last_key
+
+                exhausted = len(rows) < self.chunk_rows
+                if current is not None and (
+                    exhausted or current.rows >= self.rows_per_file
+                ):
+                    manifest.files.append(current.close())
+                    manifest.total_rows += current.rows
+                    manifest.last_key = current.last_key
+                    manifest.save(manifest_path)
+                    current = None
+
+                if exhausted:
+                    break
+        finally:
+            if current is not None:
+                current.discard()
+
+        remaining = await self._remaining_rows(manifest)
+        if remaining == 0:
+            manifest.completed = True
+            manifest.save(manifest_path)
+            logger.info(
+                f"Archived {manifest.total_rows} rows from {manifest.table} "
+                f"into {len(manifest.files)} files under {run_dir}"
+            )
+        else:
+            logger.warning(
+                f"Archive of {manifest.table} incomplete "
+                f"({remaining if remaining is not None else 'unknown'} rows "
+                "remaining); it will resume on the next run"
+            )
+        return manifest
+
+    async def archive(
+        self, table: str, timestamp_column: str, cutoff: datetime
+    ) -> ArchiveManifest:
+        """
+        Archive rows older than ``cutoff``, resuming an unfinished run first.
+
+        The returned manifest is only marked completed once ClickHouse
+        confirms no rows remain before its cutoff. Rows may still arrive
+        later with older timestamps, so use ``purge_archived`` rather than
+        deleting everything up to ``manifest.cutoff``.
+        """
+        manifest = self._start_run(table, timestamp_column, cutoff)
+        if not manifest.completed:
+            manifest = await self._run(manifest)
+        if manifest.completed and datetime.fromisoformat(manifest.cutoff) < cutoff:
+            # A resumed run stops at its own cutoff; continue up to this one
+            manifest = await self._run(self._start_run(table, timestamp_column, cutoff))
+        return manifest
+
+    async def purge_archived(self, table: str) -> int:
+        """
+        Delete rows of ``table`` that are confirmed to be in the archive.
+
+        Each archive file covers the keys after the previous file's last key
+        up to its own last key. A file's range is only deleted while
+        ClickHouse holds exactly as many rows in it as the file; rows that
+        arrived late with older timestamps make the counts differ, and the
+        range is then kept rather than losing them. Returns the number of
+        rows deleted.
+        """
+        execute = self.clickhouse_client.execute_command
+        deleted = 0
+        for run_dir in self._run_dirs(table):
+            manifest_path = run_dir / MANIFEST_NAME
+            manifest = ArchiveManifest.load(manifest_path)
+            column = manifest.timestamp_column
+            after = manifest.start_after
+            for entry in manifest.files:
+                condition = self._key_range_filter(column, after, entry["last_key"])
+                after = entry["last_key"]
+                if entry.get("purged"):
+                    continue
+
+                result = await execute(
+                    f"SELECT count() as count FROM {table} WHERE {condition}"
+                )
+                in_table = int(result[0]["count"])
+                if in_table and in_table != entry["rows"]:
+                    logger.warning(
+                        f"Not purging {table} rows in {entry['name']}: "
+                        f"{in_table} rows in range, {entry['rows']} archived"
+                    )
+                    continue
+                if in_table:
+                    await execute(f"DELETE FROM {table} WHERE {condition}")
+                    deleted += in_table
+                entry["purged"] = True
+                manifest.save(manifest_path)
+        return deleted
@@ -157,6 +157,8 @@ class DashboardWebConfig:
     cache_duration: int = 300
     max_concurrent_users: int = 10
     auto_open_browser: bool = True
+    # Run the cache dashboard's session analyzers in worker processes
+    analysis_process_pool: bool = False
 
 
 @dataclass
@@ -432,6 +434,10 @@ class ApplicationConfig:
         config.dashboard.auto_open_browser = (
             os.getenv("CONTEXT_CLEANER_AUTO_BROWSER", "true").lower() == "true"
         )
+        config.dashboard.analysis_process_pool = (
+            os.getenv("CONTEXT_CLEANER_ANALYSIS_PROCESS_POOL", "false").lower()
+            == "true"
+        )
 
         # Privacy configuration
         config.privacy.local_only = (
@@ -645,6 +651,7 @@ class ApplicationConfig:
             "dashboard.auto_refresh": self.dashboard.auto_refresh,
             "dashboard.cache_duration": self.dashboard.cache_duration,
             "dashboard.max_concurrent_users": self.dashboard.max_concurrent_users,
+            "dashboard.analysis_process_pool": self.dashboard.analysis_process_pool,
             "tracking.enabled": self.tracking.enabled,
             "tracking.sampling_rate": self.tracking.sampling_rate,
             "tracking.session_timeout_minutes": self.tracking.session_timeout_minutes,
@@ -677,6 +684,7 @@ class ApplicationConfig:
                 "auto_refresh": self.dashboard.auto_refresh,
                 "cache_duration": self.dashboard.cache_duration,
                 "max_concurrent_users": self.dashboard.max_concurrent_users,
+                "analysis_process_pool": self.dashboard.analysis_process_pool,
             },
             "tracking": {
                 "enabled": self.tracking.enabled,
@@ -778,6 +786,10 @@ class ApplicationConfig:
                 config.dashboard.max_concurrent_users = dashboard_data[
                     "max_concurrent_users"
                 ]
+            if "analysis_process_pool" in dashboard_data:
+                config.dashboard.analysis_process_pool = dashboard_data[
+                    "analysis_process_pool"
+                ]
 
         if "tracking" in data:
             tracking_data = data["tracking"]
@@ -8,13 +8,16 @@ GDPR compliance, privacy protection, and efficient storage management.
 import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
 import json
+from pathlib import Path
 
+from .archive_pipeline import StreamingArchiver
 from .health_monitor import get_health_monitor, HealthStatus
+from .retention_engine import PartitionRetentionEngine, RetentionPlan
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +48,9 @@ class RetentionRule:
     category: DataCategory
     policy: RetentionPolicy
     retention_days: int
-    archive_days: Optional[int]  # Days before archiving (if supported)
-    anonymize_after_days: Optional[int]  # Days before anonymization
     hard_delete_days: int  # Days before permanent deletion
+    archive_days: Optional[int] = None  # Days before archiving (if supported)
+    anonymize_after_days: Optional[int] = None  # Days before anonymization
     requires_user_consent: bool = False
     description: str = ""
 
@@ -64,6 +67,7 @@ class CleanupResult:
     storage_freed_mb: float
     execution_time_seconds: float
     errors: List[str]
+    partitions_dropped: int = 0
 
 
 class DataRetentionManager:
@@ -73,8 +77,14 @@ class DataRetentionManager:
         self,
         clickhouse_client,
         default_policy: RetentionPolicy = RetentionPolicy.PRIVACY_FOCUSED,
+        archive_dir: Optional[Path] = None,
     ):
         self.clickhouse_client = clickhouse_client
+        self.retention_engine = PartitionRetentionEngine(clickhouse_client)
+        self.archiver = StreamingArchiver(
+            clickhouse_client,
+            archive_dir or Path.home() / ".context_cleaner" / "archives",
+        )
         self.default_policy = default_policy
         self.retention_rules = self._initialize_retention_rules()
         self.health_monitor = get_health_monitor()
@@ -389,11 +399,13 @@ class DataRetentionManager:
                 result.records_archived = archive_count
 
             # Step 3: Delete data past hard delete threshold
-            delete_count, storage_freed = await self._delete_old_data(
+            plan = await self._delete_old_data(
                 table_config, rule.hard_delete_days, dry_run
             )
-            result.records_deleted = delete_count
-            result.storage_freed_mb = storage_freed
+            result.records_deleted = plan.rows_to_delete
+            result.storage_freed_mb = plan.storage_freed_mb
+            result.partitions_dropped = len(plan.expired_partitions)
+            result.errors.extend(plan.errors)
 
             # Step 4: Count total processed
             total_count = await self._count_category_records(table_config)
@@ -449,45 +461,22 @@ class DataRetentionManager:
         """Anonymize data older than specified days."""
         cutoff_date = datetime.now() - timedelta(days=days_old)
         table = table_config["table"]
-        timestamp_col = table_config["timestamp_column"]
 
-        # Count records to anonymize
-        count_query = f"""
-        SELECT COUNT(*) as count
-        FROM {table}
-        WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-        """
-
-        count_result = await self.clickhouse_client.execute_query(count_query)
-        record_count = count_result[0]["count"] if count_result else 0
+        # Rewrites expired partitions with INSERT ... SELECT instead of
+        # mutating every row, and skips rows anonymized by earlier runs
+        record_count = await self.retention_engine.anonymize(
+            table,
+            table_config["timestamp_column"],
+            cutoff_date,
+            pii_columns=table_config.get("pii_columns", []),
+            anonymize_columns=table_config.get("anonymize_columns", []),
+            dry_run=dry_run,
+        )
 
-        if record_count == 0 or dry_run:
+        if dry_run:
             logger.info(
                 f"Would anonymize {record_count} records in {table} (dry_run={dry_run})"
             )
-            return record_count
-
-        # Anonymize PII columns
-        pii_columns = table_config.get("pii_columns", [])
-        anonymize_columns = table_config.get("anonymize_columns", [])
-
-        updates = []
-        for col in pii_columns:
-            updates.append(f"{col} = '[ANONYMIZED]'")
-
-        for col in anonymize_columns:
-            updates.append(f"{col} = concat('anon_', cityHash64({col}))")
-
-        if updates:
-            anonymize_query = f"""
-            ALTER TABLE {table} 
-            UPDATE {', '.join(updates)}
-            WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-            """
-
-            await self.clickhouse_client.execute_query(anonymize_query)
-            logger.info(f"Anonymized {record_count} records in {table}")
-
         return record_count
 
     async def _archive_old_data(
@@ -497,101 +486,65 @@ class DataRetentionManager:
         cutoff_date = datetime.now() - timedelta(days=days_old)
         table = table_config["table"]
         timestamp_col = table_config["timestamp_column"]
-        archive_table = f"{table}_archive"
 
-        # Count records to archive
-        count_query = f"""
-        SELECT COUNT(*) as count
-        FROM {table}
-        WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-        """
-
-        count_result = await self.clickhouse_client.execute_query(count_query)
-        record_count = count_result[0]["count"] if count_result else 0
-
-        if record_count == 0 or dry_run:
+        if dry_run:
+            count_query = f"""
+            SELECT COUNT(*) as count
+            FROM {table}
+            WHERE {timestamp_col} < '{cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}'
+            """
+            count_result = await self.clickhouse_client.execute_query(count_query)
+            record_count = int(count_result[0]["count"]) if count_result else 0
             logger.info(
                 f"Would archive {record_count} records from {table} (dry_run={dry_run})"
             )
             return record_count
 
-        # Create archive table if it doesn't exist (copy structure)
-        create_archive_query = f"""
-        CREATE TABLE IF NOT EXISTS {archive_table} AS {table} ENGINE = MergeTree()
-        ORDER BY {timestamp_col}
-        """
-
-        await self.clickhouse_client.execute_query(create_archive_query)
+        # Streams rows to compressed files in bounded chunks; an interrupted
+        # run resumes from its manifest on the next cleanup
+        manifest = await self.archiver.archive(table, timestamp_col, cutoff_date)
 
-        # Insert into archive
-        archive_query = f"""
-        INSERT INTO {archive_table}
-        SELECT * FROM {table}
-        WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-        """
-
-        await self.clickhouse_client.execute_query(archive_query)
-
-        # Delete from main table
-        delete_query = f"""
-        ALTER TABLE {table} 
-        DELETE WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-        """
-
-        await self.clickhouse_client.execute_query(delete_query)
-
-        logger.info(f"Archived {record_count} records from {table} to {archive_table}")
-        return record_count
+        # Only key ranges whose rows all made it into an archive file are
+        # removed from the main table, so late-arriving rows are kept
+        purged = await self.archiver.purge_archived(table)
+        if manifest.completed:
+            logger.info(
+                f"Archived {manifest.total_rows} records from {table} "
+                f"to {self.archiver.archive_dir}, purged {purged}"
+            )
+        return manifest.total_rows
 
     async def _delete_old_data(
         self, table_config: Dict[str, Any], days_old: int, dry_run: bool
-    ) -> Tuple[int, float]:
+    ) -> RetentionPlan:
         """Delete data older than specified days."""
         cutoff_date = datetime.now() - timedelta(days=days_old)
         table = table_config["table"]
         timestamp_col = table_config["timestamp_column"]
 
-        # Count records and estimate storage before deletion
-        count_query = f"""
-        SELECT 
-            COUNT(*) as count,
-            sum(length(toString(*))) as estimated_bytes
-        FROM {table}
-        WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-        """
-
-        count_result = await self.clickhouse_client.execute_query(count_query)
-        if not count_result:
-            return 0, 0.0
-
-        record_count = count_result[0]["count"]
-        estimated_bytes = count_result[0].get("estimated_bytes", 0)
-        storage_freed_mb = estimated_bytes / (1024 * 1024) if estimated_bytes else 0
+        # Whole expired partitions are dropped; only partitions straddling
+        # the cutoff need row-level deletes
+        plan = await self.retention_engine.purge(
+            table, timestamp_col, cutoff_date, dry_run=dry_run
+        )
 
-        if record_count == 0 or dry_run:
+        if dry_run:
             logger.info(
-                f"Would delete {record_count} records from {table}, freeing ~{storage_freed_mb:.2f}MB (dry_run={dry_run})"
+                f"Would delete {plan.rows_to_delete} records from {table} "
+                f"({len(plan.expired_partitions)} whole partitions), "
+                f"freeing ~{plan.storage_freed_mb:.2f}MB (dry_run={dry_run})"
             )
-            return record_count, storage_freed_mb
-
-        # Delete old records
-        delete_query = f"""
-        ALTER TABLE {table} 
-        DELETE WHERE {timestamp_col} < '{cutoff_date.isoformat()}'
-        """
-
-        await self.clickhouse_client.execute_query(delete_query)
-
-        logger.info(
-            f"Deleted {record_count} records from {table}, freed ~{storage_freed_mb:.2f}MB"
-        )
-        return record_count, storage_freed_mb
+        return plan
 
     async def _count_category_records(self, table_config: Dict[str, Any]) -> int:
         """Count total records in category table."""
         table = table_config["table"]
 
         try:
+            storage = await self.retention_engine.get_table_storage(table)
+            if storage is not None:
+                return storage[0]
+
             count_query = f"SELECT COUNT(*) as count FROM {table}"
             result = await self.clickhouse_client.execute_query(count_query)
             return result[0]["count"] if result else 0
@@ -623,22 +576,26 @@ class DataRetentionManager:
 
             if table_config:
                 try:
-                    # Get category statistics
+                    # Get category statistics; sizes come from part metadata
                     stats_query = f"""
                     SELECT 
                         COUNT(*) as count,
                         min({table_config['timestamp_column']}) as oldest,
-                        max({table_config['timestamp_column']}) as newest,
-                        sum(length(toString(*))) as estimated_bytes
+                        max({table_config['timestamp_column']}) as newest
                     FROM {table_config['table']}
                     """
 
                     stats_result = await self.clickhouse_client.execute_query(
                         stats_query
                     )
+                    storage = await self.retention_engine.get_table_storage(
+                        table_config["table"]
+                    )
 
                     if stats_result:
                         stats = stats_result[0]
+                        if storage is not None:
+                            stats["count"], stats["estimated_bytes"] = storage
                         category_stats = {
                             "retention_days": rule.retention_days,
                             "hard_delete_days": rule.hard_delete_days,
@@ -16,7 +16,9 @@ import logging
 import json
 import psutil
 import threading
-from collections import deque, defaultdict
+from collections import defaultdict
+
+from .metric_store import MetricSeries, TimeBucketedMetricStore
 
 logger = logging.getLogger(__name__)
 
@@ -93,18 +95,35 @@ class Alert:
 class MetricCollector:
     """Collects and aggregates system metrics."""
 
+    # Quantiles reported for timer and histogram summaries
+    SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
     def __init__(self, max_history: int = 1000):
+        # Samples are aggregated into per-second buckets, so max_history
+        # bounds the number of active seconds kept per metric series
         self.max_history = max_history
-        self.metrics_history = deque(maxlen=max_history)
+        self.store = TimeBucketedMetricStore(max_buckets=max_history)
         self.current_metrics = {}
         self._lock = threading.Lock()
         self._start_time = time.time()
 
+    @staticmethod
+    def _series_key(name: str, labels: Dict[str, str]) -> str:
+        return f"{name}:{json.dumps(labels, sort_keys=True)}"
+
     def record_metric(self, metric: HealthMetric) -> None:
         """Record a new metric."""
+        key = self._series_key(metric.name, metric.labels)
         with self._lock:
-            self.metrics_history.append(metric)
-            key = f"{metric.name}:{json.dumps(metric.labels, sort_keys=True)}"
+            self.store.add(
+                (metric.name, key),
+                metric.labels,
+                metric.value,
+                metric.timestamp.timestamp(),
+                sample=metric,
+                track_quantiles=metric.metric_type
+                in (MetricType.TIMER, MetricType.HISTOGRAM),
+            )
             self.current_metrics[key] = metric
 
     def increment_counter(
@@ -158,36 +177,45 @@ class MetricCollector:
         self, name: str, time_window_minutes: int = 5
     ) -> Dict[str, Any]:
         """Get summary statistics for a metric."""
-        cutoff_time = datetime.now() - timedelta(minutes=time_window_minutes)
+        since = time.time() - time_window_minutes * 60
 
-        relevant_metrics = [
-            m
-            for m in self.metrics_history
-            if m.name == name and m.timestamp >= cutoff_time
-        ]
+        with self._lock:
+            summary = self.store.summarize(
+                name, since, quantiles=self.SUMMARY_QUANTILES
+            )
+            series = self.store.series_for(name)
+            metric_type = series[0].latest.metric_type if series else None
 
-        if not relevant_metrics:
+        if summary["count"] == 0:
             return {"count": 0, "latest": None}
 
-        values = [m.value for m in relevant_metrics]
-
-        return {
-            "count": len(values),
-            "latest": relevant_metrics[-1].value,
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-            "total": (
-                sum(values)
-                if relevant_metrics[0].metric_type == MetricType.COUNTER
-                else None
-            ),
+        result = {
+            "count": summary["count"],
+            "latest": summary["latest"],
+            "min": summary["min"],
+            "max": summary["max"],
+            "avg": summary["total"] / summary["count"],
+            "total": summary["total"] if metric_type == MetricType.COUNTER else None,
         }
+        for q, value in summary.get("quantiles", {}).items():
+            result[f"p{int(q * 100)}"] = value
+        return result
 
     def get_recent_metrics(self, minutes: int = 5) -> List[HealthMetric]:
-        """Get metrics from the last N minutes."""
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        return [m for m in self.metrics_history if m.timestamp >= cutoff_time]
+        """Get the latest value of each metric series updated in the last N minutes."""
+        with self._lock:
+            return self.store.recent(time.time() - minutes * 60)
+
+    def get_series_by_name(self) -> Dict[str, List[MetricSeries]]:
+        """Get every metric series grouped by metric name."""
+        with self._lock:
+            names = sorted({name for name, _ in self.store.series})
+            return {name: self.store.series_for(name) for name in names}
+
+    def prune(self, older_than: datetime) -> int:
+        """Drop aggregated samples older than a cutoff; returns samples removed."""
+        with self._lock:
+            return self.store.prune(older_than.timestamp())
 
     def get_uptime_seconds(self) -> float:
         """Get system uptime in seconds."""
@@ -633,18 +661,41 @@ class ContextRotHealthMonitor:
         """Export metrics in Prometheus format."""
         lines = []
 
-        for metric in self.metric_collector.get_recent_metrics(minutes=60):
-            labels = ",".join(f'{k}="{v}"' for k, v in metric.labels.items())
-            labels_str = f"{{{labels}}}" if labels else ""
-
-            lines.append(f"# HELP {metric.name} {metric.description}")
-            lines.append(f"# TYPE {metric.name} {metric.metric_type.value}")
-            lines.append(
-                f"{metric.name}{labels_str} {metric.value} {int(metric.timestamp.timestamp() * 1000)}"
-            )
+        for name, series_list in self.metric_collector.get_series_by_name().items():
+            latest = series_list[0].latest
+            summarized = latest.metric_type in (MetricType.TIMER, MetricType.HISTOGRAM)
+            metric_type = "summary" if summarized else latest.metric_type.value
+
+            lines.append(f"# HELP {name} {latest.description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+            for series in series_list:
+                metric = series.latest
+                timestamp_ms = int(metric.timestamp.timestamp() * 1000)
+                if not summarized:
+                    lines.append(
+                        f"{name}{self._prometheus_labels(series.labels)} "
+                        f"{metric.value} {timestamp_ms}"
+                    )
+                    continue
+
+                for q in MetricCollector.SUMMARY_QUANTILES:
+                    labels = self._prometheus_labels(
+                        {**series.labels, "quantile": str(q)}
+                    )
+                    lines.append(f"{name}{labels} {series.lifetime_sketch.quantile(q)}")
+                labels = self._prometheus_labels(series.labels)
+                lines.append(f"{name}_sum{labels} {series.lifetime_total}")
+                lines.append(f"{name}_count{labels} {series.lifetime_count}")
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _prometheus_labels(labels: Dict[str, str]) -> str:
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+
 
 # Global health monitor instance
 _health_monitor: Optional[ContextRotHealthMonitor] = None
@@ -0,0 +1,254 @@
+"""
+Time-bucketed Metric Store for Context Rot Meter.
+
+Keeps health metrics pre-aggregated instead of as a raw event log. Each
+metric series (name plus labels) owns a ring of per-second buckets holding
+count, sum, min, max and last value, and timers additionally carry a
+mergeable quantile sketch. Window summaries touch one bucket per active
+second in the window and exports touch one entry per series, so reads stay
+cheap no matter how many samples were recorded.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch over logarithmic bins (DDSketch style).
+
+    Any quantile is reported within ``relative_accuracy`` of a true sample
+    value, and sketches merge by adding bin counts, so per-second sketches
+    can be combined into a sketch for any window.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        # Values too small for a log bin (zero and negatives)
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of the bin in relative terms
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        self.count += count
+        if value <= 1e-9:
+            self.zero_count += count
+            return
+        index = self._index(value)
+        self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def merge(self, other: "QuantileSketch"):
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self):
+        # Fold the lowest bins together; high quantiles stay accurate
+        indexes = sorted(self.bins)
+        excess = indexes[: len(indexes) - self.max_bins + 1]
+        folded = sum(self.bins.pop(index) for index in excess)
+        self.bins[excess[-1]] = folded
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return self._value(index)
+        return self._value(max(self.bins))
+
+
+@dataclass
+class SecondBucket:
+    """Aggregated samples of one series within one second"""
+
+    second: int
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    last: float = 0.0
+    last_at: float = 0.0
+    sketch: Optional[QuantileSketch] = None
+
+    def add(self, value: float, timestamp: float):
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if timestamp >= self.last_at:
+            self.last = value
+            self.last_at = timestamp
+        if self.sketch is not None:
+            self.sketch.add(value)
+
+
+@dataclass
+class MetricSeries:
+    """Ring of per-second buckets for one metric name and label set"""
+
+    name: str
+    labels: Dict[str, str]
+    track_quantiles: bool
+    max_buckets: int
+    latest: Any = None
+    latest_at: float = 0.0
+    lifetime_count: int = 0
+    lifetime_total: float = 0.0
+    lifetime_sketch: Optional[QuantileSketch] = None
+    buckets: deque = field(default_factory=deque)
+
+    def __post_init__(self):
+        self.buckets = deque(maxlen=self.max_buckets)
+        if self.track_quantiles:
+            self.lifetime_sketch = QuantileSketch()
+
+    def add(self, value: float, timestamp: float, sample: Any):
+        second = int(timestamp)
+        bucket = self._bucket_for(second)
+        bucket.add(value, timestamp)
+        self.lifetime_count += 1
+        self.lifetime_total += value
+        if self.lifetime_sketch is not None:
+            self.lifetime_sketch.add(value)
+        if self.latest is None or timestamp >= self.latest_at:
+            self.latest = sample
+            self.latest_at = timestamp
+
+    def _bucket_for(self, second: int) -> SecondBucket:
+        if self.buckets and self.buckets[-1].second == second:
+            return self.buckets[-1]
+        if not self.buckets or self.buckets[-1].second < second:
+            bucket = SecondBucket(
+                second, sketch=QuantileSketch() if self.track_quantiles else None
+            )
+            self.buckets.append(bucket)
+            return bucket
+        # Late sample: fold it into the closest bucket not after it
+        for bucket in reversed(self.buckets):
+            if bucket.second <= second:
+                return bucket
+        return self.buckets[0]
+
+    def window(self, since: int) -> Iterator[SecondBucket]:
+        """Buckets at or after ``since``, newest first"""
+        for bucket in reversed(self.buckets):
+            if bucket.second < since:
+                break
+            yield bucket
+
+    def prune(self, before: int) -> int:
+        dropped = 0
+        while self.buckets and self.buckets[0].second < before:
+            dropped += self.buckets.popleft().count
+        return dropped
+
+
+class TimeBucketedMetricStore:
+    """Per-series second-bucket rings indexed by metric name"""
+
+    def __init__(self, max_buckets: int = 3600):
+        self.max_buckets = max_buckets
+        self.series: Dict[Tuple[str, str], MetricSeries] = {}
+        self._by_name: Dict[str, List[MetricSeries]] = {}
+
+    def add(
+        self,
+        key: Tuple[str, str],
+        labels: Dict[str, str],
+        value: float,
+        timestamp: float,
+        sample: Any = None,
+        track_quantiles: bool = False,
+    ) -> MetricSeries:
+        series = self.series.get(key)
+        if series is None:
+            series = MetricSeries(
+                name=key[0],
+                labels=dict(labels),
+                track_quantiles=track_quantiles,
+                max_buckets=self.max_buckets,
+            )
+            self.series[key] = series
+            self._by_name.setdefault(key[0], []).append(series)
+        series.add(value, timestamp, sample)
+        return series
+
+    def series_for(self, name: str) -> List[MetricSeries]:
+        return list(self._by_name.get(name, ()))
+
+    def summarize(
+        self, name: str, since: float, quantiles: Tuple[float, ...] = ()
+    ) -> Dict[str, Any]:
+        """Aggregate every series of ``name`` over buckets since ``since``"""
+        since_second = int(since)
+        count = 0
+        total = 0.0
+        minimum = math.inf
+        maximum = -math.inf
+        latest = None
+        latest_at = None
+        sketch = QuantileSketch() if quantiles else None
+
+        for series in self._by_name.get(name, ()):
+            for bucket in series.window(since_second):
+                count += bucket.count
+                total += bucket.total
+                minimum = min(minimum, bucket.minimum)
+                maximum = max(maximum, bucket.maximum)
+                if latest_at is None or bucket.last_at > latest_at:
+                    latest, latest_at = bucket.last, bucket.last_at
+                if sketch is not None and bucket.sketch is not None:
+                    sketch.merge(bucket.sketch)
+
+        summary = {
+            "count": count,
+            "latest": latest,
+            "min": minimum,
+            "max": maximum,
+            "total": total,
+        }
+        if sketch is not None and sketch.count:
+            summary["quantiles"] = {q: sketch.quantile(q) for q in quantiles}
+        return summary
+
+    def recent(self, since: float) -> List[Any]:
+        """Latest sample of every series updated since ``since``"""
+        since_second = int(since)
+        return [
+            series.latest
+            for series in self.series.values()
+            if series.buckets and series.buckets[-1].second >= since_second
+        ]
+
+    def prune(self, before: float) -> int:
+        """Drop buckets older than ``before``; returns samples removed"""
+        before_second = int(before)
+        return sum(series.prune(before_second) for series in self.series.values())
+
+    def sample_count(self) -> int:
+        return sum(
+            bucket.count for series in self.series.values() for bucket in series.buckets
+        )
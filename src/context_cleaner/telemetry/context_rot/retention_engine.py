@@ -0,0 +1,468 @@
+"""
+Partition-aware Retention Engine for Context Rot Meter.
+
+Removes expired rows from ClickHouse tables without heavyweight mutations:
+partitions that lie entirely before the cutoff are dropped (a metadata-only
+operation), partitions straddling the cutoff are left to the table TTL when
+one covers the cutoff and otherwise cleaned with a lightweight DELETE.
+Row counts and storage figures come from system.parts instead of scans.
+Anonymization likewise rewrites whole partitions set-wise instead of
+mutating every old row.
+"""
+
+import logging
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_UNSET_DATE = "1970-01-01"
+_UNSET_DATETIME = "1970-01-01 00:00:00"
+
+# Copying a whole partition can take far longer than an ordinary query
+REWRITE_TIMEOUT_SECONDS = 600
+
+
+def _format_datetime(value: datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value or str(value) == _UNSET_DATE:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if not value or str(value) == _UNSET_DATETIME:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _partition_range(
+    partition_key: str, value: str
+) -> Optional[Tuple[datetime, datetime]]:
+    """Time range [start, end) covered by a partition of a date-based key"""
+    value = value.strip("'")
+    try:
+        if partition_key.startswith("toYYYYMM("):
+            start = datetime.strptime(value, "%Y%m")
+            end = (start + timedelta(days=32)).replace(day=1)
+            return start, end
+        if partition_key.startswith("toYYYYMMDD("):
+            start = datetime.strptime(value, "%Y%m%d")
+            return start, start + timedelta(days=1)
+        if partition_key.startswith("toDate(") or re.fullmatch(r"\w+", partition_key):
+            start = datetime.strptime(value, "%Y-%m-%d")
+            return start, start + timedelta(days=1)
+    except ValueError:
+        pass
+    return None
+
+
+@dataclass
+class PartitionInfo:
+    """Active parts of one partition, aggregated from system.parts"""
+
+    partition_id: str
+    partition: str
+    rows: int
+    bytes_on_disk: int
+    # Oldest and newest possible row time; None if not time-partitioned
+    min_time: Optional[datetime] = None
+    max_time: Optional[datetime] = None
+
+    @property
+    def is_temporal(self) -> bool:
+        return self.min_time is not None and self.max_time is not None
+
+    def expired_before(self, cutoff: datetime) -> bool:
+        return self.is_temporal and self.max_time < cutoff
+
+    def straddles(self, cutoff: datetime) -> bool:
+        return self.is_temporal and self.min_time < cutoff <= self.max_time
+
+
+@dataclass
+class RetentionPlan:
+    """What removing rows older than ``cutoff`` from a table involves"""
+
+    table: str
+    cutoff: datetime
+    partition_aware: bool = False
+    expired_partitions: List[PartitionInfo] = field(default_factory=list)
+    partial_partitions: List[PartitionInfo] = field(default_factory=list)
+    partial_rows: int = 0
+    partial_bytes: int = 0
+    ttl_days: Optional[int] = None
+    # Statements that failed during purge(); their rows are not counted
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def expired_rows(self) -> int:
+        return sum(p.rows for p in self.expired_partitions)
+
+    @property
+    def expired_bytes(self) -> int:
+        return sum(p.bytes_on_disk for p in self.expired_partitions)
+
+    @property
+    def deferred_to_ttl(self) -> bool:
+        """Whether the table TTL already removes the partially expired rows"""
+        if self.ttl_days is None:
+            return False
+        return datetime.now() - timedelta(days=self.ttl_days) >= self.cutoff
+
+    @property
+    def rows_to_delete(self) -> int:
+        partial = 0 if self.deferred_to_ttl else self.partial_rows
+        return self.expired_rows + partial
+
+    @property
+    def storage_freed_mb(self) -> float:
+        partial = 0 if self.deferred_to_ttl else self.partial_bytes
+        return (self.expired_bytes + partial) / (1024 * 1024)
+
+
+class PartitionRetentionEngine:
+    """Applies time-based retention to ClickHouse MergeTree tables."""
+
+    def __init__(self, clickhouse_client):
+        self.clickhouse_client = clickhouse_client
+
+    @staticmethod
+    def _split_table(table: str) -> Tuple[str, str]:
+        if "." in table:
+            database, name = table.split(".", 1)
+            return f"'{database}'", f"'{name}'"
+        return "currentDatabase()", f"'{table}'"
+
+    async def get_partitions(self, table: str) -> List[PartitionInfo]:
+        """Active partitions of a table with their row counts and sizes."""
+        database, name = self._split_table(table)
+        query = f"""
+        SELECT
+            partition_id,
+            partition,
+            sum(rows) as rows,
+            sum(bytes_on_disk) as bytes_on_disk,
+            min(min_date) as min_date,
+            max(max_date) as max_date,
+            min(min_time) as min_time,
+            max(max_time) as max_time
+        FROM system.parts
+        WHERE database = {database} AND table = {name} AND active
+        GROUP BY partition_id, partition
+        """
+
+        partitions = []
+        for row in await self.clickhouse_client.execute_query(query):
+            info = PartitionInfo(
+                partition_id=str(row["partition_id"]),
+                partition=str(row["partition"]),
+                rows=int(row.get("rows") or 0),
+                bytes_on_disk=int(row.get("bytes_on_disk") or 0),
+            )
+            min_time = _parse_datetime(row.get("min_time"))
+            max_time = _parse_datetime(row.get("max_time"))
+            if min_time is None or max_time is None:
+                min_date = _parse_date(row.get("min_date"))
+                max_date = _parse_date(row.get("max_date"))
+                if min_date and max_date:
+                    # A Date value covers the whole day
+                    min_time = datetime.combine(min_date, datetime.min.time())
+                    max_time = datetime.combine(
+                        max_date + timedelta(days=1), datetime.min.time()
+                    ) - timedelta(microseconds=1)
+            info.min_time, info.max_time = min_time, max_time
+            partitions.append(info)
+        return partitions
+
+    async def get_table_layout(self, table: str) -> Dict[str, str]:
+        """Partition key and engine definition (including TTL) of a table."""
+        database, name = self._split_table(table)
+        query = f"""
+        SELECT partition_key, engine_full
+        FROM system.tables
+        WHERE database = {database} AND name = {name}
+        """
+        result = await self.clickhouse_client.execute_query(query)
+        if not result:
+            return {"partition_key": "", "engine_full": ""}
+        return {
+            "partition_key": str(result[0].get("partition_key") or ""),
+            "engine_full": str(result[0].get("engine_full") or ""),
+        }
+
+    @staticmethod
+    def _table_ttl_days(engine_full: str, timestamp_column: str) -> Optional[int]:
+        match = re.search(
+            rf"TTL\s+{re.escape(timestamp_column)}\s*\+\s*toIntervalDay\((\d+)\)",
+            engine_full,
+        )
+        return int(match.group(1)) if match else None
+
+    async def get_table_storage(self, table: str) -> Optional[Tuple[int, int]]:
+        """Total rows and bytes on disk of a table, from part metadata."""
+        partitions = await self.get_partitions(table)
+        if not partitions:
+            return None
+        return (
+            sum(p.rows for p in partitions),
+            sum(p.bytes_on_disk for p in partitions),
+        )
+
+    async def _time_partitions(
+        self, table: str, timestamp_column: str
+    ) -> Tuple[bool, List[PartitionInfo], Dict[str, str]]:
+        """
+        Partitions with time bounds, and whether the table is partitioned
+        by the retention timestamp so whole partitions can be replaced.
+        """
+        layout = await self.get_table_layout(table)
+        partition_key = layout["partition_key"]
+        partitions = await self.get_partitions(table)
+
+        keyed_on_timestamp = bool(
+            re.search(rf"\b{re.escape(timestamp_column)}\b", partition_key)
+        )
+        if not keyed_on_timestamp:
+            return False, partitions, layout
+
+        for partition in partitions:
+            if not partition.is_temporal:
+                bounds = _partition_range(partition_key, partition.partition)
+                if bounds:
+                    start, end = bounds
+                    partition.min_time = start
+                    partition.max_time = end - timedelta(microseconds=1)
+        partition_aware = bool(partitions) and all(p.is_temporal for p in partitions)
+        return partition_aware, partitions, layout
+
+    async def plan(
+        self, table: str, timestamp_column: str, cutoff: datetime
+    ) -> RetentionPlan:
+        """Work out which partitions can be dropped and what remains."""
+        plan = RetentionPlan(table=table, cutoff=cutoff)
+        plan.partition_aware, partitions, layout = await self._time_partitions(
+            table, timestamp_column
+        )
+        plan.ttl_days = self._table_ttl_days(layout["engine_full"], timestamp_column)
+
+        cutoff_literal = _format_datetime(cutoff)
+        if plan.partition_aware:
+            plan.expired_partitions = [
+                p for p in partitions if p.expired_before(cutoff)
+            ]
+            plan.partial_partitions = [p for p in partitions if p.straddles(cutoff)]
+            if not plan.partial_partitions:
+                return plan
+
+            partition_ids = ", ".join(
+                f"'{p.partition_id}'" for p in plan.partial_partitions
+            )
+            # Only the straddling partitions are read
+            count_query = f"""
+            SELECT count() as count
+            FROM {table}
+            WHERE _partition_id IN ({partition_ids})
+              AND {timestamp_column} < '{cutoff_literal}'
+            """
+            scope_rows = sum(p.rows for p in plan.partial_partitions)
+            scope_bytes = sum(p.bytes_on_disk for p in plan.partial_partitions)
+        else:
+            count_query = f"""
+            SELECT count() as count
+            FROM {table}
+            WHERE {timestamp_column} < '{cutoff_literal}'
+            """
+            scope_rows = sum(p.rows for p in partitions)
+            scope_bytes = sum(p.bytes_on_disk for p in partitions)
+
+        count_result = await self.clickhouse_client.execute_query(count_query)
+        plan.partial_rows = int(count_result[0]["count"]) if count_result else 0
+        if scope_rows:
+            plan.partial_bytes = int(scope_bytes * plan.partial_rows / scope_rows)
+        return plan
+
+    async def purge(
+        self,
+        table: str,
+        timestamp_column: str,
+        cutoff: datetime,
+        dry_run: bool = False,
+    ) -> RetentionPlan:
+        """Remove rows older than ``cutoff``; returns the executed plan.
+
+        Partitions whose drop fails are removed from ``expired_partitions``
+        and a failed DELETE zeroes the partial counts, so the returned plan
+        only counts what actually ran. Failures are listed in ``errors``.
+        """
+        plan = await self.plan(table, timestamp_column, cutoff)
+        if dry_run:
+            return plan
+
+        dropped = []
+        for partition in plan.expired_partitions:
+            try:
+                await self.clickhouse_client.execute_command(
+                    f"ALTER TABLE {table} DROP PARTITION ID '{partition.partition_id}'"
+                )
+            except Exception as e:
+                error = (
+                    f"Failed to drop partition {partition.partition_id} of {table}: {e}"
+                )
+                logger.error(error)
+                plan.errors.append(error)
+            else:
+                dropped.append(partition)
+        plan.expired_partitions = dropped
+
+        if plan.partial_rows and not plan.deferred_to_ttl:
+            # Lightweight delete marks rows as deleted without rewriting parts;
+            # after the drops it only touches partitions straddling the cutoff
+            try:
+                await self.clickhouse_client.execute_command(
+                    f"DELETE FROM {table} "
+                    f"WHERE {timestamp_column} < '{_format_datetime(cutoff)}'"
+                )
+            except Exception as e:
+                error = f"Failed to delete expired rows from {table}: {e}"
+                logger.error(error)
+                plan.errors.append(error)
+                plan.partial_rows = 0
+                plan.partial_bytes = 0
+
+        logger.info(
+            f"Retention on {table}: dropped {len(plan.expired_partitions)} partitions "
+            f"({plan.expired_rows} rows), "
+            f"{'left to TTL' if plan.deferred_to_ttl else 'deleted'} "
+            f"{plan.partial_rows} rows from partially expired data"
+        )
+        return plan
+
+    async def _partition_row_count(self, table: str, partition_id: str) -> int:
+        result = await self.clickhouse_client.execute_command(
+            f"SELECT count() as count FROM {table} "
+            f"WHERE _partition_id = '{partition_id}'"
+        )
+        return int(result[0]["count"])
+
+    async def anonymize(
+        self,
+        table: str,
+        timestamp_column: str,
+        cutoff: datetime,
+        pii_columns: List[str],
+        anonymize_columns: List[str],
+        dry_run: bool = False,
+    ) -> int:
+        """
+        Anonymize rows older than ``cutoff`` set-wise inside ClickHouse.
+
+        Whole expired partitions are rewritten with ``INSERT ... SELECT``
+        through a staging table and swapped in with REPLACE PARTITION, so no
+        mutation runs on them. A partition is only swapped in once its
+        staging copy holds as many rows as the source, and any failed step
+        raises instead of carrying on. Partitions straddling the cutoff get
+        an UPDATE scoped to that partition. Transformations are idempotent
+        and rows that are already anonymized are skipped.
+        """
+        expressions = {col: "'[ANONYMIZED]'" for col in pii_columns}
+        for col in anonymize_columns:
+            expressions[col] = (
+                f"if(startsWith({col}, 'anon_'), {col}, "
+                f"concat('anon_', toString(cityHash64({col}))))"
+            )
+        if not expressions:
+            return 0
+
+        pending = " OR ".join(
+            [f"{col} != '[ANONYMIZED]'" for col in pii_columns]
+            + [f"NOT startsWith({col}, 'anon_')" for col in anonymize_columns]
+        )
+        old_rows = f"{timestamp_column} < '{_format_datetime(cutoff)}'"
+
+        count_query = f"""
+        SELECT _partition_id as partition_id, count() as count
+        FROM {table}
+        WHERE {old_rows} AND ({pending})
+        GROUP BY partition_id
+        """
+        pending_counts = {
+            str(row["partition_id"]): int(row["count"])
+            for row in await self.clickhouse_client.execute_query(count_query)
+        }
+        record_count = sum(pending_counts.values())
+        if record_count == 0 or dry_run:
+            return record_count
+
+        assignments = ", ".join(f"{col} = {expr}" for col, expr in expressions.items())
+        partition_aware, partitions, _ = await self._time_partitions(
+            table, timestamp_column
+        )
+        if not partition_aware:
+            await self.clickhouse_client.execute_command(
+                f"ALTER TABLE {table} UPDATE {assignments} "
+                f"WHERE {old_rows} AND ({pending})"
+            )
+            return record_count
+
+        replacements = ", ".join(
+            f"{expr} AS {col}" for col, expr in expressions.items()
+        )
+        # A fresh staging table per run, so rows or a schema left behind by
+        # an earlier, interrupted run can never be swapped into the table
+        staging = f"{table}_anon_staging_{uuid.uuid4().hex[:12]}"
+        expired = {p.partition_id for p in partitions if p.expired_before(cutoff)}
+        execute = self.clickhouse_client.execute_command
+        await execute(f"CREATE TABLE {staging} AS {table}")
+        try:
+            for partition_id in pending_counts:
+                if partition_id not in expired:
+                    await execute(
+                        f"ALTER TABLE {table} UPDATE {assignments} "
+                        f"IN PARTITION ID '{partition_id}' "
+                        f"WHERE {old_rows} AND ({pending})"
+                    )
+                    continue
+
+                await execute(
+                    f"INSERT INTO {staging} SELECT * REPLACE ({replacements}) "
+                    f"FROM {table} WHERE _partition_id = '{partition_id}'",
+                    timeout=REWRITE_TIMEOUT_SECONDS,
+                )
+                # REPLACE PARTITION overwrites the source partition with
+                # whatever staging holds; refuse unless it is a full copy
+                source_rows = await self._partition_row_count(table, partition_id)
+                staged_rows = await self._partition_row_count(staging, partition_id)
+                if staged_rows != source_rows:
+                    raise RuntimeError(
+                        f"Anonymization of {table} partition {partition_id} "
+                        f"aborted: staging holds {staged_rows} rows, "
+                        f"source holds {source_rows}"
+                    )
+                await execute(
+                    f"ALTER TABLE {table} REPLACE PARTITION ID '{partition_id}' "
+                    f"FROM {staging}"
+                )
+                await execute(
+                    f"ALTER TABLE {staging} DROP PARTITION ID '{partition_id}'"
+                )
+        finally:
+            try:
+                await execute(f"DROP TABLE IF EXISTS {staging}")
+            except Exception as e:
+                logger.warning(f"Could not drop staging table {staging}: {e}")
+
+        logger.info(f"Anonymized {record_count} records in {table}")
+        return record_count
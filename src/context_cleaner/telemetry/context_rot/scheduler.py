@@ -300,19 +300,8 @@ class ContextRotScheduler:
 
         # Clean old metrics (keep last 24 hours by default)
         retention_hours = self.config.monitoring.metrics_retention_hours
-        current_count = len(self.health_monitor.metric_collector.metrics_history)
-
-        # Keep only recent metrics
         cutoff_time = datetime.now() - timedelta(hours=retention_hours)
-        self.health_monitor.metric_collector.metrics_history = [
-            metric
-            for metric in self.health_monitor.metric_collector.metrics_history
-            if metric.timestamp >= cutoff_time
-        ]
-
-        cleaned_count = current_count - len(
-            self.health_monitor.metric_collector.metrics_history
-        )
+        cleaned_count = self.health_monitor.metric_collector.prune(cutoff_time)
 
         if cleaned_count > 0:
             logger.info(f"Cleaned {cleaned_count} old metrics from memory")
@@ -0,0 +1,150 @@
+"""Token-indexed full-text search over stored conversation and file content.
+
+Search terms are split the same way ClickHouse splits text for ``hasToken``
+and ``tokenbf_v1`` skip indexes (runs of ASCII alphanumerics, with any
+non-ASCII character counted as part of a token). Tokens are lower-cased
+for ASCII letters only, like ClickHouse ``lower()``, so non-ASCII letters
+keep their case on both sides. Every token becomes a
+``hasToken(lower(column), ...)`` predicate, which lets the bloom filter index
+on ``lower(column)`` skip granules that cannot match. Quoted phrases are then
+verified exactly on the surviving rows, and matches are ranked by term
+frequency normalised for document length.
+"""
+
+import re
+import shlex
+import string
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+# Mirrors ClickHouse token boundaries: ASCII non-alphanumerics separate tokens
+_TOKEN_PATTERN = re.compile(r"[0-9a-z\u0080-\U0010ffff]+")
+
+# ClickHouse lower() only folds ASCII; str.lower() would also fold "Ä" to "ä"
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Skip indexes backing hasToken() lookups on lower-cased content. The index
+# expression must match the one used in queries for ClickHouse to apply it.
+SEARCH_INDEXES: Dict[str, Tuple[str, str]] = {
+    "claude_message_content": (
+        "idx_content_tokens",
+        "lower(message_content)",
+    ),
+    "claude_file_content": (
+        "idx_content_tokens",
+        "lower(file_content)",
+    ),
+    "claude_tool_results": (
+        "idx_output_tokens",
+        "lower(tool_output)",
+    ),
+}
+SEARCH_INDEX_TYPE = "tokenbf_v1(32768, 3, 0)"
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into ASCII-lower-cased tokens using ClickHouse token boundaries."""
+    return _TOKEN_PATTERN.findall(text.translate(_ASCII_LOWER))
+
+
+@dataclass
+class ContentSearchQuery:
+    """Parsed search input: individual terms plus exact phrases.
+
+    ``"connection refused" retry`` yields the phrase ``connection refused`` and
+    the term ``retry``. Words that contain token separators (``foo_bar``,
+    ``api.client``) are treated as phrases so punctuation is still honoured.
+    """
+
+    terms: List[str] = field(default_factory=list)
+    phrases: List[str] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, text: str) -> "ContentSearchQuery":
+        try:
+            parts = shlex.split(text)
+        except ValueError:
+            # Unbalanced quotes - fall back to plain whitespace splitting
+            parts = text.replace('"', " ").split()
+
+        query = cls()
+        for part in parts:
+            part = part.strip()
+            if not part:
+                continue
+            part_tokens = tokenize(part)
+            if len(part_tokens) == 1 and part_tokens[0] == part.translate(_ASCII_LOWER):
+                if part_tokens[0] not in query.terms:
+                    query.terms.append(part_tokens[0])
+            elif part not in query.phrases:
+                query.phrases.append(part)
+        return query
+
+    @property
+    def tokens(self) -> List[str]:
+        """All distinct index tokens required by terms and phrases."""
+        tokens: List[str] = []
+        for token in self.terms + [t for p in self.phrases for t in tokenize(p)]:
+            if token not in tokens:
+                tokens.append(token)
+        return tokens
+
+    @property
+    def is_indexable(self) -> bool:
+        """Whether at least one token can be looked up through the index."""
+        return bool(self.tokens)
+
+    @property
+    def anchor(self) -> str:
+        """Text used to position the result snippet."""
+        if self.phrases:
+            return self.phrases[0]
+        return self.terms[0] if self.terms else ""
+
+
+def build_search_sql(
+    query: ContentSearchQuery, column: str
+) -> Tuple[str, str, Dict[str, str]]:
+    """Build the WHERE predicate and relevance expression for ``column``.
+
+    Returns:
+        ``(where_sql, score_sql, params)`` using ``{name:String}``
+        placeholders understood by ``ClickHouseClient.execute_query``.
+    """
+    params: Dict[str, str] = {}
+    predicates: List[str] = []
+    score_terms: List[str] = []
+
+    for i, token in enumerate(query.tokens):
+        name = f"search_token_{i}"
+        params[name] = token
+        predicates.append(f"hasToken(lower({column}), {{{name}:String}})")
+        score_terms.append(
+            f"log(1 + countSubstringsCaseInsensitiveUTF8({column}, {{{name}:String}}))"
+        )
+
+    for i, phrase in enumerate(query.phrases):
+        name = f"search_phrase_{i}"
+        params[name] = phrase
+        predicates.append(
+            f"positionCaseInsensitiveUTF8({column}, {{{name}:String}}) > 0"
+        )
+        # Exact phrase occurrences weigh more than scattered tokens
+        score_terms.append(
+            f"2 * log(1 + countSubstringsCaseInsensitiveUTF8({column}, {{{name}:String}}))"
+        )
+
+    params["search_anchor"] = query.anchor
+
+    where_sql = " AND ".join(predicates) if predicates else "1"
+    score_sql = f"round(({' + '.join(score_terms) or '0'}) / log(2 + length({column}) / 1000), 4)"
+    return where_sql, score_sql, params
+
+
+def search_index_ddl(database: str = "otel") -> List[str]:
+    """DDL adding the search skip indexes to existing content tables."""
+    return [
+        f"ALTER TABLE {database}.{table} ADD INDEX IF NOT EXISTS {name} {expression} "
+        f"TYPE {SEARCH_INDEX_TYPE} GRANULARITY 1"
+        for table, (name, expression) in SEARCH_INDEXES.items()
+    ]
@@ -1,11 +1,150 @@
 """Manage security and privacy for full content storage."""
 
+import asyncio
+import hashlib
+import os
 import re
-from typing import Dict, Any, List
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Payloads at least this long are sanitized off the event loop
+OFFLOAD_THRESHOLD = 64 * 1024
+
+# Payloads at least this long are remembered by content hash
+HASH_SKIP_MIN_LENGTH = 1024
+
+
+# Non-ASCII characters that case-insensitive regexes match against ASCII
+# letters but that str.lower() leaves alone
+_CASE_FOLD_FIXES = str.maketrans({"\u0131": "i", "\u017f": "s"})
+
+# Equivalent forms of PII_PATTERNS that begin with a character class rather
+# than \b, which lets the regex engine skip straight to candidate positions
+_FAST_PATTERNS = {
+    "phone": r"\d(?<!\w\d)\d{2}[-.]?\d{3}[-.]?\d{4}\b",
+    "ssn": r"\d(?<!\w\d)\d{2}-?\d{2}-?\d{4}\b",
+    "credit_card": r"\d(?<!\w\d)\d{3}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
+    "password_field": r'p(?<!\wp)(assword|asswd|wd)[\s=:\'\"]+[^\s\'"]+',
+    # No keyword contains a "g", so checking for github/ghp_ after the
+    # keyword rather than before it cannot change the outcome
+    "token_field": (
+        r"[tks](?<!\w[tks])(?:(?<=t)oken|(?<=k)ey|(?<=s)ecret)"
+        r'(?!.*(?:github|ghp_))[\s=:\'\"]+[^\s\'"]+'
+    ),
+}
+
+
+@dataclass(frozen=True)
+class _SanitizationRule:
+    """One compiled redaction plus the cheap checks that gate it."""
+
+    name: str
+    regex: Pattern
+    replacement: str
+    # Lower-case literals, one of which must occur for the regex to match.
+    # An empty tuple means the rule always runs.
+    triggers: Tuple[str, ...] = ()
+    # Optional fast regex that must find a hit before the full rule runs
+    precheck: Optional[Pattern] = None
+
+
+class _SanitizedContentCache:
+    """Bounded LRU of content digests that sanitization has already seen.
+
+    Maps ``digest(level, content)`` to the sanitized text, or to ``None``
+    when sanitization leaves the content unchanged. Sanitized output is not
+    assumed clean: redaction can expose new matches next to a placeholder,
+    so a second pass may still change it.
+
+    The cache is bounded both by entry count and by the memory held in
+    sanitized texts; a single text larger than ``max_entry_bytes`` is not
+    cached at all.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(value: Optional[str]) -> int:
+        return 0 if value is None else sys.getsizeof(value)
+
+    @staticmethod
+    def key(content: str, privacy_level: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(privacy_level.encode())
+        digest.update(b"\0")
+        digest.update(content.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Tuple[bool, Optional[str]]:
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def put(self, key: bytes, value: Optional[str]):
+        size = self._size(value)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._size(self._entries.pop(key))
+            if size > self.max_entry_bytes:
+                return
+            self._entries[key] = value
+            self.total_bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= self._size(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+_worker_pool: Optional[ProcessPoolExecutor] = None
+_worker_pool_lock = threading.Lock()
+
+
+def _get_worker_pool() -> ProcessPoolExecutor:
+    """Shared process pool for sanitizing large payloads."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = ProcessPoolExecutor(
+                max_workers=max(1, min(4, (os.cpu_count() or 1)))
+            )
+        return _worker_pool
+
+
+def _reset_worker_pool():
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is not None:
+            _worker_pool.shutdown(wait=False)
+        _worker_pool = None
+
 
 class ContentSecurityManager:
     """Manage security and privacy for full content storage."""
@@ -25,107 +164,200 @@ class ContentSecurityManager:
         "slack_token": r"xox[baprs]-[A-Za-z0-9-]+",
     }
 
+    # Literals each pattern needs before it can match (see _SanitizationRule)
+    PATTERN_TRIGGERS = {
+        "email": ("@",),
+        "password_field": ("password", "passwd", "pwd"),
+        "token_field": ("token", "key", "secret"),
+        "private_key": ("-----begin",),
+        "aws_key": ("akia",),
+        "github_token": ("ghp_",),
+        "slack_token": ("xox",),
+    }
+
+    # Patterns applied at each privacy level, in application order
+    LEVEL_PATTERNS = {
+        "strict": list(PII_PATTERNS),
+        "standard": [
+            "api_key",
+            "password_field",
+            "token_field",
+            "private_key",
+            "aws_key",
+            "github_token",
+            "slack_token",
+            "email",
+        ],
+        "minimal": ["private_key", "aws_key", "github_token", "slack_token"],
+    }
+
+    _cache = _SanitizedContentCache()
+
     @classmethod
-    def sanitize_content(cls, content: str, privacy_level: str = "standard") -> str:
-        """Sanitize content based on privacy level."""
-        if not content:
-            return content
+    def _compile_pattern(cls, pattern_name: str, ignore_case: bool = True) -> Pattern:
+        flags = re.IGNORECASE if ignore_case else 0
+        if pattern_name == "private_key":
+            flags |= re.DOTALL
+        pattern = _FAST_PATTERNS.get(pattern_name, cls.PII_PATTERNS[pattern_name])
+        return re.compile(pattern, flags)
 
-        if privacy_level == "strict":
-            return cls._strict_sanitization(content)
-        elif privacy_level == "standard":
-            return cls._standard_sanitization(content)
-        elif privacy_level == "minimal":
-            return cls._minimal_sanitization(content)
+    @classmethod
+    def _build_rules(cls) -> Dict[str, List[_SanitizationRule]]:
+        # Every email match contains "@domain.tld"; finding that literal-led
+        # fragment is far cheaper than the full pattern
+        email_precheck = re.compile(r"@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", re.IGNORECASE)
 
-        return content
+        rules = {}
+        for level, pattern_names in cls.LEVEL_PATTERNS.items():
+            rules[level] = [
+                _SanitizationRule(
+                    name,
+                    # Standard mode has always matched email case-sensitively
+                    cls._compile_pattern(
+                        name, ignore_case=not (level == "standard" and name == "email")
+                    ),
+                    f"[REDACTED_{name.upper()}]",
+                    cls.PATTERN_TRIGGERS.get(name, ()),
+                    email_precheck if name == "email" else None,
+                )
+                for name in pattern_names
+            ]
+
+        # Strict mode additionally hides user paths and URLs
+        rules["strict"] = rules["strict"] + [
+            _SanitizationRule(
+                "home_path",
+                re.compile(r"/home/[^/\s]+"),
+                "/home/[REDACTED]",
+                ("/home/",),
+            ),
+            _SanitizationRule(
+                "windows_user_path",
+                re.compile(r"C:\\\\Users\\\\[^\\\\]+"),
+                r"C:\\Users\\[REDACTED]",
+                ("users",),
+            ),
+            _SanitizationRule(
+                "url", re.compile(r"https?://[^\s]+"), "[REDACTED_URL]", ("http",)
+            ),
+        ]
+        return rules
 
     @classmethod
-    def _strict_sanitization(cls, content: str) -> str:
-        """Strict sanitization - redact most potentially sensitive content."""
-        sanitized = content
+    def _rules(cls) -> Dict[str, List[_SanitizationRule]]:
+        rules = cls.__dict__.get("_compiled_rules")
+        if rules is None:
+            rules = cls._compiled_rules = cls._build_rules()
+        return rules
 
-        # Redact all PII patterns
-        for pattern_name, pattern in cls.PII_PATTERNS.items():
-            flags = (
-                re.IGNORECASE | re.DOTALL
-                if pattern_name == "private_key"
-                else re.IGNORECASE
-            )
-            sanitized = re.sub(
-                pattern, f"[REDACTED_{pattern_name.upper()}]", sanitized, flags=flags
-            )
+    @staticmethod
+    def _present_triggers(content: str, rules: List[_SanitizationRule]) -> set:
+        """Trigger literals that occur anywhere in ``content``, ignoring case."""
+        folded = content.lower()
+        if not content.isascii():
+            folded = folded.translate(_CASE_FOLD_FIXES)
+        return {
+            trigger for rule in rules for trigger in rule.triggers if trigger in folded
+        }
 
-        # Redact file paths that might contain usernames
-        sanitized = re.sub(r"/home/[^/\s]+", "/home/[REDACTED]", sanitized)
-        sanitized = re.sub(
-            r"C:\\\\Users\\\\[^\\\\]+", r"C:\\Users\\[REDACTED]", sanitized
-        )
+    @classmethod
+    def _apply_rules(cls, content: str, privacy_level: str) -> str:
+        """Run the level's redactions in order, skipping rules that cannot match.
 
-        # Redact URLs with sensitive info
-        sanitized = re.sub(r"https?://[^\s]+", "[REDACTED_URL]", sanitized)
+        Replacement markers never introduce a trigger at a word boundary, so
+        triggers found in the original content stay valid for every pass.
+        """
+        rules = cls._rules()[privacy_level]
+        present = cls._present_triggers(content, rules)
 
+        sanitized = content
+        for rule in rules:
+            if rule.triggers and present.isdisjoint(rule.triggers):
+                continue
+            if rule.precheck is not None and not rule.precheck.search(sanitized):
+                continue
+            sanitized = rule.regex.sub(rule.replacement, sanitized)
         return sanitized
 
     @classmethod
-    def _standard_sanitization(cls, content: str) -> str:
-        """Standard sanitization - redact obvious secrets and PII."""
-        sanitized = content
+    def sanitize_content(cls, content: str, privacy_level: str = "standard") -> str:
+        """Sanitize content based on privacy level."""
+        if not content or privacy_level not in cls.LEVEL_PATTERNS:
+            return content
 
-        # Redact critical patterns
-        critical_patterns = [
-            "api_key",
-            "password_field",
-            "token_field",
-            "private_key",
-            "aws_key",
-            "github_token",
-            "slack_token",
-        ]
-        for pattern_name in critical_patterns:
-            if pattern_name in cls.PII_PATTERNS:
-                pattern = cls.PII_PATTERNS[pattern_name]
-                flags = (
-                    re.IGNORECASE | re.DOTALL
-                    if pattern_name == "private_key"
-                    else re.IGNORECASE
-                )
-                sanitized = re.sub(
-                    pattern,
-                    f"[REDACTED_{pattern_name.upper()}]",
-                    sanitized,
-                    flags=flags,
-                )
+        if len(content) < HASH_SKIP_MIN_LENGTH:
+            return cls._apply_rules(content, privacy_level)
 
-        # Redact email addresses
-        sanitized = re.sub(cls.PII_PATTERNS["email"], "[REDACTED_EMAIL]", sanitized)
+        key = cls._cache.key(content, privacy_level)
+        hit, cached = cls._cache.get(key)
+        if hit:
+            return content if cached is None else cached
 
+        sanitized = cls._apply_rules(content, privacy_level)
+        cls._remember(key, content, sanitized)
         return sanitized
 
     @classmethod
-    def _minimal_sanitization(cls, content: str) -> str:
-        """Minimal sanitization - only redact obvious API keys and tokens."""
-        sanitized = content
+    def _remember(cls, key: bytes, content: str, sanitized: str):
+        cls._cache.put(key, None if sanitized == content else sanitized)
 
-        # Only redact the most critical patterns
-        critical_patterns = ["private_key", "aws_key", "github_token", "slack_token"]
-        for pattern_name in critical_patterns:
-            if pattern_name in cls.PII_PATTERNS:
-                pattern = cls.PII_PATTERNS[pattern_name]
-                flags = (
-                    re.IGNORECASE | re.DOTALL
-                    if pattern_name == "private_key"
-                    else re.IGNORECASE
-                )
-                sanitized = re.sub(
-                    pattern,
-                    f"[REDACTED_{pattern_name.upper()}]",
-                    sanitized,
-                    flags=flags,
-                )
+    @classmethod
+    async def sanitize_content_async(
+        cls,
+        content: str,
+        privacy_level: str = "standard",
+        executor: Optional[Executor] = None,
+    ) -> str:
+        """Sanitize content, moving large payloads off the event loop.
+
+        Payloads of ``OFFLOAD_THRESHOLD`` characters or more run in
+        ``executor`` (a shared process pool by default); the hash-skip cache
+        is consulted here first, so repeated payloads never leave the loop.
+        """
+        if (
+            not content
+            or privacy_level not in cls.LEVEL_PATTERNS
+            or len(content) < OFFLOAD_THRESHOLD
+        ):
+            return cls.sanitize_content(content, privacy_level)
+
+        key = cls._cache.key(content, privacy_level)
+        hit, cached = cls._cache.get(key)
+        if hit:
+            return content if cached is None else cached
+
+        loop = asyncio.get_running_loop()
+        pool = executor or _get_worker_pool()
+        try:
+            sanitized = await loop.run_in_executor(
+                pool, _sanitize_uncached, content, privacy_level
+            )
+        except BrokenProcessPool:
+            logger.warning("Sanitization worker pool failed; falling back to a thread")
+            if executor is None:
+                _reset_worker_pool()
+            sanitized = await loop.run_in_executor(
+                None, _sanitize_uncached, content, privacy_level
+            )
 
+        cls._remember(key, content, sanitized)
         return sanitized
 
+    @classmethod
+    def _strict_sanitization(cls, content: str) -> str:
+        """Strict sanitization - redact most potentially sensitive content."""
+        return cls._apply_rules(content, "strict")
+
+    @classmethod
+    def _standard_sanitization(cls, content: str) -> str:
+        """Standard sanitization - redact obvious secrets and PII."""
+        return cls._apply_rules(content, "standard")
+
+    @classmethod
+    def _minimal_sanitization(cls, content: str) -> str:
+        """Minimal sanitization - only redact obvious API keys and tokens."""
+        return cls._apply_rules(content, "minimal")
+
     @classmethod
     def analyze_content_risks(cls, content: str) -> Dict[str, Any]:
         """Analyze content for potential security risks."""
@@ -137,13 +369,11 @@ class ContentSecurityManager:
             "detected_patterns": [],
         }
 
-        for pattern_name, pattern in cls.PII_PATTERNS.items():
-            flags = (
-                re.IGNORECASE | re.DOTALL
-                if pattern_name == "private_key"
-                else re.IGNORECASE
-            )
-            matches = re.findall(pattern, content, flags)
+        for rule in cls._rules()["strict"]:
+            if rule.name not in cls.PII_PATTERNS:
+                continue
+            pattern_name = rule.name
+            matches = rule.regex.findall(content)
             if matches:
                 risks["detected_patterns"].append(
                     {"type": pattern_name, "count": len(matches)}
@@ -169,3 +399,8 @@ class ContentSecurityManager:
             risks["risk_level"] = "medium"
 
         return risks
+
+
+def _sanitize_uncached(content: str, privacy_level: str) -> str:
+    """Worker-pool entry point: sanitize without touching the parent's cache."""
+    return ContentSecurityManager._apply_rules(content, privacy_level)
@@ -1,7 +1,8 @@
 """Process complete JSONL content for database storage."""
 
 import asyncio
-from typing import List, Dict, Any
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Optional
 import logging
 
 from .full_content_parser import FullContentJsonlParser
@@ -15,10 +16,15 @@ class FullContentBatchProcessor:
     """Process complete JSONL content for database storage."""
 
     def __init__(
-        self, clickhouse_client: ClickHouseClient, privacy_level: str = "standard"
+        self,
+        clickhouse_client: ClickHouseClient,
+        privacy_level: str = "standard",
+        sanitize_executor: Optional[Executor] = None,
     ):
         self.clickhouse = clickhouse_client
         self.privacy_level = privacy_level
+        # Worker pool for large payloads; None uses the shared process pool
+        self.sanitize_executor = sanitize_executor
         self.parser = FullContentJsonlParser()
         self.security_manager = ContentSecurityManager()
 
@@ -37,47 +43,67 @@ class FullContentBatchProcessor:
         file_batch = []
         tool_batch = []
 
+        # (record, field) pairs awaiting sanitization, grouped per entry
+        pending = []
+
         for entry in entries:
             try:
+                entry_fields = []
+
                 # Extract message content
                 message_data = self.parser.extract_message_content(entry)
                 if message_data:
-                    # Sanitize content before storage
-                    message_data["message_content"] = (
-                        self.security_manager.sanitize_content(
-                            message_data["message_content"], self.privacy_level
-                        )
-                    )
-                    message_batch.append(message_data)
+                    entry_fields.append((message_data, "message_content"))
 
                 # Extract file content
                 file_data = self.parser.extract_file_content(entry)
                 if file_data:
-                    # Sanitize file content
-                    file_data["file_content"] = self.security_manager.sanitize_content(
-                        file_data["file_content"], self.privacy_level
-                    )
-                    file_batch.append(file_data)
+                    entry_fields.append((file_data, "file_content"))
 
                 # Extract tool results
                 tool_data = self.parser.extract_tool_results(entry)
                 if tool_data:
-                    # Sanitize tool outputs
-                    tool_data["tool_output"] = self.security_manager.sanitize_content(
-                        tool_data["tool_output"], self.privacy_level
-                    )
+                    entry_fields.append((tool_data, "tool_output"))
                     if tool_data["tool_error"]:
-                        tool_data["tool_error"] = (
-                            self.security_manager.sanitize_content(
-                                tool_data["tool_error"], self.privacy_level
-                            )
-                        )
-                    tool_batch.append(tool_data)
+                        entry_fields.append((tool_data, "tool_error"))
+
+                pending.append((message_data, file_data, tool_data, entry_fields))
 
             except Exception as e:
                 logger.error(f"Error processing JSONL entry: {e}")
                 stats["errors"] += 1
 
+        # Sanitize content before storage. Small payloads are handled inline;
+        # large file bodies and tool outputs run in the sanitizer worker pool.
+        fields = [field for *_, entry_fields in pending for field in entry_fields]
+        sanitized = await asyncio.gather(
+            *(
+                self.security_manager.sanitize_content_async(
+                    record[name], self.privacy_level, self.sanitize_executor
+                )
+                for record, name in fields
+            ),
+            return_exceptions=True,
+        )
+        results = iter(sanitized)
+
+        for message_data, file_data, tool_data, entry_fields in pending:
+            values = [next(results) for _ in entry_fields]
+            failures = [v for v in values if isinstance(v, Exception)]
+            if failures:
+                logger.error(f"Error processing JSONL entry: {failures[0]}")
+                stats["errors"] += 1
+                continue
+
+            for (record, name), value in zip(entry_fields, values):
+                record[name] = value
+            if message_data:
+                message_batch.append(message_data)
+            if file_data:
+                file_batch.append(file_data)
+            if tool_data:
+                tool_batch.append(tool_data)
+
         # Batch insert into respective tables
         try:
             if message_batch:
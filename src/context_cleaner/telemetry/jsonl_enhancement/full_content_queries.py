@@ -1,8 +1,18 @@
 """Advanced queries for complete content analysis."""
 
+import logging
 from typing import List, Dict, Any, Optional
 from context_cleaner.telemetry.clients.clickhouse_client import ClickHouseClient
 
+from .content_search import (
+    SEARCH_INDEXES,
+    ContentSearchQuery,
+    build_search_sql,
+    search_index_ddl,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class FullContentQueries:
     """Advanced queries for complete content analysis."""
@@ -10,6 +20,43 @@ class FullContentQueries:
     def __init__(self, clickhouse_client: ClickHouseClient):
         self.clickhouse = clickhouse_client
 
+    async def ensure_search_indexes(self) -> List[str]:
+        """Add and build token skip indexes on existing content tables.
+
+        New deployments get the indexes from ``otel-clickhouse-init.sql``; this
+        upgrades tables created before they existed and is run as part of
+        schema setup (``context-cleaner telemetry init``), never from a search.
+        Tables that do not exist yet are skipped. Returns the tables whose
+        index was added.
+        """
+        tables = await self.clickhouse.execute_command(
+            "SELECT name FROM system.tables WHERE database = 'otel'"
+        )
+        table_names = {row.get("name") for row in tables}
+        existing = await self.clickhouse.execute_command("""
+            SELECT table, name
+            FROM system.data_skipping_indices
+            WHERE database = 'otel'
+            """)
+        present = {(row.get("table"), row.get("name")) for row in existing}
+
+        added = []
+        for (table, (index_name, _)), ddl in zip(
+            SEARCH_INDEXES.items(), search_index_ddl()
+        ):
+            if table not in table_names or (table, index_name) in present:
+                continue
+            await self.clickhouse.execute_command(ddl)
+            # Build the index for parts written before it existed
+            await self.clickhouse.execute_command(
+                f"ALTER TABLE otel.{table} MATERIALIZE INDEX {index_name}"
+            )
+            added.append(table)
+
+        if added:
+            logger.info(f"Added full-text search indexes to: {', '.join(added)}")
+        return added
+
     async def get_complete_conversation(self, session_id: str) -> List[Dict[str, Any]]:
         """Get COMPLETE conversation content for a session."""
         query = """
@@ -35,7 +82,40 @@ class FullContentQueries:
     async def search_conversation_content(
         self, search_term: str, limit: int = 50
     ) -> List[Dict[str, Any]]:
-        """Search through ACTUAL message content across all conversations."""
+        """Search through ACTUAL message content across all conversations.
+
+        Terms are matched as whole tokens via the ``lower(message_content)``
+        token index; quoted text is matched as an exact phrase. Results are
+        ordered by relevance, then recency.
+        """
+        parsed = ContentSearchQuery.parse(search_term)
+        if parsed.is_indexable:
+            where_sql, score_sql, params = build_search_sql(parsed, "message_content")
+            query = f"""
+        SELECT 
+            session_id,
+            message_uuid, 
+            timestamp,
+            role,
+            message_preview,
+            message_length,
+            model_name,
+            {score_sql} as relevance_score,
+            -- Extract context around the first matching phrase or term
+            substr(
+                message_content, 
+                greatest(1, positionCaseInsensitiveUTF8(message_content, {{search_anchor:String}}) - 100), 
+                300
+            ) as context_snippet
+        FROM otel.claude_message_content
+        WHERE {where_sql}
+        ORDER BY relevance_score DESC, timestamp DESC
+        LIMIT {{limit:UInt32}}
+        """
+            params["limit"] = limit
+            return await self.clickhouse.execute_query(query, params)
+
+        # Punctuation-only searches have no tokens to look up; scan instead
         query = """
         SELECT 
             session_id,
@@ -86,7 +166,44 @@ class FullContentQueries:
     async def search_file_content(
         self, search_term: str, language: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Search through ACTUAL file contents."""
+        """Search through ACTUAL file contents, ranked by relevance."""
+        language_filter = ""
+        params: Dict[str, Any] = {}
+
+        if language:
+            language_filter = "AND programming_language = {language:String}"
+            params["language"] = language
+
+        parsed = ContentSearchQuery.parse(search_term)
+        if parsed.is_indexable:
+            where_sql, score_sql, search_params = build_search_sql(
+                parsed, "file_content"
+            )
+            params.update(search_params)
+            query = f"""
+        SELECT 
+            session_id,
+            file_path,
+            timestamp,
+            file_size,
+            programming_language,
+            file_type,
+            {score_sql} as relevance_score,
+            -- Extract code context around the first matching phrase or term
+            substr(
+                file_content,
+                greatest(1, positionCaseInsensitiveUTF8(file_content, {{search_anchor:String}}) - 200),
+                500
+            ) as code_snippet
+        FROM otel.claude_file_content
+        WHERE {where_sql}
+        {language_filter}
+        ORDER BY relevance_score DESC, timestamp DESC
+        LIMIT 100
+        """
+            return await self.clickhouse.execute_query(query, params)
+
+        # Punctuation-only searches have no tokens to look up; scan instead
         query = """
         SELECT 
             session_id,
@@ -108,13 +225,7 @@ class FullContentQueries:
         LIMIT 100
         """
 
-        language_filter = ""
-        params = {"search_term": search_term}
-
-        if language:
-            language_filter = "AND programming_language = {language:String}"
-            params["language"] = language
-
+        params["search_term"] = search_term
         formatted_query = query.format(language_filter=language_filter)
 
         return await self.clickhouse.execute_query(formatted_query, params)
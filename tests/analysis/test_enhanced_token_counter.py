@@ -18,6 +18,9 @@ from src.context_cleaner.analysis.enhanced_token_counter import (
     SessionTokenMetrics,
     EnhancedTokenAnalysis,
     SessionTokenTracker,
+    TokenCountCache,
+    get_accurate_token_count,
+    get_accurate_token_counts,
 )
 from .fixtures import (
     UndercountTestCases,
@@ -565,5 +568,52 @@ class TestSessionTokenTracker:
         assert metrics.reported_input_tokens == sum(i * 10 for i in range(10))
 
 
+class TestTokenCountCache:
+    """Test the shared content-hash token count cache."""
+
+    def test_counts_match_uncached_estimate(self):
+        """Cached and batched counts equal the direct estimate."""
+        texts = ["", "   ", "short text", "word " * 100, None, {"key": "value " * 30}]
+        expected = [0, 0, 3, 125, 0, 48]
+
+        assert [get_accurate_token_count(t) for t in texts] == expected
+        assert get_accurate_token_counts(texts) == expected
+
+    def test_repeated_content_is_counted_once(self):
+        """Identical long strings hit the cache, within and across batches."""
+        cache = TokenCountCache()
+        long_text = "repeated content " * 20
+
+        with patch(
+            "src.context_cleaner.analysis.enhanced_token_counter._count_tokens",
+            wraps=lambda text: len(text.split()),
+        ) as count_tokens:
+            assert cache.count_many([long_text, long_text]) == [40, 40]
+            assert cache.count("x" + long_text[1:]) == 40
+            assert cache.count(long_text) == 40
+
+        assert count_tokens.call_count == 2
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 2
+
+    def test_short_strings_bypass_the_cache(self):
+        """Strings below the hashing threshold are never stored."""
+        cache = TokenCountCache(min_length=64)
+
+        cache.count_many(["a b c"] * 5)
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_cache_is_bounded(self):
+        """Least recently used entries are evicted beyond max_entries."""
+        cache = TokenCountCache(max_entries=3, min_length=0)
+        for i in range(5):
+            cache.count(f"text {i}")
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["misses"] == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
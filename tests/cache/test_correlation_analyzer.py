@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from src.context_cleaner.analysis.correlation_analyzer import (
+    _SessionSimilarityIndex,
     CrossSessionCorrelationAnalyzer,
     SessionCluster,
     CrossSessionPattern,
@@ -277,6 +278,30 @@ class TestCrossSessionCorrelationAnalyzer:
 
         assert python_similarity >= different_topic_similarity
 
+    def test_similarity_index_matches_pairwise_similarity(self):
+        """Vectorized similarity rows match the pairwise calculation."""
+        sessions = self.sample_sessions + [
+            SessionAnalysis(
+                session_id="empty",
+                start_time=datetime.now(),
+                end_time=datetime.now(),
+                total_messages=0,
+                total_tokens=0,
+                file_operations=[],
+                context_switches=0,
+                average_response_time=0.0,
+                cache_efficiency=0.0,
+            )
+        ]
+        index = _SessionSimilarityIndex(sessions)
+
+        for i, session in enumerate(sessions):
+            row = index.row(i)
+            for j, other in enumerate(sessions):
+                assert row[j] == pytest.approx(
+                    self.analyzer._calculate_session_similarity(session, other)
+                )
+
     @pytest.mark.skip(reason="Method _calculate_topic_overlap not implemented")
     def test_calculate_topic_overlap(self):
         """Test topic overlap calculation."""
@@ -375,6 +400,35 @@ class TestCrossSessionCorrelationAnalyzer:
 
         assert isinstance(patterns, list)
 
+    def test_find_cyclical_patterns_for_similar_weekday_sessions(self):
+        """Similar sessions on the same weekday form a weekly pattern."""
+        base_time = datetime(2024, 1, 1, 9, 0)  # A Monday
+        sessions = [
+            SessionAnalysis(
+                session_id=f"monday_{week}",
+                start_time=base_time + timedelta(weeks=week),
+                end_time=base_time + timedelta(weeks=week, hours=2),
+                total_messages=1,
+                total_tokens=2000,
+                file_operations=[],
+                context_switches=1,
+                average_response_time=5.0,
+                cache_efficiency=0.8,
+                primary_topics=["planning"],
+                working_directories=["/project"],
+            )
+            for week in range(3)
+        ]
+
+        patterns = self.analyzer._find_cyclical_patterns(sessions)
+
+        assert len(patterns) == 1
+        pattern = patterns[0]
+        assert pattern.pattern_id == "weekly_0"
+        assert pattern.session_sequence == ["monday_0", "monday_1", "monday_2"]
+        assert pattern.consistency_score > 0.5
+        assert pattern.correlation_strength == pattern.consistency_score
+
     @pytest.mark.skip(
         reason="Method _calculate_correlation_coefficient not implemented"
     )
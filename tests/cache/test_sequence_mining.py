@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for Sequence Mining
+
+Tests for n-gram counting over integer-encoded tool sequences, including
+Counter-compatible ordering, arbitrary-length patterns and consensus helpers.
+"""
+
+from collections import Counter
+
+import pytest
+
+from src.context_cleaner.analysis.sequence_mining import (
+    SequenceMiner,
+    find_common_subsequences,
+    jaccard_to_reference,
+    most_common_sequence,
+)
+
+
+def _counter_subsequences(sequences, max_length=4):
+    counter = Counter()
+    for sequence in sequences:
+        for length in range(2, min(max_length + 1, len(sequence) + 1)):
+            for i in range(len(sequence) - length + 1):
+                counter[tuple(sequence[i : i + length])] += 1
+    common = [(list(seq), count) for seq, count in counter.items() if count > 1]
+    return sorted(common, key=lambda x: x[1], reverse=True)
+
+
+class TestSequenceMiner:
+    """Test suite for SequenceMiner and helpers."""
+
+    def setup_method(self):
+        self.sequences = [
+            ["Read", "Edit", "Bash", "Read", "Edit"],
+            ["Grep", "Read", "Edit", "Bash"],
+            [],
+            ["Read"],
+            ["Bash", "Read", "Edit", "Bash", "Grep"],
+        ]
+
+    def test_matches_counter_ordering(self):
+        """Results and tie order match the Counter-based implementation."""
+        assert find_common_subsequences(self.sequences) == _counter_subsequences(
+            self.sequences
+        )
+
+    def test_top_k_and_support_threshold(self):
+        miner = SequenceMiner(self.sequences)
+        top = miner.top_k(2, min_support=3)
+
+        assert [p.symbols for p in top] == [("Read", "Edit"), ("Edit", "Bash")]
+        assert [p.support for p in top] == [4, 3]
+        assert all(p.support >= 3 for p in miner.count_ngrams(min_support=3))
+
+    def test_arbitrary_length_patterns(self):
+        """Long patterns over a large alphabet use the hashed key path."""
+        long_run = list(range(200))
+        miner = SequenceMiner([long_run * 2, long_run])
+
+        top = miner.top_k(1, min_length=150, max_length=150)
+        assert top[0].symbols == tuple(range(150))
+        assert top[0].support == 3
+
+    def test_empty_input(self):
+        assert find_common_subsequences([]) == []
+        assert SequenceMiner([[], []]).count_ngrams() == []
+
+    def test_most_common_sequence_prefers_first_seen_on_ties(self):
+        sequences = [["b", "x"], ["a", "y"], ["a", "x"], ["c"]]
+        assert most_common_sequence(sequences) == ["a", "x"]
+        assert most_common_sequence([["b"], ["a"]]) == ["b"]
+        assert most_common_sequence([]) == []
+
+    def test_jaccard_to_reference(self):
+        similarities = jaccard_to_reference(
+            [["a", "b"], ["a", "a", "c"], [], ["d"]], ["a", "b"]
+        )
+        assert similarities.tolist() == pytest.approx([1.0, 1 / 3, 0.0, 0.0])
+        assert jaccard_to_reference([["a"]], []).tolist() == [0.0]
@@ -176,16 +176,6 @@ class TestUsagePatternAnalyzer:
         assert 0 <= confidence <= 1
         assert confidence > 0  # Should have some confidence with consistent tools
     
-    def test_sequence_similarity(self):
-        """Test sequence similarity calculation."""
-        seq1 = ["Read", "Edit", "Bash"]
-        seq2 = ["Read", "Edit", "Test"]
-        
-        similarity = self.analyzer._sequence_similarity(seq1, seq2)
-        
-        assert 0 <= similarity <= 1
-        assert similarity >= 0.5  # Should be similar with 2/3 overlap
-    
     def test_generate_pattern_description(self):
         """Test pattern description generation."""
         tools = ["Read", "Edit", "Bash"]
@@ -0,0 +1,371 @@
+"""
+Tests for the streaming archive pipeline and set-wise anonymization.
+"""
+
+import gzip
+import hashlib
+import json
+import operator
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from context_cleaner.telemetry.context_rot.archive_pipeline import (
+    MANIFEST_NAME,
+    ArchiveManifest,
+    StreamingArchiver,
+)
+from context_cleaner.telemetry.context_rot.data_retention import (
+    DataCategory,
+    DataRetentionManager,
+)
+from context_cleaner.telemetry.context_rot.retention_engine import (
+    PartitionRetentionEngine,
+)
+
+CUTOFF = datetime(2024, 1, 2)
+COMPARISONS = {"<": operator.lt, "<=": operator.le, ">": operator.gt}
+
+
+class FakeArchiveClickHouse:
+    """Serves keyset-paginated reads from an in-memory, timestamp-sorted table"""
+
+    def __init__(self, rows, fail_after_chunks=None):
+        self.rows = rows
+        self.fail_after_chunks = fail_after_chunks
+        self.chunk_queries = []
+        self.queries = []
+
+    def _matching(self, query):
+        conditions = re.findall(r"timestamp (<=|<|>) '([^']+)'", query)
+        return [
+            row
+            for row in self.rows
+            if all(COMPARISONS[op](row["timestamp"], key) for op, key in conditions)
+        ]
+
+    async def execute_query(self, query, params=None):
+        query = " ".join(query.split())
+        self.queries.append(query)
+        if "count()" in query:
+            return [{"count": str(len(self._matching(query)))}]
+        if query.startswith("SELECT *"):
+            if self.fail_after_chunks == len(self.chunk_queries):
+                raise ConnectionError("connection reset")
+            self.chunk_queries.append(query)
+            matching = self._matching(query)
+            limit = int(re.search(r"LIMIT (\d+) WITH TIES", query).group(1))
+            if len(matching) <= limit:
+                return matching
+            last = matching[limit - 1]["timestamp"]
+            return [row for row in matching if row["timestamp"] <= last]
+        return []
+
+    async def execute_command(self, query, timeout=None):
+        query = " ".join(query.split())
+        if query.startswith("DELETE FROM"):
+            self.queries.append(query)
+            deleted = self._matching(query)
+            self.rows = [row for row in self.rows if row not in deleted]
+            return []
+        return await self.execute_query(query)
+
+
+def _rows(count, start=datetime(2024, 1, 1), step=timedelta(minutes=1)):
+    return [
+        {"id": i, "timestamp": f"{start + step * i:%Y-%m-%d %H:%M:%S}"}
+        for i in range(count)
+    ]
+
+
+def _read_archive(run_dir, manifest):
+    rows = []
+    for entry in manifest.files:
+        data = (run_dir / entry["name"]).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == entry["sha256"]
+        rows.extend(json.loads(line) for line in gzip.decompress(data).splitlines())
+    return rows
+
+
+class TestStreamingArchiver:
+    @pytest.mark.asyncio
+    async def test_rows_stream_in_chunks_to_rotating_files(self, tmp_path):
+        client = FakeArchiveClickHouse(_rows(25) + _rows(5, start=CUTOFF))
+        archiver = StreamingArchiver(
+            client, tmp_path, chunk_rows=4, rows_per_file=8, compression="gzip"
+        )
+
+        manifest = await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        assert manifest.completed
+        assert manifest.total_rows == 25
+        assert [entry["rows"] for entry in manifest.files] == [8, 8, 8, 1]
+        assert all("ORDER BY timestamp" in q for q in client.chunk_queries)
+        assert "timestamp >" not in client.chunk_queries[0]
+        assert "timestamp > '2024-01-01 00:03:00'" in client.chunk_queries[1]
+
+        run_dir = tmp_path / "otel_metrics" / "20240102T000000"
+        assert [row["id"] for row in _read_archive(run_dir, manifest)] == list(
+            range(25)
+        )
+
+    @pytest.mark.asyncio
+    async def test_rows_sharing_a_timestamp_are_not_split(self, tmp_path):
+        rows = _rows(6, step=timedelta(0))
+        client = FakeArchiveClickHouse(rows)
+        archiver = StreamingArchiver(client, tmp_path, chunk_rows=4, compression="gzip")
+
+        manifest = await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        assert manifest.completed
+        assert manifest.total_rows == 6
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes_from_last_committed_file(self, tmp_path):
+        rows = _rows(20)
+        client = FakeArchiveClickHouse(rows, fail_after_chunks=3)
+        archiver = StreamingArchiver(
+            client, tmp_path, chunk_rows=4, rows_per_file=8, compression="gzip"
+        )
+
+        with pytest.raises(ConnectionError):
+            await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        run_dir = tmp_path / "otel_metrics" / "20240102T000000"
+        saved = ArchiveManifest.load(run_dir / MANIFEST_NAME)
+        assert not saved.completed
+        assert saved.total_rows == 8
+        assert sorted(p.name for p in run_dir.iterdir()) == [
+            MANIFEST_NAME,
+            "part-00000.jsonl.gz",
+        ]
+
+        client.fail_after_chunks = None
+        manifest = await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        assert manifest.completed
+        assert manifest.total_rows == 20
+        assert [row["id"] for row in _read_archive(run_dir, manifest)] == list(
+            range(20)
+        )
+
+    @pytest.mark.asyncio
+    async def test_later_run_continues_after_previous_archive(self, tmp_path):
+        client = FakeArchiveClickHouse(_rows(10))
+        archiver = StreamingArchiver(client, tmp_path, chunk_rows=4, compression="gzip")
+        await archiver.archive("otel.metrics", "timestamp", datetime(2024, 1, 1, 0, 5))
+
+        manifest = await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        assert manifest.start_after == "2024-01-01 00:04:00"
+        assert manifest.total_rows == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_leaves_run_open(self, tmp_path):
+        client = FakeArchiveClickHouse(_rows(3))
+        archiver = StreamingArchiver(client, tmp_path, compression="gzip")
+
+        async def no_count(query, params=None):
+            if "count()" in query:
+                return []
+            return await FakeArchiveClickHouse.execute_query(client, query)
+
+        client.execute_query = no_count
+        manifest = await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        assert not manifest.completed
+        assert manifest.total_rows == 3
+
+
+class FakePartitionedClickHouse:
+    """Reports one fully expired and one straddling daily partition"""
+
+    def __init__(self, staged_rows=10, fail_on=None):
+        self.queries = []
+        self.staged_rows = staged_rows
+        self.fail_on = fail_on
+
+    async def execute_query(self, query, params=None):
+        query = " ".join(query.split())
+        self.queries.append(query)
+        if "FROM system.tables" in query:
+            return [{"partition_key": "toDate(timestamp)", "engine_full": ""}]
+        if "FROM system.parts" in query:
+            return [
+                {
+                    "partition_id": day,
+                    "partition": f"{day[:4]}-{day[4:6]}-{day[6:]}",
+                    "rows": "10",
+                    "bytes_on_disk": "100",
+                    "min_date": "1970-01-01",
+                    "max_date": "1970-01-01",
+                    "min_time": "1970-01-01 00:00:00",
+                    "max_time": "1970-01-01 00:00:00",
+                }
+                for day in ("20240101", "20240102")
+            ]
+        if "GROUP BY partition_id" in query:
+            return [
+                {"partition_id": "20240101", "count": "10"},
+                {"partition_id": "20240102", "count": "4"},
+            ]
+        return []
+
+    async def execute_command(self, query, timeout=None):
+        query = " ".join(query.split())
+        if self.fail_on and query.startswith(self.fail_on):
+            self.queries.append(query)
+            raise RuntimeError("ClickHouse query timed out after 600s")
+        if query.startswith("SELECT count()"):
+            self.queries.append(query)
+            staged = "_anon_staging_" in query
+            return [{"count": str(self.staged_rows if staged else 10)}]
+        return await self.execute_query(query)
+
+
+class TestSetWiseAnonymization:
+    @pytest.mark.asyncio
+    async def test_expired_partitions_are_rewritten_not_mutated(self):
+        client = FakePartitionedClickHouse()
+
+        count = await PartitionRetentionEngine(client).anonymize(
+            "otel.context_rot_metrics",
+            "timestamp",
+            datetime(2024, 1, 2, 12),
+            pii_columns=["user_message"],
+            anonymize_columns=["session_id"],
+        )
+
+        assert count == 14
+        insert = next(q for q in client.queries if q.startswith("INSERT INTO"))
+        assert "SELECT * REPLACE ('[ANONYMIZED]' AS user_message" in insert
+        assert "_partition_id = '20240101'" in insert
+        assert any(
+            q.startswith("ALTER TABLE otel.context_rot_metrics REPLACE PARTITION ID")
+            for q in client.queries
+        )
+        updates = [q for q in client.queries if " UPDATE " in q]
+        assert len(updates) == 1
+        assert "IN PARTITION ID '20240102'" in updates[0]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_only_counts(self):
+        client = FakePartitionedClickHouse()
+
+        count = await PartitionRetentionEngine(client).anonymize(
+            "otel.system_logs",
+            "timestamp",
+            datetime(2024, 1, 2, 12),
+            pii_columns=[],
+            anonymize_columns=["user_id"],
+            dry_run=True,
+        )
+
+        assert count == 14
+        assert not any(q.startswith(("ALTER", "INSERT")) for q in client.queries)
+
+    @pytest.mark.asyncio
+    async def test_each_run_uses_a_fresh_staging_table(self):
+        client = FakePartitionedClickHouse()
+        engine = PartitionRetentionEngine(client)
+        args = ("otel.context_rot_metrics", "timestamp", datetime(2024, 1, 2, 12))
+
+        await engine.anonymize(
+            *args, pii_columns=["user_message"], anonymize_columns=[]
+        )
+        await engine.anonymize(
+            *args, pii_columns=["user_message"], anonymize_columns=[]
+        )
+
+        creates = [q for q in client.queries if q.startswith("CREATE TABLE")]
+        drops = [q for q in client.queries if q.startswith("DROP TABLE")]
+        assert len(creates) == 2
+        assert all("IF NOT EXISTS" not in q for q in creates)
+        staging = [q.split()[2] for q in creates]
+        assert staging[0] != staging[1]
+        assert drops == [f"DROP TABLE IF EXISTS {name}" for name in staging]
+
+    @pytest.mark.asyncio
+    async def test_incomplete_staging_copy_is_not_swapped_in(self):
+        client = FakePartitionedClickHouse(staged_rows=7)
+
+        with pytest.raises(RuntimeError, match="staging holds 7 rows"):
+            await PartitionRetentionEngine(client).anonymize(
+                "otel.context_rot_metrics",
+                "timestamp",
+                datetime(2024, 1, 2, 12),
+                pii_columns=["user_message"],
+                anonymize_columns=[],
+            )
+
+        assert not any("REPLACE PARTITION" in q for q in client.queries)
+        assert client.queries[-1].startswith("DROP TABLE IF EXISTS")
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_aborts_before_replace(self):
+        client = FakePartitionedClickHouse(fail_on="INSERT INTO")
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            await PartitionRetentionEngine(client).anonymize(
+                "otel.context_rot_metrics",
+                "timestamp",
+                datetime(2024, 1, 2, 12),
+                pii_columns=["user_message"],
+                anonymize_columns=[],
+            )
+
+        assert not any("REPLACE PARTITION" in q for q in client.queries)
+        assert client.queries[-1].startswith("DROP TABLE IF EXISTS")
+
+
+class TestPurgeArchived:
+    @pytest.mark.asyncio
+    async def test_archived_ranges_are_deleted(self, tmp_path):
+        client = FakeArchiveClickHouse(_rows(10) + _rows(2, start=CUTOFF))
+        archiver = StreamingArchiver(
+            client, tmp_path, chunk_rows=4, rows_per_file=4, compression="gzip"
+        )
+        await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+
+        assert await archiver.purge_archived("otel.metrics") == 10
+        assert client.rows == _rows(2, start=CUTOFF)
+        # Ranges already purged are not queried again
+        client.queries.clear()
+        assert await archiver.purge_archived("otel.metrics") == 0
+        assert client.queries == []
+
+    @pytest.mark.asyncio
+    async def test_late_rows_before_the_cursor_are_kept(self, tmp_path):
+        client = FakeArchiveClickHouse(_rows(8))
+        archiver = StreamingArchiver(
+            client, tmp_path, chunk_rows=4, rows_per_file=4, compression="gzip"
+        )
+        manifest = await archiver.archive("otel.metrics", "timestamp", CUTOFF)
+        assert manifest.completed
+
+        # Arrives after its range was archived, inside the first file's range
+        late = {"id": 100, "timestamp": "2024-01-01 00:01:30"}
+        client.rows.append(late)
+
+        assert await archiver.purge_archived("otel.metrics") == 4
+        assert late in client.rows
+        assert [row["id"] for row in client.rows] == [0, 1, 2, 3, 100]
+
+
+class TestDataRetentionManagerArchive:
+    @pytest.mark.asyncio
+    async def test_rows_are_purged_only_after_complete_archive(self, tmp_path):
+        client = FakeArchiveClickHouse(
+            _rows(5, start=datetime.now() - timedelta(days=100))
+        )
+        manager = DataRetentionManager(client, archive_dir=tmp_path)
+        manager.archiver.compression = "gzip"
+        config = manager._get_table_config(DataCategory.SYSTEM_LOGS)
+
+        archived = await manager._archive_old_data(config, 90, dry_run=False)
+
+        assert archived == 5
+        assert client.rows == []
+        assert any(q.startswith("DELETE FROM") for q in client.queries)
+        assert not any("INSERT INTO" in q for q in client.queries)
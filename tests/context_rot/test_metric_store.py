@@ -0,0 +1,136 @@
+"""
+Tests for the time-bucketed metric store behind the health monitor.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from context_cleaner.telemetry.context_rot.health_monitor import (
+    ContextRotHealthMonitor,
+    HealthMetric,
+    MetricCollector,
+    MetricType,
+)
+from context_cleaner.telemetry.context_rot.metric_store import (
+    QuantileSketch,
+    TimeBucketedMetricStore,
+)
+
+
+class TestQuantileSketch:
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(3, 1) for _ in range(5000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.02)
+
+    def test_merged_sketches_match_single_sketch(self):
+        left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 101):
+            (left if value % 2 else right).add(value)
+            combined.add(value)
+
+        left.merge(right)
+
+        assert left.count == 100
+        assert left.quantile(0.95) == combined.quantile(0.95)
+
+
+class TestTimeBucketedMetricStore:
+    def test_samples_share_a_bucket_per_second(self):
+        store = TimeBucketedMetricStore()
+        for offset in (0.1, 0.5, 0.9, 1.2):
+            store.add(("latency", "a"), {}, offset * 10, 1000 + offset)
+
+        series = store.series[("latency", "a")]
+        assert [b.count for b in series.buckets] == [3, 1]
+
+    def test_window_only_reads_buckets_since_cutoff(self):
+        store = TimeBucketedMetricStore()
+        for second in range(100):
+            store.add(("ops", "a"), {}, second, 1000 + second)
+        store.add(("ops", "b"), {"component": "b"}, 500, 1099)
+
+        summary = store.summarize("ops", since=1090)
+
+        assert summary["count"] == 11
+        assert summary["min"] == 90
+        assert summary["max"] == 500
+        assert summary["total"] == sum(range(90, 100)) + 500
+
+    def test_prune_and_ring_capacity(self):
+        store = TimeBucketedMetricStore(max_buckets=10)
+        for second in range(20):
+            store.add(("ops", "a"), {}, 1, 1000 + second)
+
+        assert store.sample_count() == 10
+        assert store.prune(1015) == 5
+        assert store.summarize("ops", since=0)["count"] == 5
+
+
+class TestMetricCollector:
+    def test_summary_matches_previous_semantics(self):
+        collector = MetricCollector()
+        collector.record_metric(
+            HealthMetric(
+                "old", 1, MetricType.GAUGE, datetime.now() - timedelta(minutes=10)
+            )
+        )
+        for value in (10, 20, 30):
+            collector.record_timer("duration", value, {"component": "x"})
+        collector.record_timer("duration", 40, {"component": "y"})
+        collector.increment_counter("errors")
+        collector.increment_counter("errors")
+
+        timer = collector.get_metric_summary("duration")
+        assert timer["count"] == 4
+        assert timer["latest"] == 40
+        assert timer["avg"] == 25
+        assert timer["total"] is None
+        assert timer["p50"] == pytest.approx(20, rel=0.02)
+
+        # Counters record their running value, as before
+        assert collector.get_metric_summary("errors")["total"] == 3
+        assert collector.get_metric_summary("old") == {"count": 0, "latest": None}
+        assert collector.get_metric_summary("old", time_window_minutes=15)["count"] == 1
+
+    def test_recent_metrics_are_latest_per_series(self):
+        collector = MetricCollector()
+        for value in range(50):
+            collector.set_gauge("memory_usage_mb", value)
+
+        recent = collector.get_recent_metrics()
+
+        assert [m.value for m in recent] == [49]
+
+
+class TestPrometheusExport:
+    def test_one_sample_per_series_and_summaries_for_timers(self):
+        monitor = ContextRotHealthMonitor(enable_resource_monitoring=False)
+        component = monitor.get_component_monitor("analyzer")
+        for duration in range(1, 101):
+            component.record_operation("analyze", duration)
+
+        exported = monitor.export_metrics_prometheus().splitlines()
+
+        operations = [l for l in exported if l.startswith("component_operations{")]
+        assert len(operations) == 1
+        assert operations[0].split()[1] == "100"
+        assert "# TYPE component_operation_duration summary" in exported
+        assert any(
+            l.startswith("component_operation_duration{") and 'quantile="0.99"' in l
+            for l in exported
+        )
+        assert any(
+            l.startswith("component_operation_duration_count{") and l.endswith(" 100")
+            for l in exported
+        )
+        assert exported.count("# TYPE component_operations counter") == 1
@@ -0,0 +1,190 @@
+"""
+Tests for the partition-aware retention engine and its use by
+DataRetentionManager.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from context_cleaner.telemetry.context_rot.data_retention import (
+    DataCategory,
+    DataRetentionManager,
+)
+from context_cleaner.telemetry.context_rot.retention_engine import (
+    PartitionRetentionEngine,
+)
+
+
+class FakeClickHouse:
+    """Answers system table queries from fixtures and records statements"""
+
+    def __init__(self, partitions, partition_key="toDate(timestamp)", engine_full=""):
+        self.partitions = partitions
+        self.partition_key = partition_key
+        self.engine_full = engine_full
+        self.partial_count = 0
+        self.fail_on = None
+        self.queries = []
+
+    async def execute_query(self, query, params=None):
+        self.queries.append(" ".join(query.split()))
+        if "FROM system.parts" in query:
+            return self.partitions
+        if "FROM system.tables" in query:
+            return [
+                {"partition_key": self.partition_key, "engine_full": self.engine_full}
+            ]
+        if "count()" in query:
+            return [{"count": str(self.partial_count)}]
+        return []
+
+    async def execute_command(self, query, timeout=None):
+        if self.fail_on and self.fail_on in query:
+            self.queries.append(" ".join(query.split()))
+            raise RuntimeError("Code: 241. Memory limit exceeded")
+        return await self.execute_query(query)
+
+    def statements(self, prefix):
+        return [q for q in self.queries if q.startswith(prefix)]
+
+
+def _day_partition(day, rows=100, size=1024 * 1024):
+    return {
+        "partition_id": day.strftime("%Y%m%d"),
+        "partition": day.strftime("%Y-%m-%d"),
+        "rows": str(rows),
+        "bytes_on_disk": str(size),
+        "min_date": "1970-01-01",
+        "max_date": "1970-01-01",
+        "min_time": f"{day:%Y-%m-%d} 00:10:00",
+        "max_time": f"{day:%Y-%m-%d} 23:50:00",
+    }
+
+
+@pytest.fixture
+def cutoff():
+    return datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+
+class TestPartitionRetentionEngine:
+    @pytest.mark.asyncio
+    async def test_whole_partitions_are_dropped(self, cutoff):
+        client = FakeClickHouse(
+            [
+                _day_partition(cutoff - timedelta(days=2)),
+                _day_partition(cutoff - timedelta(days=1)),
+                _day_partition(cutoff, rows=80),
+                _day_partition(cutoff + timedelta(days=1)),
+            ]
+        )
+        client.partial_count = 20
+
+        plan = await PartitionRetentionEngine(client).purge(
+            "otel.metrics", "timestamp", cutoff
+        )
+
+        assert len(client.statements("ALTER TABLE otel.metrics DROP PARTITION")) == 2
+        assert not client.statements("ALTER TABLE otel.metrics DELETE")
+        assert len(client.statements("DELETE FROM otel.metrics")) == 1
+        # The row count only reads the partition that straddles the cutoff
+        count_query = next(q for q in client.queries if "count()" in q)
+        assert f"_partition_id IN ('{cutoff:%Y%m%d}')" in count_query
+
+        assert plan.rows_to_delete == 220
+        assert plan.storage_freed_mb == pytest.approx(2.25)
+
+    @pytest.mark.asyncio
+    async def test_failed_statements_are_not_counted(self, cutoff):
+        client = FakeClickHouse(
+            [
+                _day_partition(cutoff - timedelta(days=2)),
+                _day_partition(cutoff - timedelta(days=1), rows=50),
+                _day_partition(cutoff, rows=80),
+            ]
+        )
+        client.partial_count = 20
+        client.fail_on = f"DROP PARTITION ID '{cutoff - timedelta(days=2):%Y%m%d}'"
+
+        plan = await PartitionRetentionEngine(client).purge(
+            "otel.metrics", "timestamp", cutoff
+        )
+
+        assert [p.rows for p in plan.expired_partitions] == [50]
+        assert plan.rows_to_delete == 70
+        assert len(plan.errors) == 1
+
+        client.fail_on = "DELETE FROM"
+        plan = await PartitionRetentionEngine(client).purge(
+            "otel.metrics", "timestamp", cutoff
+        )
+
+        assert plan.rows_to_delete == 150
+        assert plan.partial_bytes == 0
+        assert "Failed to delete" in plan.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_table_ttl_handles_partial_partitions(self, cutoff):
+        client = FakeClickHouse(
+            [_day_partition(cutoff - timedelta(days=40)), _day_partition(cutoff)],
+            engine_full="MergeTree ORDER BY id TTL timestamp + toIntervalDay(30)",
+        )
+        client.partial_count = 10
+
+        plan = await PartitionRetentionEngine(client).purge(
+            "otel.metrics", "timestamp", cutoff - timedelta(days=60)
+        )
+
+        assert plan.ttl_days == 30
+        assert plan.deferred_to_ttl
+        assert not client.statements("DELETE FROM")
+
+    @pytest.mark.asyncio
+    async def test_partition_value_gives_bounds_without_minmax(self, cutoff):
+        month = {
+            "partition_id": "202001",
+            "partition": "202001",
+            "rows": "5",
+            "bytes_on_disk": "10",
+            "min_date": "1970-01-01",
+            "max_date": "1970-01-01",
+            "min_time": "1970-01-01 00:00:00",
+            "max_time": "1970-01-01 00:00:00",
+        }
+        client = FakeClickHouse([month], partition_key="toYYYYMM(timestamp)")
+
+        plan = await PartitionRetentionEngine(client).plan(
+            "otel.metrics", "timestamp", cutoff
+        )
+
+        assert plan.partition_aware
+        assert [p.partition_id for p in plan.expired_partitions] == ["202001"]
+
+    @pytest.mark.asyncio
+    async def test_other_partition_keys_fall_back_to_lightweight_delete(self):
+        partition = _day_partition(datetime(2020, 1, 1))
+        client = FakeClickHouse([partition], partition_key="substr(user_id, 1, 2)")
+        client.partial_count = 50
+
+        plan = await PartitionRetentionEngine(client).purge(
+            "otel.user_baselines", "last_updated", datetime.now()
+        )
+
+        assert not plan.partition_aware
+        assert not client.statements("ALTER TABLE")
+        assert len(client.statements("DELETE FROM otel.user_baselines")) == 1
+        assert plan.partial_bytes == 524288
+
+
+class TestDataRetentionManager:
+    @pytest.mark.asyncio
+    async def test_cleanup_avoids_mutations_and_row_scans(self, cutoff):
+        client = FakeClickHouse([_day_partition(datetime.now() - timedelta(days=400))])
+        manager = DataRetentionManager(client)
+
+        results = await manager.execute_retention_policy(DataCategory.SYSTEM_LOGS)
+
+        assert results[0].partitions_dropped == 1
+        assert results[0].records_processed == 100
+        assert not any("DELETE WHERE" in q for q in client.queries)
+        assert not any("toString(*)" in q for q in client.queries)
@@ -8,10 +8,12 @@ Comprehensive tests for the main ContextAnalyzer class including:
 - Circuit breaker functionality
 - Cache management
 - Error handling and graceful degradation
+- Concurrent execution strategies and per-analyzer budgets
 """
 
 import pytest
 import asyncio
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock
 
@@ -523,6 +525,143 @@ class TestConvenienceFunctions:
         assert result is None
 
 
+class TestExecutionStrategies:
+    """Test suite for concurrent analyzer execution."""
+
+    sample_context = {
+        "messages": [
+            "Currently working on authentication bug fix",
+            "Help me debug this function",
+            "Help me debug this function",
+        ],
+        "todos": ["HIGH PRIORITY: Fix critical auth bug", "Update docs - done"],
+        "files": ["/project/auth.py", "/project/auth.py"],
+    }
+
+    @staticmethod
+    def _comparable(result):
+        return (
+            result.health_score,
+            result.focus_metrics.focus_score,
+            result.redundancy_report.duplicate_content_percentage,
+            result.recency_report.total_items_categorized,
+            result.priority_report.total_items_analyzed,
+        )
+
+    @pytest.mark.asyncio
+    async def test_strategies_produce_identical_results(self):
+        """Inline, thread and process execution agree."""
+        results = []
+        for strategy in ("inline", "thread", "process"):
+            analyzer = ContextAnalyzer({"execution_strategy": strategy})
+            try:
+                result = await analyzer.analyze_context(
+                    self.sample_context, use_cache=False
+                )
+            finally:
+                analyzer.close()
+            assert result.performance_metrics["execution_strategy"] == strategy
+            results.append(self._comparable(result))
+
+        assert results[0] == results[1] == results[2]
+
+    @pytest.mark.asyncio
+    async def test_slow_component_returns_partial_result(self):
+        """A component over budget gets an empty result without a failure."""
+        analyzer = ContextAnalyzer({"analyzer_timeout": 0.2})
+
+        async def slow_focus(context_data, index=None):
+            time.sleep(1.0)
+
+        with patch.object(analyzer.focus_scorer, "calculate_focus_metrics", slow_focus):
+            result = await analyzer.analyze_context(self.sample_context)
+        analyzer.close()
+
+        assert result is not None
+        assert result.performance_metrics["timed_out_components"] == ["focus"]
+        assert result.performance_metrics["components_analyzed"] == 3
+        assert result.focus_metrics.total_content_items == 0
+        assert result.priority_report.total_items_analyzed > 0
+        assert analyzer.circuit_breaker_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_analysis_after_timeouts_gets_full_budget(self):
+        """Analyzers stuck past their budget do not starve the next run."""
+        analyzer = ContextAnalyzer({"analyzer_timeout": 0.3})
+
+        async def stuck(context_data, index=None):
+            time.sleep(1.5)
+
+        with (
+            patch.multiple(analyzer.redundancy_detector, analyze_redundancy=stuck),
+            patch.multiple(analyzer.recency_analyzer, analyze_recency=stuck),
+            patch.multiple(analyzer.focus_scorer, calculate_focus_metrics=stuck),
+            patch.multiple(analyzer.priority_analyzer, analyze_priorities=stuck),
+        ):
+            first = await analyzer.analyze_context(self.sample_context, use_cache=False)
+        second = await analyzer.analyze_context(self.sample_context, use_cache=False)
+        analyzer.close()
+
+        assert len(first.performance_metrics["timed_out_components"]) == 4
+        assert second.performance_metrics["timed_out_components"] == []
+        assert second.focus_metrics.total_content_items > 0
+
+    @pytest.mark.asyncio
+    async def test_overrunning_threads_are_capped(self):
+        """Components stuck from earlier runs are not started yet again."""
+        analyzer = ContextAnalyzer({"analyzer_timeout": 0.1})
+        started = []
+
+        async def stuck_focus(context_data, index=None):
+            started.append(index.frozen)
+            time.sleep(1.0)
+
+        with patch.object(
+            analyzer.focus_scorer, "calculate_focus_metrics", stuck_focus
+        ):
+            runs = [
+                await analyzer.analyze_context(self.sample_context, use_cache=False)
+                for _ in range(analyzer.MAX_OVERRUNNING_THREADS + 1)
+            ]
+        analyzer.close()
+
+        assert started == [True] * analyzer.MAX_OVERRUNNING_THREADS
+        assert all(
+            run.performance_metrics["timed_out_components"] == ["focus"] for run in runs
+        )
+        assert runs[-1].priority_report.total_items_analyzed > 0
+
+    @pytest.mark.asyncio
+    async def test_thread_strategy_keeps_event_loop_free(self):
+        """CPU-bound analyzers do not block other coroutines."""
+        analyzer = ContextAnalyzer()
+        ticks = 0
+
+        async def busy_focus(context_data, index=None):
+            time.sleep(0.3)
+            return analyzer.focus_scorer._get_empty_focus_metrics(datetime.now())
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        with patch.object(analyzer.focus_scorer, "calculate_focus_metrics", busy_focus):
+            result = await analyzer.analyze_context(self.sample_context)
+        ticker_task.cancel()
+        analyzer.close()
+
+        assert result is not None
+        assert ticks >= 10
+
+    def test_unknown_strategy_rejected(self):
+        """Unknown execution strategies fail fast."""
+        with pytest.raises(ValueError):
+            ContextAnalyzer({"execution_strategy": "fibers"})
+
+
 if __name__ == "__main__":
     # Run tests if script is executed directly
     pytest.main([__file__, "-v"])
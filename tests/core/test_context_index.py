@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for ContextIndex
+
+Tests the one-time flat index shared by the context analyzers:
+- Leaves are listed in document order with their paths
+- Category tags, content hashes and timestamps
+- Analyzers reuse a prebuilt index instead of re-walking the context
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from context_cleaner.core.context_analyzer import ContextAnalyzer
+from context_cleaner.core.context_index import ContextIndex, categorize_path
+from context_cleaner.core.recency_analyzer import RecencyAnalyzer
+
+
+class TestContextIndex:
+    """Test suite for ContextIndex."""
+
+    @pytest.fixture
+    def context_data(self):
+        return {
+            "messages": ["Fix the login bug", {"text": "Fix the login bug"}],
+            "files": {"main": "/src/main.py"},
+            "todos": [{"title": "write tests", "done": False}],
+            "notes": [],
+            "summary": "updated at 2024-01-15 10:30:00",
+        }
+
+    def test_items_in_document_order(self, context_data):
+        index = ContextIndex(context_data)
+
+        assert [(item.position, item.path, item.value) for item in index] == [
+            (0, "messages[0]", "Fix the login bug"),
+            (1, "messages[1].text", "Fix the login bug"),
+            (2, "files.main", "/src/main.py"),
+            (3, "todos[0].title", "write tests"),
+            (4, "todos[0].done", False),
+            (5, "summary", "updated at 2024-01-15 10:30:00"),
+        ]
+        assert index.items[4].text == "False"
+
+    def test_categories_and_hashes(self, context_data):
+        index = ContextIndex(context_data)
+
+        assert [item.category for item in index] == [
+            "messages",
+            "messages",
+            "files",
+            "todos",
+            "todos",
+            "other",
+        ]
+        messages = index.in_category("messages")
+        assert messages[0].content_hash == messages[1].content_hash
+        assert (
+            messages[0].content_hash
+            == hashlib.md5("Fix the login bug".encode()).hexdigest()
+        )
+        assert categorize_path("System.Reminder") == "system_messages"
+
+    def test_timestamps_are_resolved_once(self, context_data):
+        index = ContextIndex(context_data)
+        analyzer = RecencyAnalyzer()
+
+        with patch.object(
+            analyzer, "_extract_timestamp", wraps=analyzer._extract_timestamp
+        ) as extract:
+            timestamped = index.resolve_timestamps(analyzer._extract_timestamp)
+            index.resolve_timestamps(analyzer._extract_timestamp)
+
+        assert extract.call_count == len(index)
+        assert [item.path for item in timestamped] == ["summary"]
+        assert timestamped[0].timestamp.year == 2024
+
+    def test_freeze_fills_lazy_fields(self, context_data):
+        index = ContextIndex(context_data)
+        analyzer = RecencyAnalyzer()
+
+        assert index.freeze(analyzer._extract_timestamp) is index
+        assert index.frozen
+        assert index._serialized is not None
+        assert all(item._content_hash is not None for item in index)
+        assert index.items[5].timestamp.year == 2024
+
+        with patch.object(analyzer, "_extract_timestamp") as extract:
+            index.freeze(extract)
+            index.resolve_timestamps(extract)
+        extract.assert_not_called()
+
+
+class TestSharedIndexAnalysis:
+    """ContextAnalyzer builds one index for all analyzers."""
+
+    @pytest.mark.asyncio
+    async def test_analysis_walks_context_once(self):
+        context_data = {
+            "messages": [f"message {i} about the current task" for i in range(20)],
+            "todos": ["fix urgent bug", "write tests"],
+            "files": ["/src/app.py", "/src/app.py"],
+        }
+        analyzer = ContextAnalyzer()
+
+        with patch.object(
+            ContextIndex, "_build", autospec=True, side_effect=ContextIndex._build
+        ) as build:
+            result = await analyzer._perform_analysis(context_data)
+
+        roots = [call for call in build.call_args_list if call.args[2] == ""]
+        assert len(roots) == 1
+        assert result.focus_metrics.total_content_items == 24
+        assert result.priority_report.total_items_analyzed == 24
+        assert result.recency_report.total_items_categorized == 24
+        assert result.redundancy_report.total_items_analyzed == 24
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for KeywordEngine
+
+Tests the shared multi-family matcher used by the focus, priority and
+recency analyzers:
+- Per-family results match findall()/search() with IGNORECASE
+- Overlapping hits from different families are all reported
+- Original case is kept when requested
+- Items without hits are rejected early
+"""
+
+import re
+
+import pytest
+
+from context_cleaner.core.keyword_engine import KeywordEngine
+
+
+class TestKeywordEngine:
+    """Test suite for KeywordEngine."""
+
+    @pytest.fixture
+    def engine(self):
+        return KeywordEngine(
+            keywords={
+                "current": ["current", "currently", "priority"],
+                "priority": ["urgent", "high priority"],
+            },
+            patterns={"action": r"\b(fix|test)\b"},
+        )
+
+    def test_scan_matches_findall_per_family(self, engine):
+        text = "Currently fixing: FIX the TEST, urgent!"
+
+        hits = engine.scan(text)
+
+        assert hits == {
+            "current": re.findall("current|currently|priority", text.lower()),
+            "priority": ["urgent"],
+            "action": ["fix", "test"],
+        }
+
+    def test_overlapping_families_are_all_reported(self, engine):
+        hits = engine.scan("High Priority item")
+
+        assert hits == {"current": ["priority"], "priority": ["high priority"]}
+
+    def test_present_reports_matching_families(self, engine):
+        assert engine.present("an URGENT fix") == {"priority", "action"}
+        assert engine.present("/src/module/file.py") == set()
+        assert engine.scan("/src/module/file.py") == {}
+
+    def test_preserve_case_slices_original_text(self):
+        engine = KeywordEngine(
+            patterns={"deadline": r"(?i)deadline\s*:?\s*([^\n,\.]+)"},
+            preserve_case=True,
+        )
+
+        assert engine.scan("DEADLINE: Friday Noon, then") == {
+            "deadline": ["Friday Noon"]
+        }
+
+    def test_text_changing_length_when_lowercased(self):
+        # "İ" lowercases to two code points; spans must still line up
+        engine = KeywordEngine(
+            patterns={"deadline": r"(?i)deadline\s*:?\s*([^\n,\.]+)"},
+            preserve_case=True,
+        )
+
+        assert engine.scan("İ DEADLINE: Friday") == {"deadline": ["Friday"]}
+
+    def test_requires_a_family(self):
+        with pytest.raises(ValueError):
+            KeywordEngine()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for WorkingContext and copy-free plan execution
+
+Tests the undo-logged working copy used by ManipulationEngine and
+PreviewGenerator:
+- Changes never touch the original context
+- Rollback restores values and key order
+- Diffs cover only touched keys
+- Plans run on one working copy without deep copies
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from context_cleaner.core.manipulation_engine import (
+    ManipulationEngine,
+    ManipulationOperation,
+    ManipulationPlan,
+)
+from context_cleaner.core.preview_generator import ChangeType, PreviewGenerator
+from context_cleaner.core.working_context import WorkingContext
+
+
+def _operation(operation_id, operation_type, target_keys, **operation_data):
+    return ManipulationOperation(
+        operation_id=operation_id,
+        operation_type=operation_type,
+        target_keys=target_keys,
+        operation_data=operation_data,
+        estimated_token_impact=-10,
+        confidence_score=0.9,
+        reasoning="test",
+        requires_confirmation=False,
+    )
+
+
+def _plan(operations):
+    return ManipulationPlan(
+        plan_id="plan",
+        total_operations=len(operations),
+        operations=operations,
+        estimated_total_reduction=0,
+        estimated_execution_time=0.0,
+        safety_level="balanced",
+        requires_user_approval=False,
+        created_timestamp="2024-01-01T00:00:00",
+    )
+
+
+class TestWorkingContext:
+    """Test suite for WorkingContext."""
+
+    @pytest.fixture
+    def original(self):
+        return {"a": 1, "b": [2], "c": 3, "d": 4}
+
+    def test_changes_leave_original_untouched(self, original):
+        working = WorkingContext(original)
+        working.pop("a")
+        working.set("b", "replaced")
+        working.set("e", 5)
+
+        assert original == {"a": 1, "b": [2], "c": 3, "d": 4}
+        assert working.data == {"b": "replaced", "c": 3, "d": 4, "e": 5}
+
+    def test_rollback_restores_values_and_key_order(self, original):
+        working = WorkingContext(original)
+        working.set("c", 30)
+        checkpoint = working.checkpoint()
+        working.pop("b")
+        working.reorder(["d"])
+        working.set("e", 5)
+
+        working.rollback(checkpoint)
+
+        assert list(working.data.items()) == [("a", 1), ("b", [2]), ("c", 30), ("d", 4)]
+
+    def test_rollback_without_removals_undoes_in_place(self, original):
+        working = WorkingContext(original)
+        working.set("a", 10)
+        working.reorder(["c"])
+        working.set("e", 5)
+
+        working.rollback()
+
+        assert list(working.data.items()) == list(original.items())
+
+    def test_diff_covers_only_touched_keys(self, original):
+        working = WorkingContext(original)
+        working.set("a", 10)
+        checkpoint = working.checkpoint()
+        working.set("b", "x")
+        working.set("b", "y")
+        working.pop("c")
+        working.set("e", 5)
+
+        assert working.touched_keys(checkpoint) == ["b", "c", "e"]
+        assert working.before_values(checkpoint) == {"b": [2], "c": 3}
+
+
+class TestCopyFreeExecution:
+    """Plans execute and preview on a single working copy."""
+
+    @pytest.fixture
+    def context_data(self):
+        context = {f"key_{i}": {"content": f"value {i}"} for i in range(50)}
+        context["verbose"] = "word " * 200
+        return context
+
+    @pytest.fixture
+    def operations(self):
+        return [
+            _operation("op1", "remove", ["key_1", "key_2"]),
+            _operation("op2", "consolidate", ["key_3", "key_4"]),
+            _operation("op3", "summarize", ["verbose"]),
+            _operation("op4", "reorder", [], new_order=["key_10"]),
+        ]
+
+    def test_plan_matches_chained_operations_without_deep_copies(
+        self, context_data, operations
+    ):
+        engine = ManipulationEngine()
+        expected = context_data
+        for operation in operations:
+            expected, _ = engine.execute_operation(operation, expected)
+
+        with patch("context_cleaner.core.manipulation_engine.deepcopy") as deepcopy:
+            result = engine.execute_plan(_plan(operations), context_data)
+
+        deepcopy.assert_not_called()
+        assert result.execution_success
+        assert list(result.modified_context.items()) == list(expected.items())
+        assert "key_1" in context_data
+        # Untouched values are shared, not copied
+        assert result.modified_context["key_20"] is context_data["key_20"]
+
+    def test_deep_copy_mode_copies_once_per_plan(self, context_data, operations):
+        engine = ManipulationEngine({"execution_mode": "deep_copy"})
+
+        result = engine.execute_plan(_plan(operations), context_data)
+
+        assert result.execution_success
+        assert result.modified_context["key_20"] == context_data["key_20"]
+        assert result.modified_context["key_20"] is not context_data["key_20"]
+
+    def test_failed_operation_is_rolled_back(self, context_data):
+        engine = ManipulationEngine()
+        operations = [
+            _operation("op1", "remove", ["key_1"]),
+            _operation("op2", "unknown", ["key_2"]),
+            _operation("op3", "remove", ["key_3"]),
+        ]
+
+        result = engine.execute_plan(_plan(operations), context_data)
+
+        assert result.operations_executed == 2
+        assert result.operations_failed == 1
+        assert "key_1" not in result.modified_context
+        assert "key_2" in result.modified_context
+        assert "key_3" not in result.modified_context
+
+    def test_plan_preview_chains_operations(self, context_data, operations):
+        generator = PreviewGenerator(config={"include_validation": False})
+
+        preview = generator.preview_plan(_plan(operations), context_data)
+
+        removed = {
+            change.key
+            for change in preview.operation_previews[0].changes
+            if change.change_type == ChangeType.REMOVED
+        }
+        assert removed == {"key_1", "key_2"}
+        consolidated = [change.key for change in preview.operation_previews[1].changes]
+        assert sorted(consolidated) == ["consolidated_key_3", "key_3", "key_4"]
+        assert preview.summary["final_size"] < preview.summary["original_size"]
+        assert "key_1" in context_data
@@ -0,0 +1,148 @@
+"""
+Tests for content-hash memoization of the comprehensive health report.
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from context_cleaner.dashboard.comprehensive_health_dashboard import (
+    ComprehensiveHealthDashboard,
+)
+from context_cleaner.dashboard.modules.dashboard_health_memo import HealthReportMemo
+from context_cleaner.optimization.cache_dashboard import UsageBasedHealthMetrics
+
+
+def _classify(item):
+    return {"current_work": "todo" in str(item)}
+
+
+def _context(*contents, **extra):
+    return {"items": [{"content": c} for c in contents], **extra}
+
+
+class TestHealthReportMemo:
+    def test_only_new_items_are_classified(self):
+        memo = HealthReportMemo()
+        calls = []
+
+        def classify(item):
+            calls.append(item["content"])
+            return _classify(item)
+
+        first = memo.snapshot(_context("a todo", "b"), classify)
+        second = memo.snapshot(_context("a todo", "b", "c"), classify)
+
+        assert calls == ["a todo", "b", "c"]
+        assert first.digest != second.digest
+        assert [item.current_work for item in second.items] == [True, False, False]
+
+    def test_snapshot_sizes_match_full_rendering(self):
+        context = _context("x", "y" * 50, session={"id": 1})
+        context["items"].append("plain")
+
+        snapshot = HealthReportMemo().snapshot(context, _classify)
+
+        assert snapshot.text_length == len(str(context))
+        assert snapshot.char_count == sum(
+            [len("items"), len("content") * 2, 1, 50, len("session"), 2, 1, 5]
+        )
+
+    def test_stable_until_next_recency_transition(self):
+        now = datetime.now()
+        context = {"items": [{"timestamp": (now - timedelta(minutes=30)).isoformat()}]}
+
+        def classify(item):
+            return {"timestamp": datetime.fromisoformat(item["timestamp"])}
+
+        snapshot = HealthReportMemo().snapshot(context, classify)
+
+        assert snapshot.stable_until(now) == now + timedelta(minutes=30)
+        assert snapshot.stable_until(now + timedelta(days=2)) is None
+
+    def test_results_are_keyed_and_expire(self):
+        memo = HealthReportMemo()
+        now = datetime.now()
+        memo.put_result("focus", ("a",), 1, expires_at=now + timedelta(seconds=1))
+
+        assert memo.get_result("focus", ("a",), now) == (True, 1)
+        assert memo.get_result("focus", ("b",), now) == (False, None)
+        assert memo.get_result("focus", ("a",), now + timedelta(seconds=2))[0] is False
+
+    def test_unchanged_file_reuses_snapshot(self, tmp_path):
+        memo = HealthReportMemo()
+        path = tmp_path / "context.json"
+        path.write_text(json.dumps(_context("a")))
+        snapshot = memo.snapshot(_context("a"), _classify)
+        memo.remember_file(path, snapshot)
+
+        assert memo.file_snapshot(path) is snapshot
+
+        path.write_text(json.dumps(_context("a", "b")))
+        assert memo.file_snapshot(path) is None
+
+
+class TestIncrementalHealthReport:
+    @pytest.fixture
+    def dashboard(self):
+        # Skip the Flask/telemetry setup; the report only needs these pieces
+        dashboard = object.__new__(ComprehensiveHealthDashboard)
+        dashboard._health_memo = HealthReportMemo()
+        cache_data = Mock(
+            enhanced_analysis=None,
+            correlation_insights=None,
+            traditional_health=None,
+            health_metrics=UsageBasedHealthMetrics(0.5, 0.6, 0.7, 0.8, 0.3, 0.4, 0.5),
+        )
+        dashboard.cache_dashboard = Mock(
+            generate_dashboard=AsyncMock(return_value=cache_data),
+            discover_cache_inputs=AsyncMock(return_value=[]),
+            input_fingerprint=Mock(return_value=(("/cache", 3, 1024, "t0"),)),
+        )
+        return dashboard
+
+    @pytest.mark.asyncio
+    async def test_unchanged_context_reuses_partial_results(self, dashboard):
+        context = _context("todo: implement memo", "done: read docs")
+        dashboard._analyze_focus_metrics = Mock(wraps=dashboard._analyze_focus_metrics)
+
+        first = await dashboard.generate_comprehensive_health_report(
+            context_data=context
+        )
+        second = await dashboard.generate_comprehensive_health_report(
+            context_data=_context("todo: implement memo", "done: read docs")
+        )
+
+        assert dashboard._analyze_focus_metrics.call_count == 1
+        assert second.focus_metrics is first.focus_metrics
+        assert dashboard._health_memo.stats["item_misses"] == 2
+
+        changed = await dashboard.generate_comprehensive_health_report(
+            context_data=_context("todo: implement memo", "todo: write tests")
+        )
+        assert dashboard._analyze_focus_metrics.call_count == 2
+        assert dashboard._health_memo.stats["item_misses"] == 3
+        assert changed.focus_metrics.current_work_ratio == 1.0
+
+    @pytest.mark.asyncio
+    async def test_cache_dashboard_is_generated_only_for_new_inputs(self, dashboard):
+        context = _context("todo: implement memo")
+        generate = dashboard.cache_dashboard.generate_dashboard
+
+        await dashboard.generate_comprehensive_health_report(context_data=context)
+        await dashboard.generate_comprehensive_health_report(context_data=context)
+        assert generate.await_count == 1
+
+        # New session cache files change the fingerprint
+        dashboard.cache_dashboard.input_fingerprint.return_value = (
+            ("/cache", 4, 2048, "t1"),
+        )
+        await dashboard.generate_comprehensive_health_report(context_data=context)
+        assert generate.await_count == 2
+
+        await dashboard.generate_comprehensive_health_report(
+            context_data=_context("todo: write tests")
+        )
+        assert generate.await_count == 3
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from context_cleaner.hooks.integration_manager import HookIntegrationManager
+from context_cleaner.ipc.hook_client import encode_hook_event, send_hook_event
+from context_cleaner.ipc.protocol import RequestAction, SupervisorRequest
+from context_cleaner.services.service_supervisor import (
+    ServiceSupervisor,
+    SupervisorConfig,
+)
+
+
+class RecordingHookManager:
+    def __init__(self):
+        self.events = []
+        self.flushes = 0
+
+    def apply_event(self, event_type, hook_data):
+        self.events.append((event_type, hook_data))
+        return True
+
+    def flush_session(self):
+        self.flushes += 1
+        return True
+
+
+class StubOrchestrator:
+    def get_service_status(self):
+        return {}
+
+
+@pytest.fixture
+def isolated_registry(tmp_path, monkeypatch):
+    monkeypatch.setenv(
+        "CONTEXT_CLEANER_PROCESS_REGISTRY_DB", str(tmp_path / "registry.db")
+    )
+    monkeypatch.setattr("context_cleaner.services.process_registry._registry", None)
+    monkeypatch.setattr(
+        "context_cleaner.services.process_registry._discovery_engine", None
+    )
+
+
+def test_encoded_hook_event_parses_as_supervisor_request(monkeypatch):
+    monkeypatch.setenv("CONTEXT_CLEANER_SUPERVISOR_TOKEN", "secret")
+    frame = encode_hook_event("session_start", {"session_id": "s1"})
+
+    assert int.from_bytes(frame[:4], "big") == len(frame) - 4
+    request = SupervisorRequest.from_json(frame[4:].decode("utf-8"))
+    assert request.action is RequestAction.HOOK_EVENT
+    assert request.options == {
+        "event_type": "session_start",
+        "payload": {"session_id": "s1"},
+    }
+    assert request.auth.token == "secret"
+
+
+def test_send_hook_event_without_supervisor_returns_false(tmp_path):
+    assert (
+        send_hook_event("context_change", {}, endpoint=str(tmp_path / "missing.sock"))
+        is False
+    )
+
+
+@pytest.mark.asyncio
+async def test_supervisor_rejects_malformed_hook_event(tmp_path, isolated_registry):
+    supervisor = ServiceSupervisor(
+        StubOrchestrator(),
+        SupervisorConfig(
+            endpoint="ipc://test", audit_log_path=str(tmp_path / "audit.log")
+        ),
+    )
+    supervisor.register_hook_manager(RecordingHookManager())
+    await supervisor.start()
+    try:
+        response = await supervisor.handle_request(
+            SupervisorRequest(action=RequestAction.HOOK_EVENT, options={"payload": {}})
+        )
+        assert response.status == "error"
+        assert response.error["message"] == "invalid-hook-event"
+    finally:
+        await supervisor.stop()
+
+
+@pytest.mark.skipif(
+    os.name == "nt", reason="Unix socket transport not available on Windows"
+)
+@pytest.mark.asyncio
+async def test_hook_events_over_socket_are_batched(tmp_path, isolated_registry):
+    socket_dir = tempfile.mkdtemp(prefix="cc-hook-", dir="/tmp")
+    endpoint = os.path.join(socket_dir, "supervisor.sock")
+    manager = RecordingHookManager()
+    supervisor = ServiceSupervisor(
+        StubOrchestrator(),
+        SupervisorConfig(
+            endpoint=endpoint,
+            audit_log_path=str(tmp_path / "audit.log"),
+            hook_flush_interval_seconds=60,
+        ),
+    )
+    supervisor.register_hook_manager(manager)
+    try:
+        await supervisor.start()
+    except PermissionError as exc:
+        pytest.skip(f"Unable to bind unix socket in test environment: {exc}")
+
+    try:
+        for event_type in ("session_start", "context_change", "context_change"):
+            sent = await asyncio.to_thread(
+                send_hook_event, event_type, {"session_id": "s1"}, endpoint
+            )
+            assert sent is True
+
+        for _ in range(100):
+            if len(manager.events) == 3:
+                break
+            await asyncio.sleep(0.01)
+        assert [event for event, _ in manager.events] == [
+            "session_start",
+            "context_change",
+            "context_change",
+        ]
+        # Session state is only written on the flush interval, not per event
+        assert manager.flushes == 0
+    finally:
+        await supervisor.stop()
+        os.rmdir(socket_dir)
+
+    assert manager.flushes == 1
+    # Accepted hook events are not audited per request
+    audit_log = tmp_path / "audit.log"
+    assert not audit_log.exists() or "hook-event" not in audit_log.read_text()
+
+
+@pytest.mark.skipif(
+    os.name == "nt", reason="Unix socket transport not available on Windows"
+)
+@pytest.mark.asyncio
+async def test_rejected_hook_event_is_reported(
+    tmp_path, isolated_registry, monkeypatch
+):
+    monkeypatch.delenv("CONTEXT_CLEANER_SUPERVISOR_TOKEN", raising=False)
+    socket_dir = tempfile.mkdtemp(prefix="cc-hook-", dir="/tmp")
+    endpoint = os.path.join(socket_dir, "supervisor.sock")
+    manager = RecordingHookManager()
+    supervisor = ServiceSupervisor(
+        StubOrchestrator(),
+        SupervisorConfig(
+            endpoint=endpoint,
+            audit_log_path=str(tmp_path / "audit.log"),
+            auth_token="secret",
+        ),
+    )
+    supervisor.register_hook_manager(manager)
+    try:
+        await supervisor.start()
+    except PermissionError as exc:
+        pytest.skip(f"Unable to bind unix socket in test environment: {exc}")
+
+    try:
+        sent = await asyncio.to_thread(
+            send_hook_event, "context_change", {"session_id": "s1"}, endpoint
+        )
+        assert sent is False
+
+        monkeypatch.setenv("CONTEXT_CLEANER_SUPERVISOR_TOKEN", "secret")
+        sent = await asyncio.to_thread(
+            send_hook_event, "context_change", {"session_id": "s1"}, endpoint
+        )
+        assert sent is True
+    finally:
+        await supervisor.stop()
+        os.rmdir(socket_dir)
+
+    assert [event for event, _ in manager.events] == ["context_change"]
+    assert "invalid-auth-token" in (tmp_path / "audit.log").read_text()
+
+
+def test_apply_event_defers_session_writes(tmp_path, monkeypatch):
+    manager = HookIntegrationManager()
+    monkeypatch.setattr(manager.config, "data_directory", str(tmp_path))
+
+    assert manager.apply_event("session_start", {"session_id": "s1"}) is True
+    assert manager.apply_event("context_change", {"event_type": "edit"}) is True
+    session_file = tmp_path / "sessions" / "s1.json"
+    assert not session_file.exists()
+
+    assert manager.flush_session() is True
+    assert session_file.exists()
+    assert manager.flush_session() is False
+
+    assert manager.apply_event("session_end", {}) is True
+    assert manager.current_session is None
@@ -0,0 +1,93 @@
+"""
+Tests for the process-wide metrics registry.
+"""
+
+import asyncio
+
+import pytest
+
+from context_cleaner.monitoring.metrics_registry import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestMetricFamilies:
+    def test_counter_and_gauge_render_per_label_set(self, registry):
+        requests = registry.counter("app_requests_total", "Requests", ["route"])
+        in_flight = registry.gauge("app_in_flight", "In-flight requests")
+
+        requests.inc(route="/a")
+        requests.inc(2, route="/a")
+        requests.inc(route="/b")
+        in_flight.set(3)
+        in_flight.dec()
+
+        text = registry.render()
+
+        assert "# TYPE app_requests_total counter" in text
+        assert 'app_requests_total{route="/a"} 3' in text
+        assert 'app_requests_total{route="/b"} 1' in text
+        assert "app_in_flight 2" in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        latency = registry.histogram("app_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        text = registry.render()
+
+        assert 'app_seconds_bucket{le="0.1"} 2' in text
+        assert 'app_seconds_bucket{le="1"} 3' in text
+        assert 'app_seconds_bucket{le="+Inf"} 4' in text
+        assert "app_seconds_count 4" in text
+        assert "app_seconds_sum 3.65" in text
+
+    def test_same_name_returns_existing_family(self, registry):
+        first = registry.counter("app_total", "Total")
+
+        assert registry.counter("app_total", "Total") is first
+        with pytest.raises(ValueError):
+            registry.gauge("app_total", "Total")
+
+    def test_wrong_labels_are_rejected(self, registry):
+        counter = registry.counter("app_total", "Total", ["route"])
+
+        with pytest.raises(ValueError):
+            counter.inc(path="/a")
+
+
+class TestSpans:
+    def test_span_and_timed_record_durations(self, registry):
+        seconds = registry.histogram("op_seconds", "Op", ["operation"])
+
+        with registry.span(seconds, operation="block"):
+            pass
+
+        @registry.timed(seconds, operation="sync")
+        def work():
+            return 1
+
+        @registry.timed(seconds, operation="async")
+        async def async_work():
+            return 2
+
+        assert work() == 1
+        assert asyncio.run(async_work()) == 2
+        for operation in ("block", "sync", "async"):
+            assert seconds.snapshot(operation=operation)["count"] == 1
+
+    def test_disabled_registry_records_nothing(self, registry):
+        registry.disable()
+        counter = registry.counter("app_total", "Total")
+        seconds = registry.histogram("op_seconds", "Op")
+
+        counter.inc()
+        with registry.span(seconds):
+            pass
+
+        assert counter.value() == 0
+        assert seconds.snapshot() is None
+        assert registry.render() == "\n"
@@ -0,0 +1,151 @@
+"""
+Tests for the built-in sampling profiler.
+"""
+
+import threading
+import time
+
+import pytest
+
+from context_cleaner.ipc.protocol import RequestAction, SupervisorRequest
+from context_cleaner.monitoring.sampling_profiler import SamplingProfiler
+
+
+def _spin_until(event):
+    while not event.is_set():
+        sum(range(200))
+
+
+@pytest.fixture
+def busy_thread():
+    done = threading.Event()
+    thread = threading.Thread(target=_spin_until, args=(done,), name="busy-worker")
+    thread.start()
+    yield thread
+    done.set()
+    thread.join()
+
+
+class TestSamplingProfiler:
+    def test_manual_samples_fold_thread_and_frames(self, busy_thread):
+        profiler = SamplingProfiler()
+        for _ in range(5):
+            profiler.sample()
+
+        lines = profiler.folded_stacks().splitlines()
+        busy = [l for l in lines if l.startswith("busy-worker;")]
+        assert busy
+        assert all("test_sampling_profiler:_spin_until" in l for l in busy)
+        assert sum(int(l.rsplit(" ", 1)[1]) for l in busy) == 5
+        assert profiler.samples_taken == 5
+
+    def test_top_functions_rank_hot_code(self, busy_thread):
+        profiler = SamplingProfiler()
+        for _ in range(20):
+            profiler.sample(exclude=threading.get_ident())
+
+        top = {f.function: f for f in profiler.top_functions(limit=50)}
+
+        spin = top["test_sampling_profiler:_spin_until"]
+        assert spin.total_samples == 20
+        assert 0 < spin.total_percent <= 100
+
+    def test_background_sampling_respects_duration(self, busy_thread):
+        profiler = SamplingProfiler()
+
+        assert profiler.start(hz=200, duration_seconds=0.2)
+        assert not profiler.start()
+        deadline = time.monotonic() + 5
+        while profiler.running and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        status = profiler.get_status()
+        assert not status["running"]
+        assert status["samples_taken"] > 0
+        assert status["stopped_at"] is not None
+        # The sampler thread never records itself
+        assert "context-cleaner-sampler" not in profiler.folded_stacks()
+
+    def test_stop_keeps_samples_until_reset(self, busy_thread):
+        profiler = SamplingProfiler()
+        profiler.start(hz=100)
+        time.sleep(0.1)
+
+        assert profiler.stop()
+        assert not profiler.stop()
+        assert profiler.get_report()["top_functions"]
+
+        profiler.reset()
+        assert profiler.folded_stacks() == ""
+        assert profiler.top_functions() == []
+
+    def test_invalid_rate_is_rejected(self):
+        with pytest.raises(ValueError):
+            SamplingProfiler().start(hz=0)
+
+    def test_distinct_stacks_are_bounded(self, busy_thread):
+        profiler = SamplingProfiler(max_stacks=1)
+        profiler._stacks["seen"] = 1
+        profiler.sample()
+
+        assert set(profiler._stacks) == {"seen", SamplingProfiler.OVERFLOW_STACK}
+
+
+@pytest.mark.asyncio
+async def test_supervisor_profile_action(tmp_path, monkeypatch):
+    from context_cleaner.services.service_supervisor import (
+        ServiceSupervisor,
+        SupervisorConfig,
+    )
+
+    monkeypatch.setenv(
+        "CONTEXT_CLEANER_PROCESS_REGISTRY_DB", str(tmp_path / "registry.db")
+    )
+    monkeypatch.setattr("context_cleaner.services.process_registry._registry", None)
+    monkeypatch.setattr(
+        "context_cleaner.services.process_registry._discovery_engine", None
+    )
+    profiler = SamplingProfiler()
+    monkeypatch.setattr(
+        "context_cleaner.services.service_supervisor.get_sampling_profiler",
+        lambda: profiler,
+    )
+    supervisor = ServiceSupervisor(
+        None,
+        SupervisorConfig(
+            endpoint="ipc://test",
+            audit_log_path=str(tmp_path / "audit.log"),
+        ),
+    )
+    await supervisor.start()
+
+    started = await supervisor.handle_request(
+        SupervisorRequest(
+            action=RequestAction.PROFILE, options={"command": "start", "hz": 50}
+        )
+    )
+    assert started.status == "ok"
+    assert profiler.running
+
+    stopped = await supervisor.handle_request(
+        SupervisorRequest(action=RequestAction.PROFILE, options={"command": "stop"})
+    )
+    assert stopped.status == "ok"
+    assert stopped.result["stopped"]
+    assert not profiler.running
+
+    report = await supervisor.handle_request(
+        SupervisorRequest(
+            action=RequestAction.PROFILE, options={"command": "report", "folded": True}
+        )
+    )
+    assert report.status == "ok"
+    assert "top_functions" in report.result
+    assert "folded" in report.result
+
+    invalid = await supervisor.handle_request(
+        SupervisorRequest(action=RequestAction.PROFILE, options={"command": "bogus"})
+    )
+    assert invalid.status == "error"
+
+    await supervisor.stop()
@@ -0,0 +1,143 @@
+"""
+Tests for streaming report rendering in AdvancedReportingSystem.
+"""
+
+import csv
+import io
+import json
+
+from unittest.mock import patch
+
+import pytest
+
+from context_cleaner.optimization.advanced_reports import (
+    AdvancedReportingSystem,
+    ReportFormat,
+    ReportSection,
+    ReportType,
+    ReportWriter,
+    create_report_writer,
+)
+
+
+def _section(title):
+    return ReportSection(
+        title=title,
+        content=f"{title} content, with a comma",
+        charts=[],
+        insights=[f"{title} insight"],
+        recommendations=[f"{title} recommendation"],
+        metadata={},
+    )
+
+
+class TestReportWriters:
+    def test_json_writer_produces_a_valid_document(self):
+        writer = create_report_writer(ReportFormat.JSON)
+        text = (
+            writer.begin({"report_id": "r1"})
+            + writer.write_section(_section("A"))
+            + writer.write_section(_section("B"))
+            + writer.end({"confidence_score": 0.5})
+        )
+
+        document = json.loads(text)
+        assert document["report_id"] == "r1"
+        assert [s["title"] for s in document["sections"]] == ["A", "B"]
+        assert document["confidence_score"] == 0.5
+
+    def test_csv_writer_escapes_values(self):
+        writer = create_report_writer(ReportFormat.CSV)
+        text = writer.begin({}) + writer.write_section(_section("A"))
+
+        rows = list(csv.reader(io.StringIO(text)))
+        assert rows[0] == ["section", "kind", "value"]
+        assert ["A", "content", "A content, with a comma"] in rows
+
+    def test_pdf_is_not_streamable(self):
+        with pytest.raises(ValueError):
+            create_report_writer(ReportFormat.PDF)
+
+    def test_writers_must_render_sections(self):
+        with pytest.raises(TypeError):
+            ReportWriter()
+
+
+class TestStreamReport:
+    @pytest.mark.asyncio
+    async def test_sections_are_emitted_incrementally(
+        self, temp_storage_dir, mock_dashboard_data, mock_cross_session_insights
+    ):
+        reports = AdvancedReportingSystem(temp_storage_dir / "reports")
+
+        chunks = [
+            chunk
+            async for chunk in reports.stream_report(
+                mock_dashboard_data,
+                mock_cross_session_insights,
+                [],
+                report_type=ReportType.TREND_REPORT,
+                output_format=ReportFormat.JSON,
+            )
+        ]
+
+        # Header, one chunk per section, footer
+        assert len(chunks) == 4
+        document = json.loads("".join(chunks))
+        assert [s["title"] for s in document["sections"]] == [
+            "Efficiency Trends Over Time",
+            "Pattern Evolution Analysis",
+        ]
+        assert "executive_summary" in document
+        assert "raw_data" not in document
+
+    @pytest.mark.asyncio
+    async def test_next_section_is_built_after_previous_is_emitted(
+        self, temp_storage_dir, mock_dashboard_data, mock_cross_session_insights
+    ):
+        reports = AdvancedReportingSystem(temp_storage_dir / "reports")
+
+        with patch.object(
+            reports, "_format_pattern_evolution", return_value="evolution"
+        ) as format_evolution:
+            stream = reports.stream_report(
+                mock_dashboard_data,
+                mock_cross_session_insights,
+                [],
+                report_type=ReportType.TREND_REPORT,
+                output_format=ReportFormat.MARKDOWN,
+            )
+            await stream.__anext__()  # Header
+            first_section = await stream.__anext__()
+            assert "Efficiency Trends Over Time" in first_section
+            format_evolution.assert_not_called()
+
+            second_section = await stream.__anext__()
+            assert "Pattern Evolution Analysis" in second_section
+            format_evolution.assert_called_once()
+            await stream.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "output_format", [ReportFormat.MARKDOWN, ReportFormat.HTML, ReportFormat.CSV]
+    )
+    async def test_export_report_writes_to_disk(
+        self,
+        temp_storage_dir,
+        mock_dashboard_data,
+        mock_cross_session_insights,
+        output_format,
+    ):
+        reports = AdvancedReportingSystem(temp_storage_dir / "reports")
+        path = temp_storage_dir / f"report.{output_format.value}"
+
+        await reports.export_report(
+            path,
+            mock_dashboard_data,
+            mock_cross_session_insights,
+            [],
+            report_type=ReportType.TREND_REPORT,
+            output_format=output_format,
+        )
+
+        assert "Pattern Evolution Analysis" in path.read_text(encoding="utf-8")
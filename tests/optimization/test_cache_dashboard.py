@@ -10,6 +10,7 @@ This test suite addresses critical issues in the cache dashboard:
 
 import pytest
 import asyncio
+import re
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from pathlib import Path
@@ -114,6 +115,33 @@ class TestCacheEnhancedDashboard:
                 locations = await dashboard._discover_cache_locations()
                 assert locations == []  # Should filter out non-existent paths
     
+    @pytest.mark.asyncio
+    async def test_input_fingerprint_tracks_session_files(self, dashboard, tmp_path):
+        """Fingerprint changes with the session files, without parsing them."""
+        def location(files, size):
+            return Mock(path=tmp_path, session_files=[Path("s.jsonl")] * files,
+                        total_size_bytes=size, last_modified=datetime(2024, 1, 1))
+
+        with patch.object(dashboard.cache_discovery, 'discover_cache_locations', return_value=[location(2, 100)]):
+            first = dashboard.input_fingerprint(await dashboard.discover_cache_inputs())
+            assert dashboard.input_fingerprint(await dashboard.discover_cache_inputs()) == first
+
+        with patch.object(dashboard.cache_discovery, 'discover_cache_locations', return_value=[location(3, 150)]):
+            assert dashboard.input_fingerprint(await dashboard.discover_cache_inputs()) != first
+
+        with patch.object(dashboard.cache_discovery, 'discover_cache_locations', side_effect=Exception("Discovery failed")):
+            assert await dashboard.discover_cache_inputs() == []
+
+    @pytest.mark.asyncio
+    async def test_generate_dashboard_reuses_discovered_locations(self, dashboard, tmp_path):
+        """Locations passed in are not discovered a second time."""
+        with patch.object(dashboard.cache_discovery, 'discover_cache_locations') as discover:
+            with patch.object(dashboard, '_parse_recent_sessions', return_value=[]) as parse:
+                await dashboard.generate_dashboard(cache_locations=[Mock(path=tmp_path)])
+
+        assert not discover.called
+        assert parse.call_args[0][0] == [tmp_path]
+    
     @pytest.mark.asyncio
     async def test_parse_recent_sessions_error_handling(self, dashboard):
         """Test session parsing handles various error conditions."""
@@ -670,4 +698,76 @@ class TestCacheDashboardEdgeCases:
         )
         
         assert metrics_max.overall_health_score == 1.0
-        assert metrics_max.health_level == HealthLevel.EXCELLENT
\ No newline at end of file
+        assert metrics_max.health_level == HealthLevel.EXCELLENT
+
+class TestCacheDashboardProcessPool:
+    """Process-pool execution of the session analyzers."""
+
+    @pytest.fixture
+    def pooled_dashboard(self, temp_storage_dir):
+        dashboard = CacheEnhancedDashboard(
+            temp_storage_dir, use_process_pool=True, max_workers=2
+        )
+        dashboard.PROCESS_POOL_MIN_SESSIONS = 0
+        yield dashboard
+        dashboard.close()
+
+    @pytest.mark.asyncio
+    async def test_pooled_results_match_threaded(self, pooled_dashboard, temp_storage_dir):
+        sessions = []
+        pooled = await asyncio.gather(
+            pooled_dashboard._analyze_usage_patterns(sessions),
+            pooled_dashboard._analyze_token_efficiency(sessions),
+            pooled_dashboard._analyze_temporal_patterns(sessions),
+        )
+        assert pooled_dashboard._process_pool is not None
+
+        threaded_dashboard = CacheEnhancedDashboard(temp_storage_dir)
+        threaded = await asyncio.gather(
+            threaded_dashboard._analyze_usage_patterns(sessions),
+            threaded_dashboard._analyze_token_efficiency(sessions),
+            threaded_dashboard._analyze_temporal_patterns(sessions),
+        )
+        # Summaries stamp their creation time; compare everything else
+        def strip_times(result):
+            return re.sub(r"datetime\.datetime\([^)]*\)", "<time>", repr(result))
+
+        assert [strip_times(r) for r in pooled] == [strip_times(r) for r in threaded]
+
+    @pytest.mark.asyncio
+    async def test_dashboard_config_enables_process_pool(self, temp_storage_dir, monkeypatch):
+        from context_cleaner.config.settings import ContextCleanerConfig
+        from context_cleaner.telemetry.context_rot.config import ApplicationConfig
+
+        assert not CacheEnhancedDashboard.from_config(None).use_process_pool
+
+        monkeypatch.setenv("CONTEXT_CLEANER_ANALYSIS_PROCESS_POOL", "true")
+        assert CacheEnhancedDashboard.from_config(
+            ContextCleanerConfig.from_env()
+        ).use_process_pool
+
+        config = ApplicationConfig.default()
+        config.dashboard.analysis_process_pool = True
+        dashboard = CacheEnhancedDashboard.from_config(config, temp_storage_dir)
+        try:
+            sessions = [Mock()] * dashboard.PROCESS_POOL_MIN_SESSIONS
+            assert dashboard._should_use_process_pool(sessions)
+            assert not dashboard._should_use_process_pool(sessions[1:])
+
+            dashboard.PROCESS_POOL_MIN_SESSIONS = 0
+            await dashboard._analyze_token_efficiency([])
+            assert dashboard._process_pool is not None
+        finally:
+            dashboard.close()
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_sessions_fall_back_to_threads(self, pooled_dashboard):
+        sessions = [Mock()]
+        expected = Mock()
+        with patch.object(
+            pooled_dashboard.usage_analyzer, 'analyze_usage_patterns', return_value=expected
+        ):
+            result = await pooled_dashboard._analyze_usage_patterns(sessions)
+
+        assert result is expected
+        assert pooled_dashboard._process_pool is None
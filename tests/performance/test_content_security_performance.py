@@ -0,0 +1,68 @@
+"""
+Throughput benchmarks for ContentSecurityManager sanitization.
+
+Compares cold and cached sanitization per privacy level on a mixed corpus
+of source code, prose and tool output with scattered secrets, checking that
+hash-skip makes repeated payloads cheaper than running the rules.
+"""
+
+import time
+
+import pytest
+
+from src.context_cleaner.telemetry.jsonl_enhancement.content_security import (
+    ContentSecurityManager,
+)
+
+SAMPLE = """
+def connect(host, port=8123):
+    \"\"\"Open a connection to the analytics database.\"\"\"
+    session = Session(host=host, port=port, timeout=30)
+    logger.info(f"Connected to {host}:{port} in {elapsed:.2f}s")
+    return session
+
+Running the test suite produced 42 passed, 3 skipped in 12.5s.
+See https://docs.example.com/setup for configuration details.
+Contact maintainer@example.com or open an issue for help.
+export API_TOKEN=abc123def456
+-rw-r--r--  1 dev  staff  4096 Mar 10 12:00 /home/dev/project/config.yaml
+"""
+
+
+def _corpus(size_bytes: int) -> str:
+    repeats = size_bytes // len(SAMPLE) + 1
+    return "".join(f"{SAMPLE}# block {i}\n" for i in range(repeats))[:size_bytes]
+
+
+def _best_time(fn, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.slow
+class TestSanitizationThroughput:
+    """Cached versus cold sanitization per privacy level."""
+
+    @pytest.mark.parametrize("privacy_level", ["minimal", "standard", "strict"])
+    def test_hash_skip_for_repeated_payloads(self, privacy_level):
+        content = _corpus(1_000_000)
+
+        def cold():
+            ContentSecurityManager._cache.clear()
+            return ContentSecurityManager.sanitize_content(content, privacy_level)
+
+        expected = cold()
+        cold_time = _best_time(cold)
+        cached_time = _best_time(
+            lambda: ContentSecurityManager.sanitize_content(content, privacy_level)
+        )
+
+        assert ContentSecurityManager.sanitize_content(content, privacy_level) == (
+            expected
+        )
+        # Hashing the payload is a small fraction of running the rules
+        assert cached_time < cold_time
@@ -0,0 +1,108 @@
+"""
+Checks for the shared KeywordEngine against per-family regex scans.
+
+Classifying every item with the engine must give exactly the results of the
+previous approach of one case-insensitive regex scan per pattern family. The
+timing comparison only guards against gross regressions, with a ratio loose
+enough for loaded CI runners.
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from src.context_cleaner.core.focus_scorer import FocusScorer
+from src.context_cleaner.core.priority_analyzer import PriorityAnalyzer
+
+WORDS = (
+    "the user asked how to fix this bug in the Login module currently working "
+    "on high priority deadline: Friday tomorrow completed old legacy need to "
+    "refactor [ ] write tests todo: deploy maybe later random tangent Important "
+    "code review depends on AuthService and the data model with filler text"
+).split()
+
+ITEM_COUNT = 10_000
+
+# The engine is usually several times faster; only fail if it is clearly slower
+MAX_SLOWDOWN = 2.0
+
+
+def _context_items(count: int):
+    rng = random.Random(42)
+    items = []
+    for index in range(count):
+        if index % 2:
+            # Identifiers and paths make up much of a real context
+            items.append(f"/project/src/module_{index}/handler_{index % 97}.py")
+        else:
+            items.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 30))))
+    return items
+
+
+def _per_family_scan(families, content):
+    hits = {}
+    for name, regex in families:
+        matches = regex.findall(content)
+        if matches:
+            hits[name] = matches
+    return hits
+
+
+def _best_of(func, items, rounds=2):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.slow
+class TestKeywordEngineThroughput:
+    """Single-matcher classification versus one scan per family."""
+
+    def test_focus_families_match_per_family_scans(self):
+        scorer = FocusScorer()
+        families = [
+            ("current_work", scorer.current_work_regex),
+            ("high_priority", scorer.high_priority_regex),
+            ("distraction", scorer.distraction_regex),
+        ] + [
+            (f"action_{index}", pattern)
+            for index, pattern in enumerate(scorer.task_action_patterns)
+        ]
+        items = _context_items(ITEM_COUNT)
+
+        def baseline(item):
+            return _per_family_scan(families, item.lower())
+
+        for item in items:
+            assert scorer.keyword_engine.scan(item) == baseline(item)
+
+        before = _best_of(baseline, items)
+        after = _best_of(scorer.keyword_engine.scan, items)
+        assert after < before * MAX_SLOWDOWN
+
+    def test_priority_extraction_matches_per_family_scans(self):
+        analyzer = PriorityAnalyzer()
+        families = [
+            (f"deadline_{index}", pattern)
+            for index, pattern in enumerate(analyzer.deadline_patterns)
+        ] + [
+            (f"dependency_{index}", pattern)
+            for index, pattern in enumerate(analyzer.dependency_patterns)
+        ]
+        items = _context_items(ITEM_COUNT)
+
+        def baseline(item):
+            return _per_family_scan(families, item)
+
+        for item in items:
+            assert analyzer.extraction_engine.scan(item) == baseline(item)
+
+        before = _best_of(baseline, items)
+        after = _best_of(analyzer.extraction_engine.scan, items)
+        assert after < before * MAX_SLOWDOWN
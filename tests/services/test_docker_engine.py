@@ -0,0 +1,251 @@
+"""
+Tests for the async Docker Engine API client.
+
+Runs the client against a small in-process HTTP stub bound to a unix socket,
+so no Docker daemon is required.
+"""
+
+import asyncio
+import json
+import struct
+import tempfile
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.context_cleaner.services.docker_engine import (
+    DockerEngineClient,
+    DockerEngineError,
+    demultiplex_stream,
+)
+
+
+def _frame(stream_type: int, payload: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream_type, len(payload)) + payload
+
+
+class StubDockerDaemon:
+    """Minimal keep-alive HTTP/1.1 server imitating the Engine API."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.connections = 0
+        self.requests = []
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_unix_server(self._handle, self.socket_path)
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    key, _, value = line.decode().partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((method, target, body))
+
+                keep_open = await self._respond(writer, method, target, body)
+                await writer.drain()
+                if not keep_open:
+                    break
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, method, target, body) -> bool:
+        url = urlsplit(target)
+        path = url.path
+        query = parse_qs(url.query)
+
+        def send(status, payload, chunked=False):
+            reason = {200: "OK", 201: "Created", 404: "Not Found"}[status]
+            head = f"HTTP/1.1 {status} {reason}\r\n"
+            if chunked:
+                half = len(payload) // 2
+                data = b""
+                for part in (payload[:half], payload[half:]):
+                    if part:
+                        data += f"{len(part):x}\r\n".encode() + part + b"\r\n"
+                data += b"0\r\n\r\n"
+                writer.write(
+                    (head + "Transfer-Encoding: chunked\r\n\r\n").encode() + data
+                )
+            else:
+                writer.write(
+                    (head + f"Content-Length: {len(payload)}\r\n\r\n").encode()
+                    + payload
+                )
+
+        if path == "/_ping":
+            send(200, b"OK")
+        elif path == "/containers/json":
+            filters = json.loads(query.get("filters", ["{}"])[0])
+            containers = [
+                {"Id": "a" * 64, "Names": ["/clickhouse-otel"], "State": "running"},
+                {"Id": "b" * 64, "Names": ["/otel-collector"], "State": "running"},
+            ]
+            names = filters.get("name", [])
+            if names:
+                containers = [
+                    c for c in containers if any(n in c["Names"][0] for n in names)
+                ]
+            send(200, json.dumps(containers).encode(), chunked=True)
+        elif path == "/containers/clickhouse-otel/json":
+            send(200, json.dumps({"State": {"Status": "running"}}).encode())
+        elif path.startswith("/containers/") and path.endswith("/json"):
+            send(404, json.dumps({"message": "No such container"}).encode())
+        elif path == "/containers/otel-collector/logs":
+            send(
+                200,
+                _frame(1, b"started\n") + _frame(2, b"connection refused\n"),
+                chunked=True,
+            )
+        elif path == "/containers/clickhouse-otel/exec":
+            assert json.loads(body)["Cmd"][0] == "clickhouse-client"
+            send(201, json.dumps({"Id": "exec1"}).encode())
+        elif path == "/exec/exec1/start":
+            # Raw stream: no length, delimited by closing the connection
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/vnd.docker.raw-stream\r\n\r\n"
+                + _frame(1, b"traces\nmetrics\n")
+            )
+            return False
+        elif path == "/_malformed":
+            writer.write(b"HTTP/1.1 abc OK\r\nContent-Length: 0\r\n\r\n")
+        elif path == "/exec/exec1/json":
+            send(200, json.dumps({"ExitCode": 0}).encode())
+        else:
+            send(404, b"{}")
+        return True
+
+
+@pytest.fixture
+def socket_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+class TestDemultiplexStream:
+    """Test splitting of framed stdout/stderr streams."""
+
+    def test_splits_framed_streams(self):
+        data = _frame(1, b"out1 ") + _frame(2, b"err") + _frame(1, b"out2")
+        assert demultiplex_stream(data) == ("out1 out2", "err")
+
+    def test_raw_tty_stream_is_stdout(self):
+        assert demultiplex_stream(b"plain output\n") == ("plain output\n", "")
+
+
+class TestDockerEngineClient:
+    """Test the Engine API client against a stub daemon."""
+
+    @pytest.mark.asyncio
+    async def test_requests_share_pooled_connection(self, socket_dir):
+        daemon = StubDockerDaemon(str(socket_dir / "docker.sock"))
+        await daemon.start()
+        client = DockerEngineClient(daemon.socket_path)
+        try:
+            assert await client.ping() is True
+            names = await client.container_names({"name": "clickhouse"})
+            assert names == ["clickhouse-otel"]
+            assert await client.container_names() == [
+                "clickhouse-otel",
+                "otel-collector",
+            ]
+            assert daemon.connections == 1
+        finally:
+            await client.close()
+            await daemon.stop()
+
+    @pytest.mark.asyncio
+    async def test_batched_inspect_and_missing_container(self, socket_dir):
+        daemon = StubDockerDaemon(str(socket_dir / "docker.sock"))
+        await daemon.start()
+        client = DockerEngineClient(daemon.socket_path, max_connections=2)
+        try:
+            states = await client.inspect_containers(
+                ["clickhouse-otel", "missing", "clickhouse-otel"]
+            )
+            assert states["clickhouse-otel"]["State"]["Status"] == "running"
+            assert states["missing"] is None
+            assert daemon.connections <= 2
+        finally:
+            await client.close()
+            await daemon.stop()
+
+    @pytest.mark.asyncio
+    async def test_logs_and_exec(self, socket_dir):
+        daemon = StubDockerDaemon(str(socket_dir / "docker.sock"))
+        await daemon.start()
+        client = DockerEngineClient(daemon.socket_path)
+        try:
+            logs = await client.container_logs("otel-collector", tail=50)
+            assert "started" in logs and "connection refused" in logs
+
+            result = await client.exec_run(
+                "clickhouse-otel", ["clickhouse-client", "--query", "SHOW TABLES"]
+            )
+            assert result.success
+            assert result.stdout.split() == ["traces", "metrics"]
+        finally:
+            await client.close()
+            await daemon.stop()
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_closes_connection(self, socket_dir):
+        daemon = StubDockerDaemon(str(socket_dir / "docker.sock"))
+        await daemon.start()
+        client = DockerEngineClient(daemon.socket_path)
+        closed = []
+        connect = client._connect
+
+        async def tracking_connect(pool, timeout):
+            reader, writer = await connect(pool, timeout)
+            close = writer.close
+            writer.close = lambda: closed.append(writer) or close()
+            return reader, writer
+
+        client._connect = tracking_connect
+        try:
+            with pytest.raises(DockerEngineError, match="malformed"):
+                await client._request("GET", "/_malformed")
+            assert len(closed) == 1
+            assert client._get_pool().idle == []
+        finally:
+            await client.close()
+            await daemon.stop()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_socket_raises(self, socket_dir):
+        client = DockerEngineClient(str(socket_dir / "absent.sock"), timeout=1)
+        assert await client.ping() is False
+        with pytest.raises(DockerEngineError):
+            await client.list_containers()
+
+    def test_from_environment_requires_socket(self, monkeypatch, socket_dir):
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_dir / 'absent.sock'}")
+        assert DockerEngineClient.from_environment() is None
+
+        monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:2375")
+        assert DockerEngineClient.from_environment() is None
+
+        socket_path = socket_dir / "docker.sock"
+        socket_path.touch()
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+        client = DockerEngineClient.from_environment()
+        assert client is not None and client.socket_path == str(socket_path)
@@ -285,6 +285,54 @@ class TestProcessDiscoveryEngine:
         assert discovered[0].pid == 2001
         assert discovered[0].service_type == "dashboard"
 
+    @patch('psutil.net_connections')
+    @patch('psutil.process_iter')
+    def test_discovery_shares_single_snapshot(self, mock_process_iter, mock_net_connections):
+        """All discovery strategies should share one process scan."""
+        parent = Mock()
+        parent.info = {
+            'pid': 3001,
+            'name': 'python',
+            'cmdline': ['python', '-m', 'context_cleaner.cli', 'run'],
+            'create_time': 1234567890.0,
+            'ppid': 1,
+        }
+        child = Mock()
+        child.info = {
+            'pid': 3002,
+            'name': 'node',
+            'cmdline': ['node', 'worker.js'],
+            'create_time': 1234567891.0,
+            'ppid': 3001,
+        }
+        mock_process_iter.return_value = [parent, child]
+        mock_net_connections.return_value = [
+            Mock(pid=3001, laddr=Mock(ip='127.0.0.1', port=8110))
+        ]
+
+        discovered = {p.pid: p for p in self.discovery.discover_all_processes()}
+
+        assert mock_process_iter.call_count == 1
+        assert mock_net_connections.call_count == 1
+        assert set(discovered) == {3001, 3002}
+        assert discovered[3002].parent_pid == 3001
+        assert discovered[3002].registration_source == "tree_discovery"
+
+    @patch('psutil.net_connections', return_value=[])
+    @patch('psutil.process_iter', return_value=[])
+    def test_snapshot_cache_respects_max_age(self, mock_process_iter, _mock_net):
+        """Cached snapshots are reused only when a max age is allowed."""
+        self.discovery.discover_all_processes()
+        self.discovery.discover_all_processes()
+        assert mock_process_iter.call_count == 2
+
+        self.discovery.discover_all_processes(max_snapshot_age=60)
+        assert mock_process_iter.call_count == 2
+
+        self.discovery.invalidate_snapshot()
+        self.discovery.discover_all_processes(max_snapshot_age=60)
+        assert mock_process_iter.call_count == 3
+
 
 class TestGlobalRegistryFunctions:
     """Test global registry functions."""
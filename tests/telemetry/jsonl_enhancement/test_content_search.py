@@ -0,0 +1,161 @@
+"""Tests for token-indexed full-text content search."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.context_cleaner.telemetry.jsonl_enhancement.content_search import (
+    ContentSearchQuery,
+    build_search_sql,
+    search_index_ddl,
+    tokenize,
+)
+from src.context_cleaner.telemetry.jsonl_enhancement.full_content_queries import (
+    FullContentQueries,
+)
+
+
+class TestContentSearchQuery:
+
+    def test_tokenize_matches_clickhouse_boundaries(self):
+        """Tokens split on ASCII punctuation and are lower-cased."""
+        assert tokenize("Foo_bar.baz(42) naïve") == ["foo", "bar", "baz", "42", "naïve"]
+
+    def test_tokenize_lowercases_ascii_only(self):
+        """Non-ASCII letters keep their case, as with ClickHouse lower()."""
+        assert tokenize("ÄRGER Über") == ["Ärger", "Über"]
+        assert ContentSearchQuery.parse("Über").terms == ["Über"]
+
+    def test_parse_terms_and_phrases(self):
+        """Quoted text and punctuated words become phrases."""
+        query = ContentSearchQuery.parse('"Connection refused" retry api.client Retry')
+
+        assert query.terms == ["retry"]
+        assert query.phrases == ["Connection refused", "api.client"]
+        assert query.tokens == ["retry", "connection", "refused", "api", "client"]
+        assert query.anchor == "Connection refused"
+
+    def test_unbalanced_quotes_do_not_fail(self):
+        """A stray quote falls back to whitespace splitting."""
+        query = ContentSearchQuery.parse('"unterminated phrase')
+        assert query.terms == ["unterminated", "phrase"]
+
+    def test_punctuation_only_is_not_indexable(self):
+        """Searches without tokens cannot use the index."""
+        assert not ContentSearchQuery.parse("-> ::").is_indexable
+
+    def test_build_search_sql(self):
+        """Every token gets a hasToken predicate and phrases are verified."""
+        query = ContentSearchQuery.parse('"token budget" overflow')
+        where_sql, score_sql, params = build_search_sql(query, "message_content")
+
+        assert where_sql.count("hasToken(lower(message_content)") == 3
+        assert (
+            "positionCaseInsensitiveUTF8(message_content, {search_phrase_0:String}) > 0"
+            in where_sql
+        )
+        assert "countSubstringsCaseInsensitiveUTF8" in score_sql
+        assert params["search_token_0"] == "overflow"
+        assert params["search_phrase_0"] == "token budget"
+        assert params["search_anchor"] == "token budget"
+
+    def test_index_ddl_uses_lowercase_expression(self):
+        """DDL indexes the same expression the queries filter on."""
+        ddl = search_index_ddl()
+        assert any(
+            "lower(message_content)" in stmt and "tokenbf_v1" in stmt for stmt in ddl
+        )
+        assert all(stmt.startswith("ALTER TABLE otel.") for stmt in ddl)
+
+
+class TestFullContentQueriesSearch:
+
+    @pytest.fixture
+    def client(self):
+        client = Mock()
+        client.execute_query = AsyncMock(return_value=[])
+        return client
+
+    @pytest.mark.asyncio
+    async def test_conversation_search_uses_token_index(self, client):
+        """Token searches avoid LIKE scans and rank by relevance."""
+        queries = FullContentQueries(client)
+
+        await queries.search_conversation_content("Python function", limit=10)
+
+        sql, params = client.execute_query.call_args[0]
+        assert "hasToken(lower(message_content), {search_token_0:String})" in sql
+        assert "LIKE" not in sql
+        assert "ORDER BY relevance_score DESC" in sql
+        assert params["search_token_0"] == "python"
+        assert params["search_token_1"] == "function"
+        assert params["limit"] == 10
+
+    @pytest.mark.asyncio
+    async def test_file_search_keeps_language_filter(self, client):
+        """Language filtering still applies on the indexed path."""
+        queries = FullContentQueries(client)
+
+        await queries.search_file_content("parse_config", language="python")
+
+        sql, params = client.execute_query.call_args[0]
+        assert "hasToken(lower(file_content)" in sql
+        assert "AND programming_language = {language:String}" in sql
+        assert params["search_phrase_0"] == "parse_config"
+        assert params["language"] == "python"
+
+    @pytest.mark.asyncio
+    async def test_punctuation_search_falls_back_to_scan(self, client):
+        """Searches with no tokens still work via substring matching."""
+        queries = FullContentQueries(client)
+
+        await queries.search_conversation_content("=>")
+
+        sql, params = client.execute_query.call_args[0]
+        assert "LIKE" in sql
+        assert params["search_term"] == "=>"
+        # No tokens means the index check is never needed
+        assert client.execute_query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_never_runs_index_ddl(self, client):
+        """Index maintenance belongs to schema setup, not to searches."""
+        client.execute_command = AsyncMock(return_value=[])
+        queries = FullContentQueries(client)
+
+        await queries.search_conversation_content("retry")
+        await queries.search_file_content("retry")
+
+        executed = [call.args[0] for call in client.execute_query.call_args_list]
+        assert len(executed) == 2
+        assert not any("ALTER TABLE" in q or "system." in q for q in executed)
+        client.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_indexes_are_added(self, client):
+        """Existing tables get their search index added and materialized."""
+
+        async def execute_command(query, timeout=None):
+            if "system.tables" in query:
+                return [
+                    {"name": "claude_message_content"},
+                    {"name": "claude_file_content"},
+                ]
+            if "data_skipping_indices" in query:
+                return [
+                    {"table": "claude_message_content", "name": "idx_content_tokens"}
+                ]
+            return []
+
+        client.execute_command = AsyncMock(side_effect=execute_command)
+        queries = FullContentQueries(client)
+
+        added = await queries.ensure_search_indexes()
+
+        executed = [call.args[0] for call in client.execute_command.call_args_list]
+        ddl = [q for q in executed if q.startswith("ALTER TABLE")]
+        assert added == ["claude_file_content"]
+        assert not any("claude_message_content" in q for q in ddl)
+        # claude_tool_results does not exist yet and is left alone
+        assert not any("claude_tool_results" in q for q in ddl)
+        assert any("MATERIALIZE INDEX idx_content_tokens" in q for q in ddl)
+        client.execute_query.assert_not_called()
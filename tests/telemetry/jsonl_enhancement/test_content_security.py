@@ -1,6 +1,13 @@
 """Tests for ContentSecurityManager."""
 import pytest
-from src.context_cleaner.telemetry.jsonl_enhancement.content_security import ContentSecurityManager
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from src.context_cleaner.telemetry.jsonl_enhancement.content_security import (
+    OFFLOAD_THRESHOLD,
+    ContentSecurityManager,
+    _SanitizedContentCache,
+)
 
 class TestContentSecurityManager:
     
@@ -140,4 +147,95 @@ class TestContentSecurityManager:
         
         risks = ContentSecurityManager.analyze_content_risks('')
         assert risks['risk_level'] == 'low'
-        assert len(risks['detected_patterns']) == 0
\ No newline at end of file
+        assert len(risks['detected_patterns']) == 0
+
+class TestCompiledSanitizer:
+    """Tests for rule gating, hash-skip caching and worker offload."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ContentSecurityManager._cache.clear()
+        yield
+        ContentSecurityManager._cache.clear()
+
+    def test_word_boundaries_preserved(self):
+        """Rewritten patterns still require a word boundary before the match."""
+        content = "xpassword=1 password=2 id555-123-4567 555-123-4567 mytoken=a token=b"
+        sanitized = ContentSecurityManager.sanitize_content(content, 'strict')
+
+        assert 'xpassword=1' in sanitized
+        assert 'id555-123-4567' in sanitized
+        assert 'mytoken=a' in sanitized
+        assert sanitized.count('[REDACTED_PASSWORD_FIELD]') == 1
+        assert sanitized.count('[REDACTED_PHONE]') == 1
+        assert sanitized.count('[REDACTED_TOKEN_FIELD]') == 1
+
+    def test_unicode_case_folding_triggers_rules(self):
+        """Trigger detection honours the same case folding as the regexes."""
+        content = "ſecret=hunter2"
+        assert ContentSecurityManager.sanitize_content(content, 'standard') == '[REDACTED_TOKEN_FIELD]'
+
+    def test_large_content_is_skipped_by_hash(self):
+        """Repeated payloads skip the regex passes."""
+        content = ("password = hunter2\n" + "plain text line\n" * 100)
+        first = ContentSecurityManager.sanitize_content(content, 'standard')
+
+        with patch.object(ContentSecurityManager, '_apply_rules') as apply_rules:
+            assert ContentSecurityManager.sanitize_content(content, 'standard') == first
+            apply_rules.assert_not_called()
+
+        # The cache is keyed by privacy level
+        assert ContentSecurityManager.sanitize_content(content, 'minimal') == content
+
+    def test_cache_is_bounded_by_bytes(self):
+        """Large sanitized texts are evicted by size, oversized ones never cached."""
+        cache = _SanitizedContentCache(max_bytes=3000, max_entry_bytes=2000)
+        keys = [cache.key(str(i), 'standard') for i in range(4)]
+
+        cache.put(keys[0], "a" * 1000)
+        cache.put(keys[1], "b" * 1000)
+        cache.put(keys[2], None)
+        cache.put(keys[3], "c" * 1000)
+        assert cache.get(keys[0]) == (False, None)
+        assert cache.get(keys[2]) == (True, None)
+        assert cache.total_bytes <= 3000
+
+        cache.put(keys[1], "d" * 5000)
+        assert cache.get(keys[1]) == (False, None)
+        assert cache.get(keys[3]) == (True, "c" * 1000)
+
+    @pytest.mark.parametrize("secret, exposed", [
+        ("ghp_" + "a" * 36 + "555-123-4567http://example.com/x", '[REDACTED_PHONE]'),
+        ("AKIA" + "A" * 16 + "pwd='x'", '[REDACTED_PASSWORD_FIELD]'),
+    ])
+    def test_sanitized_output_is_not_cached_as_clean(self, secret, exposed):
+        """Re-sanitizing output runs the rules again, since redaction is not idempotent."""
+        content = secret + "\n" + "plain text line\n" * 70
+        first = ContentSecurityManager.sanitize_content(content, 'strict')
+        assert exposed not in first
+
+        again = ContentSecurityManager.sanitize_content(first, 'strict')
+
+        assert again == ContentSecurityManager._apply_rules(first, 'strict')
+        assert exposed in again
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_run_in_executor(self):
+        """Payloads above the offload threshold are sanitized in the worker pool."""
+        large = "api_key = sk-" + "a" * 30 + "\n" + "x " * OFFLOAD_THRESHOLD
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(executor, 'submit', wraps=executor.submit) as submit:
+                small = await ContentSecurityManager.sanitize_content_async(
+                    "password=1", 'standard', executor
+                )
+                sanitized = await ContentSecurityManager.sanitize_content_async(
+                    large, 'standard', executor
+                )
+                again = await ContentSecurityManager.sanitize_content_async(
+                    large, 'standard', executor
+                )
+
+        assert small == '[REDACTED_PASSWORD_FIELD]'
+        assert '[REDACTED_API_KEY]' in sanitized
+        assert again == sanitized
+        assert submit.call_count == 1
@@ -87,6 +87,19 @@ class TestAdvancedSearchEngine:
             assert isinstance(result, SearchResult)
             assert result.search_strategy == SearchStrategy.KEYWORD_SEARCH
             assert result.relevance_score > 0
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_falls_back_without_indexed_hits(self, search_engine):
+        """An empty (or failed) indexed search uses the local strategy."""
+        search_engine._content_queries.search_file_content = AsyncMock(return_value=[])
+
+        with patch.object(
+            search_engine, "_simulate_file_search", return_value=[]
+        ) as local_search:
+            await search_engine._keyword_search("function", context_files=None)
+
+        search_engine._content_queries.search_file_content.assert_awaited_once()
+        assert local_search.called
     
     def test_extract_search_terms(self, search_engine):
         """Test search term extraction."""
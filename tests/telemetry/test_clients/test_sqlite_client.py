@@ -0,0 +1,349 @@
+"""Tests for the embedded SQLite telemetry backend."""
+
+import logging
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.context_cleaner.api.repositories import ClickHouseTelemetryRepository
+from src.context_cleaner.telemetry.clients.clickhouse_client import ClickHouseClient
+from src.context_cleaner.telemetry.clients.sqlite_client import (
+    FallbackTelemetryClient,
+    SQLiteTelemetryClient,
+    select_telemetry_client,
+    translate_clickhouse_sql,
+)
+from src.context_cleaner.telemetry.dashboard.widgets import TelemetryWidgetManager
+from src.context_cleaner.telemetry.jsonl_enhancement.full_content_processor import (
+    FullContentBatchProcessor,
+)
+from src.context_cleaner.telemetry.jsonl_enhancement.full_content_queries import (
+    FullContentQueries,
+)
+
+
+def _jsonl_entries(now: datetime):
+    timestamp = (now - timedelta(minutes=5)).isoformat().replace("+00:00", "Z")
+    return [
+        {
+            "uuid": "m1",
+            "sessionId": "s1",
+            "timestamp": timestamp,
+            "message": {"role": "user", "content": "Please read config.py"},
+        },
+        {
+            "uuid": "m2",
+            "sessionId": "s1",
+            "timestamp": timestamp,
+            "message": {
+                "role": "assistant",
+                "model": "claude-sonnet",
+                "content": [
+                    {"type": "text", "text": "Reading it now"},
+                    {"type": "tool_use", "id": "t1", "name": "Read", "input": {}},
+                ],
+                "usage": {
+                    "input_tokens": 100,
+                    "output_tokens": 40,
+                    "cache_read_input_tokens": 500,
+                    "cost_usd": 0.25,
+                },
+            },
+            "toolUseResult": {"stdout": "import os\n"},
+        },
+    ]
+
+
+def _tool_events(now: datetime, sessions: int = 4):
+    """Read then Edit in each session, ten minutes apart."""
+    return [
+        {
+            "Timestamp": now - timedelta(minutes=offset),
+            "Body": "claude_code.tool_decision",
+            "LogAttributes": {"session.id": f"s{i}", "tool_name": tool},
+        }
+        for i in range(sessions)
+        for tool, offset in (("Read", 20), ("Edit", 10))
+    ]
+
+
+def _query_errors(caplog):
+    return [r for r in caplog.records if "SQLite query failed" in r.getMessage()]
+
+
+@pytest.fixture
+def client(tmp_path):
+    return SQLiteTelemetryClient(tmp_path / "telemetry.db")
+
+
+class TestTranslateClickHouseSQL:
+
+    def test_rewrites_dialect(self):
+        sql = translate_clickhouse_sql(
+            "SELECT LogAttributes['session.id'], LogAttributes['user.email'] "
+            "FROM otel.otel_logs WHERE Timestamp >= now() - INTERVAL 2 WEEK "
+            "AND Body = {body:String}"
+        )
+        assert "otel." not in sql
+        assert (
+            "SELECT session_id, json_extract(LogAttributes, '$.\"user.email\"')" in sql
+        )
+        assert "strftime('%Y-%m-%d %H:%M:%f', 'now', '-14 days')" in sql
+        assert sql.endswith("Body = :body")
+
+    def test_rewrites_arrays(self):
+        sql = translate_clickhouse_sql(
+            "WITH t AS (SELECT s, groupArray(DISTINCT x) as xs FROM otel.e "
+            "GROUP BY s HAVING length(xs) > 1) "
+            "SELECT arrayJoin(xs) as a, arrayJoin(xs) as b FROM t WHERE a != b"
+        )
+        assert "json_group_array(DISTINCT x) as xs" in sql
+        assert "HAVING json_array_length(xs) > 1" in sql
+        assert "SELECT _aj_a.value AS a, _aj_b.value AS b" in sql
+        assert "FROM t, json_each(t.xs) AS _aj_a, json_each(t.xs) AS _aj_b" in sql
+
+
+class TestSQLiteTelemetryClient:
+
+    @pytest.mark.asyncio
+    async def test_batch_processor_populates_dashboard_tables(self, client):
+        """Content ingestion also yields request events and token metrics."""
+        processor = FullContentBatchProcessor(client)
+        stats = await processor.process_jsonl_entries(
+            _jsonl_entries(datetime.now(timezone.utc))
+        )
+        assert stats["messages_processed"] == 2
+        assert stats["tools_processed"] == 1
+
+        session = await client.get_session_metrics("s1")
+        assert session.api_calls == 1
+        assert session.total_cost == pytest.approx(0.25)
+        assert session.total_input_tokens == 100
+        assert session.tools_used == ["Read"]
+
+        aggregated = await client.get_total_aggregated_stats()
+        assert aggregated["raw_total_tokens"] == 640
+        assert aggregated["token_breakdown"]["cacheRead"] == 500
+        assert aggregated["active_agents"] == "1"
+
+        model_stats = await client.get_model_token_stats(7)
+        assert model_stats["claude-sonnet"]["request_count"] == 1
+        assert model_stats["claude-sonnet"]["output_tokens"] == 40
+
+        content = await client.get_jsonl_content_stats()
+        assert content["messages"]["total_messages"] == 2
+        assert content["tools"]["unique_tools"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reingestion_is_idempotent(self, client):
+        processor = FullContentBatchProcessor(client)
+        entries = _jsonl_entries(datetime.now(timezone.utc))
+        await processor.process_jsonl_entries(entries)
+        await processor.process_jsonl_entries(entries)
+
+        assert await client.get_current_session_cost("s1") == pytest.approx(0.25)
+
+    @pytest.mark.asyncio
+    async def test_repository_queries_run_unchanged(self, client):
+        """ClickHouse-dialect repository queries run against the local store."""
+        now = datetime.now(timezone.utc)
+        await client.bulk_insert(
+            "otel_logs",
+            [
+                {
+                    "Timestamp": now - timedelta(minutes=1),
+                    "Body": "claude_code.api_request",
+                    "LogAttributes": {
+                        "session.id": "s1",
+                        "model": "m",
+                        "cost_usd": "0.5",
+                        "duration_ms": "40000",
+                    },
+                },
+                {
+                    "Timestamp": now - timedelta(minutes=2),
+                    "Body": "claude_code.api_error",
+                    "LogAttributes": {"session.id": "s2", "error": "overloaded"},
+                },
+                {
+                    "Timestamp": now - timedelta(days=60),
+                    "Body": "claude_code.api_request",
+                    "LogAttributes": {"session.id": "old", "cost_usd": "9"},
+                },
+            ],
+        )
+        await client.bulk_insert(
+            "otel_metrics_sum",
+            [
+                {
+                    "TimeUnix": now,
+                    "MetricName": "claude_code.token.usage",
+                    "Value": 1200,
+                    "Attributes": {"type": "input", "model": "m"},
+                }
+            ],
+        )
+        repository = ClickHouseTelemetryRepository(client)
+
+        metrics = await repository.get_dashboard_metrics()
+        assert metrics.total_tokens == 1200
+        assert metrics.total_sessions == 2
+        assert metrics.success_rate == pytest.approx(50.0)
+        assert float(metrics.cost) == pytest.approx(0.5)
+
+        sessions = await repository.get_active_sessions()
+        assert {s["session_id"] for s in sessions} == {"s1"}
+
+        errors = await client.get_recent_errors(hours=1)
+        assert [e.error_type for e in errors] == ["overloaded"]
+
+        health = await repository.get_system_health()
+        assert health.connection_status == "connected"
+
+    @pytest.mark.asyncio
+    async def test_unknown_table_is_rejected(self, client):
+        assert await client.bulk_insert("missing_table", [{"a": 1}]) is False
+
+    @pytest.mark.asyncio
+    async def test_failed_query_returns_empty_like_clickhouse(self, client, caplog):
+        assert await client.execute_query("SELECT * FROM missing_table") == []
+        assert len(_query_errors(caplog)) == 1
+
+        with pytest.raises(sqlite3.OperationalError):
+            await client.execute_command("SELECT * FROM missing_table")
+
+    @pytest.mark.asyncio
+    async def test_date_diff_counts_unit_boundaries(self, client):
+        rows = await client.execute_query(
+            "SELECT dateDiff('minute', '2024-01-01 10:00:59', '2024-01-01 10:01:00') as m, "
+            "dateDiff('day', '2024-01-01 23:00:00', '2024-01-03 01:00:00') as d, "
+            "dateDiff('month', '2023-12-31', '2024-02-01') as mo"
+        )
+        assert rows == [{"m": 1.0, "d": 2.0, "mo": 2.0}]
+
+
+class TestDashboardWidgetQueries:
+    """The dashboard's own ClickHouse queries run against the local store."""
+
+    @pytest.mark.asyncio
+    async def test_agent_utilization_widget(self, client, caplog):
+        await client.bulk_insert("otel_logs", _tool_events(datetime.now(timezone.utc)))
+        manager = TelemetryWidgetManager(client, None, None)
+
+        with caplog.at_level(logging.ERROR):
+            widget = await manager._get_agent_utilization_data()
+
+        assert _query_errors(caplog) == []
+        assert widget.status != "error"
+        assert widget.data["tool_partnerships"] == {
+            "Edit": [{"partner": "Read", "frequency": 4}],
+            "Read": [{"partner": "Edit", "frequency": 4}],
+        }
+        # One use per session spans no time, so no velocity is computed
+        assert widget.data["session_performance"] == {}
+
+    @pytest.mark.asyncio
+    async def test_session_duration_uses_date_diff(self, client, caplog):
+        now = datetime.now(timezone.utc)
+        events = _tool_events(now) + [
+            {
+                "Timestamp": now - timedelta(minutes=5),
+                "Body": "claude_code.tool_decision",
+                "LogAttributes": {"session.id": "s0", "tool_name": "Read"},
+            }
+        ]
+        await client.bulk_insert("otel_logs", events)
+        manager = TelemetryWidgetManager(client, None, None)
+
+        with caplog.at_level(logging.ERROR):
+            widget = await manager._get_agent_utilization_data()
+
+        assert _query_errors(caplog) == []
+        assert widget.data["session_performance"] == {
+            "Read": {
+                "avg_session_duration": 15.0,
+                "avg_uses_per_session": 2.0,
+                "usage_velocity": 0.13,
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_content_statistics(self, client, caplog):
+        processor = FullContentBatchProcessor(client)
+        await processor.process_jsonl_entries(
+            _jsonl_entries(datetime.now(timezone.utc))
+        )
+
+        with caplog.at_level(logging.ERROR):
+            stats = await FullContentQueries(client).get_content_statistics()
+
+        assert _query_errors(caplog) == []
+        assert stats["messages"]["total_messages"] == 2
+        assert stats["tools"]["most_used_tools"] == "Read"
+
+
+class TestSelectTelemetryClient:
+
+    def test_healthy_clickhouse_is_kept(self, tmp_path):
+        clickhouse = ClickHouseClient(enable_health_monitoring=False)
+        with patch.object(clickhouse, "health_check", AsyncMock(return_value=True)):
+            selected = select_telemetry_client(clickhouse, tmp_path / "t.db")
+
+        assert selected.active_client is clickhouse
+
+    def test_unreachable_clickhouse_falls_back_to_sqlite(self, tmp_path):
+        clickhouse = ClickHouseClient(enable_health_monitoring=False)
+        with patch.object(clickhouse, "health_check", AsyncMock(return_value=False)):
+            selected = select_telemetry_client(clickhouse, tmp_path / "t.db")
+
+        assert isinstance(selected.active_client, SQLiteTelemetryClient)
+        assert selected.active_client.db_path == str(tmp_path / "t.db")
+
+
+class TestFallbackTelemetryClient:
+
+    @pytest.mark.asyncio
+    async def test_backend_is_rechecked_at_query_time(self, tmp_path):
+        clickhouse = ClickHouseClient(enable_health_monitoring=False)
+        clickhouse.health_check = AsyncMock(return_value=False)
+        clickhouse.execute_query = AsyncMock(return_value=[{"source": "clickhouse"}])
+        fallback = FallbackTelemetryClient(
+            clickhouse, tmp_path / "t.db", recheck_seconds=0
+        )
+
+        assert await fallback.execute_query("SELECT 'sqlite' AS source") == [
+            {"source": "sqlite"}
+        ]
+        clickhouse.execute_query.assert_not_awaited()
+
+        clickhouse.health_check.return_value = True
+        assert await fallback.execute_query("SELECT 1") == [{"source": "clickhouse"}]
+        assert fallback.active_client is clickhouse
+
+    @pytest.mark.asyncio
+    async def test_recent_check_is_reused(self, tmp_path):
+        clickhouse = ClickHouseClient(enable_health_monitoring=False)
+        clickhouse.health_check = AsyncMock(return_value=False)
+        fallback = FallbackTelemetryClient(clickhouse, tmp_path / "t.db")
+
+        await fallback.execute_query("SELECT 1")
+        await fallback.execute_query("SELECT 1")
+
+        assert clickhouse.health_check.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ingestion_lands_in_the_store_being_read(self, tmp_path):
+        clickhouse = ClickHouseClient(enable_health_monitoring=False)
+        clickhouse.health_check = AsyncMock(return_value=False)
+        clickhouse.bulk_insert = AsyncMock(return_value=True)
+        fallback = FallbackTelemetryClient(clickhouse, tmp_path / "t.db")
+
+        await FullContentBatchProcessor(fallback).process_jsonl_entries(
+            _jsonl_entries(datetime.now(timezone.utc))
+        )
+
+        clickhouse.bulk_insert.assert_not_awaited()
+        stats = await fallback.get_jsonl_content_stats()
+        assert stats["messages"]["total_messages"] == 2
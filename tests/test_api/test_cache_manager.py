@@ -0,0 +1,248 @@
+"""
+Test Suite for AdvancedCacheManager
+
+Tests the in-process dependency graph, batched invalidation, single-flight
+fetching and the bounded refresh-ahead scheduler.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from context_cleaner.api.cache import InMemoryCache
+from context_cleaner.api.cache_manager import (
+    AdvancedCacheManager,
+    CachePolicy,
+    DependencyTracker,
+    InvalidationStrategy,
+    RefreshAheadScheduler,
+)
+from context_cleaner.api.response_optimization import EncodedResponseCache
+
+
+class CountingCache(InMemoryCache):
+    """In-memory cache that records invalidation calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.invalidate_calls = 0
+        self.batch_calls = 0
+
+    async def invalidate(self, pattern):
+        self.invalidate_calls += 1
+        return await super().invalidate(pattern)
+
+    async def invalidate_keys(self, keys):
+        self.batch_calls += 1
+        return await super().invalidate_keys(keys)
+
+
+class TestDependencyTracker:
+    @pytest.mark.asyncio
+    async def test_invalidation_is_batched_and_cleans_graph(self):
+        cache = CountingCache()
+        tracker = DependencyTracker(cache)
+        for i in range(5):
+            await cache.set(f"key{i}", i)
+            await tracker.add_dependencies(f"key{i}", ["dep:a", "dep:b"], 60)
+
+        assert await tracker.invalidate_dependents("dep:a") == 5
+        assert cache.batch_calls == 1
+        assert cache.invalidate_calls == 0
+        assert await cache.get("key0") is None
+        # Keys are gone from every dependency they were registered under
+        assert tracker._dependencies == {}
+        assert tracker._reverse_deps == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_invalidation_keeps_graph(self):
+        class FailingCache(InMemoryCache):
+            async def invalidate_keys(self, keys):
+                raise ConnectionError("cache unavailable")
+
+        tracker = DependencyTracker(FailingCache())
+        await tracker.add_dependency("key", "dep:a", ttl_seconds=60)
+
+        with pytest.raises(ConnectionError):
+            await tracker.invalidate_dependents("dep:a")
+        # Nothing was deleted, so a retry must still find the dependents
+        assert tracker._dependencies == {"dep:a": {"key"}}
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_pruned(self):
+        tracker = DependencyTracker(InMemoryCache())
+        await tracker.add_dependency("old", "dep:a", ttl_seconds=0)
+        assert tracker.prune_expired() == 1
+
+        # Adding a dependency also prunes whatever has expired
+        await tracker.add_dependency("old", "dep:a", ttl_seconds=0)
+        await tracker.add_dependency("new", "dep:a", ttl_seconds=60)
+        assert tracker._dependencies == {"dep:a": {"new"}}
+
+    @pytest.mark.asyncio
+    async def test_restored_key_is_not_pruned_by_stale_expiry(self):
+        tracker = DependencyTracker(InMemoryCache())
+        await tracker.add_dependency("key", "dep:a", ttl_seconds=0)
+        await tracker.add_dependency("key", "dep:a", ttl_seconds=60)
+
+        assert tracker.prune_expired() == 0
+        assert "key" in tracker._reverse_deps
+
+    @pytest.mark.asyncio
+    async def test_dependency_invalidation_clears_encoded_responses(self):
+        encoded = EncodedResponseCache()
+        cache = InMemoryCache()
+        manager = AdvancedCacheManager(cache)
+        manager.add_invalidation_listener(
+            lambda keys: [encoded.invalidate(key) for key in keys]
+        )
+        encoded.put("dashboard:overview:v1", {"total_tokens": 1})
+        encoded.put("widget:health:global:7", {"status": "ok"})
+        await cache.set("dashboard:overview:v1", {"total_tokens": 1})
+        await manager.track_dependencies(
+            "dashboard:overview:v1", manager.policies["dashboard_overview"]
+        )
+
+        assert await manager.invalidate_by_dependency("metrics") == 1
+        assert encoded.get("dashboard:overview:v1") is None
+        assert encoded.get("widget:health:global:7") is not None
+
+
+class TestRefreshAheadScheduler:
+    @pytest.mark.asyncio
+    async def test_single_flight_and_concurrency_limit(self):
+        scheduler = RefreshAheadScheduler(max_concurrent=2, max_pending=3)
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def refresh():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        assert scheduler.schedule("a", refresh) is True
+        assert scheduler.schedule("a", refresh) is False
+        assert scheduler.schedule("b", refresh) is True
+        assert scheduler.schedule("c", refresh) is True
+        assert scheduler.schedule("d", refresh) is False
+
+        await asyncio.sleep(0.01)
+        assert peak == 2
+
+        release.set()
+        for _ in range(100):
+            if not scheduler.pending:
+                break
+            await asyncio.sleep(0.01)
+        assert scheduler.pending == 0
+        assert peak == 2
+
+
+class TestAdvancedCacheManager:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        manager = AdvancedCacheManager(InMemoryCache())
+        calls = 0
+
+        async def fetcher():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        results = await asyncio.gather(
+            *(manager.get_with_policy("widget_data", fetcher) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert all(result == {"value": 1} for result in results)
+        assert manager.stats["single_flight_waits"] == 9
+
+    @pytest.mark.asyncio
+    async def test_waiters_take_over_when_leader_is_cancelled(self):
+        manager = AdvancedCacheManager(InMemoryCache())
+        calls = 0
+        leader_started = asyncio.Event()
+
+        async def fetcher():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                leader_started.set()
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        leader = asyncio.create_task(manager.get_with_policy("widget_data", fetcher))
+        await leader_started.wait()
+        waiters = [
+            asyncio.create_task(manager.get_with_policy("widget_data", fetcher))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert calls == 2
+        assert all(result == {"value": 2} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_is_single_flight(self):
+        cache = InMemoryCache()
+        manager = AdvancedCacheManager(cache)
+        manager.register_policy(
+            "hot",
+            CachePolicy(
+                ttl_seconds=10,
+                strategy=InvalidationStrategy.TIME_BASED,
+                refresh_ahead_factor=0.5,
+            ),
+        )
+        refreshes = 0
+        release = asyncio.Event()
+
+        async def fetcher():
+            nonlocal refreshes
+            refreshes += 1
+            await release.wait()
+            return {"fresh": True}
+
+        key = "api:v1:hot"
+        await cache.set(
+            key,
+            {
+                "data": {"fresh": False},
+                "cached_at": (datetime.now() - timedelta(seconds=8)).isoformat(),
+            },
+            ttl=10,
+        )
+
+        for _ in range(20):
+            assert await manager.get_with_policy("hot", fetcher) == {"fresh": False}
+        await asyncio.sleep(0.01)
+
+        assert refreshes == 1
+        assert manager.stats["refresh_ahead_hits"] == 1
+        assert manager.stats["refresh_ahead_skipped"] == 19
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert await manager.get_with_policy("hot", fetcher) == {"fresh": True}
+        await manager.close()
+
+    def test_early_expiration_respects_threshold(self):
+        policy = CachePolicy(ttl_seconds=100, refresh_ahead_factor=0.8)
+        fresh = {"cached_at": datetime.now().isoformat(), "compute_ms": 0}
+        stale = {
+            "cached_at": (datetime.now() - timedelta(seconds=90)).isoformat(),
+            "compute_ms": 0,
+        }
+
+        assert AdvancedCacheManager._should_refresh_early(fresh, policy) is False
+        assert AdvancedCacheManager._should_refresh_early(stale, policy) is True
@@ -531,4 +531,42 @@ class TestResponseFormat:
         assert 'request_id' in data
         assert data['success'] is False
         assert data['error'] is not None
-        assert data['error_code'] is not None
\ No newline at end of file
+        assert data['error_code'] is not None
+
+class TestMetricsEndpoint:
+    """Test the Prometheus scrape endpoint"""
+
+    def test_metrics_exposes_request_latency_by_route(self, client):
+        """Requests are timed under their route template"""
+        client.get('/api/v1/nonexistent-endpoint')
+        client.get('/metrics')
+
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/plain')
+        assert '# TYPE context_cleaner_http_request_duration_seconds histogram' in response.text
+        assert 'route="/metrics",status="200"' in response.text
+        assert 'route="unmatched",status="404"' in response.text
+
+
+class TestProfilerEndpoints:
+    """Test the sampling profiler controls"""
+
+    def test_profiler_start_report_and_flamegraph(self, client):
+        """A profiling session can be started, stopped and exported"""
+        started = client.post('/api/v1/performance/profiler/start', params={'hz': 200})
+        assert started.status_code == 200
+        assert started.json()['status']['running'] is True
+
+        stopped = client.post('/api/v1/performance/profiler/stop')
+        assert stopped.status_code == 200
+        assert stopped.json()['status']['running'] is False
+
+        report = client.get('/api/v1/performance/profiler', params={'limit': 5})
+        assert report.status_code == 200
+        assert 'top_functions' in report.json()
+
+        flamegraph = client.get('/api/v1/performance/profiler/flamegraph')
+        assert flamegraph.status_code == 200
+        assert flamegraph.headers['content-type'].startswith('text/plain')
@@ -0,0 +1,226 @@
+"""
+Test Suite for pre-encoded responses
+
+Tests EncodedResponseCache encoding, ETag revalidation and content
+negotiation, and the widget endpoint serving from it.
+"""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from context_cleaner.api.app import create_testing_app
+from context_cleaner.api.models import WidgetData
+from context_cleaner.api.response_optimization import (
+    EncodedResponse,
+    EncodedResponseCache,
+    StreamingDataProcessor,
+    accepts_encoding,
+)
+
+
+def _request(headers=None):
+    raw_headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+class TestEncodedResponse:
+    def test_payload_is_wrapped_in_each_envelope(self):
+        data = {"value": list(range(200))}
+        entry = EncodedResponse.encode(data)
+
+        first = json.loads(entry.render({"request_id": "a", "data": None}))
+        second = json.loads(entry.render({"request_id": "b"}))
+
+        assert first == {"request_id": "a", "data": data}
+        assert second == {"request_id": "b", "data": data}
+        assert json.loads(entry.render({})) == {"data": data}
+
+    def test_conditional_request_returns_304(self):
+        entry = EncodedResponse.encode({"value": 1})
+
+        response = entry.to_response(_request({"If-None-Match": entry.etag}), {})
+        assert response.status_code == 304
+        assert response.body == b""
+
+        other = entry.to_response(
+            _request({"If-None-Match": '"other", ' + entry.etag}), {}
+        )
+        assert other.status_code == 304
+
+    def test_gzip_body_splices_precompressed_payload(self):
+        entry = EncodedResponse.encode({"value": "x" * 1000})
+        assert entry.deflated is not None
+        envelope = {"success": True, "metadata": {"cached": True}}
+
+        response = entry.to_response(_request({"Accept-Encoding": "gzip"}), envelope)
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(response.body) == entry.render(envelope)
+
+        plain = entry.to_response(_request(), envelope)
+        assert "content-encoding" not in plain.headers
+        assert plain.body == entry.render(envelope)
+
+    @pytest.mark.parametrize(
+        "header, accepted",
+        [
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, gzip;q=0.5", True),
+            ("GZIP", True),
+            ("*", True),
+            ("gzip;q=0", False),
+            ("gzip;q=0.0, *;q=1", False),
+            ("br, *;q=0", False),
+            ("identity", False),
+            ("", False),
+        ],
+    )
+    def test_accept_encoding_honours_q_values(self, header, accepted):
+        assert accepts_encoding(header, "gzip") is accepted
+
+    def test_refused_gzip_is_not_served(self):
+        entry = EncodedResponse.encode({"value": "x" * 1000})
+
+        response = entry.to_response(_request({"Accept-Encoding": "gzip;q=0"}), {})
+        assert "content-encoding" not in response.headers
+
+
+class TestEncodedResponseCache:
+    def test_lru_eviction_and_invalidation(self):
+        cache = EncodedResponseCache(max_entries=2)
+        cache.put("widget:a", {"a": 1})
+        cache.put("widget:b", {"b": 1})
+        cache.get("widget:a")
+        cache.put("dashboard:overview:v1", {"c": 1})
+
+        assert cache.get("widget:b") is None
+        assert cache.get("widget:a") is not None
+
+        assert cache.invalidate("widget:*") == 1
+        assert cache.get("widget:a") is None
+
+    def test_expired_entries_are_not_served(self):
+        cache = EncodedResponseCache()
+        cache.put("key", {"a": 1}, ttl_seconds=0)
+        assert cache.respond("key", _request(), {}) is None
+
+
+class TestWidgetEndpointCaching:
+    @pytest.fixture
+    def client_and_service(self):
+        app = create_testing_app()
+        service = Mock()
+        service.get_widget_data = AsyncMock(
+            return_value=WidgetData(
+                widget_id="error_monitor_1",
+                widget_type="error_monitor",
+                title="Error Monitor",
+                status="healthy",
+                data={"error_count": 5},
+                last_updated=datetime.now(),
+                metadata={},
+            )
+        )
+        app.state.dashboard_service = service
+        return TestClient(app), service
+
+    def test_repeat_requests_are_served_from_encoded_cache(self, client_and_service):
+        client, service = client_and_service
+
+        first = client.get("/api/v1/widgets/error_monitor")
+        assert first.status_code == 200
+        assert first.json()["data"]["data"]["error_count"] == 5
+        etag = first.headers["etag"]
+
+        second = client.get("/api/v1/widgets/error_monitor")
+        assert second.json()["data"] == first.json()["data"]
+        assert second.headers["etag"] == etag
+        assert service.get_widget_data.await_count == 1
+        # Envelope fields describe this response, not the one that was cached
+        assert second.json()["metadata"]["cached"] is True
+        assert second.json()["request_id"] != first.json()["request_id"]
+
+        not_modified = client.get(
+            "/api/v1/widgets/error_monitor", headers={"If-None-Match": etag}
+        )
+        assert not_modified.status_code == 304
+        assert service.get_widget_data.await_count == 1
+
+        refreshed = client.get("/api/v1/widgets/error_monitor?force_refresh=true")
+        assert json.loads(refreshed.content)["metadata"]["cached"] is False
+        assert service.get_widget_data.await_count == 2
+
+
+class TestReportStreaming:
+    def test_text_chunks_are_coalesced_into_blocks(self):
+        async def chunks():
+            for part in ["ab", "cd", "é", "f"]:
+                yield part
+
+        async def collect():
+            return [
+                block
+                async for block in StreamingDataProcessor.stream_text_chunks(
+                    chunks(), min_chunk_bytes=4
+                )
+            ]
+
+        assert asyncio.run(collect()) == [b"abcd", "éf".encode("utf-8")]
+
+    @pytest.fixture
+    def report_client(self, monkeypatch):
+        import context_cleaner.api.app as app_module
+
+        dashboard = Mock()
+        dashboard.generate_dashboard = AsyncMock(return_value=Mock(context_size=10))
+        monkeypatch.setattr(
+            app_module.CacheEnhancedDashboard,
+            "from_config",
+            classmethod(lambda cls, config=None: dashboard),
+        )
+        cross_session = Mock()
+        cross_session.analyze_cross_session_patterns = AsyncMock(return_value=Mock())
+        monkeypatch.setattr(
+            app_module, "CrossSessionAnalyticsEngine", Mock(return_value=cross_session)
+        )
+        recommender = Mock()
+        recommender.generate_intelligent_recommendations = AsyncMock(return_value=[])
+        monkeypatch.setattr(
+            app_module,
+            "IntelligentRecommendationEngine",
+            Mock(return_value=recommender),
+        )
+
+        reporting = Mock()
+
+        async def stream_report(*args, **kwargs):
+            yield "# Report\n"
+            yield f"format={kwargs['output_format'].value}\n"
+
+        reporting.stream_report = Mock(side_effect=stream_report)
+        monkeypatch.setattr(
+            app_module, "AdvancedReportingSystem", Mock(return_value=reporting)
+        )
+        return TestClient(create_testing_app()), reporting
+
+    def test_report_endpoint_streams_rendered_report(self, report_client):
+        client, reporting = report_client
+
+        response = client.get("/api/v1/reports/executive_summary?format=markdown")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert ".md" in response.headers["content-disposition"]
+        assert response.text == "# Report\nformat=markdown\n"
+        assert reporting.stream_report.call_args.kwargs["report_type"].value == (
+            "executive_summary"
+        )
@@ -0,0 +1,221 @@
+"""
+Test Suite for WebSocket state publishing
+
+Tests JSON-patch computation, encode-once broadcasting, snapshot/delta
+state frames and per-client coalescing and queue bounds.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from context_cleaner.api.websocket import (
+    ClientChannel,
+    ConnectionManager,
+    compute_json_patch,
+)
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records sent frames"""
+
+    def __init__(self, block: bool = False):
+        self.sent = []
+        self.accepted = False
+        self.release = asyncio.Event()
+        if not block:
+            self.release.set()
+
+    async def accept(self):
+        self.accepted = True
+
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(json.loads(text))
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestComputeJsonPatch:
+    def test_nested_changes(self):
+        old = {"a": 1, "b": {"c": 2, "d": 3}, "gone": True}
+        new = {"a": 1, "b": {"c": 5, "d": 3}, "new/key": [1]}
+
+        assert compute_json_patch(old, new) == [
+            {"op": "remove", "path": "/gone"},
+            {"op": "replace", "path": "/b/c", "value": 5},
+            {"op": "add", "path": "/new~1key", "value": [1]},
+        ]
+
+    def test_identical_and_type_changes(self):
+        assert compute_json_patch({"a": [1, 2]}, {"a": [1, 2]}) == []
+        assert compute_json_patch({"a": 1}, {"a": 1.0}) == [
+            {"op": "replace", "path": "/a", "value": 1.0}
+        ]
+
+
+class TestConnectionManager:
+    async def _connect(self, manager, client_id, topic, block=False, deltas=True):
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, client_id)
+        await manager.subscribe(client_id, topic, deltas=deltas)
+        await _drain()
+        websocket.sent.clear()
+        if block:
+            websocket.release.clear()
+        return websocket
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self, monkeypatch):
+        manager = ConnectionManager()
+        clients = [await self._connect(manager, f"c{i}", "t") for i in range(3)]
+
+        encoded = []
+        encode = manager._encode
+        monkeypatch.setattr(
+            manager, "_encode", lambda message: encoded.append(1) or encode(message)
+        )
+        await manager.broadcast_to_topic("t", {"type": "ping"})
+        await _drain()
+
+        assert len(encoded) == 1
+        assert all(ws.sent == [{"type": "ping"}] for ws in clients)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_then_delta(self):
+        manager = ConnectionManager()
+        websocket = await self._connect(manager, "c1", "health")
+
+        await manager.publish_state("health", {"score": 80, "status": "ok"})
+        await _drain()
+        await manager.publish_state("health", {"score": 75, "status": "ok"})
+        await _drain()
+
+        snapshot, delta = websocket.sent
+        assert snapshot["type"] == "state.snapshot"
+        assert snapshot["data"] == {"score": 80, "status": "ok"}
+        assert delta["type"] == "state.delta"
+        assert delta["base_version"] == snapshot["version"]
+        assert delta["patch"] == [{"op": "replace", "path": "/score", "value": 75}]
+
+    @pytest.mark.asyncio
+    async def test_slow_client_receives_coalesced_state(self):
+        manager = ConnectionManager()
+        fast = await self._connect(manager, "fast", "health")
+        slow = await self._connect(manager, "slow", "health", block=True)
+
+        await manager.publish_state("health", {"score": 1})
+        await _drain()
+        for score in (2, 3, 4):
+            await manager.publish_state("health", {"score": score})
+            await _drain()
+
+        slow.release.set()
+        await _drain()
+
+        assert len(fast.sent) == 4
+        # The first frame was already in flight; later ones collapse into one
+        # delta against it
+        assert [frame["type"] for frame in slow.sent] == [
+            "state.snapshot",
+            "state.delta",
+        ]
+        assert slow.sent[1]["base_version"] == 1
+        assert slow.sent[1]["patch"] == [
+            {"op": "replace", "path": "/score", "value": 4}
+        ]
+        assert manager._channels["slow"].coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_current_snapshot(self):
+        manager = ConnectionManager()
+        await manager.publish_state("health", {"score": 9})
+
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "late")
+        await manager.subscribe("late", "health", deltas=True)
+        await _drain()
+
+        assert websocket.sent[-1]["type"] == "state.snapshot"
+        assert websocket.sent[-1]["data"] == {"score": 9}
+
+    @pytest.mark.asyncio
+    async def test_clients_without_deltas_get_full_state(self):
+        manager = ConnectionManager()
+        legacy = await self._connect(manager, "legacy", "health_update", deltas=False)
+        patched = await self._connect(manager, "patched", "health_update")
+
+        await manager.publish_state("health_update", {"score": 1, "status": "ok"})
+        await _drain()
+        await manager.publish_state("health_update", {"score": 2, "status": "ok"})
+        await _drain()
+
+        assert [frame["type"] for frame in legacy.sent] == ["health_update"] * 2
+        assert legacy.sent[-1]["data"] == {"score": 2, "status": "ok"}
+        assert [frame["type"] for frame in patched.sent] == [
+            "state.snapshot",
+            "state.delta",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_message_opts_into_deltas(self):
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "c1")
+
+        await manager.handle_client_message(
+            "c1", json.dumps({"type": "subscribe", "topic": "health", "deltas": True})
+        )
+        await manager.publish_state("health", {"score": 3})
+        await _drain()
+
+        assert websocket.sent[-2]["data"]["deltas"] is True
+        assert websocket.sent[-1]["type"] == "state.snapshot"
+
+
+class TestClientChannel:
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        websocket = FakeWebSocket(block=True)
+        channel = ClientChannel(websocket, max_queue=2)
+
+        async def on_error(error):
+            raise AssertionError(error)
+
+        channel.start(on_error)
+        channel.put(json.dumps({"n": 0}))
+        await _drain()
+        for n in (1, 2, 3):
+            channel.put(json.dumps({"n": n}))
+
+        websocket.release.set()
+        await _drain()
+        await channel.close()
+
+        assert [frame["n"] for frame in websocket.sent] == [0, 2, 3]
+        assert channel.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_state_frames_interleave_with_messages(self):
+        websocket = FakeWebSocket(block=True)
+        channel = ClientChannel(websocket, max_queue=10)
+
+        async def on_error(error):
+            raise AssertionError(error)
+
+        channel.start(on_error)
+        for n in range(3):
+            channel.put(json.dumps({"n": n}))
+        channel.put_state("health", 1, json.dumps({"state": 1}))
+
+        websocket.release.set()
+        await _drain()
+        await channel.close()
+
+        # The state frame goes out after one message, not after the backlog
+        assert websocket.sent[:2] == [{"n": 0}, {"state": 1}]
+        assert len(websocket.sent) == 4
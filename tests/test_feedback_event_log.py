@@ -0,0 +1,117 @@
+"""
+Tests for the segmented feedback event log and FeedbackStorage on top of it.
+"""
+
+import gc
+import json
+from datetime import datetime, timedelta
+
+from context_cleaner.feedback import user_feedback_collector
+from context_cleaner.feedback.event_log import SegmentedEventLog
+from context_cleaner.feedback.user_feedback_collector import (
+    FeedbackEvent,
+    FeedbackStorage,
+)
+
+
+def _event(timestamp, name="e"):
+    return {"event_type": name, "timestamp": timestamp.isoformat(), "data": {}}
+
+
+class TestSegmentedEventLog:
+    def test_events_are_buffered_then_written_to_daily_segments(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, flush_interval=3600, max_buffered_events=10)
+        now = datetime.now()
+        log.append(_event(now - timedelta(days=1)), now - timedelta(days=1))
+        log.append(_event(now), now)
+        assert log.segment_count() == 0
+
+        log.flush()
+        assert log.segment_count() == 2
+        index = json.loads((tmp_path / "index.json").read_text())
+        assert index[now.date().isoformat()]["count"] == 1
+
+    def test_read_since_skips_old_segments(self, tmp_path, monkeypatch):
+        log = SegmentedEventLog(tmp_path)
+        now = datetime.now()
+        for days in (10, 5, 0):
+            timestamp = now - timedelta(days=days)
+            log.append(_event(timestamp, f"d{days}"), timestamp)
+        log.flush()
+
+        opened = []
+        read_segment = log._read_segment
+
+        def tracking_read(path, cutoff):
+            opened.append(path.name)
+            return read_segment(path, cutoff)
+
+        monkeypatch.setattr(log, "_read_segment", tracking_read)
+        events = log.read_since(now - timedelta(hours=1))
+
+        assert [e["event_type"] for e in events] == ["d0"]
+        assert opened == [f"events-{now.date().isoformat()}.jsonl"]
+
+    def test_stale_index_entry_falls_back_to_parsing(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        now = datetime.now()
+        log.append(_event(now - timedelta(minutes=30), "old"), now)
+        log.flush()
+
+        # Another process appends to the same segment behind our back
+        segment = tmp_path / f"events-{now.date().isoformat()}.jsonl"
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write(json.dumps(_event(now, "other")) + "\n")
+
+        events = log.read_since(now - timedelta(minutes=1))
+        assert [e["event_type"] for e in events] == ["other"]
+
+    def test_drop_before_deletes_whole_segments(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        now = datetime.now()
+        for days in (40, 31, 1):
+            timestamp = now - timedelta(days=days)
+            log.append(_event(timestamp), timestamp)
+
+        assert log.drop_before(now - timedelta(days=30)) == 2
+        assert log.segment_count() == 1
+
+
+class TestFeedbackStorage:
+    def test_store_and_read_recent_events(self, tmp_path):
+        storage = FeedbackStorage(tmp_path)
+        storage.store_event(
+            FeedbackEvent("usage", datetime.now(), "session", {"cpu_percent": 5})
+        )
+        storage.store_event(
+            FeedbackEvent("usage", datetime.now() - timedelta(days=2), "session")
+        )
+
+        recent = storage.get_recent_events(24)
+        assert len(recent) == 1
+        assert recent[0]["data"] == {"cpu_percent": 5.0}
+
+        storage.cleanup_old_data(retention_days=1)
+        assert storage.event_log.segment_count() == 1
+
+    def test_legacy_events_file_is_migrated(self, tmp_path):
+        legacy = tmp_path / "feedback_events.jsonl"
+        legacy.write_text(
+            json.dumps(_event(datetime.now(), "legacy")) + "\nnot json\n",
+            encoding="utf-8",
+        )
+
+        storage = FeedbackStorage(tmp_path)
+
+        assert not legacy.exists()
+        assert [e["event_type"] for e in storage.get_recent_events(1)] == ["legacy"]
+
+    def test_exit_flush_does_not_keep_storages_alive(self, tmp_path):
+        storage = FeedbackStorage(tmp_path / "live")
+        storage.store_event(FeedbackEvent("usage", datetime.now(), "session"))
+        FeedbackStorage(tmp_path / "discarded")
+        gc.collect()
+
+        assert list(user_feedback_collector._open_storages) == [storage]
+        user_feedback_collector._flush_open_storages()
+        assert storage.event_log.segment_count() == 1